@@ -1,15 +1,28 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { MarineInputs, decide_and_eta } from '../../../src/marine_ops/core/marine_decision';
+
+// Python 의사결정 서비스 (uvicorn marine_ops.service:app)
+const MARINE_OPS_SERVICE_URL = process.env.MARINE_OPS_SERVICE_URL || 'http://127.0.0.1:8000';
+
+async function decide(inputs: Record<string, unknown>) {
+  const response = await fetch(`${MARINE_OPS_SERVICE_URL}/v1/decide`, {
+    method: 'POST',
+    headers: { 'content-type': 'application/json' },
+    body: JSON.stringify(inputs),
+    cache: 'no-store',
+  });
+  const payload = await response.json();
+  if (!response.ok || !payload.success) {
+    throw new Error(payload.error || `Decision service returned ${response.status}`);
+  }
+  return payload.data;
+}
 
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
     
-    // 입력 데이터 검증
-    const inputs = MarineInputs.parse(body);
-    
-    // 해양 운항 의사결정 실행
-    const result = decide_and_eta(inputs);
+    // 해양 운항 의사결정 실행 (입력 검증은 서비스에서 수행)
+    const result = await decide(body);
     
     return NextResponse.json({
       success: true,
@@ -41,7 +54,7 @@ export async function GET(request: NextRequest) {
   }
   
   // 샘플 데이터로 의사결정 실행
-  const sampleInputs = new MarineInputs({
+  const sampleInputs = {
     combined_ft: 3.5,
     wind_adnoc: 15.0,
     hs_onshore_ft: 2.0,
@@ -51,14 +64,22 @@ export async function GET(request: NextRequest) {
     offshore_weight: 0.35,
     distance_nm: 120.0,
     planned_speed: 12.0,
-  });
-  
-  const result = decide_and_eta(sampleInputs);
+  };
   
-  return NextResponse.json({
-    success: true,
-    data: result,
-    coordinates: { lat: parseFloat(lat), lon: parseFloat(lon) },
-    timestamp: new Date().toISOString(),
-  });
+  try {
+    const result = await decide(sampleInputs);
+    
+    return NextResponse.json({
+      success: true,
+      data: result,
+      coordinates: { lat: parseFloat(lat), lon: parseFloat(lon) },
+      timestamp: new Date().toISOString(),
+    });
+  } catch (error) {
+    console.error('Marine ops API error:', error);
+    return NextResponse.json(
+      { success: false, error: error instanceof Error ? error.message : 'Unknown error' },
+      { status: 502 }
+    );
+  }
 }
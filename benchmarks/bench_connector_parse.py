@@ -0,0 +1,72 @@
+"""커넥터 파싱 벤치마크. Connector parse benchmark.
+
+기록된 공급자 응답(tests/marine_ops/fixtures)을 검증 경로와 신뢰(고속) 경로로 파싱한다.
+Parses the recorded provider payloads (tests/marine_ops/fixtures) with the validated and
+trusted (fast) paths.
+
+    python benchmarks/bench_connector_parse.py --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from marine_ops.connectors import OpenMeteoFallback, StormglassConnector, WorldTidesConnector
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "marine_ops" / "fixtures"
+PROVIDERS: dict[str, tuple[str, Callable[[bool], Any], str]] = {
+    "stormglass": (
+        "stormglass_forecast.json",
+        lambda trusted: StormglassConnector("bench", trusted=trusted),
+        "parse_forecast",
+    ),
+    "open-meteo": (
+        "open_meteo_forecast.json",
+        lambda trusted: OpenMeteoFallback(trusted=trusted),
+        "parse_forecast",
+    ),
+    "worldtides": (
+        "worldtides_heights.json",
+        lambda trusted: WorldTidesConnector("bench", trusted=trusted),
+        "parse_heights",
+    ),
+}
+
+
+def _time_parse(parse: Callable[..., Any], payload: dict[str, Any], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse(payload, 25.0, 55.0)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark connector payload parsing")
+    parser.add_argument("--repeat", type=int, default=50, help="Parses per provider and path")
+    args = parser.parse_args()
+
+    for provider, (fixture, factory, method) in PROVIDERS.items():
+        payload = json.loads((FIXTURES / fixture).read_text(encoding="utf-8"))
+        parse = getattr(factory(False), method)
+        fast = getattr(factory(True), method)
+        columnar = getattr(factory(True), f"{method}_columnar")
+        if parse(payload, 25.0, 55.0) != fast(payload, 25.0, 55.0):
+            raise SystemExit(f"{provider}: trusted path output differs")
+        slow_seconds = _time_parse(parse, payload, args.repeat)
+        fast_seconds = _time_parse(fast, payload, args.repeat)
+        columnar_seconds = _time_parse(columnar, payload, args.repeat)
+        print(
+            f"{provider:<11} validated {slow_seconds * 1e3:7.2f} ms  "
+            f"trusted {fast_seconds * 1e3:7.2f} ms ({slow_seconds / fast_seconds:4.1f}x)  "
+            f"columnar {columnar_seconds * 1e3:7.2f} ms ({slow_seconds / columnar_seconds:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""CSV 읽기 벤치마크. CSV ingestion benchmark.
+
+생성한 ``CSV_HEADER`` 형식 파일(기본 5백만 행)을 청크 컬럼형 모드로 읽고, 행마다
+``strptime`` 과 pydantic 검증을 거치는 단순 읽기의 표본 처리량과 비교한다.
+Reads a generated ``CSV_HEADER`` file (5M rows by default) in chunked columnar mode and
+compares it with a sampled naive reader that calls ``strptime`` and pydantic validation
+on every row.
+
+    python benchmarks/bench_csv_read.py --rows 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import itertools
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.schema import (
+    CSV_TIMESTAMP_FORMAT,
+    MarineMeasurement,
+    MarineVariable,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from marine_ops.io import StreamingCsvWriter, iter_csv_columnar
+
+UNITS = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+    MarineVariable.WIND_DIRECTION_10M: UnitEnum.DEGREES,
+    MarineVariable.VISIBILITY: UnitEnum.KILOMETERS,
+}
+SITES = 50
+
+
+def generate(path: Path, rows: int, seed: int) -> None:
+    """합성 CSV 생성. Write a synthetic multi-site CSV with about ``rows`` rows."""
+
+    rng = np.random.default_rng(seed)
+    metadata = TimeseriesMetadata(source="stormglass", units=UNITS)
+    hours = max(1, rows // (SITES * len(UNITS)))
+    start_us = int(dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc).timestamp()) * 1_000_000
+    with StreamingCsvWriter(path) as writer:
+        for site in range(SITES):
+            writer.write_columnar(
+                ColumnarTimeseries.from_arrays(
+                    start_us + np.arange(hours, dtype=np.int64) * 3_600_000_000,
+                    24.0 + site * 0.01,
+                    54.0 + site * 0.01,
+                    {
+                        MarineVariable.SIGNIFICANT_WAVE_HEIGHT: rng.uniform(0.2, 3.0, hours),
+                        MarineVariable.WIND_SPEED_10M: rng.uniform(0.0, 18.0, hours),
+                        MarineVariable.WIND_DIRECTION_10M: rng.uniform(0.0, 360.0, hours),
+                        MarineVariable.VISIBILITY: rng.uniform(1.0, 20.0, hours),
+                    },
+                    UNITS,
+                    metadata,
+                )
+            )
+
+
+def naive_rows_per_second(path: Path, sample: int) -> float:
+    """행별 strptime·검증 처리량. Throughput of per-row strptime plus validation."""
+
+    started = time.perf_counter()
+    with path.open(newline="", encoding="utf-8") as handle:
+        for row in itertools.islice(csv.DictReader(handle), sample):
+            dt.datetime.strptime(row["timestamp"], CSV_TIMESTAMP_FORMAT)
+            MarineMeasurement(variable=row["variable"], value=row["value"], unit=row["unit"])
+    return sample / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark CSV ingestion")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Generated CSV rows")
+    parser.add_argument("--chunk-rows", type=int, default=250_000, help="Rows per chunk")
+    parser.add_argument("--naive-rows", type=int, default=200_000, help="Naive sample size")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "timeseries.csv"
+        started = time.perf_counter()
+        generate(path, args.rows, args.seed)
+        print(
+            f"generated {path.stat().st_size / 1e6:,.0f} MB in {time.perf_counter() - started:.1f}s"
+        )
+
+        started = time.perf_counter()
+        rows = points = chunks = 0
+        for chunk in iter_csv_columnar(path, chunk_rows=args.chunk_rows):
+            chunks += 1
+            points += len(chunk)
+            rows += sum(int(np.count_nonzero(codes >= 0)) for codes in chunk.quality.values())
+        seconds = time.perf_counter() - started
+
+        fast_rate = rows / seconds
+        naive_rate = naive_rows_per_second(path, min(args.naive_rows, rows))
+        print(
+            f"columnar: {rows:>10,d} rows ({points:,d} points, {chunks} chunks) in "
+            f"{seconds:7.2f}s -> {fast_rate:12,.0f} rows/s"
+        )
+        print(
+            f"naive   : {naive_rate:12,.0f} rows/s (sampled), speedup {fast_rate / naive_rate:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""배치 의사결정 벤치마크. Batch decision benchmark.
+
+``decide_and_eta`` 행별 호출과 ``decide_and_eta_batch`` 처리량을 비교한다.
+Compares per-row ``decide_and_eta`` calls with ``decide_and_eta_batch`` throughput.
+
+    python benchmarks/bench_decision_batch.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from marine_ops.core.marine_decision import MarineInputs, decide_and_eta, decide_and_eta_batch
+
+ALERTS = np.array([None, "rough at times westward", "High seas", "Fog"], dtype=object)
+
+
+def build_columns(rows: int, seed: int) -> dict[str, np.ndarray]:
+    """무작위 입력 열 생성. Build random input columns."""
+
+    rng = np.random.default_rng(seed)
+    return {
+        "combined_ft": np.round(rng.uniform(0.0, 8.0, rows), 2),
+        "wind_adnoc": np.round(rng.uniform(0.0, 35.0, rows), 1),
+        "hs_onshore_ft": np.round(rng.uniform(0.0, 6.0, rows), 2),
+        "hs_offshore_ft": np.round(rng.uniform(0.0, 8.0, rows), 2),
+        "wind_albahar": np.round(rng.uniform(0.0, 35.0, rows), 1),
+        "offshore_weight": np.round(rng.uniform(0.0, 1.0, rows), 2),
+        "distance_nm": np.round(rng.uniform(5.0, 200.0, rows), 1),
+        "planned_speed": np.round(rng.uniform(4.0, 14.0, rows), 1),
+        "alert": ALERTS[rng.integers(0, ALERTS.size, rows)],
+    }
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark decide_and_eta_batch")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Batch size")
+    parser.add_argument("--scalar-rows", type=int, default=20_000, help="Scalar sample size")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    columns = build_columns(args.rows, args.seed)
+
+    started = time.perf_counter()
+    decide_and_eta_batch(**columns)
+    batch_seconds = time.perf_counter() - started
+
+    sample = min(args.scalar_rows, args.rows)
+    started = time.perf_counter()
+    scalar = [
+        decide_and_eta(MarineInputs(**{key: values[index] for key, values in columns.items()}))
+        for index in range(sample)
+    ]
+    scalar_seconds = time.perf_counter() - started
+
+    head = decide_and_eta_batch(**{key: values[:sample] for key, values in columns.items()})
+    mismatches = sum(1 for expected, actual in zip(scalar, head.to_outputs()) if expected != actual)
+    batch_rate = args.rows / batch_seconds
+    scalar_rate = sample / scalar_seconds
+    print(f"batch : {args.rows:>10,d} rows in {batch_seconds:8.3f}s -> {batch_rate:12,.0f} rows/s")
+    print(f"scalar: {sample:>10,d} rows in {scalar_seconds:8.3f}s -> {scalar_rate:12,.0f} rows/s")
+    print(f"speedup: {batch_rate / scalar_rate:,.1f}x, mismatches in sample: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
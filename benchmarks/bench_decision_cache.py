@@ -0,0 +1,79 @@
+"""의사결정 메모이제이션 벤치마크. Decision memoization benchmark.
+
+항로 몇 개와 소수 둘째 자리로 양자화된 예보 값을 반복하는 현실적 입력 흐름에서
+``decide_and_eta`` 와 ``DecisionCache`` 처리 시간을 비교한다.
+Compares ``decide_and_eta`` with ``DecisionCache`` on a realistic stream of inputs: a few
+routes and forecast values quantized to two decimals that repeat across evaluations.
+
+    python benchmarks/bench_decision_cache.py --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from marine_ops.core.decision_cache import DecisionCache
+from marine_ops.core.marine_decision import MarineInputs, decide_and_eta
+
+ROUTES = (
+    {"offshore_weight": 0.35, "distance_nm": 120.0, "planned_speed": 12.0},
+    {"offshore_weight": 0.80, "distance_nm": 65.0, "planned_speed": 10.0},
+    {"offshore_weight": 0.20, "distance_nm": 30.0, "planned_speed": 9.0},
+)
+ALERTS = (None, None, None, "rough at times westward")
+
+
+def build_inputs(calls: int, seed: int) -> list[MarineInputs]:
+    """반복되는 양자화 입력 흐름. Stream of repeating quantized inputs."""
+
+    rng = np.random.default_rng(seed)
+    # 잔잔한 해역의 좁은 분포라 양자화된 값이 자주 반복된다.
+    hs_ft = np.round(rng.normal(2.5, 0.15, calls), 1)
+    wind_kt = np.round(rng.normal(12.0, 0.6, calls), 0)
+    return [
+        MarineInputs(
+            combined_ft=float(hs_ft[index]) + 0.5,
+            wind_adnoc=float(wind_kt[index]),
+            hs_onshore_ft=float(hs_ft[index]) - 0.5,
+            hs_offshore_ft=float(hs_ft[index]),
+            wind_albahar=float(wind_kt[index]) + 1.0,
+            alert=ALERTS[index % len(ALERTS)],
+            **ROUTES[index % len(ROUTES)],
+        )
+        for index in range(calls)
+    ]
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark DecisionCache")
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--maxsize", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    inputs = build_inputs(args.calls, args.seed)
+    started = time.perf_counter()
+    plain = [decide_and_eta(item) for item in inputs]
+    plain_s = time.perf_counter() - started
+
+    cache = DecisionCache(args.maxsize)
+    started = time.perf_counter()
+    cached = [cache(item) for item in inputs]
+    cached_s = time.perf_counter() - started
+
+    assert cached == plain
+    stats = cache.stats()
+    print(
+        f"{args.calls:,d} calls: uncached {plain_s * 1e6 / args.calls:.2f} us/call, "
+        f"cached {cached_s * 1e6 / args.calls:.2f} us/call ({plain_s / cached_s:.1f}x), "
+        f"hit rate {stats['hits'] / args.calls:.1%}, size {stats['size']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
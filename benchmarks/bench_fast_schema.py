@@ -0,0 +1,153 @@
+"""경량 스키마 생성·할당 벤치마크. Lightweight schema construction and allocation benchmark.
+
+같은 포인트를 pydantic 검증 생성, 컬럼형 → pydantic(무검증), ``__slots__`` 생성자와
+컬럼형 → ``__slots__`` 경로로 만들어 소요 시간과 tracemalloc 최대 할당량을 비교한다.
+Builds the same points through validated pydantic construction, columnar → pydantic
+(unvalidated), the ``__slots__`` constructors and columnar → ``__slots__``, comparing wall
+time and tracemalloc peak allocation.
+
+    python benchmarks/bench_fast_schema.py --points 20000 --variables 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.fast_schema import (
+    FastDataPoint,
+    FastMeasurement,
+    FastPosition,
+    FastTimeseries,
+)
+from marine_ops.core.schema import (
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+VARIABLES: tuple[tuple[MarineVariable, UnitEnum], ...] = (
+    (MarineVariable.SIGNIFICANT_WAVE_HEIGHT, UnitEnum.METERS),
+    (MarineVariable.WIND_SPEED_10M, UnitEnum.METERS_PER_SECOND),
+    (MarineVariable.WIND_DIRECTION_10M, UnitEnum.DEGREES),
+    (MarineVariable.VISIBILITY, UnitEnum.KILOMETERS),
+    (MarineVariable.SWELL_HEIGHT, UnitEnum.METERS),
+    (MarineVariable.SWELL_PERIOD, UnitEnum.SECONDS),
+    (MarineVariable.SWELL_DIRECTION, UnitEnum.DEGREES),
+)
+
+
+def build_pydantic(
+    times: list[dt.datetime], values: np.ndarray, metadata: TimeseriesMetadata
+) -> MarineTimeseries:
+    """검증 생성. Validated pydantic construction."""
+
+    variables = VARIABLES[: values.shape[1]]
+    return MarineTimeseries(
+        points=[
+            MarineDataPoint(
+                timestamp=timestamp,
+                position=Position(latitude=24.8, longitude=54.6),
+                measurements=[
+                    MarineMeasurement(variable=variable, value=value, unit=unit)
+                    for (variable, unit), value in zip(variables, row)
+                ],
+                metadata=metadata,
+            )
+            for timestamp, row in zip(times, values.tolist())
+        ]
+    )
+
+
+def build_fast(
+    times: list[dt.datetime], values: np.ndarray, metadata: TimeseriesMetadata
+) -> FastTimeseries:
+    """``__slots__`` 생성자. ``__slots__`` constructors with the same rules."""
+
+    variables = VARIABLES[: values.shape[1]]
+    return FastTimeseries(
+        [
+            FastDataPoint(
+                timestamp,
+                FastPosition(24.8, 54.6),
+                [
+                    FastMeasurement(variable, value, unit)
+                    for (variable, unit), value in zip(variables, row)
+                ],
+                metadata,
+            )
+            for timestamp, row in zip(times, values.tolist())
+        ]
+    )
+
+
+def measure(build: Callable[[], Any]) -> tuple[float, float, Any]:
+    """(초, 최대 할당 MiB, 결과). Return (seconds, peak MiB, result)."""
+
+    gc.collect()
+    started = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, result
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark the __slots__ schema variants")
+    parser.add_argument("--points", type=int, default=20_000)
+    parser.add_argument("--variables", type=int, default=5, choices=range(1, len(VARIABLES) + 1))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    values = rng.uniform(0.0, 30.0, (args.points, args.variables))
+    times = [START + dt.timedelta(hours=hour) for hour in range(args.points)]
+    metadata = TimeseriesMetadata(
+        source="bench", units={variable: unit for variable, unit in VARIABLES}
+    )
+    model = build_pydantic(times, values, metadata)
+    columnar = ColumnarTimeseries.from_timeseries(model)
+    fast = build_fast(times, values, metadata)
+    if fast.to_model() != model or columnar.to_fast_timeseries() != fast:
+        raise SystemExit("fast schema output differs from the pydantic models")
+
+    cases: dict[str, Callable[[], Any]] = {
+        "pydantic (validated)": lambda: build_pydantic(times, values, metadata),
+        "columnar -> pydantic": columnar.to_timeseries,
+        "__slots__ (validated)": lambda: build_fast(times, values, metadata),
+        "columnar -> __slots__": columnar.to_fast_timeseries,
+        "pydantic -> __slots__": lambda: FastTimeseries.from_model(model),
+        "__slots__ -> pydantic": fast.to_model,
+    }
+    print(f"points={args.points} variables={args.variables}")
+    baseline_time, baseline_peak = 0.0, 0.0
+    for name, build in cases.items():
+        elapsed, peak, _ = measure(build)
+        if not baseline_time:
+            baseline_time, baseline_peak = elapsed, peak
+        print(
+            f"{name:<22} {elapsed * 1000:9.1f} ms ({baseline_time / elapsed:5.1f}x)  "
+            f"peak {peak:7.1f} MiB ({baseline_peak / peak:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
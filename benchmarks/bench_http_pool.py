@@ -0,0 +1,156 @@
+"""공유 HTTP 풀 벤치마크. Shared HTTP pool benchmark.
+
+로컬 TLS 대역 서버(자체 서명 인증서, ``openssl`` 필요)에 대해 반복 조회 주기를 실행하고
+주기마다 새 클라이언트를 만드는 방식과 ``MarineOpsSettings`` 공유 풀의 TLS 핸드셰이크 수와
+소요 시간을 비교한다.
+Runs repeated fetch cycles against a local TLS stand-in server (self-signed certificate,
+requires ``openssl``) and compares TLS handshakes and wall time for fresh clients per cycle
+versus the shared ``MarineOpsSettings`` pool.
+
+    python benchmarks/bench_http_pool.py --cycles 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from marine_ops.core.settings import MarineOpsSettings
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "marine_ops" / "fixtures"
+ROUTES = {
+    "/stormglass": "stormglass_forecast.json",
+    "/worldtides": "worldtides_heights.json",
+    "/open-meteo": "open_meteo_forecast.json",
+}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies: dict[str, bytes] = {}
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        body = self.bodies[self.path.split("?", 1)[0]]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _TLSServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, context: ssl.SSLContext) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.context = context
+        self.handshakes = 0
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        sock, address = super().get_request()
+        # 새 연결마다 TLS 핸드셰이크 1회. One TLS handshake per accepted connection.
+        self.handshakes += 1
+        return self.context.wrap_socket(sock, server_side=True), address
+
+
+def _certificate(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def _cycle(settings: MarineOpsSettings, base: str, fresh: bool, verify: str) -> None:
+    def client() -> httpx.Client | None:
+        return httpx.Client(verify=verify) if fresh else None
+
+    stormglass = settings.build_stormglass_connector(client())
+    tides = settings.build_worldtides_connector(client())
+    fallback = settings.build_open_meteo_fallback(client())
+    stormglass.base_url = f"{base}/stormglass"
+    tides.base_url = f"{base}/worldtides"
+    end = START + dt.timedelta(days=1)
+    stormglass.fetch_forecast(25.0, 55.0, START, end)
+    tides.fetch_heights(25.0, 55.0, START, hours=24)
+    fallback.fetch_forecast(25.0, 55.0, START, end)
+    if fresh:
+        for connector in (stormglass, tides, fallback):
+            connector.client.close()
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=50)
+    args = parser.parse_args()
+
+    _Handler.bodies = {route: (FIXTURES / name).read_bytes() for route, name in ROUTES.items()}
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _certificate(Path(tmp))
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+        server = _TLSServer(context)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"https://127.0.0.1:{server.server_address[1]}"
+        env = {
+            "STORMGLASS_API_KEY": "bench",
+            "WORLDTIDES_API_KEY": "bench",
+            "OPEN_METEO_BASE": f"{base}/open-meteo",
+            "HTTP_CA_BUNDLE": str(cert),
+            "TRUSTED_SOURCES": "true",
+        }
+        try:
+            for label, fresh in (("fresh clients", True), ("shared pool", False)):
+                server.handshakes = 0
+                with MarineOpsSettings.from_env(env) as settings:
+                    started = time.perf_counter()
+                    for _ in range(args.cycles):
+                        _cycle(settings, base, fresh, str(cert))
+                    elapsed = time.perf_counter() - started
+                print(
+                    f"{label:>13}: {server.handshakes:5d} TLS handshakes, "
+                    f"{elapsed * 1000 / args.cycles:7.2f} ms/cycle over {args.cycles} cycles"
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""시계열 색인 벤치마크. Timeseries index benchmark.
+
+10^5–10^7 측정값에서 ``TimeseriesIndex`` 의 최근접·구간 조회 지연을 배열 전체 선형 스캔과,
+10^5 규모에서는 ``MarineTimeseries.points`` 순회와 비교한다.
+Compares ``TimeseriesIndex`` nearest and window query latency with a full-array linear
+scan at 10^5–10^7 measurements, and with a ``MarineTimeseries.points`` walk at 10^5.
+
+    python benchmarks/bench_index.py --sizes 100000 1000000 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.index import TimeseriesIndex
+from marine_ops.core.schema import MarineTimeseries, MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.units import haversine_nm
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+UNITS = {HS: UnitEnum.METERS, MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND}
+HOUR_US = 3_600_000_000
+SITES = 2000
+
+
+def build(measurements: int, seed: int) -> ColumnarTimeseries:
+    """합성 다지점 시계열. Synthetic multi-site hourly series."""
+
+    rng = np.random.default_rng(seed)
+    hours = max(1, measurements // (SITES * len(UNITS)))
+    site_ids = np.repeat(np.arange(SITES), hours)
+    lat = rng.uniform(22.0, 27.0, SITES)[site_ids]
+    lon = rng.uniform(51.0, 57.0, SITES)[site_ids]
+    size = site_ids.size
+    return ColumnarTimeseries.from_arrays(
+        np.tile(np.arange(hours, dtype=np.int64) * HOUR_US, SITES),
+        lat,
+        lon,
+        {variable: rng.uniform(0.0, 10.0, size) for variable in UNITS},
+        UNITS,
+        TimeseriesMetadata(source="bench", units=UNITS),
+    )
+
+
+def per_query_us(run: Callable[[float, float, int, int], object], queries: np.ndarray) -> float:
+    """질의당 평균 마이크로초. Mean microseconds per query."""
+
+    started = time.perf_counter()
+    for lat, lon, start, end in queries:
+        run(lat, lon, int(start), int(end))
+    return (time.perf_counter() - started) * 1e6 / len(queries)
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark TimeseriesIndex")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for size in args.sizes:
+        columnar = build(size, args.seed)
+        hours = int(columnar.timestamps.max() // HOUR_US) + 1
+        starts = rng.integers(0, max(hours - 24, 1), args.queries) * HOUR_US
+        queries = np.stack(
+            [
+                rng.uniform(22.0, 27.0, args.queries),
+                rng.uniform(51.0, 57.0, args.queries),
+                starts,
+                starts + 24 * HOUR_US,
+            ],
+            axis=1,
+        )
+        started = time.perf_counter()
+        index = TimeseriesIndex(columnar)
+        build_ms = (time.perf_counter() - started) * 1e3
+        hs = columnar.column(HS)
+
+        def indexed(lat: float, lon: float, start: int, end: int) -> object:
+            return index.values(HS, lat, lon, start, end)
+
+        def scan(lat: float, lon: float, start: int, end: int) -> object:
+            distances = haversine_nm(lat, lon, columnar.latitude, columnar.longitude)
+            nearest = distances == distances.min()
+            window = (columnar.timestamps >= start) & (columnar.timestamps <= end)
+            return hs[nearest & window]
+
+        indexed_us = per_query_us(indexed, queries)
+        scan_us = per_query_us(scan, queries[: max(1, args.queries // 10)])
+        line = (
+            f"{size:>11,d} measurements: build {build_ms:8.1f} ms, index {indexed_us:8.1f} us/q, "
+            f"array scan {scan_us:10.1f} us/q ({scan_us / indexed_us:,.0f}x)"
+        )
+        if size <= 200_000:
+            points = columnar.to_timeseries().points
+            series = MarineTimeseries.model_construct(points=points)
+
+            def walk(lat: float, lon: float, start: int, end: int) -> object:
+                best = min(
+                    series.points,
+                    key=lambda point: (point.position.latitude - lat) ** 2
+                    + (point.position.longitude - lon) ** 2,
+                ).position
+                return [
+                    measurement.value
+                    for point in series.points
+                    if point.position == best and start <= point.timestamp.timestamp() * 1e6 <= end
+                    for measurement in point.measurements
+                    if measurement.variable is HS
+                ]
+
+            walk_us = per_query_us(walk, queries[:5])
+            line += f", points walk {walk_us:10.1f} us/q ({walk_us / indexed_us:,.0f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""작업 CSV 일괄 실행 벤치마크. Jobs CSV batch runner benchmark.
+
+조회 지연을 흉내 낸 비동기 커넥터로 작업 10,000개(조회 좌표는 그보다 적음)를 실행해, 작업마다
+순차 조회·평가하는 루프(일부 작업으로 추정)와 처리량 및 조회 횟수를 비교한다.
+Runs 10,000 jobs (over fewer distinct fetch positions) through an async connector with
+simulated latency and compares throughput and fetch count against a loop that fetches and
+evaluates each job sequentially (extrapolated from a subset).
+
+    python benchmarks/bench_jobs.py --jobs 10000 --positions 2000 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries, datetime_to_epoch_us
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.jobs import JobRunner, JobSettings, JobSpec, evaluate_jobs
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+HOUR_US = 3_600_000_000
+
+
+class SlowForecasts:
+    """고정 지연 합성 예보 커넥터. Synthetic forecast connector with fixed latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.calls = 0
+
+    async def fetch_forecast(
+        self, latitude: float, longitude: float, start: dt.datetime, end: dt.datetime
+    ) -> ColumnarTimeseries:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        times = np.arange(datetime_to_epoch_us(start), datetime_to_epoch_us(end) + 1, HOUR_US)
+        clock = (times - times[0]) / HOUR_US + latitude * 10.0
+        return ColumnarTimeseries.from_arrays(
+            times,
+            np.full(times.size, latitude),
+            np.full(times.size, longitude),
+            {HS: 1.0 + 0.8 * np.sin(clock / 18.0), WIND: 8.0 + 5.0 * np.sin(clock / 30.0)},
+            UNITS,
+            TimeseriesMetadata(source="bench", units=UNITS),
+        )
+
+
+def build_jobs(count: int, positions: int, seed: int) -> list[JobSpec]:
+    """무작위 작업 목록. Random job list over a fixed set of positions."""
+
+    rng = np.random.default_rng(seed)
+    sites = np.round(rng.uniform([22.0, 51.0], [27.0, 57.0], (positions, 2)), 2)
+    picks = rng.integers(0, positions, count)
+    offsets = rng.integers(0, 144, count)
+    lengths = rng.integers(12, 97, count)
+    return [
+        JobSpec(
+            job_id=f"job-{number:05d}",
+            latitude=float(sites[site, 0]),
+            longitude=float(sites[site, 1]),
+            start=START + dt.timedelta(hours=int(offset)),
+            end=START + dt.timedelta(hours=int(offset + length)),
+        )
+        for number, (site, offset, length) in enumerate(zip(picks, offsets, lengths))
+    ]
+
+
+async def loop_jobs(connector: SlowForecasts, jobs: list[JobSpec]) -> None:
+    """작업별 순차 조회·평가. Fetch and evaluate each job sequentially."""
+
+    settings = JobSettings()
+    for job in jobs:
+        forecast = await connector.fetch_forecast(job.latitude, job.longitude, job.start, job.end)
+        evaluate_jobs(forecast, [job], settings)
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark JobRunner")
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--positions", type=int, default=2_000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per fetch")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--loop-jobs", type=int, default=50, help="Jobs timed in the loop")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.jobs, args.positions, args.seed)
+    connector = SlowForecasts(args.latency)
+    runner = JobRunner(connector, concurrency=args.concurrency, workers=args.workers)
+    with tempfile.TemporaryDirectory() as tmp:
+        summary = runner.run(jobs, Path(tmp) / "results.csv")
+
+    started = time.perf_counter()
+    asyncio.run(loop_jobs(SlowForecasts(args.latency), jobs[: args.loop_jobs]))
+    loop = (time.perf_counter() - started) * len(jobs) / args.loop_jobs
+
+    print(
+        f"jobs={summary.total:,} fetches={summary.fetches:,} "
+        f"workers={runner.workers} concurrency={args.concurrency} latency={args.latency}s"
+    )
+    print(f"per-job loop (est.): {loop:9.2f} s")
+    print(
+        f"JobRunner:           {summary.elapsed_seconds:9.2f} s  "
+        f"({loop / summary.elapsed_seconds:,.0f}x, "
+        f"{summary.total / summary.elapsed_seconds:,.0f} jobs/s)"
+    )
+    print(f"succeeded={summary.succeeded:,} failed={summary.failed:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""커넥터 응답 디코딩 벤치마크. Connector payload decoding benchmark.
+
+기록된 공급자 응답(tests/marine_ops/fixtures)을 ``--hours`` 시간·``--sources`` 공급원으로
+늘린 바이트 본문을 만들어, ``response.json()`` 과 같은 표준 json 디코딩 + 시간별 파싱과
+고속 디코딩(orjson 설치 시) + 배열 추출 경로의 시간과 tracemalloc 최대 할당량을 비교한다.
+Expands the recorded provider payloads (tests/marine_ops/fixtures) to ``--hours`` hours and
+``--sources`` sources as raw bytes, then compares stdlib json decoding (as in
+``response.json()``) plus per-hour parsing against the fast decoder (orjson when installed)
+plus array extraction, by wall time and tracemalloc peak.
+
+    python benchmarks/bench_payload_decode.py --hours 240 --sources 8 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from marine_ops.connectors import OpenMeteoFallback, StormglassConnector, WorldTidesConnector
+from marine_ops.io import loads, orjson_available
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "marine_ops" / "fixtures"
+EXTRA_SOURCES = ("icon", "dwd", "meteo", "ecmwf", "gfs", "smhi", "fcoo", "fmi", "yr")
+
+
+def stormglass_payload(hours: int, sources: int) -> bytes:
+    """기록 응답을 늘린 Stormglass 본문. Recorded Stormglass payload, expanded."""
+
+    recorded = json.loads((FIXTURES / "stormglass_forecast.json").read_text(encoding="utf-8"))
+    template = recorded["hours"]
+    start = dt.datetime.fromisoformat(template[0]["time"])
+    names = ("sg", "noaa", *EXTRA_SOURCES)[: max(sources, 1)]
+    expanded = []
+    for hour in range(hours):
+        base = template[hour % len(template)]
+        entry: dict[str, Any] = {"time": (start + dt.timedelta(hours=hour)).isoformat()}
+        for key, values in base.items():
+            if key == "time":
+                continue
+            # 기록된 공급원 값(null 포함)은 그대로 두고 추가 공급원만 합성한다.
+            value = next((item for item in values.values() if item is not None), None)
+            entry[key] = {
+                name: values.get(
+                    name, None if value is None else round(value * (1 + number / 100), 2)
+                )
+                for number, name in enumerate(names)
+            }
+        expanded.append(entry)
+    return json.dumps({"hours": expanded, "meta": recorded.get("meta", {})}).encode("utf-8")
+
+
+def recorded_payload(name: str) -> bytes:
+    """기록 응답 원본. Recorded payload as-is."""
+
+    return (FIXTURES / name).read_bytes()
+
+
+def measure(run: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    """(평균 ms, 최대 할당 KiB). Return (mean ms, peak KiB)."""
+
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = (time.perf_counter() - started) / repeat
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 1024
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark connector payload decoding")
+    parser.add_argument("--hours", type=int, default=240, help="Stormglass hours")
+    parser.add_argument("--sources", type=int, default=8, help="Stormglass sources per value")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    stormglass = StormglassConnector("bench")
+    open_meteo = OpenMeteoFallback()
+    worldtides = WorldTidesConnector("bench")
+    cases: dict[str, tuple[bytes, Callable[[Any], Any], Callable[[Any], Any]]] = {
+        "stormglass": (
+            stormglass_payload(args.hours, args.sources),
+            lambda payload: stormglass.parse_forecast(payload, 25.0, 55.0),
+            lambda payload: stormglass.parse_forecast_columnar(payload, 25.0, 55.0),
+        ),
+        "open-meteo": (
+            recorded_payload("open_meteo_forecast.json"),
+            lambda payload: open_meteo.parse_forecast(payload, 25.0, 55.0),
+            lambda payload: open_meteo.parse_forecast_columnar(payload, 25.0, 55.0),
+        ),
+        "worldtides": (
+            recorded_payload("worldtides_heights.json"),
+            lambda payload: worldtides.parse_heights(payload, 25.0, 55.0),
+            lambda payload: worldtides.parse_heights_columnar(payload, 25.0, 55.0),
+        ),
+    }
+    print(f"orjson={orjson_available()} hours={args.hours} sources={args.sources}")
+    for provider, (content, per_hour, columnar) in cases.items():
+        if columnar(loads(content)).to_timeseries() != per_hour(json.loads(content)):
+            raise SystemExit(f"{provider}: fast decoding output differs")
+        baseline_ms, baseline_kib = measure(lambda: per_hour(json.loads(content)), args.repeat)
+        json_ms, json_kib = measure(lambda: columnar(json.loads(content)), args.repeat)
+        fast_ms, fast_kib = measure(lambda: columnar(loads(content)), args.repeat)
+        print(
+            f"{provider:<11} {len(content) / 1024:7.1f} KiB  "
+            f"json+per-hour {baseline_ms:7.2f} ms {baseline_kib:8.0f} KiB  "
+            f"json+arrays {json_ms:6.2f} ms ({baseline_ms / json_ms:4.1f}x)  "
+            f"fast {fast_ms:6.2f} ms ({baseline_ms / fast_ms:5.1f}x) {fast_kib:7.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""확률적 의사결정 벤치마크. Probabilistic decision benchmark.
+
+항로 × 표본 몬테카를로 평가를 ``decide_and_eta`` 표본 루프(일부로 추정)와
+``decide_probabilistic`` 벡터화 묶음으로 비교한다.
+Compares route × sample Monte Carlo evaluation with a ``decide_and_eta`` sample loop
+(extrapolated from a subset) against vectorized ``decide_probabilistic`` blocks.
+
+    python benchmarks/bench_probabilistic.py --routes 500 --samples 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from marine_ops.core.marine_decision import MarineInputs, decide_and_eta
+from marine_ops.core.probabilistic import decide_probabilistic
+
+ALERTS = np.array([None, "rough at times westward", "High seas"], dtype=object)
+
+
+def build_routes(count: int, seed: int) -> dict[str, np.ndarray]:
+    """합성 항로 입력 열. Synthetic route input columns."""
+
+    rng = np.random.default_rng(seed)
+    return {
+        "combined_ft": np.round(rng.uniform(0.5, 7.0, count), 2),
+        "wind_adnoc": np.round(rng.uniform(5.0, 30.0, count), 1),
+        "hs_onshore_ft": np.round(rng.uniform(0.5, 5.0, count), 2),
+        "hs_offshore_ft": np.round(rng.uniform(0.5, 7.0, count), 2),
+        "wind_albahar": np.round(rng.uniform(5.0, 30.0, count), 1),
+        "offshore_weight": np.round(rng.uniform(0.0, 1.0, count), 2),
+        "distance_nm": np.round(rng.uniform(20.0, 150.0, count), 1),
+        "planned_speed": np.round(rng.uniform(8.0, 14.0, count), 1),
+        "alert": ALERTS[rng.integers(0, ALERTS.size, count)],
+    }
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark Monte Carlo decisions")
+    parser.add_argument("--routes", type=int, default=500)
+    parser.add_argument("--samples", type=int, default=10_000)
+    parser.add_argument("--loop-samples", type=int, default=20, help="Samples for the loop")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    routes = build_routes(args.routes, args.seed)
+    rng = np.random.default_rng(args.seed)
+    started = time.perf_counter()
+    for _ in range(args.loop_samples):
+        wave = np.exp(rng.normal(0.0, 0.15, args.routes))
+        wind = rng.normal(0.0, 2.0, args.routes)
+        for index in range(args.routes):
+            decide_and_eta(
+                MarineInputs(
+                    combined_ft=routes["combined_ft"][index] * wave[index],
+                    wind_adnoc=max(routes["wind_adnoc"][index] + wind[index], 0.0),
+                    hs_onshore_ft=routes["hs_onshore_ft"][index] * wave[index],
+                    hs_offshore_ft=routes["hs_offshore_ft"][index] * wave[index],
+                    wind_albahar=max(routes["wind_albahar"][index] + wind[index], 0.0),
+                    alert=routes["alert"][index],
+                    offshore_weight=routes["offshore_weight"][index],
+                    distance_nm=routes["distance_nm"][index],
+                    planned_speed=routes["planned_speed"][index],
+                )
+            )
+    loop = (time.perf_counter() - started) * args.samples / args.loop_samples
+
+    started = time.perf_counter()
+    result = decide_probabilistic(routes, samples=args.samples, seed=args.seed)
+    vectorized = time.perf_counter() - started
+
+    cells = args.routes * args.samples
+    print(f"routes={args.routes} samples={args.samples} cells={cells:,}")
+    print(f"decide_and_eta loop (est.): {loop:9.2f} s")
+    print(f"decide_probabilistic:       {vectorized:9.2f} s  ({loop / vectorized:,.0f}x)")
+    print(
+        f"mean P(Go)={result.p_go.mean():.3f} P(Conditional)={result.p_conditional.mean():.3f} "
+        f"P(No-Go)={result.p_no_go.mean():.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""의사결정 HTTP 서비스 부하 테스트. Decision HTTP service load test.
+
+단일 결정·컬럼형 배치·타임라인 경로에 동시 요청을 보내 경로별 p50/p99 지연과 초당 요청
+수를 측정한다. ``--url`` 이 없으면 uvicorn 이 설치된 경우 로컬 포트에 서비스를 띄우고,
+아니면 httpx ASGI 전송으로 프로세스 안에서 호출한다(네트워크 제외).
+Sends concurrent requests to the single-decision, columnar batch and timeline routes and
+reports p50/p99 latency and requests/sec per route. Without ``--url`` the service is
+started on a local port when uvicorn is installed, otherwise it is called in-process
+through the httpx ASGI transport (no network).
+
+    python benchmarks/bench_service.py --requests 2000 --concurrency 32 --batch-rows 1000
+    python benchmarks/bench_service.py --timeline-cache 0
+    python benchmarks/bench_service.py --url http://127.0.0.1:8000  # uvicorn marine_ops.service:app
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import importlib.util
+import socket
+import threading
+import time
+from typing import Any
+
+import httpx
+import numpy as np
+
+from marine_ops.core.marine_decision import create_sample_inputs
+from marine_ops.io import dumps, orjson_available
+from marine_ops.service import DecisionService
+
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def build_payloads(batch_rows: int, routes: int, hours: int, seed: int) -> dict[str, bytes]:
+    """경로별 요청 본문. Request bodies per route."""
+
+    rng = np.random.default_rng(seed)
+    sample = create_sample_inputs().model_dump()
+    batch = {
+        "combined_ft": rng.uniform(1.0, 8.0, batch_rows).round(2),
+        "wind_adnoc": rng.uniform(5.0, 30.0, batch_rows).round(2),
+        "hs_onshore_ft": rng.uniform(0.5, 5.0, batch_rows).round(2),
+        "hs_offshore_ft": rng.uniform(1.0, 8.0, batch_rows).round(2),
+        "wind_albahar": rng.uniform(5.0, 30.0, batch_rows).round(2),
+        "offshore_weight": 0.35,
+        "distance_nm": 120.0,
+        "planned_speed": 12.0,
+    }
+    sites = rng.uniform([23.0, 52.0], [26.0, 56.0], (routes, 2)).round(2)
+    clock = np.tile(np.arange(hours), routes)
+    forecast = {
+        "timestamps": (int(START.timestamp()) * 1_000_000 + clock * 3_600_000_000),
+        "latitude": np.repeat(sites[:, 0], hours),
+        "longitude": np.repeat(sites[:, 1], hours),
+        "hs_m": (1.0 + 0.8 * np.sin(clock / 18.0)).round(2),
+        "wind_ms": (8.0 + 5.0 * np.sin(clock / 30.0)).round(2),
+    }
+    timeline = {
+        "forecast": forecast,
+        "routes": [
+            {
+                "name": f"route-{number}",
+                "latitude": float(lat),
+                "longitude": float(lon),
+                "distance_nm": 120.0,
+                "planned_speed": 12.0,
+                "offshore_weight": 0.35,
+            }
+            for number, (lat, lon) in enumerate(sites.tolist())
+        ],
+        "hours": hours,
+    }
+    return {
+        "/v1/decide": dumps(sample),
+        "/v1/decide/batch": dumps(batch),
+        "/v1/timeline": dumps(timeline),
+    }
+
+
+async def load(
+    client: httpx.AsyncClient, path: str, body: bytes, requests: int, concurrency: int
+) -> tuple[np.ndarray, float]:
+    """동시 요청 실행 → (지연 배열, 경과 초). Run concurrent requests."""
+
+    latencies = np.empty(requests)
+    queue = iter(range(requests))
+    headers = {"content-type": "application/json"}
+
+    async def worker() -> None:
+        for number in queue:
+            started = time.perf_counter()
+            response = await client.post(path, content=body, headers=headers)
+            latencies[number] = time.perf_counter() - started
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - started
+
+
+def start_uvicorn(service: DecisionService) -> tuple[str, Any]:
+    """로컬 포트에서 uvicorn 실행. Serve on a free local port with uvicorn."""
+
+    import uvicorn
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(service, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", server
+
+
+async def run(args: argparse.Namespace) -> None:
+    payloads = build_payloads(args.batch_rows, args.routes, args.hours, args.seed)
+    server = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60.0)
+        mode = args.url
+    elif importlib.util.find_spec("uvicorn") is not None:
+        url, server = start_uvicorn(DecisionService(timeline_cache_size=args.timeline_cache))
+        client = httpx.AsyncClient(base_url=url, timeout=60.0)
+        mode = f"uvicorn {url}"
+    else:
+        service = DecisionService(timeline_cache_size=args.timeline_cache)
+        service.warm_up()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=service), base_url="http://bench", timeout=60.0
+        )
+        mode = "in-process ASGI (uvicorn not installed)"
+
+    print(f"target: {mode}; orjson={orjson_available()} concurrency={args.concurrency}")
+    async with client:
+        for path, body in payloads.items():
+            requests = args.requests if path == "/v1/decide" else max(1, args.requests // 10)
+            await load(client, path, body, min(requests, args.concurrency), args.concurrency)
+            latencies, elapsed = await load(client, path, body, requests, args.concurrency)
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+            print(
+                f"{path:<18} {len(body) / 1024:8.1f} KiB  n={requests:<6} "
+                f"p50={p50:7.2f} ms  p99={p99:7.2f} ms  {requests / elapsed:8.0f} req/s"
+            )
+    if server is not None:
+        server.should_exit = True
+
+
+def main() -> None:
+    """부하 테스트 실행. Run the load test."""
+
+    parser = argparse.ArgumentParser(description="Load test the decision service")
+    parser.add_argument("--url", default=None, help="Running service base URL")
+    parser.add_argument("--requests", type=int, default=2000, help="Single-decision requests")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-rows", type=int, default=1000)
+    parser.add_argument("--routes", type=int, default=20, help="Timeline routes")
+    parser.add_argument("--hours", type=int, default=240, help="Timeline horizon")
+    parser.add_argument(
+        "--timeline-cache", type=int, default=64, help="Timeline response cache size (0: off)"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
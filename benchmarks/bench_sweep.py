@@ -0,0 +1,96 @@
+"""계수 스윕 벤치마크. Coefficient sweep benchmark.
+
+과거 입력 표에 대한 계수 격자 평가를 ``decide_and_eta`` 중첩 루프(표본으로 추정)와
+``sweep`` 브로드캐스트(단일 프로세스/프로세스 풀)로 비교한다.
+Compares a coefficient grid evaluated with nested ``decide_and_eta`` loops (extrapolated
+from a sample) against ``sweep`` broadcasting, serial and with a process pool.
+
+    python benchmarks/bench_sweep.py --rows 10000 --steps 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from marine_ops.core.marine_decision import MarineInputs, decide_and_eta
+from marine_ops.core.sweep import coefficient_grid, sweep
+
+ALERTS = np.array([None, "rough at times westward", "High seas"], dtype=object)
+
+
+def build_history(rows: int, seed: int) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """합성 과거 입력 표와 관측 ETA. Synthetic history table and observed ETAs."""
+
+    rng = np.random.default_rng(seed)
+    history = {
+        "combined_ft": np.round(rng.uniform(0.5, 7.0, rows), 2),
+        "wind_adnoc": np.round(rng.uniform(5.0, 30.0, rows), 1),
+        "hs_onshore_ft": np.round(rng.uniform(0.5, 5.0, rows), 2),
+        "hs_offshore_ft": np.round(rng.uniform(0.5, 7.0, rows), 2),
+        "wind_albahar": np.round(rng.uniform(5.0, 30.0, rows), 1),
+        "offshore_weight": np.round(rng.uniform(0.0, 1.0, rows), 2),
+        "distance_nm": np.round(rng.uniform(20.0, 150.0, rows), 1),
+        "planned_speed": np.round(rng.uniform(8.0, 14.0, rows), 1),
+        "alert": ALERTS[rng.integers(0, ALERTS.size, rows)],
+    }
+    observed = history["distance_nm"] / (history["planned_speed"] * rng.uniform(0.8, 1.0, rows))
+    return history, np.round(observed, 1)
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark the coefficient sweep")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=5, help="Grid points per axis")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    history, observed = build_history(args.rows, args.seed)
+    grid = coefficient_grid(
+        alpha=np.linspace(0.75, 0.95, args.steps),
+        beta=np.linspace(0.70, 0.90, args.steps),
+        k_wind=np.linspace(0.04, 0.08, args.steps),
+        k_wave=np.linspace(0.50, 0.70, args.steps),
+    )
+    sets = grid["alpha"].size
+    cells = sets * args.rows
+
+    sample_sets, sample_rows = 2, min(args.rows, 2000)
+    started = time.perf_counter()
+    for index in range(sample_sets):
+        kwargs = {name: float(grid[name][index]) for name in ("alpha", "beta", "k_wind", "k_wave")}
+        for row in range(sample_rows):
+            decide_and_eta(
+                MarineInputs(**{name: column[row] for name, column in history.items()}),
+                **kwargs,
+            )
+    loop_s = (time.perf_counter() - started) / (sample_sets * sample_rows) * cells
+
+    started = time.perf_counter()
+    result = sweep(history, grid, observed, workers=1)
+    serial_s = time.perf_counter() - started
+
+    best = result.best()
+    print(f"{sets:,d} sets x {args.rows:,d} rows = {cells:,d} evaluations")
+    print(f"  nested loop (estimated): {loop_s:9.1f} s")
+    print(f"  sweep, 1 process:        {serial_s:9.2f} s ({loop_s / serial_s:,.0f}x)")
+    if args.workers > 1:
+        started = time.perf_counter()
+        sweep(history, grid, observed, workers=args.workers, parallel_threshold=0)
+        pool_s = time.perf_counter() - started
+        print(f"  sweep, {args.workers} processes:     {pool_s:9.2f} s ({loop_s / pool_s:,.0f}x)")
+    print(
+        f"  best ETA MAE {np.nanmin(result.eta_mae_hours):.2f} h "
+        f"(defaults {result.baseline_eta_mae_hours:.2f} h) at "
+        + ", ".join(f"{name}={best[name]:.3f}" for name in ("alpha", "beta", "k_wind", "k_wave"))
+    )
+
+
+if __name__ == "__main__":
+    main()
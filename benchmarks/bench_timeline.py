@@ -0,0 +1,112 @@
+"""결정 타임라인 벤치마크. Decision timeline benchmark.
+
+위치 수백 곳의 240시간 예보에서 항로 수백 개의 결정 타임라인과 출항 창을 계산하는 시간을
+재고, 시각의 ``--changed`` 비율만 바뀐 다음 예보를 전체 재평가와 ``IncrementalTimeline``
+으로 반영하는 시간을 비교한다.
+Times decision timelines and departure windows for hundreds of routes over a 240-hour
+forecast at hundreds of positions, then compares a full rerun with ``IncrementalTimeline``
+for a next issue in which a ``--changed`` fraction of the hours differs.
+
+    python benchmarks/bench_timeline.py --routes 500 --hours 240 --changed 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import time
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.timeline import IncrementalTimeline, TimelineRoute, evaluate_timeline
+
+UNITS = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+}
+HOUR_US = 3_600_000_000
+
+
+def build(sites: int, hours: int, seed: int) -> ColumnarTimeseries:
+    """합성 다지점 시간별 예보. Synthetic multi-site hourly forecast."""
+
+    rng = np.random.default_rng(seed)
+    site_ids = np.repeat(np.arange(sites), hours)
+    phase = rng.uniform(0.0, 2 * np.pi, sites)[site_ids]
+    clock = np.tile(np.arange(hours), sites)
+    return ColumnarTimeseries.from_arrays(
+        clock * HOUR_US,
+        rng.uniform(22.0, 27.0, sites)[site_ids],
+        rng.uniform(51.0, 57.0, sites)[site_ids],
+        {
+            MarineVariable.SIGNIFICANT_WAVE_HEIGHT: 1.0 + 0.8 * np.sin(clock / 18.0 + phase),
+            MarineVariable.WIND_SPEED_10M: 8.0 + 5.0 * np.sin(clock / 30.0 + phase),
+        },
+        UNITS,
+        TimeseriesMetadata(source="bench", units=UNITS),
+    )
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark evaluate_timeline")
+    parser.add_argument("--routes", type=int, default=500)
+    parser.add_argument("--sites", type=int, default=500)
+    parser.add_argument("--hours", type=int, default=240)
+    parser.add_argument("--changed", type=float, default=0.1, help="Fraction of changed hours")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    forecast = build(args.sites, args.hours, args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    routes = [
+        TimelineRoute(
+            name=f"route-{number}",
+            latitude=float(rng.uniform(22.0, 27.0)),
+            longitude=float(rng.uniform(51.0, 57.0)),
+            distance_nm=float(rng.uniform(20.0, 200.0)),
+            planned_speed=float(rng.uniform(8.0, 14.0)),
+            offshore_weight=float(rng.uniform(0.0, 1.0)),
+        )
+        for number in range(args.routes)
+    ]
+    best = float("inf")
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        timeline = evaluate_timeline(forecast, routes, hours=args.hours)
+        best = min(best, time.perf_counter() - started)
+    print(
+        f"{args.routes} routes x {args.hours} h ({args.sites} forecast sites): "
+        f"{best * 1e3:.1f} ms, {timeline.window_route.size:,d} departure windows"
+    )
+
+    # 다음 예보: 무작위로 고른 시각의 값만 바뀐다.
+    hs = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+    changed_hours = rng.choice(args.hours, int(args.hours * args.changed), replace=False)
+    clock = (forecast.timestamps // HOUR_US).astype(np.intp)
+    values = dict(forecast.values)
+    values[hs] = np.where(np.isin(clock, changed_hours), values[hs] + 0.4, values[hs])
+    update = dataclasses.replace(forecast, values=values)
+    full_best = incremental_best = float("inf")
+    for _ in range(args.repeat):
+        evaluator = IncrementalTimeline(routes, 0, hours=args.hours)
+        evaluator.update(forecast)
+        started = time.perf_counter()
+        result = evaluator.update(update)
+        incremental_best = min(incremental_best, time.perf_counter() - started)
+        started = time.perf_counter()
+        evaluate_timeline(update, routes, 0, hours=args.hours)
+        full_best = min(full_best, time.perf_counter() - started)
+    print(
+        f"{args.changed:.0%} hours changed: full {full_best * 1e3:.1f} ms, incremental "
+        f"{incremental_best * 1e3:.1f} ms ({result.cells_evaluated:,d} cells re-decided, "
+        f"{len(result):,d} decision changes)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""웨이포인트 항로 ETA 적분 벤치마크. Waypoint route ETA integration benchmark.
+
+다지점 240시간 예보 위에서 웨이포인트 항로 수백 개를 1 NM 세그먼트로 나눠 출항 시각
+여러 개에 대해 ETA 를 적분하는 시간을, 세그먼트마다 최근접 검색·시간 보간·``decide_and_eta``
+를 호출하는 루프(일부 항로로 추정)와 비교한다.
+Times forward ETA integration of hundreds of waypoint routes cut into 1 NM segments for
+several departures over a multi-site 240-hour forecast, against a loop that runs a nearest
+lookup, time interpolation and ``decide_and_eta`` per segment (extrapolated from a subset).
+
+    python benchmarks/bench_voyage.py --routes 200 --waypoints 8 --segment-nm 1 --departures 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.index import TimeseriesIndex
+from marine_ops.core.marine_decision import (
+    DECISION_NO_GO,
+    FT_TO_M,
+    MarineInputs,
+    decide_and_eta,
+)
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.units import METER_PER_SECOND_TO_KNOT
+from marine_ops.core.voyage import WaypointRoute, plan_voyages, segment_routes
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+HOUR_US = 3_600_000_000
+
+
+def build(sites: int, hours: int, seed: int) -> ColumnarTimeseries:
+    """합성 다지점 시간별 예보. Synthetic multi-site hourly forecast."""
+
+    rng = np.random.default_rng(seed)
+    site_ids = np.repeat(np.arange(sites), hours)
+    phase = rng.uniform(0.0, 2 * np.pi, sites)[site_ids]
+    clock = np.tile(np.arange(hours), sites)
+    return ColumnarTimeseries.from_arrays(
+        clock * HOUR_US,
+        rng.uniform(22.0, 27.0, sites)[site_ids],
+        rng.uniform(51.0, 57.0, sites)[site_ids],
+        {
+            HS: 1.0 + 0.8 * np.sin(clock / 18.0 + phase),
+            WIND: 8.0 + 5.0 * np.sin(clock / 30.0 + phase),
+        },
+        UNITS,
+        TimeseriesMetadata(source="bench", units=UNITS),
+    )
+
+
+def loop_voyage(
+    index: TimeseriesIndex, route: WaypointRoute, segment_nm: float, departure_us: int
+) -> float:
+    """세그먼트별 스칼라 루프 ETA. Per-segment scalar loop ETA."""
+
+    segments = segment_routes([route], segment_nm)
+    clock = float(departure_us)
+    for lat, lon, distance, weight in zip(
+        segments.latitude, segments.longitude, segments.distance_nm, segments.offshore_weight
+    ):
+        times, hs = index.values(HS, float(lat), float(lon))
+        _, wind = index.values(WIND, float(lat), float(lon))
+        hs_ft = float(np.interp(clock, times, hs)) / FT_TO_M
+        wind_kt = float(np.interp(clock, times, wind)) * METER_PER_SECOND_TO_KNOT
+        result = decide_and_eta(
+            MarineInputs(
+                combined_ft=hs_ft,
+                wind_adnoc=wind_kt,
+                hs_onshore_ft=hs_ft,
+                hs_offshore_ft=hs_ft,
+                wind_albahar=wind_kt,
+                offshore_weight=float(weight),
+                distance_nm=float(distance),
+                planned_speed=route.planned_speed,
+            )
+        )
+        clock += float(distance) / result.effective_speed * HOUR_US
+    return (clock - departure_us) / HOUR_US
+
+
+def main() -> None:
+    """벤치마크 실행. Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description="Benchmark plan_voyages")
+    parser.add_argument("--routes", type=int, default=200)
+    parser.add_argument("--waypoints", type=int, default=8)
+    parser.add_argument("--segment-nm", type=float, default=1.0)
+    parser.add_argument("--departures", type=int, default=24)
+    parser.add_argument("--sites", type=int, default=500)
+    parser.add_argument("--hours", type=int, default=240)
+    parser.add_argument("--loop-routes", type=int, default=5, help="Routes timed in the loop")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    forecast = build(args.sites, args.hours, args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    routes = []
+    for number in range(args.routes):
+        # 걸프 해역 안에서 무작위 보행으로 웨이포인트를 만든다 (leg 당 약 10–25 NM).
+        start = rng.uniform([23.0, 52.0], [26.0, 56.0])
+        steps = rng.uniform(-0.3, 0.3, (args.waypoints - 1, 2))
+        waypoints = np.vstack([start, start + np.cumsum(steps, axis=0)])
+        routes.append(
+            WaypointRoute(
+                name=f"route-{number}",
+                waypoints=tuple(map(tuple, waypoints.tolist())),
+                planned_speed=float(rng.uniform(8.0, 14.0)),
+                offshore_weight=float(rng.uniform(0.0, 1.0)),
+            )
+        )
+    departures = [hour * HOUR_US for hour in range(args.departures)]
+
+    started = time.perf_counter()
+    segments = segment_routes(routes, args.segment_nm)
+    plan = plan_voyages(forecast, segments, departures)
+    batched = time.perf_counter() - started
+
+    index = TimeseriesIndex(forecast)
+    started = time.perf_counter()
+    for route in routes[: args.loop_routes]:
+        loop_voyage(index, route, args.segment_nm, departures[0])
+    loop = (time.perf_counter() - started) * len(routes) * len(departures) / args.loop_routes
+
+    print(
+        f"routes={args.routes} segments={len(segments):,} departures={args.departures} "
+        f"cells={len(segments) * args.departures:,}"
+    )
+    print(f"per-segment loop (est.): {loop:9.2f} s")
+    print(f"plan_voyages:            {batched:9.3f} s  ({loop / batched:,.0f}x)")
+    no_go = (plan.decision_code == DECISION_NO_GO).mean()
+    print(f"mean ETA {plan.eta_hours.mean():.1f} h, No-Go share {no_go:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,6 @@ import datetime as dt
 from pathlib import Path
 
 from marine_ops import (
-    CSV_HEADER,
     CSV_TIMESTAMP_FORMAT,
     MarineDataPoint,
     MarineMeasurement,
@@ -18,6 +17,7 @@ from marine_ops import (
     TimeseriesMetadata,
     UnitEnum,
 )
+from marine_ops.io import StreamingCsvWriter
 
 DEFAULT_OUTPUT = Path(__file__).resolve().parent.parent
 
@@ -72,14 +72,11 @@ def build_sample_timeseries() -> MarineTimeseries:
     return MarineTimeseries(points=points)
 
 
-def write_timeseries_csv(timeseries: MarineTimeseries, path: Path) -> None:
+def write_timeseries_csv(timeseries: MarineTimeseries, path: Path, compress: bool = False) -> None:
     """시계열 CSV 저장. Save timeseries CSV."""
 
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(CSV_HEADER)
-        for row in timeseries.iter_rows():
-            writer.writerow(row)
+    with StreamingCsvWriter(path, compress=compress) as writer:
+        writer.write_timeseries(timeseries)
 
 
 def write_jobs_csv(path: Path) -> None:
@@ -116,12 +113,17 @@ def main() -> None:
     parser.add_argument(
         "--output", type=Path, default=DEFAULT_OUTPUT, help="Target directory for CSV files"
     )
+    parser.add_argument(
+        "--gzip", action="store_true", help="Write sample_timeseries.csv.gz instead"
+    )
     args = parser.parse_args()
     output_dir = args.output
     output_dir.mkdir(parents=True, exist_ok=True)
-    timeseries_path = output_dir / "sample_timeseries.csv"
+    timeseries_path = output_dir / (
+        "sample_timeseries.csv.gz" if args.gzip else "sample_timeseries.csv"
+    )
     jobs_path = output_dir / "sample_jobs.csv"
-    write_timeseries_csv(build_sample_timeseries(), timeseries_path)
+    write_timeseries_csv(build_sample_timeseries(), timeseries_path, compress=args.gzip)
     write_jobs_csv(jobs_path)
     print(f"Generated {timeseries_path}")
     print(f"Generated {jobs_path}")
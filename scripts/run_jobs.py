@@ -0,0 +1,66 @@
+"""작업 CSV 일괄 실행 스크립트. Jobs CSV batch run script.
+
+python scripts/run_jobs.py sample_jobs.csv --output job_results.csv --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from marine_ops.core.settings import MarineOpsSettings
+from marine_ops.jobs import JobRunner, JobRunSummary, JobSettings, available_cores, read_jobs
+
+
+async def run(args: argparse.Namespace) -> JobRunSummary:
+    """설정 기반 커넥터로 작업 실행. Run the jobs through the configured connectors."""
+
+    jobs = read_jobs(args.jobs)
+    async with MarineOpsSettings.from_env() as settings:
+        # Stormglass 키가 없으면 Open-Meteo 폴백만 사용한다.
+        connector = (
+            settings.build_async_provider_router()
+            if settings.stormglass_api_key
+            else settings.build_async_open_meteo_fallback()
+        )
+        runner = JobRunner(
+            connector,
+            JobSettings(
+                distance_nm=args.distance_nm,
+                planned_speed=args.planned_speed,
+                offshore_weight=args.offshore_weight,
+            ),
+            concurrency=args.concurrency,
+            workers=args.workers,
+            grid_resolution=args.grid_resolution,
+        )
+        return await runner.run_async(jobs, args.output, resume=not args.restart)
+
+
+def main() -> None:
+    """작업 실행. Execute the jobs CSV."""
+
+    parser = argparse.ArgumentParser(description="Run the marine operations jobs CSV")
+    parser.add_argument("jobs", type=Path, help="Jobs CSV (job_id, latitude, longitude, ...)")
+    parser.add_argument("--output", type=Path, default=Path("job_results.csv"))
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint in --output")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent fetches")
+    parser.add_argument("--workers", type=int, default=available_cores())
+    parser.add_argument(
+        "--grid-resolution", type=float, default=None, help="Snap fetch positions (degrees)"
+    )
+    parser.add_argument("--distance-nm", type=float, default=JobSettings.distance_nm)
+    parser.add_argument("--planned-speed", type=float, default=JobSettings.planned_speed)
+    parser.add_argument("--offshore-weight", type=float, default=JobSettings.offshore_weight)
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args))
+    print(
+        f"{summary.succeeded} ok, {summary.failed} failed, {summary.skipped} skipped "
+        f"({summary.fetches} fetches, {summary.elapsed_seconds:.1f} s) → {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""정기 점검 데몬 실행 스크립트. Daily check daemon script.
+
+python scripts/run_scheduler.py --route MW4-AGI 24.8 54.6 120 12 0.35 --lead-minutes 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import logging
+import signal
+
+from marine_ops.core.settings import MarineOpsSettings
+from marine_ops.core.timeline import TimelineRoute
+from marine_ops.jobs import DEFAULT_PREFETCH_LEAD, DEFAULT_TIMEZONE, CheckScheduler
+
+DEFAULT_ROUTE = ("MW4-AGI", "24.8", "54.6", "120", "12", "0.35")
+
+
+def parse_route(values: list[str]) -> TimelineRoute:
+    """``NAME LAT LON DISTANCE_NM SPEED OFFSHORE_WEIGHT`` 파싱. Parse one --route option."""
+
+    name, latitude, longitude, distance, speed, weight = values
+    return TimelineRoute(
+        name, float(latitude), float(longitude), float(distance), float(speed), float(weight)
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """커넥터를 유지한 채 점검 실행. Run checks while keeping the connectors warm."""
+
+    async with MarineOpsSettings.from_env() as settings:
+        logging.basicConfig(
+            level=settings.app_log_level, format="%(asctime)s %(levelname)s %(message)s"
+        )
+        # Stormglass 키가 없으면 Open-Meteo 폴백만 사용한다.
+        connector = (
+            settings.build_async_provider_router()
+            if settings.stormglass_api_key
+            else settings.build_async_open_meteo_fallback()
+        )
+        scheduler = CheckScheduler(
+            connector,
+            [parse_route(route) for route in args.route or [list(DEFAULT_ROUTE)]],
+            times=[dt.time.fromisoformat(value) for value in args.times],
+            timezone=args.timezone,
+            lead=dt.timedelta(minutes=args.lead_minutes),
+            hours=args.hours,
+            concurrency=args.concurrency,
+        )
+        if args.once:
+            await scheduler.run_check()
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, scheduler.stop)
+            except NotImplementedError:  # pragma: no cover - Windows
+                pass
+        await scheduler.serve()
+
+
+def main() -> None:
+    """점검 데몬 실행. Execute the check daemon."""
+
+    parser = argparse.ArgumentParser(description="Run the scheduled marine checks")
+    parser.add_argument(
+        "--route",
+        nargs=6,
+        action="append",
+        metavar=("NAME", "LAT", "LON", "DISTANCE_NM", "SPEED", "WEIGHT"),
+        help="Route to evaluate (repeatable)",
+    )
+    parser.add_argument("--times", nargs="+", default=["06:00", "17:00"])
+    parser.add_argument("--timezone", default=DEFAULT_TIMEZONE)
+    parser.add_argument(
+        "--lead-minutes", type=float, default=DEFAULT_PREFETCH_LEAD.total_seconds() / 60
+    )
+    parser.add_argument("--hours", type=int, default=240, help="Decision horizon in hours")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent fetches")
+    parser.add_argument("--once", action="store_true", help="Run one check now and exit")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
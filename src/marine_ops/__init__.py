@@ -1,5 +1,18 @@
 """해양 운항 분석 툴킷. Marine operations analytics toolkit."""
 
+from .core.columnar import ColumnarTimeseries
+from .core.decision_cache import DecisionCache
+from .core.ensemble import EnsembleResult, fuse
+from .core.index import TimeseriesIndex
+from .core.marine_decision import (
+    MarineBatchOutput,
+    MarineInputs,
+    MarineOutput,
+    decide_and_eta,
+    decide_and_eta_batch,
+)
+from .core.probabilistic import ForecastError, ProbabilisticDecision, decide_probabilistic
+from .core.resample import align, resample, time_grid
 from .core.schema import (
     CSV_HEADER,
     CSV_TIMESTAMP_FORMAT,
@@ -13,15 +26,60 @@ from .core.schema import (
     UnitEnum,
 )
 from .core.settings import MarineOpsSettings
+from .core.sweep import SweepResult, coefficient_grid, sample_coefficients, sweep
+from .core.timeline import (
+    DecisionChange,
+    DecisionTimeline,
+    DepartureWindow,
+    IncrementalTimeline,
+    TimelineRoute,
+    TimelineUpdate,
+    evaluate_timeline,
+)
 from .core.units import (
     feet_to_meters,
+    haversine_nm,
     knots_to_meters_per_second,
     meters_per_second_to_knots,
     meters_to_feet,
+    round_array,
+)
+from .core.voyage import (
+    RouteSegments,
+    VoyagePlan,
+    WaypointRoute,
+    plan_voyages,
+    segment_routes,
 )
-from .core.marine_decision import MarineInputs, MarineOutput, decide_and_eta
 
 __all__ = [
+    "ColumnarTimeseries",
+    "DecisionCache",
+    "EnsembleResult",
+    "TimeseriesIndex",
+    "align",
+    "fuse",
+    "DecisionChange",
+    "DecisionTimeline",
+    "DepartureWindow",
+    "IncrementalTimeline",
+    "TimelineRoute",
+    "TimelineUpdate",
+    "evaluate_timeline",
+    "SweepResult",
+    "coefficient_grid",
+    "sample_coefficients",
+    "sweep",
+    "ForecastError",
+    "ProbabilisticDecision",
+    "decide_probabilistic",
+    "RouteSegments",
+    "VoyagePlan",
+    "WaypointRoute",
+    "plan_voyages",
+    "segment_routes",
+    "resample",
+    "time_grid",
     "CSV_HEADER",
     "CSV_TIMESTAMP_FORMAT",
     "MarineDataPoint",
@@ -34,10 +92,14 @@ __all__ = [
     "UnitEnum",
     "MarineOpsSettings",
     "feet_to_meters",
+    "haversine_nm",
     "knots_to_meters_per_second",
     "meters_per_second_to_knots",
     "meters_to_feet",
+    "round_array",
+    "MarineBatchOutput",
     "MarineInputs",
     "MarineOutput",
     "decide_and_eta",
+    "decide_and_eta_batch",
 ]
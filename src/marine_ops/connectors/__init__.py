@@ -1,17 +1,51 @@
 """커넥터 패키지. Connectors package."""
 
+from .cache import AsyncCachedConnector, CachedConnector, ForecastCache
+from .coalesce import AsyncCoalescingConnector, CoalescingConnector, RequestCoalescer
+from .fanout import DEFAULT_CONCURRENCY, fetch_forecasts_with_fallback, gather_positions
+from .http_pool import HttpClientRegistry
 from .open_meteo_fallback import (
     FALLBACK_STATUS_CODES,
+    AsyncOpenMeteoFallback,
     OpenMeteoFallback,
     fetch_forecast_with_fallback,
+    fetch_forecast_with_fallback_async,
 )
-from .stormglass import StormglassConnector
-from .worldtides import WorldTidesConnector
+from .routing import (
+    AsyncProviderRouter,
+    CircuitBreaker,
+    CircuitState,
+    NoHealthyProviderError,
+    ProviderHealth,
+    ProviderRouter,
+)
+from .stormglass import AsyncStormglassConnector, StormglassConnector
+from .worldtides import AsyncWorldTidesConnector, WorldTidesConnector
 
 __all__ = [
+    "AsyncCachedConnector",
+    "AsyncCoalescingConnector",
+    "CachedConnector",
+    "CircuitBreaker",
+    "CircuitState",
+    "CoalescingConnector",
+    "ForecastCache",
+    "DEFAULT_CONCURRENCY",
     "FALLBACK_STATUS_CODES",
+    "HttpClientRegistry",
+    "AsyncOpenMeteoFallback",
+    "AsyncProviderRouter",
+    "AsyncStormglassConnector",
+    "AsyncWorldTidesConnector",
+    "NoHealthyProviderError",
     "OpenMeteoFallback",
+    "ProviderHealth",
+    "ProviderRouter",
+    "RequestCoalescer",
     "StormglassConnector",
     "WorldTidesConnector",
     "fetch_forecast_with_fallback",
+    "fetch_forecast_with_fallback_async",
+    "fetch_forecasts_with_fallback",
+    "gather_positions",
 ]
@@ -0,0 +1,330 @@
+"""디스크 예보 캐시. Persistent on-disk forecast cache."""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from pydantic import ValidationError
+
+from ..core.columnar import datetime_to_epoch_us
+from ..core.fast_schema import FastTimeseries
+from ..core.schema import MarineTimeseries
+
+DEFAULT_GRID_RESOLUTION = 0.05  # degrees
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL_SECONDS: dict[str, float] = {
+    "stormglass": 6 * 3600.0,
+    "open-meteo": 3600.0,
+    "worldtides": 24 * 3600.0,
+}
+FALLBACK_TTL_SECONDS = 3600.0
+
+logger = logging.getLogger(__name__)
+
+
+def _touch(path: str | os.PathLike[str]) -> None:
+    # 파일시스템 타임스탬프 해상도가 거칠 수 있어 ns 단위로 명시 설정한다.
+    now_ns = time.time_ns()
+    os.utime(path, ns=(now_ns, now_ns))
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """캐시 파일 항목. Cache file entry parsed from its name."""
+
+    path: Path
+    start_us: int
+    end_us: int
+    created_ms: int
+
+    @classmethod
+    def parse(cls, path: Path) -> CacheEntry | None:
+        """파일명 해석. Parse ``<start_us>_<end_us>_<created_ms>.json``."""
+
+        try:
+            start_us, end_us, created_ms = path.stem.split("_")
+            return cls(path, int(start_us), int(end_us), int(created_ms))
+        except ValueError:
+            return None
+
+
+class ForecastCache:
+    """
+    공급자·격자·시간창 키 디스크 캐시. Disk cache keyed by provider, grid cell and window.
+
+    항목은 ``<root>/<provider>/<lat>_<lon>/<start>_<end>_<created>.json`` 파일이며 임시 파일
+    작성 후 ``os.replace`` 로 원자적으로 게시되므로 여러 프로세스가 안전하게 공유할 수 있다.
+    LRU 순서는 파일 mtime(조회 시 갱신)으로 관리한다.
+    Entries are ``<root>/<provider>/<lat>_<lon>/<start>_<end>_<created>.json`` files,
+    published atomically via a temporary file and ``os.replace`` so several processes can
+    share one directory. LRU order is tracked with file mtimes, touched on every hit.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        grid_resolution: float = DEFAULT_GRID_RESOLUTION,
+        ttl_seconds: Mapping[str, float] | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if grid_resolution <= 0:
+            raise ValueError("grid_resolution must be positive")
+        self.root = Path(root)
+        self.grid_resolution = grid_resolution
+        self.ttl_seconds = dict(DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds)
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def cell_dir(self, provider: str, latitude: float, longitude: float, variant: str = "") -> Path:
+        """격자 셀 디렉터리. Directory of the snapped grid cell."""
+
+        lat_cell = round(latitude / self.grid_resolution)
+        lon_cell = round(longitude / self.grid_resolution)
+        namespace = f"{provider}@{variant}" if variant else provider
+        return self.root / namespace / f"{lat_cell}_{lon_cell}"
+
+    def get(
+        self,
+        provider: str,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        variant: str = "",
+    ) -> MarineTimeseries | None:
+        """
+        요청 구간을 덮는 항목 조회. Look up an entry covering the requested window.
+
+        같은 창이든 더 넓은 창이든 항상 요청 구간으로 잘라 반환한다(공급자가 하루 단위로
+        응답하면 같은 창의 항목에도 구간 밖 시각이 들어 있다).
+        The entry is always sliced to ``start <= timestamp <= end``, whether its window is
+        exact or wider; providers answering whole days store rows outside even an exact window.
+        """
+
+        start_us = datetime_to_epoch_us(start)
+        end_us = datetime_to_epoch_us(end)
+        now_ms = int(self.clock() * 1000)
+        ttl_ms = int(self.ttl_seconds.get(provider, FALLBACK_TTL_SECONDS) * 1000)
+        candidates = [
+            entry
+            for entry in self._entries(self.cell_dir(provider, latitude, longitude, variant))
+            if entry.start_us <= start_us
+            and entry.end_us >= end_us
+            and now_ms - entry.created_ms <= ttl_ms
+        ]
+        candidates.sort(key=lambda entry: (entry.end_us - entry.start_us, -entry.created_ms))
+        for entry in candidates:
+            timeseries = self._load(entry.path)
+            if timeseries is None:
+                continue
+            self.hits += 1
+            return timeseries.window(start, end)
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        provider: str,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        timeseries: MarineTimeseries | FastTimeseries,
+        variant: str = "",
+    ) -> Path:
+        """항목 원자적 저장. Store an entry atomically."""
+
+        if isinstance(timeseries, FastTimeseries):
+            timeseries = timeseries.to_model()
+        directory = self.cell_dir(provider, latitude, longitude, variant)
+        directory.mkdir(parents=True, exist_ok=True)
+        start_us = datetime_to_epoch_us(start)
+        end_us = datetime_to_epoch_us(end)
+        target = directory / f"{start_us}_{end_us}_{int(self.clock() * 1000)}.json"
+        handle, temp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                stream.write(timeseries.model_dump_json().encode("utf-8"))
+                stream.flush()
+                os.fsync(stream.fileno())
+            _touch(temp_name)
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        for entry in self._entries(directory):
+            if entry.path != target and (entry.start_us, entry.end_us) == (start_us, end_us):
+                entry.path.unlink(missing_ok=True)
+        self.evict()
+        return target
+
+    def evict(self) -> int:
+        """LRU 용량 제한 적용. Evict least recently used entries above ``max_bytes``."""
+
+        files: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self.root.glob("*/*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """전체 항목 삭제. Remove every entry."""
+
+        for path in self.root.glob("*/*/*.json"):
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _entries(directory: Path) -> list[CacheEntry]:
+        try:
+            names = list(directory.iterdir())
+        except FileNotFoundError:
+            return []
+        return [
+            entry
+            for entry in (CacheEntry.parse(path) for path in names if path.suffix == ".json")
+            if entry is not None
+        ]
+
+    @staticmethod
+    def _load(path: Path) -> MarineTimeseries | None:
+        try:
+            data = path.read_bytes()
+            _touch(path)
+        except FileNotFoundError:
+            return None
+        try:
+            return MarineTimeseries.model_validate_json(data)
+        except ValidationError:
+            logger.warning("Discarding corrupt forecast cache entry %s", path)
+            path.unlink(missing_ok=True)
+            return None
+
+
+def request_variant(args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> str:
+    """추가 인자 식별자. Short identifier for extra connector arguments."""
+
+    if not args and not kwargs:
+        return ""
+    return hashlib.sha1(repr((args, sorted(kwargs.items()))).encode("utf-8")).hexdigest()[:12]
+
+
+class CachedConnector:
+    """
+    캐시 선행 커넥터 래퍼. Cache-first wrapper around a connector.
+
+    ``fetch_forecast``/``fetch_heights`` 를 가진 동기 커넥터를 감싼다. 추가 인자
+    (예: Stormglass ``source_priority``)는 별도 캐시 네임스페이스가 된다.
+    Wraps a sync connector exposing ``fetch_forecast``/``fetch_heights``. Extra arguments
+    (e.g. Stormglass ``source_priority``) get their own cache namespace.
+    """
+
+    def __init__(self, connector: Any, cache: ForecastCache) -> None:
+        self.connector = connector
+        self.cache = cache
+        self.provider: str = connector.provider
+
+    def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        *args: Any,
+        **kwargs: Any,
+    ) -> MarineTimeseries:
+        """캐시 우선 예보 조회. Cache-first forecast fetch."""
+
+        variant = request_variant(args, kwargs)
+        cached = self.cache.get(self.provider, latitude, longitude, start, end, variant)
+        if cached is not None:
+            return cached
+        timeseries = self.connector.fetch_forecast(latitude, longitude, start, end, *args, **kwargs)
+        self.cache.put(self.provider, latitude, longitude, start, end, timeseries, variant)
+        return timeseries.window(start, end)
+
+    def fetch_heights(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        hours: int = 72,
+    ) -> MarineTimeseries:
+        """캐시 우선 수위 조회. Cache-first tide height fetch."""
+
+        end = start + dt.timedelta(hours=hours)
+        cached = self.cache.get(self.provider, latitude, longitude, start, end)
+        if cached is not None:
+            return cached
+        timeseries = self.connector.fetch_heights(latitude, longitude, start, hours)
+        self.cache.put(self.provider, latitude, longitude, start, end, timeseries)
+        return timeseries.window(start, end)
+
+
+class AsyncCachedConnector:
+    """비동기 커넥터용 캐시 래퍼. Cache-first wrapper around an async connector."""
+
+    def __init__(self, connector: Any, cache: ForecastCache) -> None:
+        self.connector = connector
+        self.cache = cache
+        self.provider: str = connector.provider
+
+    async def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        *args: Any,
+        **kwargs: Any,
+    ) -> MarineTimeseries:
+        """캐시 우선 예보 비동기 조회. Cache-first async forecast fetch."""
+
+        variant = request_variant(args, kwargs)
+        cached = self.cache.get(self.provider, latitude, longitude, start, end, variant)
+        if cached is not None:
+            return cached
+        timeseries = await self.connector.fetch_forecast(
+            latitude, longitude, start, end, *args, **kwargs
+        )
+        self.cache.put(self.provider, latitude, longitude, start, end, timeseries, variant)
+        return timeseries.window(start, end)
+
+    async def fetch_heights(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        hours: int = 72,
+    ) -> MarineTimeseries:
+        """캐시 우선 수위 비동기 조회. Cache-first async tide height fetch."""
+
+        end = start + dt.timedelta(hours=hours)
+        cached = self.cache.get(self.provider, latitude, longitude, start, end)
+        if cached is not None:
+            return cached
+        timeseries = await self.connector.fetch_heights(latitude, longitude, start, hours)
+        self.cache.put(self.provider, latitude, longitude, start, end, timeseries)
+        return timeseries.window(start, end)
@@ -0,0 +1,247 @@
+"""중복 요청 병합 (single-flight). Single-flight coalescing of duplicate fetches."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ..core.columnar import datetime_to_epoch_us
+from ..core.fast_schema import FastTimeseries
+from ..core.schema import MarineTimeseries
+from .cache import request_variant
+
+FlightKey = tuple[str, str, float, float]
+
+
+@dataclass
+class _Flight:
+    start_us: int
+    end_us: int
+    future: Future[MarineTimeseries] = field(default_factory=Future)
+
+    def covers(self, start_us: int, end_us: int) -> bool:
+        return self.start_us <= start_us and self.end_us >= end_us
+
+
+class RequestCoalescer:
+    """
+    진행 중 요청 공유기. Shares in-flight fetches between concurrent callers.
+
+    같은 공급자·좌표(선택적 격자 스냅)에서 진행 중인 요청이 요청 구간을 덮으면 HTTP 호출과
+    파싱을 공유하고, 각 호출자는 자신의 구간으로 잘린 별도 시계열을 받는다. 스레드와 asyncio
+    호출자가 같은 레지스트리를 공유할 수 있다.
+    When an in-flight fetch for the same provider and position (optionally snapped to a
+    grid) covers the requested window, callers share its HTTP call and parse and each
+    gets its own series sliced to its window. Threads and asyncio tasks share one registry.
+    """
+
+    def __init__(self, grid_resolution: float | None = None) -> None:
+        self.grid_resolution = grid_resolution
+        self.issued = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._flights: dict[FlightKey, list[_Flight]] = {}
+
+    def stats(self) -> dict[str, int]:
+        """병합 통계. Coalescing counters."""
+
+        with self._lock:
+            in_flight = sum(len(flights) for flights in self._flights.values())
+            return {"issued": self.issued, "coalesced": self.coalesced, "in_flight": in_flight}
+
+    def run(
+        self,
+        provider: str,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        fetch: Callable[[], MarineTimeseries],
+        variant: str = "",
+    ) -> MarineTimeseries:
+        """스레드 호출자용 병합 실행. Coalesced call for threaded callers."""
+
+        key = self._key(provider, variant, latitude, longitude)
+        start_us, end_us = datetime_to_epoch_us(start), datetime_to_epoch_us(end)
+        flight, leader = self._join(key, start_us, end_us)
+        if not leader:
+            return self._slice(flight, flight.future.result(), start_us, end_us, start, end)
+        try:
+            result = fetch()
+        except BaseException as exc:
+            flight.future.set_exception(exc)
+            raise
+        finally:
+            self._leave(key, flight)
+        flight.future.set_result(result)
+        return result
+
+    async def run_async(
+        self,
+        provider: str,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        fetch: Callable[[], Awaitable[MarineTimeseries]],
+        variant: str = "",
+    ) -> MarineTimeseries:
+        """asyncio 호출자용 병합 실행. Coalesced call for asyncio callers."""
+
+        key = self._key(provider, variant, latitude, longitude)
+        start_us, end_us = datetime_to_epoch_us(start), datetime_to_epoch_us(end)
+        flight, leader = self._join(key, start_us, end_us)
+        if not leader:
+            result = await asyncio.wrap_future(flight.future)
+            return self._slice(flight, result, start_us, end_us, start, end)
+        try:
+            result = await fetch()
+        except BaseException as exc:
+            flight.future.set_exception(exc)
+            raise
+        finally:
+            self._leave(key, flight)
+        flight.future.set_result(result)
+        return result
+
+    def _key(self, provider: str, variant: str, latitude: float, longitude: float) -> FlightKey:
+        if self.grid_resolution is not None:
+            latitude = round(latitude / self.grid_resolution) * self.grid_resolution
+            longitude = round(longitude / self.grid_resolution) * self.grid_resolution
+        return provider, variant, latitude, longitude
+
+    def _join(self, key: FlightKey, start_us: int, end_us: int) -> tuple[_Flight, bool]:
+        with self._lock:
+            for flight in self._flights.get(key, ()):
+                if flight.covers(start_us, end_us):
+                    self.coalesced += 1
+                    return flight, False
+            flight = _Flight(start_us, end_us)
+            # 실행 중 상태로 두어 취소된 후속 호출자가 공유 Future 를 취소하지 못하게 한다.
+            flight.future.set_running_or_notify_cancel()
+            self._flights.setdefault(key, []).append(flight)
+            self.issued += 1
+            return flight, True
+
+    def _leave(self, key: FlightKey, flight: _Flight) -> None:
+        with self._lock:
+            flights = self._flights.get(key, [])
+            if flight in flights:
+                flights.remove(flight)
+            if not flights:
+                self._flights.pop(key, None)
+
+    @staticmethod
+    def _slice(
+        flight: _Flight,
+        result: MarineTimeseries | FastTimeseries,
+        start_us: int,
+        end_us: int,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries | FastTimeseries:
+        if (flight.start_us, flight.end_us) == (start_us, end_us):
+            if isinstance(result, FastTimeseries):
+                return FastTimeseries(list(result.points))
+            return MarineTimeseries.model_construct(points=list(result.points))
+        return result.window(start, end)
+
+
+class CoalescingConnector:
+    """동기 커넥터용 병합 래퍼. Coalescing wrapper around a sync connector."""
+
+    def __init__(self, connector: Any, coalescer: RequestCoalescer) -> None:
+        self.connector = connector
+        self.coalescer = coalescer
+        self.provider: str = connector.provider
+
+    def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        *args: Any,
+        **kwargs: Any,
+    ) -> MarineTimeseries:
+        """병합 예보 조회. Coalesced forecast fetch."""
+
+        return self.coalescer.run(
+            self.provider,
+            latitude,
+            longitude,
+            start,
+            end,
+            lambda: self.connector.fetch_forecast(latitude, longitude, start, end, *args, **kwargs),
+            request_variant(args, kwargs),
+        )
+
+    def fetch_heights(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        hours: int = 72,
+    ) -> MarineTimeseries:
+        """병합 수위 조회. Coalesced tide height fetch."""
+
+        return self.coalescer.run(
+            self.provider,
+            latitude,
+            longitude,
+            start,
+            start + dt.timedelta(hours=hours),
+            lambda: self.connector.fetch_heights(latitude, longitude, start, hours),
+        )
+
+
+class AsyncCoalescingConnector:
+    """비동기 커넥터용 병합 래퍼. Coalescing wrapper around an async connector."""
+
+    def __init__(self, connector: Any, coalescer: RequestCoalescer) -> None:
+        self.connector = connector
+        self.coalescer = coalescer
+        self.provider: str = connector.provider
+
+    async def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        *args: Any,
+        **kwargs: Any,
+    ) -> MarineTimeseries:
+        """병합 예보 비동기 조회. Coalesced async forecast fetch."""
+
+        return await self.coalescer.run_async(
+            self.provider,
+            latitude,
+            longitude,
+            start,
+            end,
+            lambda: self.connector.fetch_forecast(latitude, longitude, start, end, *args, **kwargs),
+            request_variant(args, kwargs),
+        )
+
+    async def fetch_heights(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        hours: int = 72,
+    ) -> MarineTimeseries:
+        """병합 수위 비동기 조회. Coalesced async tide height fetch."""
+
+        return await self.coalescer.run_async(
+            self.provider,
+            latitude,
+            longitude,
+            start,
+            start + dt.timedelta(hours=hours),
+            lambda: self.connector.fetch_heights(latitude, longitude, start, hours),
+        )
@@ -0,0 +1,70 @@
+"""다중 지점 동시 수집. Concurrent multi-site fetching."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+from typing import Awaitable, Callable, Iterable, Sequence, TypeVar
+
+from ..core.schema import MarineTimeseries
+from .open_meteo_fallback import (
+    FALLBACK_STATUS_CODES,
+    AsyncOpenMeteoFallback,
+    fetch_forecast_with_fallback_async,
+)
+from .stormglass import AsyncStormglassConnector
+
+DEFAULT_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+async def gather_positions(
+    positions: Iterable[tuple[float, float]],
+    fetch: Callable[[float, float], Awaitable[T]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[T | BaseException]:
+    """
+    동시성 제한 하에 지점별 조회 실행. Run per-position fetches under a concurrency limit.
+
+    결과는 입력 순서를 따른다. ``return_exceptions`` 가 거짓이면 첫 실패에서 나머지를 취소한다.
+    Results follow input order. Unless ``return_exceptions`` is set, the first failure
+    cancels the remaining fetches and is re-raised.
+    """
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(latitude: float, longitude: float) -> T:
+        async with semaphore:
+            return await fetch(latitude, longitude)
+
+    tasks = [asyncio.ensure_future(run(latitude, longitude)) for latitude, longitude in positions]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def fetch_forecasts_with_fallback(
+    positions: Iterable[tuple[float, float]],
+    start: dt.datetime,
+    end: dt.datetime,
+    primary: AsyncStormglassConnector,
+    fallback: AsyncOpenMeteoFallback,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retry_statuses: Sequence[int] = FALLBACK_STATUS_CODES,
+    return_exceptions: bool = False,
+) -> list[MarineTimeseries | BaseException]:
+    """여러 지점 예보 동시 조회 (폴백 포함). Fetch many forecasts concurrently with fallback."""
+
+    async def fetch(latitude: float, longitude: float) -> MarineTimeseries:
+        return await fetch_forecast_with_fallback_async(
+            latitude, longitude, start, end, primary, fallback, retry_statuses
+        )
+
+    return await gather_positions(positions, fetch, concurrency, return_exceptions)
@@ -0,0 +1,148 @@
+"""신뢰 공급자 고속 파싱 유틸. Trusted-source fast-path parsing helpers."""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from ..core.columnar import MISSING_QUALITY, ColumnarTimeseries, datetime_to_epoch_us
+from ..core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from ..io.json_codec import loads
+
+UTC_SUFFIXES: tuple[str, ...] = ("Z", "+00:00", "+0000")
+_NAIVE_ISO = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?")
+
+
+def decode_payload(content: bytes) -> dict[str, Any]:
+    """
+    응답 본문 디코딩. Decode a response body straight from bytes.
+
+    ``response.json()`` 은 본문을 문자열로 바꾼 뒤 표준 json 으로 디코딩하므로, 바이트를
+    그대로 ``io.loads`` (orjson 설치 시 orjson)에 넘긴다.
+    ``response.json()`` decodes the body to text and parses it with stdlib json; the raw bytes
+    go to ``io.loads`` instead (orjson when installed).
+    """
+
+    payload = loads(content)
+    if not isinstance(payload, dict):
+        raise ValueError("provider payload must be a JSON object")
+    return payload
+
+
+def parse_utc_timestamp(text: str) -> dt.datetime:
+    """ISO-8601 문자열을 UTC datetime으로 변환. Parse an ISO-8601 string as UTC."""
+
+    timestamp = dt.datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=dt.timezone.utc)
+    return timestamp.astimezone(dt.timezone.utc)
+
+
+def parse_epoch_us(texts: Iterable[str]) -> np.ndarray:
+    """
+    ISO-8601 문자열 배열을 epoch 마이크로초로 변환. Parse ISO-8601 strings to epoch µs.
+
+    모든 값이 같은 UTC 표기(``Z``/``+00:00``/``+0000`` 또는 오프셋 없음)이면 numpy 로 한 번에
+    변환하고, 아니면 값마다 ``parse_utc_timestamp`` 를 쓴다.
+    When every value shares one UTC spelling (``Z``/``+00:00``/``+0000`` or no offset) the
+    array is converted by numpy in one call; otherwise each value goes through
+    ``parse_utc_timestamp``.
+    """
+
+    items = texts if isinstance(texts, list) else list(texts)
+    naive = _strip_utc_suffix(items)
+    if naive is not None:
+        return np.array(naive, dtype="datetime64[us]").astype(np.int64)
+    return np.fromiter(
+        (datetime_to_epoch_us(parse_utc_timestamp(text)) for text in items), dtype=np.int64
+    )
+
+
+def _strip_utc_suffix(items: list[str]) -> list[str] | None:
+    # 공통 UTC 접미사를 떼고, 남은 값이 모두 오프셋 없는 ISO-8601 일 때만 반환한다.
+    if not items or not isinstance(items[0], str):
+        return None
+    suffix = next((suffix for suffix in UTC_SUFFIXES if items[0].endswith(suffix)), "")
+    cut = len(suffix)
+    naive = [
+        text[: len(text) - cut] for text in items if isinstance(text, str) and text.endswith(suffix)
+    ]
+    if len(naive) != len(items) or not all(map(_NAIVE_ISO.fullmatch, naive)):
+        return None
+    return naive
+
+
+def numeric_column(values: Sequence[object], size: int, label: str) -> np.ndarray:
+    """
+    배열 단위 수치 검증. Validate one payload array as numeric, once.
+
+    짧은 배열은 결측(NaN)으로 채우고 None은 결측으로 처리한다.
+    Short arrays are padded with NaN and ``None`` becomes NaN.
+    """
+
+    try:
+        column = np.array(values[:size], dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{label} must contain only numbers or null") from exc
+    if column.ndim != 1:
+        raise ValueError(f"{label} must be a flat array")
+    if column.size < size:
+        column = np.concatenate([column, np.full(size - column.size, np.nan)])
+    return column
+
+
+def source_column(
+    entries: Sequence[object], priority: Sequence[str], size: int, label: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    공급원 우선순위 열 선택. Pick one value per row from per-source objects, by priority.
+
+    우선순위 공급원마다 값 배열을 한 번 검증해 빈 행만 채우고, 어느 우선순위 공급원에도 값이
+    없는 행 번호를 함께 반환한다.
+    Validates one array per priority source and fills only the rows still empty; also returns
+    the rows no priority source covered.
+    """
+
+    column = np.full(size, np.nan)
+    missing = np.ones(size, dtype=bool)
+    for source in priority:
+        values = numeric_column(
+            [entry.get(source) if type(entry) is dict else None for entry in entries],
+            size,
+            label,
+        )
+        fill = missing & ~np.isnan(values)
+        column[fill] = values[fill]
+        missing &= ~fill
+        if not missing.any():
+            break
+    return column, np.flatnonzero(missing)
+
+
+def columns_to_columnar(
+    timestamps_us: np.ndarray,
+    latitude: float,
+    longitude: float,
+    columns: Mapping[MarineVariable, np.ndarray],
+    units: Mapping[MarineVariable, UnitEnum],
+    metadata: TimeseriesMetadata,
+) -> ColumnarTimeseries:
+    """
+    검증된 열에서 컬럼형 시계열 구성. Build a columnar timeseries from validated columns.
+
+    측정값이 하나도 없는 시각은 기존 커넥터와 같이 건너뛴다.
+    Hours without any measurement are skipped, as in the per-hour parsers.
+    """
+
+    columnar = ColumnarTimeseries.from_arrays(
+        timestamps_us, latitude, longitude, columns, units, metadata
+    )
+    present = np.zeros(len(columnar), dtype=bool)
+    for codes in columnar.quality.values():
+        present |= codes != MISSING_QUALITY
+    if not present.all():
+        columnar = columnar.take(np.flatnonzero(present))
+    return columnar
@@ -0,0 +1,138 @@
+"""공유 HTTP 클라이언트 풀. Shared pooled HTTP clients."""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from types import TracebackType
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
+DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds
+
+HostKey = tuple[str, str, int | None]
+
+
+def http2_available() -> bool:
+    """HTTP/2 (h2) 사용 가능 여부. Whether the optional ``h2`` package is installed."""
+
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """
+    호스트별 공유 HTTP 클라이언트 레지스트리. Registry of pooled clients, one per host.
+
+    같은 호스트를 호출하는 커넥터는 하나의 연결 풀을 공유하므로 keep-alive 연결과 TLS 세션이
+    재사용된다. HTTP/2 는 ``h2`` 가 설치된 경우에만 켠다. 동기·비동기 클라이언트는 별도 풀을
+    가지며 ``close``/``aclose`` 또는 컨텍스트 관리자로 정리한다.
+    Connectors calling the same host share one connection pool, so keep-alive connections
+    and TLS sessions are reused. HTTP/2 is only enabled when ``h2`` is installed. Sync and
+    async clients keep separate pools and are released via ``close``/``aclose`` or a
+    context manager.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = True,
+        verify: str | bool = True,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be positive")
+        if max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections must be non-negative")
+        self.timeout = httpx.Timeout(timeout, connect=min(timeout, DEFAULT_CONNECT_TIMEOUT))
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_keepalive_connections, max_connections),
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and http2_available()
+        self.verify = verify
+        self._lock = threading.Lock()
+        self._clients: dict[HostKey, httpx.Client] = {}
+        self._async_clients: dict[HostKey, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def host_key(url: str) -> HostKey:
+        """URL 의 호스트 키. Pool key (scheme, host, port) of a URL."""
+
+        parsed = httpx.URL(url)
+        return parsed.scheme, parsed.host, parsed.port
+
+    def client(self, url: str) -> httpx.Client:
+        """호스트 공유 동기 클라이언트. Shared sync client for the URL's host."""
+
+        key = self.host_key(url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2, verify=self.verify
+                )
+                self._clients[key] = client
+            return client
+
+    def async_client(self, url: str) -> httpx.AsyncClient:
+        """호스트 공유 비동기 클라이언트. Shared async client for the URL's host."""
+
+        key = self.host_key(url)
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2, verify=self.verify
+                )
+                self._async_clients[key] = client
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients) + len(self._async_clients)
+
+    def close(self) -> None:
+        """동기 클라이언트 종료. Close every sync client."""
+
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """모든 클라이언트 종료. Close every async and sync client."""
+
+        with self._lock:
+            clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for client in clients:
+            await client.aclose()
+        self.close()
+
+    def __enter__(self) -> HttpClientRegistry:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> HttpClientRegistry:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
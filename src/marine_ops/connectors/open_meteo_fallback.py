@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
-from typing import TYPE_CHECKING, Any, Sequence, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Sequence, cast
 
 import httpx
+import numpy as np
 from pydantic import HttpUrl
 
+from ..core.columnar import ColumnarTimeseries
 from ..core.schema import (
     MarineDataPoint,
     MarineMeasurement,
@@ -18,59 +20,71 @@ from ..core.schema import (
     TimeseriesMetadata,
     UnitEnum,
 )
+from .fast_path import columns_to_columnar, decode_payload, numeric_column, parse_epoch_us
 
 if TYPE_CHECKING:
-    from .stormglass import StormglassConnector
+    from .stormglass import AsyncStormglassConnector, StormglassConnector
 
 OPEN_METEO_URL = "https://marine-api.open-meteo.com/v1/marine"
 FALLBACK_STATUS_CODES: tuple[int, ...] = (408, 425, 429, 500, 502, 503, 504)
+OPEN_METEO_PARAMS: tuple[tuple[str, MarineVariable, UnitEnum], ...] = (
+    ("significant_wave_height", MarineVariable.SIGNIFICANT_WAVE_HEIGHT, UnitEnum.METERS),
+    ("wave_direction", MarineVariable.SWELL_DIRECTION, UnitEnum.DEGREES),
+    ("wave_period", MarineVariable.SWELL_PERIOD, UnitEnum.SECONDS),
+    ("wind_speed_10m", MarineVariable.WIND_SPEED_10M, UnitEnum.METERS_PER_SECOND),
+    ("wind_direction_10m", MarineVariable.WIND_DIRECTION_10M, UnitEnum.DEGREES),
+    ("visibility", MarineVariable.VISIBILITY, UnitEnum.KILOMETERS),
+)
+OPEN_METEO_UNITS: dict[MarineVariable, UnitEnum] = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+    MarineVariable.WIND_DIRECTION_10M: UnitEnum.DEGREES,
+    MarineVariable.VISIBILITY: UnitEnum.KILOMETERS,
+    MarineVariable.SWELL_DIRECTION: UnitEnum.DEGREES,
+    MarineVariable.SWELL_PERIOD: UnitEnum.SECONDS,
+}
 
 logger = logging.getLogger(__name__)
 
 
-class OpenMeteoFallback:
-    """Open-Meteo 예보 폴백. Open-Meteo forecast fallback."""
+class _OpenMeteoBase:
+    """Open-Meteo 요청·파싱 공통부. Shared Open-Meteo request and parsing logic."""
 
-    def __init__(
-        self,
-        base_url: str = OPEN_METEO_URL,
-        client: httpx.Client | None = None,
-        timeout: float = 10.0,
-    ) -> None:
+    provider: ClassVar[str] = "open-meteo"
+
+    def __init__(self, base_url: str, trusted: bool) -> None:
         self.base_url = base_url
-        self.client = client or httpx.Client(timeout=timeout)
+        self.trusted = trusted
 
-    def fetch_forecast(
-        self,
+    @staticmethod
+    def _request_params(
         latitude: float,
         longitude: float,
         start: dt.datetime,
         end: dt.datetime,
-    ) -> MarineTimeseries:
-        """Open-Meteo 해양 예보 조회. Fetch Open-Meteo marine forecast."""
-
-        params: dict[str, str | float] = {
+    ) -> dict[str, str | float]:
+        return {
             "latitude": latitude,
             "longitude": longitude,
-            "hourly": "significant_wave_height,wave_direction,wave_period,wind_speed_10m,wind_direction_10m,visibility",  # noqa: E501
+            "hourly": ",".join(key for key, *_ in OPEN_METEO_PARAMS),
             "start_date": start.date().isoformat(),
             "end_date": end.date().isoformat(),
             "timezone": "UTC",
         }
-        response = self.client.get(self.base_url, params=params)
-        response.raise_for_status()
-        payload = response.json()
+
+    def parse_forecast(
+        self,
+        payload: dict[str, Any],
+        latitude: float,
+        longitude: float,
+    ) -> MarineTimeseries:
+        """Open-Meteo 응답 파싱. Parse an Open-Meteo response payload."""
+
+        if self.trusted:
+            return self.parse_forecast_columnar(payload, latitude, longitude).to_timeseries()
         hourly = payload.get("hourly", {})
         timestamps = hourly.get("time", [])
         points: list[MarineDataPoint] = []
-        metadata_units = {
-            MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
-            MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
-            MarineVariable.WIND_DIRECTION_10M: UnitEnum.DEGREES,
-            MarineVariable.VISIBILITY: UnitEnum.KILOMETERS,
-            MarineVariable.SWELL_DIRECTION: UnitEnum.DEGREES,
-            MarineVariable.SWELL_PERIOD: UnitEnum.SECONDS,
-        }
         for index, timestamp_str in enumerate(timestamps):
             timestamp = dt.datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
             if timestamp.tzinfo is None:
@@ -78,60 +92,14 @@ class OpenMeteoFallback:
             else:
                 timestamp = timestamp.astimezone(dt.timezone.utc)
             measurements: list[MarineMeasurement] = []
-            self._append_measurement(
-                hourly,
-                "significant_wave_height",
-                index,
-                MarineVariable.SIGNIFICANT_WAVE_HEIGHT,
-                UnitEnum.METERS,
-                measurements,
-            )
-            self._append_measurement(
-                hourly,
-                "wave_direction",
-                index,
-                MarineVariable.SWELL_DIRECTION,
-                UnitEnum.DEGREES,
-                measurements,
-            )
-            self._append_measurement(
-                hourly,
-                "wave_period",
-                index,
-                MarineVariable.SWELL_PERIOD,
-                UnitEnum.SECONDS,
-                measurements,
-            )
-            self._append_measurement(
-                hourly,
-                "wind_speed_10m",
-                index,
-                MarineVariable.WIND_SPEED_10M,
-                UnitEnum.METERS_PER_SECOND,
-                measurements,
-            )
-            self._append_measurement(
-                hourly,
-                "wind_direction_10m",
-                index,
-                MarineVariable.WIND_DIRECTION_10M,
-                UnitEnum.DEGREES,
-                measurements,
-            )
-            self._append_measurement(
-                hourly,
-                "visibility",
-                index,
-                MarineVariable.VISIBILITY,
-                UnitEnum.KILOMETERS,
-                measurements,
-            )
+            for key, variable, unit in OPEN_METEO_PARAMS:
+                self._append_measurement(hourly, key, index, variable, unit, measurements)
             if not measurements:
                 continue
             metadata = TimeseriesMetadata(
-                source="open-meteo",
+                source=self.provider,
                 source_url=cast(HttpUrl, str(httpx.URL(self.base_url))),
-                units=metadata_units,
+                units=OPEN_METEO_UNITS,
             )
             points.append(
                 MarineDataPoint(
@@ -143,6 +111,34 @@ class OpenMeteoFallback:
             )
         return MarineTimeseries(points=points)
 
+    def parse_forecast_columnar(
+        self,
+        payload: dict[str, Any],
+        latitude: float,
+        longitude: float,
+    ) -> ColumnarTimeseries:
+        """배열 단위 검증 고속 파싱. Array-validated fast-path parsing to columnar form."""
+
+        hourly = payload.get("hourly", {})
+        timestamps = hourly.get("time", [])
+        if not isinstance(timestamps, list):
+            raise ValueError("Open-Meteo payload 'hourly.time' must be a list")
+        size = len(timestamps)
+        columns: dict[MarineVariable, np.ndarray] = {}
+        for key, variable, _ in OPEN_METEO_PARAMS:
+            values = hourly.get(key) or []
+            if not isinstance(values, list):
+                raise ValueError(f"Open-Meteo payload 'hourly.{key}' must be a list")
+            columns[variable] = numeric_column(values, size, f"Open-Meteo {key}")
+        metadata = TimeseriesMetadata(
+            source=self.provider,
+            source_url=cast(HttpUrl, str(httpx.URL(self.base_url))),
+            units=OPEN_METEO_UNITS,
+        )
+        return columns_to_columnar(
+            parse_epoch_us(timestamps), latitude, longitude, columns, OPEN_METEO_UNITS, metadata
+        )
+
     @staticmethod
     def _append_measurement(
         hourly: dict[str, Any],
@@ -164,6 +160,62 @@ class OpenMeteoFallback:
         container.append(MarineMeasurement(variable=variable, value=float(value), unit=unit))
 
 
+class OpenMeteoFallback(_OpenMeteoBase):
+    """Open-Meteo 예보 폴백. Open-Meteo forecast fallback."""
+
+    def __init__(
+        self,
+        base_url: str = OPEN_METEO_URL,
+        client: httpx.Client | None = None,
+        timeout: float = 10.0,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(base_url, trusted)
+        self.client = client or httpx.Client(timeout=timeout)
+
+    def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries:
+        """Open-Meteo 해양 예보 조회. Fetch Open-Meteo marine forecast."""
+
+        params = self._request_params(latitude, longitude, start, end)
+        response = self.client.get(self.base_url, params=params)
+        response.raise_for_status()
+        return self.parse_forecast(decode_payload(response.content), latitude, longitude)
+
+
+class AsyncOpenMeteoFallback(_OpenMeteoBase):
+    """비동기 Open-Meteo 예보 폴백. Async Open-Meteo forecast fallback."""
+
+    def __init__(
+        self,
+        base_url: str = OPEN_METEO_URL,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 10.0,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(base_url, trusted)
+        self.client = client or httpx.AsyncClient(timeout=timeout)
+
+    async def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries:
+        """Open-Meteo 해양 예보 비동기 조회. Fetch Open-Meteo marine forecast."""
+
+        params = self._request_params(latitude, longitude, start, end)
+        response = await self.client.get(self.base_url, params=params)
+        response.raise_for_status()
+        return self.parse_forecast(decode_payload(response.content), latitude, longitude)
+
+
 def fetch_forecast_with_fallback(
     latitude: float,
     longitude: float,
@@ -185,3 +237,26 @@ def fetch_forecast_with_fallback(
     except (httpx.TimeoutException, httpx.RequestError) as exc:
         logger.warning("Stormglass request error triggered fallback: %s", exc)
     return fallback.fetch_forecast(latitude, longitude, start, end)
+
+
+async def fetch_forecast_with_fallback_async(
+    latitude: float,
+    longitude: float,
+    start: dt.datetime,
+    end: dt.datetime,
+    primary: "AsyncStormglassConnector",
+    fallback: "AsyncOpenMeteoFallback",
+    retry_statuses: Sequence[int] = FALLBACK_STATUS_CODES,
+) -> MarineTimeseries:
+    """Stormglass 장애 시 비동기 폴백. Async Open-Meteo fallback when Stormglass fails."""
+
+    try:
+        return await primary.fetch_forecast(latitude, longitude, start, end)
+    except httpx.HTTPStatusError as exc:
+        status = exc.response.status_code
+        if status not in retry_statuses:
+            raise
+        logger.warning("Stormglass HTTP %s triggered fallback: %s", status, exc.response.text)
+    except (httpx.TimeoutException, httpx.RequestError) as exc:
+        logger.warning("Stormglass request error triggered fallback: %s", exc)
+    return await fallback.fetch_forecast(latitude, longitude, start, end)
@@ -0,0 +1,498 @@
+"""서킷 브레이커 기반 공급자 라우팅. Circuit-breaking, latency-aware provider routing."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterator, Sequence
+
+import httpx
+import numpy as np
+
+from ..core.schema import MarineTimeseries
+from .open_meteo_fallback import FALLBACK_STATUS_CODES
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RECOVERY_SECONDS = 30.0
+DEFAULT_LATENCY_WINDOW = 256
+MAX_TRANSITIONS = 256
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """서킷 상태. Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class NoHealthyProviderError(RuntimeError):
+    """모든 공급자 차단. Raised when every provider's circuit is open."""
+
+
+@dataclass(frozen=True)
+class CircuitTransition:
+    """서킷 상태 전이 기록. Recorded circuit state transition."""
+
+    provider: str
+    previous: CircuitState
+    current: CircuitState
+    at: dt.datetime
+    reason: str
+
+
+@dataclass(frozen=True)
+class ProviderHealth:
+    """대시보드용 공급자 상태 스냅샷. Provider health snapshot for dashboards."""
+
+    provider: str
+    state: CircuitState
+    consecutive_failures: int
+    successes: int
+    failures: int
+    skipped: int
+    hedged: int
+    p50_ms: float | None
+    p95_ms: float | None
+
+
+class CircuitBreaker:
+    """
+    공급자별 서킷 브레이커. Per-provider circuit breaker.
+
+    연속 실패가 ``failure_threshold`` 에 도달하면 열리고(OPEN) 호출을 즉시 거부한다.
+    ``recovery_seconds`` 후 반개방(HALF_OPEN) 상태에서 시험 호출 1건을 허용하며, 성공하면
+    닫히고(CLOSED) 실패하면 다시 열린다.
+    Opens after ``failure_threshold`` consecutive failures and rejects calls immediately.
+    After ``recovery_seconds`` it lets one probe through in the half-open state; success
+    closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_seconds: float = DEFAULT_RECOVERY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        on_transition: Callable[[CircuitTransition], None] | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.clock = clock
+        self.on_transition = on_transition
+        self.consecutive_failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 상태 (복구 시간 경과 반영). Current state, honouring the recovery timer."""
+
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부. Whether a call may go through now."""
+
+        with self._lock:
+            self._maybe_half_open()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """성공 기록. Record a successful call."""
+
+        with self._lock:
+            self.consecutive_failures = 0
+            self._probing = False
+            if self._state is not CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED, "probe succeeded")
+
+    def record_failure(self, reason: str = "failure") -> None:
+        """실패 기록. Record a failed call."""
+
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probing = False
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED
+                and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = self.clock()
+                self._transition(CircuitState.OPEN, reason)
+
+    def release(self) -> None:
+        """
+        중립 결과의 시험 권한 반납. Release the probe slot without recording an outcome.
+
+        취소되었거나 가용성과 무관한 오류(4xx, 파싱 오류)로 끝난 반개방 시험 호출은 성공·실패를
+        기록하지 않으므로 다음 호출이 다시 시험하게 한다.
+        A half-open probe that was cancelled or ended in an error unrelated to availability
+        (4xx, parse errors) records neither outcome, so the next call probes again.
+        """
+
+        with self._lock:
+            self._probing = False
+
+    def _maybe_half_open(self) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and self.clock() - self._opened_at >= self.recovery_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN, "recovery timeout elapsed")
+
+    def _transition(self, current: CircuitState, reason: str) -> None:
+        previous, self._state = self._state, current
+        logger.info(
+            "Circuit %s: %s -> %s (%s)", self.provider, previous.value, current.value, reason
+        )
+        if self.on_transition is not None:
+            self.on_transition(
+                CircuitTransition(
+                    self.provider, previous, current, dt.datetime.now(dt.timezone.utc), reason
+                )
+            )
+
+
+class LatencyTracker:
+    """최근 지연 시간 백분위. Rolling latency percentiles over the last N calls."""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """지연 시간 기록. Record one call latency in seconds."""
+
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """백분위 지연 (초). Latency percentile in seconds, ``None`` without samples."""
+
+        with self._lock:
+            if not self._samples:
+                return None
+            return float(np.percentile(np.fromiter(self._samples, dtype=np.float64), q))
+
+
+class _ProviderRouterBase:
+    """라우터 상태·분류 공통부. Shared router state and error classification."""
+
+    def __init__(
+        self,
+        providers: Sequence[Any],
+        retry_statuses: Sequence[int] = FALLBACK_STATUS_CODES,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_seconds: float = DEFAULT_RECOVERY_SECONDS,
+        hedge_after: float | None = None,
+        latency_window: int = DEFAULT_LATENCY_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not providers:
+            raise ValueError("at least one provider is required")
+        names = [provider.provider for provider in providers]
+        if len(set(names)) != len(names):
+            raise ValueError("provider names must be unique")
+        if hedge_after is not None and hedge_after <= 0:
+            raise ValueError("hedge_after must be positive")
+        self.providers = list(providers)
+        self.retry_statuses = frozenset(retry_statuses)
+        self.hedge_after = hedge_after
+        self.transitions: deque[CircuitTransition] = deque(maxlen=MAX_TRANSITIONS)
+        self.breakers = {
+            name: CircuitBreaker(
+                name, failure_threshold, recovery_seconds, clock, self.transitions.append
+            )
+            for name in names
+        }
+        self.latency = {name: LatencyTracker(latency_window) for name in names}
+        self._counts = {
+            name: {"successes": 0, "failures": 0, "skipped": 0, "hedged": 0} for name in names
+        }
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> list[ProviderHealth]:
+        """공급자별 상태 스냅샷. Health snapshot of every provider, in routing order."""
+
+        health = []
+        for provider in self.providers:
+            name = provider.provider
+            breaker = self.breakers[name]
+            p50 = self.latency[name].percentile(50)
+            p95 = self.latency[name].percentile(95)
+            with self._lock:
+                counts = dict(self._counts[name])
+            health.append(
+                ProviderHealth(
+                    provider=name,
+                    state=breaker.state,
+                    consecutive_failures=breaker.consecutive_failures,
+                    p50_ms=None if p50 is None else p50 * 1000,
+                    p95_ms=None if p95 is None else p95 * 1000,
+                    **counts,
+                )
+            )
+        return health
+
+    def _allowed(self) -> Iterator[Any]:
+        # 반개방 시험 호출을 낭비하지 않도록 실제 호출 직전에 허용 여부를 묻는다.
+        for provider in self.providers:
+            if self.breakers[provider.provider].allow():
+                yield provider
+            else:
+                self._count(provider.provider, "skipped")
+
+    def _first(self, remaining: Iterator[Any]) -> Any:
+        provider = next(remaining, None)
+        if provider is None:
+            raise NoHealthyProviderError("every provider circuit is open")
+        return provider
+
+    def _retryable(self, error: BaseException) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, (httpx.TimeoutException, httpx.RequestError))
+
+    def _count(self, name: str, key: str) -> None:
+        with self._lock:
+            self._counts[name][key] += 1
+
+    def _record(self, name: str, elapsed: float, error: BaseException | None) -> bool:
+        """결과 기록 후 다음 공급자 시도 여부 반환. Record an outcome; True to try the next."""
+
+        if error is None:
+            self.latency[name].record(elapsed)
+            self.breakers[name].record_success()
+            self._count(name, "successes")
+            return False
+        if not self._retryable(error):
+            # 요청·파싱 오류는 장애도 성공도 아니므로 반개방 서킷을 닫지 않는다.
+            self.breakers[name].release()
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            reason = f"HTTP {error.response.status_code}"
+        else:
+            reason = type(error).__name__
+        self.latency[name].record(elapsed)
+        self.breakers[name].record_failure(reason)
+        self._count(name, "failures")
+        logger.warning("%s %s triggered fallback", name, reason)
+        return True
+
+
+class ProviderRouter(_ProviderRouterBase):
+    """
+    동기 공급자 라우터. Sync provider router with circuit breakers and hedging.
+
+    공급자를 순서대로 시도하되 서킷이 열린 공급자는 즉시 건너뛴다. ``hedge_after`` 초 안에
+    응답이 없으면 다음 공급자를 동시에 호출하고 먼저 성공한 응답을 쓴다(헤징 호출은 스레드
+    풀에서 실행되며 늦은 응답도 상태 기록에 반영된다).
+    Tries providers in order and skips open circuits immediately. When ``hedge_after`` is
+    set and the current provider has not answered within that budget, the next provider is
+    fired concurrently and the first success wins; hedged calls run on a thread pool and
+    late answers still feed the breaker and latency stats.
+    """
+
+    def __init__(self, providers: Sequence[Any], **kwargs: Any) -> None:
+        super().__init__(providers, **kwargs)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries:
+        """라우팅 예보 조회. Fetch a forecast through the router."""
+
+        remaining = self._allowed()
+        first = self._first(remaining)
+        if self.hedge_after is None:
+            last_error: BaseException | None = None
+            for provider in itertools.chain((first,), remaining):
+                started = time.perf_counter()
+                try:
+                    result = provider.fetch_forecast(latitude, longitude, start, end)
+                except Exception as exc:
+                    if not self._record(provider.provider, time.perf_counter() - started, exc):
+                        raise
+                    last_error = exc
+                    continue
+                self._record(provider.provider, time.perf_counter() - started, None)
+                return result
+            assert last_error is not None
+            raise last_error
+        return self._fetch_hedged(first, remaining, latitude, longitude, start, end)
+
+    def close(self) -> None:
+        """헤징 스레드 풀 종료. Shut down the hedging thread pool."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _fetch_hedged(
+        self,
+        first: Any,
+        remaining: Iterator[Any],
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2 * len(self.providers))
+
+        def launch(provider: Any) -> Future[MarineTimeseries]:
+            started = time.perf_counter()
+
+            def call() -> MarineTimeseries:
+                try:
+                    result = provider.fetch_forecast(latitude, longitude, start, end)
+                except Exception as exc:
+                    self._record(provider.provider, time.perf_counter() - started, exc)
+                    raise
+                self._record(provider.provider, time.perf_counter() - started, None)
+                return result
+
+            assert self._executor is not None
+            return self._executor.submit(call)
+
+        pending = {launch(first)}
+        last_error: BaseException | None = None
+        exhausted = False
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=None if exhausted else self.hedge_after,
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                provider = next(remaining, None)
+                if provider is None:
+                    exhausted = True
+                    continue
+                self._count(provider.provider, "hedged")
+                pending.add(launch(provider))
+                continue
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                if not self._retryable(error):
+                    raise error
+                last_error = error
+            if not pending:
+                provider = next(remaining, None)
+                if provider is not None:
+                    pending.add(launch(provider))
+        assert last_error is not None
+        raise last_error
+
+
+class AsyncProviderRouter(_ProviderRouterBase):
+    """
+    비동기 공급자 라우터. Async provider router with circuit breakers and hedging.
+
+    동기 라우터와 같은 규칙을 따르며, 헤징에서 진 호출은 취소된다.
+    Same rules as :class:`ProviderRouter`; the losing call of a hedge is cancelled.
+    """
+
+    async def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries:
+        """라우팅 예보 비동기 조회. Fetch a forecast through the router asynchronously."""
+
+        remaining = self._allowed()
+        first = self._first(remaining)
+        tasks: set[asyncio.Task[MarineTimeseries]] = set()
+
+        def launch(provider: Any) -> None:
+            tasks.add(asyncio.ensure_future(self._call(provider, latitude, longitude, start, end)))
+
+        launch(first)
+        last_error: BaseException | None = None
+        exhausted = self.hedge_after is None
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks,
+                    timeout=None if exhausted else self.hedge_after,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    provider = next(remaining, None)
+                    if provider is None:
+                        exhausted = True
+                    else:
+                        self._count(provider.provider, "hedged")
+                        launch(provider)
+                    continue
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not self._retryable(error):
+                        raise error
+                    last_error = error
+                if not tasks:
+                    provider = next(remaining, None)
+                    if provider is not None:
+                        launch(provider)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # 취소된 호출이 서킷 시험 권한을 반납할 때까지 기다린다.
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        assert last_error is not None
+        raise last_error
+
+    async def _call(
+        self,
+        provider: Any,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+    ) -> MarineTimeseries:
+        started = time.perf_counter()
+        try:
+            result = await provider.fetch_forecast(latitude, longitude, start, end)
+        except asyncio.CancelledError:
+            self.breakers[provider.provider].release()
+            raise
+        except Exception as exc:
+            self._record(provider.provider, time.perf_counter() - started, exc)
+            raise
+        self._record(provider.provider, time.perf_counter() - started, None)
+        return result
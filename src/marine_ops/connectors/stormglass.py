@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any, Sequence, cast
+from typing import Any, ClassVar, Sequence, cast
 
 import httpx
+import numpy as np
 from pydantic import HttpUrl
 
+from ..core.columnar import ColumnarTimeseries
 from ..core.schema import (
     MarineDataPoint,
     MarineMeasurement,
@@ -17,6 +19,7 @@ from ..core.schema import (
     TimeseriesMetadata,
     UnitEnum,
 )
+from .fast_path import columns_to_columnar, decode_payload, parse_epoch_us, source_column
 
 STORMGLASS_URL = "https://api.stormglass.io/v2/weather/point"
 STORMGLASS_PARAMS: tuple[tuple[str, MarineVariable, UnitEnum], ...] = (
@@ -30,31 +33,25 @@ STORMGLASS_PARAMS: tuple[tuple[str, MarineVariable, UnitEnum], ...] = (
 )
 
 
-class StormglassConnector:
-    """Stormglass 해양 예보 수집기. Stormglass marine forecast fetcher."""
+class _StormglassBase:
+    """Stormglass 요청·파싱 공통부. Shared Stormglass request and parsing logic."""
 
-    def __init__(
-        self,
-        api_key: str,
-        client: httpx.Client | None = None,
-        base_url: str = STORMGLASS_URL,
-        timeout: float = 10.0,
-    ) -> None:
+    provider: ClassVar[str] = "stormglass"
+
+    def __init__(self, api_key: str, base_url: str, timeout: float, trusted: bool) -> None:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
-        self.client = client or httpx.Client(timeout=timeout)
+        self.trusted = trusted
 
-    def fetch_forecast(
+    def _request_args(
         self,
         latitude: float,
         longitude: float,
         start: dt.datetime,
         end: dt.datetime,
-        source_priority: Sequence[str] = ("sg", "noaa"),
-    ) -> MarineTimeseries:
-        """Stormglass 7-10일 예보 조회. Fetch 7-10 day Stormglass forecast."""
-
+        source_priority: Sequence[str],
+    ) -> tuple[dict[str, str | float], dict[str, str]]:
         params: dict[str, str | float] = {
             "lat": latitude,
             "lng": longitude,
@@ -63,10 +60,21 @@ class StormglassConnector:
             "end": end.replace(tzinfo=dt.timezone.utc).isoformat().replace("+00:00", "Z"),
             "source": ",".join(source_priority),
         }
-        headers = {"Authorization": self.api_key}
-        response = self.client.get(self.base_url, params=params, headers=headers)
-        response.raise_for_status()
-        payload = response.json()
+        return params, {"Authorization": self.api_key}
+
+    def parse_forecast(
+        self,
+        payload: dict[str, Any],
+        latitude: float,
+        longitude: float,
+        source_priority: Sequence[str] = ("sg", "noaa"),
+    ) -> MarineTimeseries:
+        """Stormglass 응답 파싱. Parse a Stormglass response payload."""
+
+        if self.trusted:
+            return self.parse_forecast_columnar(
+                payload, latitude, longitude, source_priority
+            ).to_timeseries()
         hours: list[dict[str, Any]] = payload.get("hours", [])
         metadata_units = {variable: unit for _, variable, unit in STORMGLASS_PARAMS}
         points: list[MarineDataPoint] = []
@@ -90,7 +98,7 @@ class StormglassConnector:
             if not measurements:
                 continue
             metadata = TimeseriesMetadata(
-                source="stormglass",
+                source=self.provider,
                 source_url=cast(HttpUrl, str(httpx.URL(self.base_url))),
                 units=metadata_units,
             )
@@ -104,6 +112,41 @@ class StormglassConnector:
             )
         return MarineTimeseries(points=points)
 
+    def parse_forecast_columnar(
+        self,
+        payload: dict[str, Any],
+        latitude: float,
+        longitude: float,
+        source_priority: Sequence[str] = ("sg", "noaa"),
+    ) -> ColumnarTimeseries:
+        """배열 단위 검증 고속 파싱. Array-validated fast-path parsing to columnar form."""
+
+        hours: list[dict[str, Any]] = payload.get("hours", [])
+        if not isinstance(hours, list) or not all(isinstance(hour, dict) for hour in hours):
+            raise ValueError("Stormglass payload 'hours' must be a list of objects")
+        size = len(hours)
+        timestamps = parse_epoch_us(hour["time"] for hour in hours)
+        columns: dict[MarineVariable, np.ndarray] = {}
+        for key, variable, _ in STORMGLASS_PARAMS:
+            entries = [hour.get(key) for hour in hours]
+            column, uncovered = source_column(entries, source_priority, size, f"Stormglass {key}")
+            # 우선순위 밖 공급원 값은 드물므로 해당 행만 개별 처리한다.
+            for row in uncovered.tolist():
+                entry = entries[row]
+                if isinstance(entry, dict):
+                    value = self._choose_source(entry, ())
+                    if value is not None:
+                        column[row] = value
+            columns[variable] = column
+        metadata = TimeseriesMetadata(
+            source=self.provider,
+            source_url=cast(HttpUrl, str(httpx.URL(self.base_url))),
+            units={variable: unit for _, variable, unit in STORMGLASS_PARAMS},
+        )
+        return columns_to_columnar(
+            timestamps, latitude, longitude, columns, metadata.units, metadata
+        )
+
     @staticmethod
     def _choose_source(value_entry: dict[str, Any], priority: Sequence[str]) -> float | None:
         for source in priority:
@@ -113,3 +156,67 @@ class StormglassConnector:
             if value is not None:
                 return float(value)
         return None
+
+
+class StormglassConnector(_StormglassBase):
+    """Stormglass 해양 예보 수집기. Stormglass marine forecast fetcher."""
+
+    def __init__(
+        self,
+        api_key: str,
+        client: httpx.Client | None = None,
+        base_url: str = STORMGLASS_URL,
+        timeout: float = 10.0,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(api_key, base_url, timeout, trusted)
+        self.client = client or httpx.Client(timeout=timeout)
+
+    def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        source_priority: Sequence[str] = ("sg", "noaa"),
+    ) -> MarineTimeseries:
+        """Stormglass 7-10일 예보 조회. Fetch 7-10 day Stormglass forecast."""
+
+        params, headers = self._request_args(latitude, longitude, start, end, source_priority)
+        response = self.client.get(self.base_url, params=params, headers=headers)
+        response.raise_for_status()
+        return self.parse_forecast(
+            decode_payload(response.content), latitude, longitude, source_priority
+        )
+
+
+class AsyncStormglassConnector(_StormglassBase):
+    """비동기 Stormglass 예보 수집기. Async Stormglass marine forecast fetcher."""
+
+    def __init__(
+        self,
+        api_key: str,
+        client: httpx.AsyncClient | None = None,
+        base_url: str = STORMGLASS_URL,
+        timeout: float = 10.0,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(api_key, base_url, timeout, trusted)
+        self.client = client or httpx.AsyncClient(timeout=timeout)
+
+    async def fetch_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        end: dt.datetime,
+        source_priority: Sequence[str] = ("sg", "noaa"),
+    ) -> MarineTimeseries:
+        """Stormglass 7-10일 예보 비동기 조회. Fetch 7-10 day Stormglass forecast."""
+
+        params, headers = self._request_args(latitude, longitude, start, end, source_priority)
+        response = await self.client.get(self.base_url, params=params, headers=headers)
+        response.raise_for_status()
+        return self.parse_forecast(
+            decode_payload(response.content), latitude, longitude, source_priority
+        )
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 import httpx
+import numpy as np
 from pydantic import HttpUrl
 
+from ..core.columnar import ColumnarTimeseries
 from ..core.schema import (
     MarineDataPoint,
     MarineMeasurement,
@@ -17,35 +19,30 @@ from ..core.schema import (
     TimeseriesMetadata,
     UnitEnum,
 )
+from .fast_path import columns_to_columnar, decode_payload, numeric_column, parse_epoch_us
 
 WORLDTIDES_URL = "https://www.worldtides.info/api"
 
 
-class WorldTidesConnector:
-    """WorldTides 수위 시계열 수집기. WorldTides tide timeseries fetcher."""
+class _WorldTidesBase:
+    """WorldTides 요청·파싱 공통부. Shared WorldTides request and parsing logic."""
 
-    def __init__(
-        self,
-        api_key: str,
-        client: httpx.Client | None = None,
-        base_url: str = WORLDTIDES_URL,
-        timeout: float = 10.0,
-    ) -> None:
+    provider: ClassVar[str] = "worldtides"
+
+    def __init__(self, api_key: str, base_url: str, timeout: float, trusted: bool) -> None:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
-        self.client = client or httpx.Client(timeout=timeout)
+        self.trusted = trusted
 
-    def fetch_heights(
+    def _request_params(
         self,
         latitude: float,
         longitude: float,
         start: dt.datetime,
-        hours: int = 72,
-    ) -> MarineTimeseries:
-        """WorldTides 수위 30분 시계열 조회. Fetch 30-minute tide heights."""
-
-        params: dict[str, str | int | float] = {
+        hours: int,
+    ) -> dict[str, str | int | float]:
+        return {
             "heights": "",
             "extremes": "",
             "lat": latitude,
@@ -55,9 +52,17 @@ class WorldTidesConnector:
             "start": int(start.replace(tzinfo=dt.timezone.utc).timestamp()),
             "length": hours,
         }
-        response = self.client.get(self.base_url, params=params)
-        response.raise_for_status()
-        payload = response.json()
+
+    def parse_heights(
+        self,
+        payload: dict[str, Any],
+        latitude: float,
+        longitude: float,
+    ) -> MarineTimeseries:
+        """WorldTides 응답 파싱. Parse a WorldTides response payload."""
+
+        if self.trusted:
+            return self.parse_heights_columnar(payload, latitude, longitude).to_timeseries()
         heights: list[dict[str, Any]] = payload.get("heights", [])
         points: list[MarineDataPoint] = []
         metadata_units = {MarineVariable.TIDE_HEIGHT: UnitEnum.METERS}
@@ -74,7 +79,7 @@ class WorldTidesConnector:
                 unit=UnitEnum.METERS,
             )
             metadata = TimeseriesMetadata(
-                source="worldtides",
+                source=self.provider,
                 source_url=cast(HttpUrl, str(httpx.URL(self.base_url))),
                 units=metadata_units,
             )
@@ -87,3 +92,90 @@ class WorldTidesConnector:
                 )
             )
         return MarineTimeseries(points=points)
+
+    def parse_heights_columnar(
+        self,
+        payload: dict[str, Any],
+        latitude: float,
+        longitude: float,
+    ) -> ColumnarTimeseries:
+        """배열 단위 검증 고속 파싱. Array-validated fast-path parsing to columnar form."""
+
+        heights: list[dict[str, Any]] = payload.get("heights", [])
+        if not isinstance(heights, list) or not all(isinstance(item, dict) for item in heights):
+            raise ValueError("WorldTides payload 'heights' must be a list of objects")
+        values = numeric_column([item["height"] for item in heights], len(heights), "heights")
+        if np.isnan(values).any():
+            raise ValueError("WorldTides heights must all be numeric")
+        units = {MarineVariable.TIDE_HEIGHT: UnitEnum.METERS}
+        metadata = TimeseriesMetadata(
+            source=self.provider,
+            source_url=cast(HttpUrl, str(httpx.URL(self.base_url))),
+            units=units,
+        )
+        return columns_to_columnar(
+            parse_epoch_us(item["date"] for item in heights),
+            latitude,
+            longitude,
+            {MarineVariable.TIDE_HEIGHT: values},
+            units,
+            metadata,
+        )
+
+
+class WorldTidesConnector(_WorldTidesBase):
+    """WorldTides 수위 시계열 수집기. WorldTides tide timeseries fetcher."""
+
+    def __init__(
+        self,
+        api_key: str,
+        client: httpx.Client | None = None,
+        base_url: str = WORLDTIDES_URL,
+        timeout: float = 10.0,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(api_key, base_url, timeout, trusted)
+        self.client = client or httpx.Client(timeout=timeout)
+
+    def fetch_heights(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        hours: int = 72,
+    ) -> MarineTimeseries:
+        """WorldTides 수위 30분 시계열 조회. Fetch 30-minute tide heights."""
+
+        params = self._request_params(latitude, longitude, start, hours)
+        response = self.client.get(self.base_url, params=params)
+        response.raise_for_status()
+        return self.parse_heights(decode_payload(response.content), latitude, longitude)
+
+
+class AsyncWorldTidesConnector(_WorldTidesBase):
+    """비동기 WorldTides 수위 수집기. Async WorldTides tide timeseries fetcher."""
+
+    def __init__(
+        self,
+        api_key: str,
+        client: httpx.AsyncClient | None = None,
+        base_url: str = WORLDTIDES_URL,
+        timeout: float = 10.0,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(api_key, base_url, timeout, trusted)
+        self.client = client or httpx.AsyncClient(timeout=timeout)
+
+    async def fetch_heights(
+        self,
+        latitude: float,
+        longitude: float,
+        start: dt.datetime,
+        hours: int = 72,
+    ) -> MarineTimeseries:
+        """WorldTides 수위 30분 시계열 비동기 조회. Fetch 30-minute tide heights."""
+
+        params = self._request_params(latitude, longitude, start, hours)
+        response = await self.client.get(self.base_url, params=params)
+        response.raise_for_status()
+        return self.parse_heights(decode_payload(response.content), latitude, longitude)
@@ -1,6 +1,19 @@
 """코어 유틸리티 패키지. Core utilities package."""
 
-from .marine_decision import MarineInputs, MarineOutput, decide_and_eta
+from .columnar import ColumnarTimeseries
+from .decision_cache import DecisionCache
+from .ensemble import EnsembleResult, fuse
+from .fast_schema import FastDataPoint, FastMeasurement, FastPosition, FastTimeseries
+from .index import TimeseriesIndex
+from .marine_decision import (
+    MarineBatchOutput,
+    MarineInputs,
+    MarineOutput,
+    decide_and_eta,
+    decide_and_eta_batch,
+)
+from .probabilistic import ForecastError, ProbabilisticDecision, decide_probabilistic
+from .resample import align, resample, time_grid
 from .schema import (
     CSV_HEADER,
     CSV_TIMESTAMP_FORMAT,
@@ -14,14 +27,41 @@ from .schema import (
     UnitEnum,
 )
 from .settings import MarineOpsSettings
+from .sweep import SweepResult, coefficient_grid, sample_coefficients, sweep
+from .timeline import (
+    DecisionChange,
+    DecisionTimeline,
+    DepartureWindow,
+    IncrementalTimeline,
+    TimelineRoute,
+    TimelineUpdate,
+    evaluate_timeline,
+)
 from .units import (
     feet_to_meters,
+    haversine_nm,
     knots_to_meters_per_second,
     meters_per_second_to_knots,
     meters_to_feet,
+    round_array,
+)
+from .voyage import (
+    RouteSegments,
+    VoyagePlan,
+    WaypointRoute,
+    plan_voyages,
+    segment_routes,
 )
 
 __all__ = [
+    "ColumnarTimeseries",
+    "DecisionCache",
+    "EnsembleResult",
+    "FastDataPoint",
+    "FastMeasurement",
+    "FastPosition",
+    "FastTimeseries",
+    "TimeseriesIndex",
     "CSV_HEADER",
     "CSV_TIMESTAMP_FORMAT",
     "MarineDataPoint",
@@ -34,10 +74,37 @@ __all__ = [
     "UnitEnum",
     "MarineOpsSettings",
     "feet_to_meters",
+    "haversine_nm",
     "knots_to_meters_per_second",
     "meters_per_second_to_knots",
     "meters_to_feet",
+    "round_array",
+    "MarineBatchOutput",
     "MarineInputs",
     "MarineOutput",
     "decide_and_eta",
+    "decide_and_eta_batch",
+    "align",
+    "fuse",
+    "DecisionChange",
+    "DecisionTimeline",
+    "DepartureWindow",
+    "IncrementalTimeline",
+    "TimelineRoute",
+    "TimelineUpdate",
+    "evaluate_timeline",
+    "SweepResult",
+    "coefficient_grid",
+    "sample_coefficients",
+    "sweep",
+    "ForecastError",
+    "ProbabilisticDecision",
+    "decide_probabilistic",
+    "RouteSegments",
+    "VoyagePlan",
+    "WaypointRoute",
+    "plan_voyages",
+    "segment_routes",
+    "resample",
+    "time_grid",
 ]
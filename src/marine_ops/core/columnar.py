@@ -0,0 +1,476 @@
+"""컬럼형 해양 시계열. Columnar, array-backed marine timeseries."""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike
+from pydantic import BaseModel
+
+from .schema import (
+    CSV_TIMESTAMP_FORMAT,
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from .units import round_array
+
+if TYPE_CHECKING:
+    from .fast_schema import FastDataPoint, FastTimeseries
+
+EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+MICROSECOND = dt.timedelta(microseconds=1)
+QUALITY_FLAGS: tuple[QualityFlag, ...] = tuple(QualityFlag)
+MISSING_QUALITY = -1
+_QUALITY_CODE = {flag: code for code, flag in enumerate(QUALITY_FLAGS)}
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def datetime_to_epoch_us(value: dt.datetime) -> int:
+    """UTC datetime → epoch 마이크로초. Convert a UTC datetime to epoch microseconds."""
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt.timezone.utc)
+    return (value - EPOCH) // MICROSECOND
+
+
+def epoch_us_to_datetime(value: int) -> dt.datetime:
+    """epoch 마이크로초 → UTC datetime. Convert epoch microseconds to a UTC datetime."""
+
+    return EPOCH + dt.timedelta(microseconds=int(value))
+
+
+def construct_model(model: type[_ModelT], values: dict[str, object]) -> _ModelT:
+    """검증 없는 경량 생성. Lightweight unvalidated construction.
+
+    extra/private 속성이 없는 모델에 대해 ``model_construct`` 와 같은 상태를 만든다.
+    Produces the same instance state as ``model_construct`` for models without extra or
+    private attributes, without its per-field default handling.
+    """
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def merge_variable_order(sequences: Iterable[tuple[MarineVariable, ...]]) -> list[MarineVariable]:
+    """포인트별 변수 순서를 하나로 병합. Merge per-point variable orders into one order."""
+
+    order: list[MarineVariable] = []
+    distinct = list(dict.fromkeys(sequences))
+    for sequence in distinct:
+        insert_at = 0
+        for variable in sequence:
+            if variable in order:
+                insert_at = order.index(variable) + 1
+            else:
+                order.insert(insert_at, variable)
+                insert_at += 1
+    rank = {variable: index for index, variable in enumerate(order)}
+    for sequence in distinct:
+        ranks = [rank[variable] for variable in sequence]
+        if any(later <= earlier for earlier, later in zip(ranks, ranks[1:])):
+            raise ValueError(
+                "measurement order is inconsistent across points; "
+                "cannot represent the timeseries columnarly"
+            )
+    return order
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnarTimeseries:
+    """
+    배열 기반 해양 시계열. Array-backed marine timeseries.
+
+    행 하나가 ``MarineDataPoint`` 하나에 대응한다. 변수별 값 배열과 품질 코드 배열
+    (``QUALITY_FLAGS`` 인덱스, 결측은 ``MISSING_QUALITY``)을 갖고, 메타데이터는
+    ``metadata_index`` 로 행 간에 공유된다. ``values`` 의 키 순서가 행 내 측정값 순서다.
+    One row per ``MarineDataPoint``. Each variable has a value array and a quality-code
+    array (index into ``QUALITY_FLAGS``, ``MISSING_QUALITY`` when absent); metadata is
+    shared across rows through ``metadata_index``. Key order of ``values`` is the
+    measurement order within a row.
+    """
+
+    timestamps: np.ndarray
+    latitude: np.ndarray
+    longitude: np.ndarray
+    values: Mapping[MarineVariable, np.ndarray]
+    quality: Mapping[MarineVariable, np.ndarray]
+    units: Mapping[MarineVariable, UnitEnum]
+    metadata: tuple[TimeseriesMetadata, ...]
+    metadata_index: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.timestamps.size)
+
+    @property
+    def variables(self) -> tuple[MarineVariable, ...]:
+        """열 변수 순서. Column variable order."""
+
+        return tuple(self.values)
+
+    def column(self, variable: MarineVariable) -> np.ndarray:
+        """결측을 NaN으로 채운 값 배열. Value array with NaN where missing."""
+
+        values = self.values.get(variable)
+        if values is None:
+            return np.full(len(self), np.nan)
+        return np.where(self.quality[variable] == MISSING_QUALITY, np.nan, values)
+
+    def datetimes(self) -> np.ndarray:
+        """datetime64[us] 타임스탬프 배열. Timestamps as datetime64[us]."""
+
+        return self.timestamps.astype("datetime64[us]")
+
+    def take(self, rows: ArrayLike) -> ColumnarTimeseries:
+        """행 부분집합 추출. Select a subset of rows."""
+
+        index = np.asarray(rows)
+        return ColumnarTimeseries(
+            timestamps=self.timestamps[index],
+            latitude=self.latitude[index],
+            longitude=self.longitude[index],
+            values={variable: array[index] for variable, array in self.values.items()},
+            quality={variable: array[index] for variable, array in self.quality.items()},
+            units=dict(self.units),
+            metadata=self.metadata,
+            metadata_index=self.metadata_index[index],
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence[ColumnarTimeseries]) -> ColumnarTimeseries:
+        """
+        행 방향 이어 붙이기. Concatenate timeseries row-wise.
+
+        없는 변수는 결측으로 채우며, 같은 변수의 단위가 다르면 ``ValueError`` 다.
+        Variables absent from a part are filled as missing; mixed units for one variable
+        raise ``ValueError``.
+        """
+
+        if not parts:
+            raise ValueError("at least one part is required")
+        units: dict[MarineVariable, UnitEnum] = {}
+        for part in parts:
+            for variable, unit in part.units.items():
+                if units.setdefault(variable, unit) is not unit:
+                    raise ValueError(f"mixed units for variable {variable.value} across parts")
+        order = merge_variable_order(part.variables for part in parts)
+        offsets = np.cumsum([0] + [len(part.metadata) for part in parts[:-1]])
+        return cls(
+            timestamps=np.concatenate([part.timestamps for part in parts]),
+            latitude=np.concatenate([part.latitude for part in parts]),
+            longitude=np.concatenate([part.longitude for part in parts]),
+            values={
+                variable: np.concatenate(
+                    [part.values.get(variable, np.zeros(len(part))) for part in parts]
+                )
+                for variable in order
+            },
+            quality={
+                variable: np.concatenate(
+                    [
+                        part.quality.get(
+                            variable, np.full(len(part), MISSING_QUALITY, dtype=np.int8)
+                        )
+                        for part in parts
+                    ]
+                )
+                for variable in order
+            },
+            units={variable: units[variable] for variable in order},
+            metadata=tuple(meta for part in parts for meta in part.metadata),
+            metadata_index=np.concatenate(
+                [
+                    part.metadata_index + np.int32(offset)
+                    for part, offset in zip(parts, offsets.tolist())
+                ]
+            ).astype(np.int32),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        timestamps: ArrayLike,
+        latitude: ArrayLike,
+        longitude: ArrayLike,
+        values: Mapping[MarineVariable, ArrayLike],
+        units: Mapping[MarineVariable, UnitEnum],
+        metadata: TimeseriesMetadata,
+        quality: Mapping[MarineVariable, ArrayLike] | None = None,
+    ) -> ColumnarTimeseries:
+        """
+        원시 배열에서 생성. Build from raw arrays.
+
+        값은 ``MarineMeasurement`` 와 동일하게 소수 둘째 자리로 반올림되고 NaN은 결측이 된다.
+        Values are rounded to two decimals like ``MarineMeasurement``; NaN marks a missing
+        measurement. ``timestamps`` may be datetime64 or int64 epoch microseconds.
+        """
+
+        raw_times = np.asarray(timestamps)
+        if np.issubdtype(raw_times.dtype, np.datetime64):
+            epoch = raw_times.astype("datetime64[us]").astype(np.int64)
+        else:
+            epoch = raw_times.astype(np.int64)
+        size = epoch.size
+        lat = np.broadcast_to(np.asarray(latitude, dtype=np.float64), (size,)).copy()
+        lon = np.broadcast_to(np.asarray(longitude, dtype=np.float64), (size,)).copy()
+        if not np.all((lat >= -90.0) & (lat <= 90.0)):
+            raise ValueError("latitude must be within [-90, 90]")
+        if not np.all((lon >= -180.0) & (lon <= 180.0)):
+            raise ValueError("longitude must be within [-180, 180]")
+        value_columns: dict[MarineVariable, np.ndarray] = {}
+        quality_columns: dict[MarineVariable, np.ndarray] = {}
+        for variable, column in values.items():
+            if variable not in units:
+                raise ValueError(f"unit missing for variable {variable.value}")
+            array = round_array(np.asarray(column, dtype=np.float64).reshape(size), 2)
+            missing = np.isnan(array)
+            if quality is not None and variable in quality:
+                codes = np.asarray(quality[variable], dtype=np.int8).reshape(size).copy()
+            else:
+                codes = np.full(size, _QUALITY_CODE[QualityFlag.RAW], dtype=np.int8)
+            codes[missing] = MISSING_QUALITY
+            value_columns[variable] = np.where(missing, 0.0, array)
+            quality_columns[variable] = codes
+        return cls(
+            timestamps=epoch,
+            latitude=lat,
+            longitude=lon,
+            values=value_columns,
+            quality=quality_columns,
+            units={variable: units[variable] for variable in value_columns},
+            metadata=(metadata,),
+            metadata_index=np.zeros(size, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_timeseries(cls, timeseries: MarineTimeseries | FastTimeseries) -> ColumnarTimeseries:
+        """Pydantic·경량 시계열에서 무손실 변환. Lossless conversion from either schema."""
+
+        points: Sequence[MarineDataPoint | FastDataPoint] = timeseries.points
+        size = len(points)
+        order = merge_variable_order(
+            tuple(measurement.variable for measurement in point.measurements) for point in points
+        )
+        timestamps = np.empty(size, dtype=np.int64)
+        latitude = np.empty(size, dtype=np.float64)
+        longitude = np.empty(size, dtype=np.float64)
+        values = {variable: np.zeros(size, dtype=np.float64) for variable in order}
+        quality = {variable: np.full(size, MISSING_QUALITY, dtype=np.int8) for variable in order}
+        units: dict[MarineVariable, UnitEnum] = {}
+        metadata: list[TimeseriesMetadata] = []
+        metadata_ids: dict[int, int] = {}
+        metadata_index = np.empty(size, dtype=np.int32)
+        time_cache: dict[dt.datetime, int] = {}
+
+        for row, point in enumerate(points):
+            epoch = time_cache.get(point.timestamp)
+            if epoch is None:
+                epoch = time_cache[point.timestamp] = datetime_to_epoch_us(point.timestamp)
+            timestamps[row] = epoch
+            latitude[row] = point.position.latitude
+            longitude[row] = point.position.longitude
+            code = metadata_ids.get(id(point.metadata))
+            if code is None:
+                for candidate, existing in enumerate(metadata):
+                    if existing == point.metadata:
+                        code = candidate
+                        break
+                else:
+                    code = len(metadata)
+                    metadata.append(point.metadata)
+                metadata_ids[id(point.metadata)] = code
+            metadata_index[row] = code
+            for measurement in point.measurements:
+                variable = measurement.variable
+                if quality[variable][row] != MISSING_QUALITY:
+                    raise ValueError(f"duplicate {variable.value} measurement in one point")
+                unit = units.setdefault(variable, measurement.unit)
+                if unit is not measurement.unit:
+                    raise ValueError(f"mixed units for variable {variable.value}")
+                values[variable][row] = measurement.value
+                quality[variable][row] = _QUALITY_CODE[measurement.quality_flag]
+
+        return cls(
+            timestamps=timestamps,
+            latitude=latitude,
+            longitude=longitude,
+            values=values,
+            quality=quality,
+            units=units,
+            metadata=tuple(metadata),
+            metadata_index=metadata_index,
+        )
+
+    def to_timeseries(self) -> MarineTimeseries:
+        """Pydantic 시계열로 변환. Convert back to the pydantic model."""
+
+        columns = [
+            (
+                variable,
+                self.units[variable],
+                self.values[variable].tolist(),
+                self.quality[variable].tolist(),
+            )
+            for variable in self.values
+        ]
+        positions: dict[tuple[float, float], Position] = {}
+        times: dict[int, dt.datetime] = {}
+        points: list[MarineDataPoint] = []
+        for row, (epoch, lat, lon, meta) in enumerate(
+            zip(
+                self.timestamps.tolist(),
+                self.latitude.tolist(),
+                self.longitude.tolist(),
+                self.metadata_index.tolist(),
+            )
+        ):
+            position = positions.get((lat, lon))
+            if position is None:
+                position = positions[(lat, lon)] = construct_model(
+                    Position, {"latitude": lat, "longitude": lon}
+                )
+            timestamp = times.get(epoch)
+            if timestamp is None:
+                timestamp = times[epoch] = epoch_us_to_datetime(epoch)
+            measurements = [
+                construct_model(
+                    MarineMeasurement,
+                    {
+                        "variable": variable,
+                        "value": value_list[row],
+                        "unit": unit,
+                        "quality_flag": QUALITY_FLAGS[quality_list[row]],
+                    },
+                )
+                for variable, unit, value_list, quality_list in columns
+                if quality_list[row] != MISSING_QUALITY
+            ]
+            points.append(
+                construct_model(
+                    MarineDataPoint,
+                    {
+                        "timestamp": timestamp,
+                        "position": position,
+                        "measurements": measurements,
+                        "metadata": self.metadata[meta],
+                    },
+                )
+            )
+        return construct_model(MarineTimeseries, {"points": points})
+
+    def to_fast_timeseries(self) -> FastTimeseries:
+        """경량 ``__slots__`` 시계열로 변환. Convert to the lightweight ``__slots__`` schema."""
+
+        from .fast_schema import FastDataPoint, FastMeasurement, FastPosition, FastTimeseries
+
+        columns = [
+            (
+                variable,
+                self.units[variable],
+                self.values[variable].tolist(),
+                self.quality[variable].tolist(),
+            )
+            for variable in self.values
+        ]
+        positions: dict[tuple[float, float], FastPosition] = {}
+        times: dict[int, dt.datetime] = {}
+        points: list[FastDataPoint] = []
+        for row, (epoch, lat, lon, meta) in enumerate(
+            zip(
+                self.timestamps.tolist(),
+                self.latitude.tolist(),
+                self.longitude.tolist(),
+                self.metadata_index.tolist(),
+            )
+        ):
+            position = positions.get((lat, lon))
+            if position is None:
+                position = positions[(lat, lon)] = FastPosition(lat, lon)
+            timestamp = times.get(epoch)
+            if timestamp is None:
+                timestamp = times[epoch] = epoch_us_to_datetime(epoch)
+            measurements = []
+            for variable, unit, value_list, quality_list in columns:
+                code = quality_list[row]
+                if code == MISSING_QUALITY:
+                    continue
+                # 배열 값은 이미 반올림돼 있으므로 생성자 검사를 건너뛴다.
+                measurement = FastMeasurement.__new__(FastMeasurement)
+                measurement.variable = variable
+                measurement.value = value_list[row]
+                measurement.unit = unit
+                measurement.quality_flag = QUALITY_FLAGS[code]
+                measurements.append(measurement)
+            point = FastDataPoint.__new__(FastDataPoint)
+            point.timestamp = timestamp
+            point.position = position
+            point.measurements = measurements
+            point.metadata = self.metadata[meta]
+            points.append(point)
+        return FastTimeseries(points)
+
+    def iter_rows(self) -> Iterable[tuple[str, ...]]:
+        """``MarineTimeseries.iter_rows`` 와 동일한 행. Rows identical to the pydantic model."""
+
+        meta_fields = [
+            (
+                meta.source,
+                "true" if meta.bias_corrected else "false",
+                f"{meta.ensemble_weight:.2f}" if meta.ensemble_weight is not None else "",
+            )
+            for meta in self.metadata
+        ]
+        columns = [
+            (
+                variable.value,
+                self.units[variable].value,
+                self.values[variable].tolist(),
+                self.quality[variable].tolist(),
+            )
+            for variable in self.values
+        ]
+        flag_values = [flag.value for flag in QUALITY_FLAGS]
+        times: dict[int, str] = {}
+        for row, (epoch, lat, lon, meta) in enumerate(
+            zip(
+                self.timestamps.tolist(),
+                self.latitude.tolist(),
+                self.longitude.tolist(),
+                self.metadata_index.tolist(),
+            )
+        ):
+            iso_time = times.get(epoch)
+            if iso_time is None:
+                iso_time = times[epoch] = epoch_us_to_datetime(epoch).strftime(CSV_TIMESTAMP_FORMAT)
+            lat_text = f"{lat:.2f}"
+            lon_text = f"{lon:.2f}"
+            source, bias, weight = meta_fields[meta]
+            for name, unit, value_list, quality_list in columns:
+                code = quality_list[row]
+                if code == MISSING_QUALITY:
+                    continue
+                yield (
+                    iso_time,
+                    lat_text,
+                    lon_text,
+                    name,
+                    f"{value_list[row]:.2f}",
+                    unit,
+                    source,
+                    flag_values[code],
+                    bias,
+                    weight,
+                )
@@ -0,0 +1,85 @@
+"""의사결정 결과 메모이제이션. Memoized marine decisions."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from .columnar import construct_model
+from .marine_decision import ALPHA, BETA, K_WAVE, K_WIND, MarineInputs, MarineOutput, decide_and_eta
+
+DEFAULT_MAXSIZE = 4096
+
+
+class DecisionCache:
+    """
+    ``decide_and_eta`` 용 LRU 메모이제이션. Bounded LRU memoization of ``decide_and_eta``.
+
+    키는 입력 필드 값 튜플과 alpha/beta/k_wind/k_wave 계수다. 예보 값은 이미
+    ``MarineMeasurement`` 에서 소수 둘째 자리로 양자화되므로 정확한 값을 키로 써도 반복
+    입력이 적중하며, 추가 반올림을 하지 않으므로 결과는 캐시 없는 호출과 항상 같다.
+    적중 시에는 공유 인스턴스가 변경되지 않도록 결과 복사본을 반환한다.
+    Keys are the input field values plus the alpha/beta/k_wind/k_wave coefficients.
+    Forecast values are already quantized to two decimals by ``MarineMeasurement``, so exact
+    keys hit on repeated inputs; no extra rounding is applied, which keeps every result
+    identical to the uncached call. Hits return a copy so the shared instance cannot be
+    mutated by callers.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, MarineOutput] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __call__(
+        self,
+        inputs: MarineInputs,
+        alpha: float = ALPHA,
+        beta: float = BETA,
+        k_wind: float = K_WIND,
+        k_wave: float = K_WAVE,
+    ) -> MarineOutput:
+        """캐시 우선 결정. Cache-first ``decide_and_eta``."""
+
+        key = (*inputs.__dict__.values(), alpha, beta, k_wind, k_wave)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return construct_model(MarineOutput, dict(cached.__dict__))
+            self.misses += 1
+        result = decide_and_eta(inputs, alpha=alpha, beta=beta, k_wind=k_wind, k_wave=k_wave)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return construct_model(MarineOutput, dict(result.__dict__))
+
+    def stats(self) -> dict[str, int]:
+        """적중 통계. Hit/miss counters and current size."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """항목과 통계 초기화. Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,181 @@
+"""다중 공급자 앙상블 융합. Multi-provider ensemble fusion."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from .columnar import MISSING_QUALITY, ColumnarTimeseries
+from .resample import DEFAULT_STEP, DIRECTIONAL_VARIABLES, align
+from .schema import MarineTimeseries, MarineVariable, TimeseriesMetadata, UnitEnum
+from .units import round_array
+
+ENSEMBLE_SOURCE = "ensemble"
+
+
+@dataclass(frozen=True)
+class EnsembleResult:
+    """
+    앙상블 융합 결과. Result of an ensemble fusion.
+
+    ``members`` 는 입력 시계열(정렬된 경우 격자 위)에 정규화 가중치를
+    ``ensemble_weight`` 로 채운 것이고 ``weights`` 는 공급자별 정규화 가중치다.
+    ``members`` are the input series (on the grid when aligned) with the normalized weight
+    written into ``ensemble_weight``; ``weights`` maps each provider to that weight.
+    """
+
+    consensus: ColumnarTimeseries
+    members: tuple[ColumnarTimeseries, ...]
+    weights: Mapping[str, float]
+
+
+def _normalized_weights(
+    sources: Sequence[str], weights: Mapping[str, float] | None
+) -> dict[str, float]:
+    raw = {
+        source: 1.0 if weights is None else float(weights.get(source, 1.0)) for source in sources
+    }
+    if any(weight < 0 or not np.isfinite(weight) for weight in raw.values()):
+        raise ValueError("ensemble weights must be finite and non-negative")
+    total = sum(raw.values())
+    if total <= 0:
+        raise ValueError("at least one provider needs a positive ensemble weight")
+    return {source: weight / total for source, weight in raw.items()}
+
+
+def fuse(
+    series: Sequence[MarineTimeseries | ColumnarTimeseries],
+    weights: Mapping[str, float] | None = None,
+    step: dt.timedelta | int | None = DEFAULT_STEP,
+    max_gap: dt.timedelta | int | None = None,
+    source: str = ENSEMBLE_SOURCE,
+) -> EnsembleResult:
+    """
+    공급자 가중 합의 시계열 생성. Build a weighted consensus across providers.
+
+    공급자는 ``TimeseriesMetadata.source`` 로 식별하며 ``weights`` 에 없는 공급자는 1.0을
+    받고 전체 합이 1이 되도록 정규화된다. ``step`` 이 주어지면 먼저 ``align`` 으로 같은 격자에
+    맞추고, ``None`` 이면 이미 정렬된 입력으로 보고 시각이 정확히 같은 행끼리 융합한다.
+    (위치, 시각) 칸마다 값이 있는 공급자의 가중치만 다시 정규화해 가중 평균하며 방향 변수는
+    단위 벡터의 가중 평균 각도를 쓴다. 합의 품질 플래그는 기여한 값 중 가장 나쁜 것이다.
+    위치 × 시각 × 변수 전체를 한 번의 정렬과 ``reduceat`` 으로 처리한다.
+    Providers are identified by ``TimeseriesMetadata.source``; providers missing from
+    ``weights`` get 1.0 and weights are normalized to sum to one. With ``step`` the inputs
+    are first put on one grid with ``align``; with ``None`` they are assumed aligned and rows
+    with identical timestamps are fused. Each (position, time) cell is the weighted mean of
+    the providers present there, using the angle of the weighted unit-vector mean for
+    direction variables; its quality flag is the worst contributing one. All positions,
+    hours and variables are handled with one sort and ``reduceat`` calls.
+    """
+
+    if step is None:
+        columnars = [
+            (
+                item
+                if isinstance(item, ColumnarTimeseries)
+                else ColumnarTimeseries.from_timeseries(item)
+            )
+            for item in series
+        ]
+    else:
+        columnars = align(series, step, max_gap=max_gap)
+    sources = list(dict.fromkeys(meta.source for item in columnars for meta in item.metadata))
+    normalized = _normalized_weights(sources, weights)
+    members = tuple(
+        dataclasses.replace(
+            item,
+            metadata=tuple(
+                meta.model_copy(update={"ensemble_weight": round(normalized[meta.source], 2)})
+                for meta in item.metadata
+            ),
+        )
+        for item in columnars
+    )
+
+    units: dict[MarineVariable, UnitEnum] = {}
+    for item in columnars:
+        for variable, unit in item.units.items():
+            if units.setdefault(variable, unit) is not unit:
+                raise ValueError(f"mixed units for variable {variable.value} across providers")
+    consensus_meta = TimeseriesMetadata(
+        source=source,
+        units=units,
+        bias_corrected=bool(sources)
+        and all(meta.bias_corrected for item in columnars for meta in item.metadata),
+        ensemble_weight=1.0,
+    )
+
+    timestamps = np.concatenate([item.timestamps for item in columnars] + [np.empty(0, np.int64)])
+    latitude = np.concatenate([item.latitude for item in columnars] + [np.empty(0)])
+    longitude = np.concatenate([item.longitude for item in columnars] + [np.empty(0)])
+    row_weight = np.concatenate(
+        [
+            np.array([normalized[meta.source] for meta in item.metadata])[item.metadata_index]
+            for item in columnars
+            if len(item)
+        ]
+        + [np.empty(0)]
+    )
+    # (위치, 시각) 순으로 한 번 정렬해 같은 칸의 행을 연속 구간으로 모은다.
+    order = np.lexsort((timestamps, longitude, latitude))
+    timestamps, latitude, longitude = timestamps[order], latitude[order], longitude[order]
+    row_weight = row_weight[order]
+    starts = np.flatnonzero(
+        np.concatenate(
+            [
+                np.ones(min(order.size, 1), dtype=bool),
+                (timestamps[1:] != timestamps[:-1])
+                | (latitude[1:] != latitude[:-1])
+                | (longitude[1:] != longitude[:-1]),
+            ]
+        )
+    )
+
+    values: dict[MarineVariable, np.ndarray] = {}
+    quality: dict[MarineVariable, np.ndarray] = {}
+    present = np.zeros(starts.size, dtype=bool)
+    for variable in units:
+        column = np.concatenate(
+            [item.values.get(variable, np.zeros(len(item))) for item in columnars]
+        )[order]
+        codes = np.concatenate(
+            [
+                item.quality.get(variable, np.full(len(item), MISSING_QUALITY, dtype=np.int8))
+                for item in columnars
+            ]
+        )[order]
+        weight = np.where(codes != MISSING_QUALITY, row_weight, 0.0)
+        codes = np.where(weight > 0, codes, MISSING_QUALITY)
+        total = np.add.reduceat(weight, starts) if starts.size else np.empty(0)
+        valid = total > 0
+        safe_total = np.where(valid, total, 1.0)
+        if variable in DIRECTIONAL_VARIABLES:
+            radians = np.deg2rad(column)
+            sin = np.add.reduceat(weight * np.sin(radians), starts) if starts.size else total
+            cos = np.add.reduceat(weight * np.cos(radians), starts) if starts.size else total
+            fused = round_array(np.rad2deg(np.arctan2(sin, cos)) % 360.0, 2)
+            fused = np.where(fused >= 360.0, 0.0, fused)
+        else:
+            weighted = np.add.reduceat(weight * column, starts) if starts.size else total
+            fused = round_array(weighted / safe_total, 2)
+        values[variable] = np.where(valid, fused, 0.0)
+        cell_codes = np.maximum.reduceat(codes, starts) if starts.size else codes
+        quality[variable] = np.where(valid, cell_codes, MISSING_QUALITY).astype(np.int8)
+        present |= valid
+
+    rows = starts[present]
+    consensus = ColumnarTimeseries(
+        timestamps=timestamps[rows],
+        latitude=latitude[rows],
+        longitude=longitude[rows],
+        values={variable: array[present] for variable, array in values.items()},
+        quality={variable: array[present] for variable, array in quality.items()},
+        units=units,
+        metadata=(consensus_meta,),
+        metadata_index=np.zeros(rows.size, dtype=np.int32),
+    )
+    return EnsembleResult(consensus=consensus, members=members, weights=normalized)
@@ -0,0 +1,270 @@
+"""경량 ``__slots__`` 스키마. Lightweight ``__slots__`` variants of the standard schema.
+
+pydantic 모델과 같은 반올림(소수 둘째 자리)·UTC 규칙과 좌표 범위 검사를 생성자에서 적용하되,
+필드 검증기 호출과 인스턴스 ``__dict__`` 없이 만든다. ``from_model``/``to_model`` 로 표준
+모델과 오간다.
+Applies the same rounding (two decimals), UTC and coordinate-range rules as the pydantic
+models in the constructors, without validator dispatch or per-instance ``__dict__``.
+``from_model``/``to_model`` convert to and from the standard models.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Iterable, Sequence
+
+from .columnar import construct_model
+from .schema import (
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+    iter_csv_rows,
+)
+
+
+class FastPosition:
+    """경량 위치 좌표. Lightweight position coordinates."""
+
+    __slots__ = ("latitude", "longitude")
+
+    def __init__(self, latitude: float, longitude: float) -> None:
+        if not -90.0 <= latitude <= 90.0:
+            raise ValueError(f"latitude {latitude} outside [-90, 90]")
+        if not -180.0 <= longitude <= 180.0:
+            raise ValueError(f"longitude {longitude} outside [-180, 180]")
+        self.latitude = float(latitude)
+        self.longitude = float(longitude)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FastPosition):
+            return NotImplemented
+        return (self.latitude, self.longitude) == (other.latitude, other.longitude)
+
+    def __hash__(self) -> int:
+        return hash((self.latitude, self.longitude))
+
+    def __repr__(self) -> str:
+        return f"FastPosition(latitude={self.latitude!r}, longitude={self.longitude!r})"
+
+    @classmethod
+    def from_model(cls, position: Position) -> FastPosition:
+        """pydantic 모델에서 변환. Convert from the pydantic model."""
+
+        instance = cls.__new__(cls)
+        instance.latitude = position.latitude
+        instance.longitude = position.longitude
+        return instance
+
+    def to_model(self) -> Position:
+        """pydantic 모델로 변환. Convert to the pydantic model."""
+
+        return construct_model(Position, {"latitude": self.latitude, "longitude": self.longitude})
+
+
+class FastMeasurement:
+    """경량 해양 변수 관측값. Lightweight marine variable measurement."""
+
+    __slots__ = ("variable", "value", "unit", "quality_flag")
+
+    def __init__(
+        self,
+        variable: MarineVariable | str,
+        value: float,
+        unit: UnitEnum | str,
+        quality_flag: QualityFlag | str = QualityFlag.RAW,
+    ) -> None:
+        # 열거형 멤버는 조회 없이 그대로 쓴다.
+        self.variable = variable if type(variable) is MarineVariable else MarineVariable(variable)
+        self.value = round(float(value), 2)
+        self.unit = unit if type(unit) is UnitEnum else UnitEnum(unit)
+        self.quality_flag = (
+            quality_flag if type(quality_flag) is QualityFlag else QualityFlag(quality_flag)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FastMeasurement):
+            return NotImplemented
+        return (self.variable, self.value, self.unit, self.quality_flag) == (
+            other.variable,
+            other.value,
+            other.unit,
+            other.quality_flag,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"FastMeasurement(variable={self.variable.value!r}, value={self.value!r}, "
+            f"unit={self.unit.value!r}, quality_flag={self.quality_flag.value!r})"
+        )
+
+    @classmethod
+    def from_model(cls, measurement: MarineMeasurement) -> FastMeasurement:
+        """pydantic 모델에서 변환 (이미 반올림됨). Convert from the (already rounded) model."""
+
+        instance = cls.__new__(cls)
+        instance.variable = measurement.variable
+        instance.value = measurement.value
+        instance.unit = measurement.unit
+        instance.quality_flag = measurement.quality_flag
+        return instance
+
+    def to_model(self) -> MarineMeasurement:
+        """pydantic 모델로 변환. Convert to the pydantic model."""
+
+        return construct_model(
+            MarineMeasurement,
+            {
+                "variable": self.variable,
+                "value": self.value,
+                "unit": self.unit,
+                "quality_flag": self.quality_flag,
+            },
+        )
+
+
+class FastDataPoint:
+    """경량 해양 데이터 포인트. Lightweight marine data point."""
+
+    __slots__ = ("timestamp", "position", "measurements", "metadata")
+
+    def __init__(
+        self,
+        timestamp: dt.datetime,
+        position: FastPosition,
+        measurements: Sequence[FastMeasurement],
+        metadata: TimeseriesMetadata,
+    ) -> None:
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=dt.timezone.utc)
+        elif timestamp.tzinfo is not dt.timezone.utc:
+            timestamp = timestamp.astimezone(dt.timezone.utc)
+        self.timestamp = timestamp
+        self.position = position
+        self.measurements = measurements
+        self.metadata = metadata
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FastDataPoint):
+            return NotImplemented
+        return (
+            self.timestamp == other.timestamp
+            and self.position == other.position
+            and list(self.measurements) == list(other.measurements)
+            and self.metadata == other.metadata
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"FastDataPoint(timestamp={self.timestamp.isoformat()!r}, position={self.position!r}, "
+            f"measurements={list(self.measurements)!r}, source={self.metadata.source!r})"
+        )
+
+    @classmethod
+    def from_model(cls, point: MarineDataPoint) -> FastDataPoint:
+        """pydantic 모델에서 변환. Convert from the pydantic model."""
+
+        instance = cls.__new__(cls)
+        instance.timestamp = point.timestamp
+        instance.position = FastPosition.from_model(point.position)
+        instance.measurements = [FastMeasurement.from_model(item) for item in point.measurements]
+        instance.metadata = point.metadata
+        return instance
+
+    def to_model(self) -> MarineDataPoint:
+        """pydantic 모델로 변환. Convert to the pydantic model."""
+
+        return construct_model(
+            MarineDataPoint,
+            {
+                "timestamp": self.timestamp,
+                "position": self.position.to_model(),
+                "measurements": [item.to_model() for item in self.measurements],
+                "metadata": self.metadata,
+            },
+        )
+
+
+class FastTimeseries:
+    """
+    경량 해양 시계열. Lightweight marine timeseries.
+
+    ``points`` 속성을 읽는 내보내기·컬럼형 변환 경로는 pydantic 시계열과 똑같이 받는다.
+    Exporters and columnar conversion read ``points`` and accept it like the pydantic model.
+    """
+
+    __slots__ = ("points",)
+
+    def __init__(self, points: Sequence[FastDataPoint]) -> None:
+        self.points = points
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FastTimeseries):
+            return NotImplemented
+        return list(self.points) == list(other.points)
+
+    def __repr__(self) -> str:
+        return f"FastTimeseries(points={len(self.points)})"
+
+    @classmethod
+    def from_model(cls, timeseries: MarineTimeseries) -> FastTimeseries:
+        """pydantic 시계열에서 변환. Convert from the pydantic model."""
+
+        # 같은 좌표의 위치 객체는 하나만 만든다.
+        positions: dict[tuple[float, float], FastPosition] = {}
+        points: list[FastDataPoint] = []
+        for point in timeseries.points:
+            key = (point.position.latitude, point.position.longitude)
+            position = positions.get(key)
+            if position is None:
+                position = positions[key] = FastPosition.from_model(point.position)
+            fast = FastDataPoint.__new__(FastDataPoint)
+            fast.timestamp = point.timestamp
+            fast.position = position
+            fast.measurements = [FastMeasurement.from_model(item) for item in point.measurements]
+            fast.metadata = point.metadata
+            points.append(fast)
+        return cls(points)
+
+    def to_model(self) -> MarineTimeseries:
+        """pydantic 시계열로 변환. Convert to the pydantic model."""
+
+        positions: dict[FastPosition, Position] = {}
+        points: list[MarineDataPoint] = []
+        for point in self.points:
+            position = positions.get(point.position)
+            if position is None:
+                position = positions[point.position] = point.position.to_model()
+            points.append(
+                construct_model(
+                    MarineDataPoint,
+                    {
+                        "timestamp": point.timestamp,
+                        "position": position,
+                        "measurements": [item.to_model() for item in point.measurements],
+                        "metadata": point.metadata,
+                    },
+                )
+            )
+        return construct_model(MarineTimeseries, {"points": points})
+
+    def window(self, start: dt.datetime, end: dt.datetime) -> FastTimeseries:
+        """시간 구간 부분 시계열 (양끝 포함). Sub-series with start <= timestamp <= end."""
+
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=dt.timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=dt.timezone.utc)
+        return FastTimeseries([point for point in self.points if start <= point.timestamp <= end])
+
+    def iter_rows(self) -> Iterable[tuple[str, ...]]:
+        """``MarineTimeseries.iter_rows`` 와 동일한 행. Rows identical to the pydantic model."""
+
+        return iter_csv_rows(self.points)
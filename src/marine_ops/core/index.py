@@ -0,0 +1,284 @@
+"""시계열 시간·공간 색인. Time-window and spatial index over a timeseries."""
+
+from __future__ import annotations
+
+import datetime as dt
+import math
+
+import numpy as np
+
+from .columnar import MISSING_QUALITY, ColumnarTimeseries, datetime_to_epoch_us
+from .schema import MarineTimeseries, MarineVariable
+from .units import EARTH_RADIUS_NM, haversine_nm
+
+DEFAULT_CELL_DEGREES = 0.25
+BRUTE_FORCE_SITES = 1024
+BRUTE_FORCE_CELLS = 1_000_000
+# 이 위도 밖에서는 경도 칸이 좁아져 링 탐색 대신 전수 거리를 쓴다.
+POLAR_LATITUDE = 60.0
+# 링 탐색 비용 상한 (위치 하나의 거리 계산 단위): 칸 조회와 링마다의 고정 비용.
+CELL_COST = 8
+RING_COST = 1024
+
+TimeBound = dt.datetime | int | None
+
+
+def _bound(value: TimeBound, default: int) -> int:
+    if value is None:
+        return default
+    if isinstance(value, dt.datetime):
+        return datetime_to_epoch_us(value)
+    return int(value)
+
+
+class TimeseriesIndex:
+    """
+    한 번 구축하는 시간·공간 색인. Time and spatial index built once per timeseries.
+
+    행을 (위치, 시각) 순으로 정렬한 순열과 전체 시각 정렬 순열을 갖고 이분 탐색으로 구간을
+    찾는다. 최근접 위치는 위치 수가 적거나 고위도 지점이면 전수 대권 거리로, 그 밖에는 경도
+    열이 ±180° 에서 이어지는 위경도 격자 링 탐색으로 찾는다. 조회 결과는 행 번호 배열(가능하면
+    뷰)과 NumPy 값 배열로, 중간 리스트를 만들지 않는다.
+    Keeps a (position, time)-sorted row permutation and a global time-sorted one and answers
+    ranges by bisection. The nearest position is found by brute-force great-circle distance
+    for few positions or high-latitude queries, and otherwise by a lat/lon grid ring search
+    whose columns wrap at ±180°. Results are row index arrays (views where possible) and
+    NumPy value arrays; no intermediate lists are built.
+    """
+
+    def __init__(
+        self, columnar: ColumnarTimeseries, cell_degrees: float = DEFAULT_CELL_DEGREES
+    ) -> None:
+        if cell_degrees <= 0:
+            raise ValueError("cell_degrees must be positive")
+        self.columnar = columnar
+        self.cell_degrees = cell_degrees
+        # 위치(위도, 경도) 다음 시각 순으로 한 번에 정렬한다.
+        order = np.lexsort((columnar.timestamps, columnar.longitude, columnar.latitude))
+        latitude = columnar.latitude[order]
+        longitude = columnar.longitude[order]
+        starts = np.flatnonzero(
+            np.concatenate(
+                [
+                    np.ones(min(order.size, 1), dtype=bool),
+                    (latitude[1:] != latitude[:-1]) | (longitude[1:] != longitude[:-1]),
+                ]
+            )
+        )
+        self.site_latitude = latitude[starts]
+        self.site_longitude = longitude[starts]
+        self.site_order = order
+        self.site_times = columnar.timestamps[order]
+        self.site_offsets = np.append(starts, order.size)
+        self.time_order = np.argsort(columnar.timestamps, kind="stable")
+        self.sorted_times = columnar.timestamps[self.time_order]
+        self._grid: dict[tuple[int, int], np.ndarray] = {}
+        # 경도 열은 360° 를 고르게 나눠 ±180° 에서 순환한다.
+        self._columns = max(1, int(360.0 // cell_degrees))
+        self._column_degrees = 360.0 / self._columns
+        if self.site_count > BRUTE_FORCE_SITES:
+            cells = np.stack(
+                [
+                    np.floor(self.site_latitude / cell_degrees),
+                    np.floor((self.site_longitude + 180.0) / self._column_degrees) % self._columns,
+                ],
+                axis=1,
+            ).astype(np.int64)
+            keys, cell_of_site = np.unique(cells, axis=0, return_inverse=True)
+            grouped = np.argsort(cell_of_site.reshape(-1), kind="stable")
+            bounds = np.searchsorted(cell_of_site.reshape(-1)[grouped], np.arange(len(keys) + 1))
+            for key, lo, hi in zip(keys.tolist(), bounds[:-1], bounds[1:]):
+                self._grid[(key[0], key[1])] = grouped[lo:hi]
+            self._row_min = int(cells[:, 0].min())
+            self._row_max = int(cells[:, 0].max())
+            self._occupied_columns = np.unique(cells[:, 1])
+
+    @classmethod
+    def from_timeseries(
+        cls, timeseries: MarineTimeseries, cell_degrees: float = DEFAULT_CELL_DEGREES
+    ) -> TimeseriesIndex:
+        """Pydantic 시계열에서 구축. Build from a ``MarineTimeseries``."""
+
+        return cls(ColumnarTimeseries.from_timeseries(timeseries), cell_degrees)
+
+    def __len__(self) -> int:
+        return len(self.columnar)
+
+    @property
+    def site_count(self) -> int:
+        """고유 위치 수. Number of distinct positions."""
+
+        return int(self.site_latitude.size)
+
+    def nearest(self, latitude: float, longitude: float) -> tuple[int, float]:
+        """최근접 위치 (위치 번호, 해리). Nearest position id and its distance in NM."""
+
+        if self.site_count == 0:
+            raise ValueError("index is empty")
+        if not self._grid:
+            return self._nearest_brute(latitude, longitude)
+        return self._nearest_in_grid(latitude, longitude)
+
+    def nearest_many(
+        self, latitude: np.ndarray, longitude: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        여러 지점의 최근접 위치 (위치 번호, 해리 배열). Nearest positions of many points.
+
+        위치 수가 적으면 (지점, 위치) 거리 행렬을 묶음 단위로 한 번에 계산하고, 많으면 지점별로
+        격자 링 탐색을 쓴다.
+        With few positions the (point, position) distance matrix is computed in blocks;
+        otherwise every point uses the grid ring search.
+        """
+
+        if self.site_count == 0:
+            raise ValueError("index is empty")
+        latitude = np.asarray(latitude, dtype=np.float64).ravel()
+        longitude = np.asarray(longitude, dtype=np.float64).ravel()
+        sites = np.empty(latitude.size, dtype=np.intp)
+        distances = np.empty(latitude.size, dtype=np.float64)
+        if self._grid:
+            for point, (lat, lon) in enumerate(zip(latitude.tolist(), longitude.tolist())):
+                sites[point], distances[point] = self._nearest_in_grid(lat, lon)
+            return sites, distances
+        # 하버사인 항은 거리에 단조이므로 arcsin 없이 최소값을 찾고 선택된 값만 거리로 바꾼다.
+        site_phi = np.radians(self.site_latitude)
+        site_lam = np.radians(self.site_longitude)
+        site_cos = np.cos(site_phi)
+        phi = np.radians(latitude)
+        lam = np.radians(longitude)
+        block = max(1, BRUTE_FORCE_CELLS // self.site_count)
+        for start in range(0, latitude.size, block):
+            part = slice(start, start + block)
+            half = (
+                np.sin((site_phi[None, :] - phi[part, None]) / 2.0) ** 2
+                + np.cos(phi[part, None])
+                * site_cos[None, :]
+                * np.sin((site_lam[None, :] - lam[part, None]) / 2.0) ** 2
+            )
+            nearest = np.argmin(half, axis=1)
+            sites[part] = nearest
+            chosen = np.clip(half[np.arange(nearest.size), nearest], 0.0, 1.0)
+            distances[part] = 2.0 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(chosen))
+        return sites, distances
+
+    def site_position(self, site: int) -> tuple[float, float]:
+        """위치 번호의 좌표. Coordinates of a position id."""
+
+        return float(self.site_latitude[site]), float(self.site_longitude[site])
+
+    def rows_at(self, site: int, start: TimeBound = None, end: TimeBound = None) -> np.ndarray:
+        """위치의 시간 구간 행 (시각 순, 양끝 포함). Rows of one position in a time window."""
+
+        lo, hi = int(self.site_offsets[site]), int(self.site_offsets[site + 1])
+        times = self.site_times[lo:hi]
+        first = lo + int(np.searchsorted(times, _bound(start, np.iinfo(np.int64).min), "left"))
+        last = lo + int(np.searchsorted(times, _bound(end, np.iinfo(np.int64).max), "right"))
+        return self.site_order[first:last]
+
+    def rows_between(self, start: TimeBound = None, end: TimeBound = None) -> np.ndarray:
+        """전체 위치의 시간 구간 행 (시각 순). Rows of every position in a time window."""
+
+        first = int(np.searchsorted(self.sorted_times, _bound(start, np.iinfo(np.int64).min)))
+        last = int(np.searchsorted(self.sorted_times, _bound(end, np.iinfo(np.int64).max), "right"))
+        return self.time_order[first:last]
+
+    def values(
+        self,
+        variable: MarineVariable,
+        latitude: float,
+        longitude: float,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        max_distance_nm: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        최근접 위치의 변수 값. Variable values at the nearest position in a time window.
+
+        (epoch µs 타임스탬프, 값) 배열을 반환하며 결측은 NaN 이다. ``max_distance_nm`` 보다
+        멀면 빈 배열을 반환한다.
+        Returns (epoch µs timestamps, values) arrays with NaN where missing; empty arrays
+        when the nearest position is farther than ``max_distance_nm``.
+        """
+
+        site, distance = self.nearest(latitude, longitude)
+        if max_distance_nm is not None and distance > max_distance_nm:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        rows = self.rows_at(site, start, end)
+        times = self.columnar.timestamps[rows]
+        column = self.columnar.values.get(variable)
+        if column is None:
+            return times, np.full(rows.size, np.nan)
+        values = column[rows]
+        return times, np.where(
+            self.columnar.quality[variable][rows] == MISSING_QUALITY, np.nan, values
+        )
+
+    def _nearest_brute(self, latitude: float, longitude: float) -> tuple[int, float]:
+        distances = haversine_nm(latitude, longitude, self.site_latitude, self.site_longitude)
+        site = int(np.argmin(distances))
+        return site, float(distances[site])
+
+    def _nearest_in_grid(self, latitude: float, longitude: float) -> tuple[int, float]:
+        if abs(latitude) >= POLAR_LATITUDE:
+            return self._nearest_brute(latitude, longitude)
+        size = self.cell_degrees
+        columns = self._columns
+        row = math.floor(latitude / size)
+        col = math.floor((longitude + 180.0) / self._column_degrees) % columns
+        spread = np.abs(self._occupied_columns - col)
+        spread = np.minimum(spread, columns - spread)
+        row_gap = max(self._row_min - row, row - self._row_max, 0)
+        # 더 안쪽 링은 위치가 있는 행이나 열에 닿지 않는다.
+        first_ring = max(row_gap, int(spread.min()))
+        max_ring = max(abs(row - self._row_min), abs(row - self._row_max), int(spread.max()))
+        cos_phi = math.cos(math.radians(latitude))
+        best_site, best_distance = -1, math.inf
+        budget = self.site_count
+        for ring in range(first_ring, max_ring + 1):
+            if best_site >= 0:
+                # 링 ``ring`` 의 칸은 위도로 (ring-1) 칸 이상 또는 경도로 (ring-1) 열 이상
+                # 떨어져 있다. 경도 차 Δλ 이상인 점까지의 최소 거리는 asin(cos φ sin Δλ) 이다.
+                reach_lat = math.radians((ring - 1) * size)
+                reach_lon = math.radians(min((ring - 1) * self._column_degrees, 90.0))
+                lower_bound = EARTH_RADIUS_NM * min(
+                    reach_lat, math.asin(min(1.0, cos_phi * math.sin(reach_lon)))
+                )
+                if lower_bound > best_distance:
+                    break
+            cells = _ring_cells(row, col, ring, columns, self._row_min, self._row_max)
+            budget -= CELL_COST * len(cells) + RING_COST
+            if budget < 0:
+                # 링 탐색이 전수 거리 계산보다 비싸지면 전수로 바꾼다.
+                return self._nearest_brute(latitude, longitude)
+            candidates = [sites for key in cells if (sites := self._grid.get(key)) is not None]
+            if not candidates:
+                continue
+            ids = np.concatenate(candidates)
+            distances = haversine_nm(
+                latitude, longitude, self.site_latitude[ids], self.site_longitude[ids]
+            )
+            index = int(np.argmin(distances))
+            if distances[index] < best_distance:
+                best_site, best_distance = int(ids[index]), float(distances[index])
+        return best_site, best_distance
+
+
+def _ring_cells(
+    row: int, col: int, ring: int, columns: int, row_min: int, row_max: int
+) -> list[tuple[int, int]]:
+    if ring == 0:
+        return [(row, col)]
+    # 위치가 없는 행은 만들지 않고, 열은 ±180° 에서 순환한다.
+    rows = [row + step for step in (-ring, ring) if row_min <= row + step <= row_max]
+    cells: list[tuple[int, int]] = []
+    if rows:
+        if 2 * ring + 1 >= columns:
+            span: range | list[int] = range(columns)
+        else:
+            span = [(col + offset) % columns for offset in range(-ring, ring + 1)]
+        cells = [(cell_row, cell_col) for cell_row in rows for cell_col in span]
+    sides = range(max(-ring + 1, row_min - row), min(ring, row_max - row + 1))
+    edges = {(col - ring) % columns, (col + ring) % columns}
+    cells += [(row + offset, cell_col) for cell_col in edges for offset in sides]
+    return cells
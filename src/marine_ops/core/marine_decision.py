@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Sequence
 
+import numpy as np
+from numpy.typing import ArrayLike
 from pydantic import BaseModel, Field
 
+from .units import round_array
+
 # 상수 정의
 FT_TO_M = 0.3048
 ALPHA = 0.85  # Combined → 등가 Hs 축소계수
@@ -30,6 +34,18 @@ GO_THRESHOLD_WIND = 20  # kt
 CONDITIONAL_THRESHOLD_HS = 1.20  # m
 CONDITIONAL_THRESHOLD_WIND = 22  # kt
 
+# 배치 결정 코드 (DECISION_LABELS 인덱스)
+DECISION_LABELS: tuple[str, ...] = (
+    "Go",
+    "Conditional Go",
+    "No-Go",
+    "Conditional Go (coastal window)",
+)
+DECISION_GO = 0
+DECISION_CONDITIONAL = 1
+DECISION_NO_GO = 2
+DECISION_COASTAL_WINDOW = 3
+
 
 class MarineInputs(BaseModel):
     """해양 운항 입력 데이터. Marine operations input data."""
@@ -63,6 +79,57 @@ class MarineOutput(BaseModel):
     effective_speed: float = Field(..., description="유효 속력 (kn)")
 
 
+@dataclass(frozen=True)
+class MarineBatchOutput:
+    """컬럼형 배치 결정 결과. Columnar batch decision result."""
+
+    hs_fused_m: np.ndarray
+    wind_fused_kt: np.ndarray
+    decision_code: np.ndarray
+    eta_hours: np.ndarray
+    buffer_minutes: np.ndarray
+    effective_speed: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.decision_code.size)
+
+    @property
+    def decisions(self) -> np.ndarray:
+        """결정 라벨 배열. Decision label array."""
+
+        return np.asarray(DECISION_LABELS, dtype=object)[self.decision_code]
+
+    def to_outputs(self) -> list[MarineOutput]:
+        """행별 MarineOutput 변환. Convert to per-row MarineOutput models."""
+
+        return [
+            MarineOutput(
+                hs_fused_m=float(hs),
+                wind_fused_kt=float(wind),
+                decision=DECISION_LABELS[int(code)],
+                eta_hours=float(eta),
+                buffer_minutes=int(buffer),
+                effective_speed=float(speed),
+            )
+            for hs, wind, code, eta, buffer, speed in zip(
+                self.hs_fused_m.ravel().tolist(),
+                self.wind_fused_kt.ravel().tolist(),
+                self.decision_code.ravel().tolist(),
+                self.eta_hours.ravel().tolist(),
+                self.buffer_minutes.ravel().tolist(),
+                self.effective_speed.ravel().tolist(),
+            )
+        ]
+
+
+def _alert_terms(alert: str | None) -> tuple[float, bool]:
+    """경보 가중치와 즉시 No-Go 여부. Alert gamma and hard No-Go flag."""
+
+    gamma = ALERT_GAMMA.get((alert or "").strip(), 0.0)
+    lowered = (alert or "").lower()
+    return gamma, lowered.startswith("high seas") or lowered == "fog"
+
+
 def decide_and_eta(
     inputs: MarineInputs,
     alpha: float = ALPHA,
@@ -94,7 +161,7 @@ def decide_and_eta(
     hs_ncm = (1 - inputs.offshore_weight) * hs_onshore + inputs.offshore_weight * hs_offshore
     
     # C) 경보 가중치
-    gamma = ALERT_GAMMA.get((inputs.alert or "").strip(), 0.0)
+    gamma, alert_no_go = _alert_terms(inputs.alert)
     
     # D) 최종 파고 융합
     hs_fused = max(hs_ncm, beta * hs_from_adnoc) * (1 + gamma)
@@ -103,7 +170,7 @@ def decide_and_eta(
     wind_fused = max(inputs.wind_adnoc, inputs.wind_albahar)
     
     # F) Go/No-Go 게이트
-    if (inputs.alert or "").lower().startswith("high seas") or (inputs.alert or "").lower() == "fog":
+    if alert_no_go:
         decision = "No-Go"
     elif (hs_fused <= GO_THRESHOLD_HS) and (wind_fused <= GO_THRESHOLD_WIND) and gamma == 0.0:
         decision = "Go"
@@ -135,6 +202,174 @@ def decide_and_eta(
     )
 
 
+def _alert_columns(
+    alert: str | None | Sequence[str | None] | np.ndarray,
+    alert_codes: ArrayLike | None,
+    alert_labels: Sequence[str | None] | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """경보 열을 (gamma, No-Go) 배열로 변환. Map alert columns to gamma/No-Go arrays."""
+
+    if alert_codes is not None:
+        if alert_labels is None:
+            raise ValueError("alert_labels is required when alert_codes is given")
+        codes = np.asarray(alert_codes, dtype=np.intp)
+        labels = list(alert_labels)
+    elif alert is None or isinstance(alert, str):
+        terms = _alert_terms(alert)
+        return np.float64(terms[0]), np.bool_(terms[1])
+    else:
+        lookup: dict[str | None, int] = {}
+        raw = np.asarray(alert, dtype=object)
+        codes = np.fromiter(
+            (lookup.setdefault(value, len(lookup)) for value in raw.ravel().tolist()),
+            dtype=np.intp,
+            count=raw.size,
+        ).reshape(raw.shape)
+        labels = list(lookup)
+    terms = [_alert_terms(label) for label in labels]
+    gamma_table = np.array([gamma for gamma, _ in terms], dtype=np.float64)
+    no_go_table = np.array([no_go for _, no_go in terms], dtype=bool)
+    return gamma_table[codes], no_go_table[codes]
+
+
+def decide_and_eta_batch(
+    combined_ft: ArrayLike,
+    wind_adnoc: ArrayLike,
+    hs_onshore_ft: ArrayLike,
+    hs_offshore_ft: ArrayLike,
+    wind_albahar: ArrayLike,
+    offshore_weight: ArrayLike,
+    distance_nm: ArrayLike,
+    planned_speed: ArrayLike,
+    alert: str | None | Sequence[str | None] | np.ndarray = None,
+    *,
+    alert_codes: ArrayLike | None = None,
+    alert_labels: Sequence[str | None] | None = None,
+    alpha: float | np.ndarray = ALPHA,
+    beta: float | np.ndarray = BETA,
+    k_wind: float | np.ndarray = K_WIND,
+    k_wave: float | np.ndarray = K_WAVE,
+    go_threshold_hs: float | np.ndarray = GO_THRESHOLD_HS,
+    go_threshold_wind: float | np.ndarray = GO_THRESHOLD_WIND,
+    conditional_threshold_hs: float | np.ndarray = CONDITIONAL_THRESHOLD_HS,
+    conditional_threshold_wind: float | np.ndarray = CONDITIONAL_THRESHOLD_WIND,
+    rounded: bool = True,
+) -> MarineBatchOutput:
+    """
+    벡터화된 해양 운항 의사결정 및 ETA 계산.
+    Vectorized marine decision making and ETA calculation.
+
+    ``decide_and_eta`` 와 동일한 연산 순서와 반올림을 사용하므로 행별 결과가 정확히 일치한다.
+    Uses the same operation order and rounding as ``decide_and_eta`` so every row matches
+    the scalar result exactly.
+
+    Args:
+        combined_ft ... planned_speed: ``MarineInputs`` 필드와 같은 의미의 브로드캐스트 가능한 배열
+        alert: 행별 경보 문자열 (None 또는 단일 문자열이면 전체 행에 적용)
+        alert_codes: ``alert_labels`` 인덱스 배열 (문자열 대신 사전 인코딩된 경보)
+        alert_labels: ``alert_codes`` 가 가리키는 경보 문자열 목록
+        alpha, beta, k_wind, k_wave: ``decide_and_eta`` 와 동일한 계수
+        go_threshold_hs ... conditional_threshold_wind: 결정 게이트 임계값 (기본값: 모듈 상수)
+            계수와 임계값에 배열(예: (조합, 1))을 주면 입력 열과 브로드캐스트되어 여러 조합을
+            한 번에 평가한다.
+        rounded: False 이면 반올림하지 않은 값을 반환 (구간별 ETA 적분 등 중간 계산용)
+
+    Returns:
+        MarineBatchOutput: 컬럼형 결정 및 ETA 배열
+    """
+
+    gamma, alert_no_go = _alert_columns(alert, alert_codes, alert_labels)
+    (
+        combined,
+        wind_a,
+        onshore_ft,
+        offshore_ft,
+        wind_b,
+        weight,
+        distance,
+        speed,
+        gamma,
+        alert_no_go,
+    ) = np.broadcast_arrays(
+        np.asarray(combined_ft, dtype=np.float64),
+        np.asarray(wind_adnoc, dtype=np.float64),
+        np.asarray(hs_onshore_ft, dtype=np.float64),
+        np.asarray(hs_offshore_ft, dtype=np.float64),
+        np.asarray(wind_albahar, dtype=np.float64),
+        np.asarray(offshore_weight, dtype=np.float64),
+        np.asarray(distance_nm, dtype=np.float64),
+        np.asarray(planned_speed, dtype=np.float64),
+        gamma,
+        alert_no_go,
+    )
+    if not np.all((weight >= 0.0) & (weight <= 1.0)):
+        raise ValueError("offshore_weight must be within [0, 1]")
+    if not np.all(distance > 0.0):
+        raise ValueError("distance_nm must be positive")
+    if not np.all(speed > 0.0):
+        raise ValueError("planned_speed must be positive")
+
+    # A) 단위 통일
+    hs_onshore = onshore_ft * FT_TO_M
+    hs_offshore = offshore_ft * FT_TO_M
+    hs_from_adnoc = alpha * (combined * FT_TO_M)
+
+    # B) NCM(연안/외해) 혼합
+    hs_ncm = (1 - weight) * hs_onshore + weight * hs_offshore
+
+    # D) 최종 파고 융합 / E) 풍속 융합
+    hs_fused = np.maximum(hs_ncm, beta * hs_from_adnoc) * (1 + gamma)
+    wind_fused = np.maximum(wind_a, wind_b)
+
+    # F) Go/No-Go 게이트
+    go = (hs_fused <= go_threshold_hs) & (wind_fused <= go_threshold_wind) & (gamma == 0.0)
+    conditional = (
+        (hs_fused <= conditional_threshold_hs)
+        | (wind_fused <= conditional_threshold_wind)
+        | (gamma > 0.0)
+    )
+    decision = np.full(hs_fused.shape, DECISION_NO_GO, dtype=np.int8)
+    decision[conditional] = DECISION_CONDITIONAL
+    decision[go] = DECISION_GO
+    decision[np.broadcast_to(alert_no_go, decision.shape)] = DECISION_NO_GO
+
+    # G) 연안 창 완화
+    coastal = (
+        (decision == DECISION_NO_GO) & (weight <= 0.40) & (hs_onshore <= 1.00) & (gamma <= 0.15)
+    )
+    decision[coastal] = DECISION_COASTAL_WINDOW
+
+    # H) ETA 계산 (속력 손실 모델)
+    f_wind = k_wind * np.maximum(wind_fused - 10.0, 0.0)
+    f_wave = k_wave * hs_fused
+    effective_speed = np.maximum(speed - f_wind - f_wave, 0.1)
+    eta_hours = distance / effective_speed
+
+    # I) 버퍼 시간
+    buffer_minutes = np.where(weight <= 0.40, 45, 60)
+    if buffer_minutes.shape != decision.shape:
+        # 배열 계수로 결과가 커진 경우 입력 열 형태의 버퍼를 결과 형태로 맞춘다.
+        buffer_minutes = np.broadcast_to(buffer_minutes, decision.shape).copy()
+
+    if not rounded:
+        return MarineBatchOutput(
+            hs_fused_m=hs_fused,
+            wind_fused_kt=wind_fused,
+            decision_code=decision,
+            eta_hours=eta_hours,
+            buffer_minutes=buffer_minutes,
+            effective_speed=effective_speed,
+        )
+    return MarineBatchOutput(
+        hs_fused_m=round_array(hs_fused, 2),
+        wind_fused_kt=round_array(wind_fused, 1),
+        decision_code=decision,
+        eta_hours=round_array(eta_hours, 1),
+        buffer_minutes=buffer_minutes,
+        effective_speed=round_array(effective_speed, 1),
+    )
+
+
 def create_sample_inputs() -> MarineInputs:
     """샘플 입력 데이터 생성. Create sample input data."""
     
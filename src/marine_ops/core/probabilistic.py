@@ -0,0 +1,230 @@
+"""몬테카를로 확률적 의사결정. Monte Carlo probabilistic marine decisions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .marine_decision import (
+    ALPHA,
+    BETA,
+    DECISION_COASTAL_WINDOW,
+    DECISION_CONDITIONAL,
+    DECISION_GO,
+    DECISION_LABELS,
+    DECISION_NO_GO,
+    K_WAVE,
+    K_WIND,
+    MarineInputs,
+    decide_and_eta_batch,
+)
+from .sweep import DEFAULT_CHUNK_CELLS, HISTORY_COLUMNS, prepare_history
+
+ERROR_KINDS = ("normal", "lognormal", "uniform")
+DEFAULT_SAMPLES = 10_000
+DEFAULT_PERCENTILES = (10.0, 50.0, 90.0)
+WAVE_COLUMNS = ("combined_ft", "hs_onshore_ft", "hs_offshore_ft")
+WIND_COLUMNS = ("wind_adnoc", "wind_albahar")
+
+
+@dataclass(frozen=True)
+class ForecastError:
+    """
+    예보 오차 분포. Forecast error distribution.
+
+    ``kind`` 는 ``normal``(평균 ``bias``, 표준편차 ``scale``), ``lognormal``(로그 공간의 같은
+    모수) 또는 ``uniform``(``bias`` ± ``scale``)이다. ``relative`` 이면 표본을 배율로 곱하고
+    (``normal``/``uniform`` 은 1 + 표본, ``lognormal`` 은 exp(표본)), 아니면 입력 단위(ft, kt)로
+    더한다. 교란된 값은 0 아래로 내려가지 않는다.
+    ``kind`` is ``normal`` (mean ``bias``, standard deviation ``scale``), ``lognormal`` (the
+    same parameters in log space) or ``uniform`` (``bias`` ± ``scale``). With ``relative``
+    draws are applied as a factor (1 + draw for ``normal``/``uniform``, exp(draw) for
+    ``lognormal``); otherwise they are added in input units (ft, kt). Perturbed values are
+    floored at zero.
+    """
+
+    kind: str = "normal"
+    scale: float = 0.0
+    bias: float = 0.0
+    relative: bool = False
+
+    def __post_init__(self) -> None:
+        if self.kind not in ERROR_KINDS:
+            raise ValueError(f"unknown error distribution: {self.kind}")
+        if not np.isfinite(self.scale) or self.scale < 0:
+            raise ValueError("error scale must be finite and non-negative")
+        if self.kind == "lognormal" and not self.relative:
+            raise ValueError("lognormal errors must be relative")
+
+    def sample(self, rng: np.random.Generator, shape: tuple[int, ...]) -> np.ndarray:
+        """오차 표본 추출. Draw raw error samples."""
+
+        if self.kind == "uniform":
+            return rng.uniform(self.bias - self.scale, self.bias + self.scale, shape)
+        return rng.normal(self.bias, self.scale, shape)
+
+    def apply(self, values: np.ndarray, draws: np.ndarray) -> np.ndarray:
+        """표본으로 값 교란. Perturb values with drawn errors."""
+
+        if not self.relative:
+            return np.maximum(values + draws, 0.0)
+        factor = np.exp(draws) if self.kind == "lognormal" else 1.0 + draws
+        return np.maximum(values * factor, 0.0)
+
+
+# 파고 예보는 상대 오차(약 15%), 풍속은 절대 오차(약 2 kt)로 본다.
+DEFAULT_WAVE_ERROR = ForecastError("lognormal", 0.15, relative=True)
+DEFAULT_WIND_ERROR = ForecastError("normal", 2.0)
+
+
+@dataclass(frozen=True)
+class ProbabilisticDecision:
+    """
+    항로별 확률적 결정 결과. Per-route probabilistic decision result.
+
+    ``probabilities`` 는 (항로, ``DECISION_LABELS``) 표본 비율, ``eta_percentiles`` 는
+    (항로, ``percentiles``) ETA 분위수이며 ``deterministic_code`` 는 교란 없는 결정 코드다.
+    ``probabilities`` is the (route, ``DECISION_LABELS``) sample share, ``eta_percentiles``
+    the (route, ``percentiles``) ETA quantiles and ``deterministic_code`` the unperturbed
+    decision code.
+    """
+
+    samples: int
+    probabilities: np.ndarray
+    eta_percentiles: np.ndarray
+    percentiles: tuple[float, ...]
+    deterministic_code: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.probabilities.shape[0])
+
+    @property
+    def p_go(self) -> np.ndarray:
+        """P(Go)."""
+
+        return self.probabilities[:, DECISION_GO]
+
+    @property
+    def p_conditional(self) -> np.ndarray:
+        """P(Conditional), 연안 창 포함. P(Conditional) including the coastal window."""
+
+        return (
+            self.probabilities[:, DECISION_CONDITIONAL]
+            + self.probabilities[:, DECISION_COASTAL_WINDOW]
+        )
+
+    @property
+    def p_no_go(self) -> np.ndarray:
+        """P(No-Go)."""
+
+        return self.probabilities[:, DECISION_NO_GO]
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """항로별 요약 행. One summary row per route."""
+
+        rows = []
+        for index in range(len(self)):
+            row: dict[str, Any] = {
+                "decision": DECISION_LABELS[int(self.deterministic_code[index])],
+                "p_go": float(self.p_go[index]),
+                "p_conditional": float(self.p_conditional[index]),
+                "p_no_go": float(self.p_no_go[index]),
+            }
+            for percentile, eta in zip(self.percentiles, self.eta_percentiles[index]):
+                row[f"eta_p{percentile:g}"] = float(eta)
+            rows.append(row)
+        return rows
+
+
+def _route_columns(routes: Mapping[str, ArrayLike] | Sequence[MarineInputs]) -> Mapping[str, Any]:
+    if isinstance(routes, Mapping):
+        return routes
+    columns: dict[str, Any] = {
+        name: np.array([getattr(item, name) for item in routes], dtype=np.float64)
+        for name in HISTORY_COLUMNS
+    }
+    columns["alert"] = np.array([item.alert for item in routes], dtype=object)
+    return columns
+
+
+def decide_probabilistic(
+    routes: Mapping[str, ArrayLike] | Sequence[MarineInputs],
+    samples: int = DEFAULT_SAMPLES,
+    wave_error: ForecastError = DEFAULT_WAVE_ERROR,
+    wind_error: ForecastError = DEFAULT_WIND_ERROR,
+    seed: int | None = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    chunk_cells: int = DEFAULT_CHUNK_CELLS,
+    *,
+    alpha: float = ALPHA,
+    beta: float = BETA,
+    k_wind: float = K_WIND,
+    k_wave: float = K_WAVE,
+) -> ProbabilisticDecision:
+    """
+    예보 오차 표본으로 항로별 결정 확률 추정.
+    Estimate per-route decision probabilities from sampled forecast errors.
+
+    ``routes`` 는 ``MarineInputs`` 목록 또는 ``decide_and_eta_batch`` 입력 열
+    (``HISTORY_COLUMNS`` 와 선택적 ``alert``)이다. 표본마다 항로별로 파고 오차 하나를
+    Combined·연안·외해 파고에, 풍속 오차 하나를 두 풍속에 함께 적용한다(같은 기상 상황의
+    공통 예보 오차). (표본, 항로) 배열을 ``chunk_cells`` 셀 단위 표본 묶음으로 한 번씩
+    ``decide_and_eta_batch`` 에 넣어 평가한다. 파고·풍속 표본은 ``seed`` 에서 분리한 별도
+    난수열에서 순서대로 뽑으므로 결과는 ``seed`` 로 재현되고 묶음 크기와 무관하다.
+    ``routes`` is a list of ``MarineInputs`` or the ``decide_and_eta_batch`` input columns
+    (``HISTORY_COLUMNS`` plus an optional ``alert``). For every sample and route one wave
+    error is applied to the combined, onshore and offshore heights and one wind error to
+    both wind speeds, modelling a common forecast error for the same weather. The
+    (sample, route) array is evaluated with one ``decide_and_eta_batch`` call per block of
+    about ``chunk_cells`` cells. Wave and wind draws come from separate streams spawned from
+    ``seed``, so results are reproducible and independent of the block size.
+    """
+
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+    table = prepare_history(_route_columns(routes), None)
+    count = int(table["observed"].size)
+    inputs = {name: np.broadcast_to(table[name], (count,)) for name in HISTORY_COLUMNS}
+    alert_kwargs: dict[str, Any]
+    if "alert_codes" in table:
+        alert_kwargs = {
+            "alert_codes": np.broadcast_to(table["alert_codes"], (count,)),
+            "alert_labels": table["alert_labels"],
+        }
+    else:
+        alert_kwargs = {"alert": table["alert"]}
+    coefficients = {"alpha": alpha, "beta": beta, "k_wind": k_wind, "k_wave": k_wave}
+
+    deterministic = decide_and_eta_batch(**inputs, **alert_kwargs, **coefficients)
+    wave_rng, wind_rng = (
+        np.random.default_rng(stream) for stream in np.random.SeedSequence(seed).spawn(2)
+    )
+    counts = np.zeros((count, len(DECISION_LABELS)), dtype=np.int64)
+    eta = np.empty((samples, count), dtype=np.float64)
+    block = max(1, chunk_cells // max(count, 1))
+    for start in range(0, samples, block):
+        size = min(block, samples - start)
+        wave_draws = wave_error.sample(wave_rng, (size, count))
+        wind_draws = wind_error.sample(wind_rng, (size, count))
+        perturbed = dict(inputs)
+        for name in WAVE_COLUMNS:
+            perturbed[name] = wave_error.apply(inputs[name], wave_draws)
+        for name in WIND_COLUMNS:
+            perturbed[name] = wind_error.apply(inputs[name], wind_draws)
+        outputs = decide_and_eta_batch(**perturbed, **alert_kwargs, **coefficients)
+        # 항로별 결정 빈도를 (항로, 결정) 칸 번호의 bincount 한 번으로 센다.
+        cells = outputs.decision_code.astype(np.intp) + np.arange(count) * len(DECISION_LABELS)
+        counts += np.bincount(cells.ravel(), minlength=counts.size).reshape(counts.shape)
+        eta[start : start + size] = outputs.eta_hours
+
+    quantiles = tuple(float(value) for value in percentiles)
+    return ProbabilisticDecision(
+        samples=samples,
+        probabilities=counts / samples,
+        eta_percentiles=np.percentile(eta, quantiles, axis=0).T.reshape(count, len(quantiles)),
+        percentiles=quantiles,
+        deterministic_code=deterministic.decision_code,
+    )
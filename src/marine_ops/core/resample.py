@@ -0,0 +1,214 @@
+"""공통 시간 격자 재표본화. Resampling and alignment onto a common time grid."""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Sequence
+
+import numpy as np
+
+from .columnar import MISSING_QUALITY, QUALITY_FLAGS, ColumnarTimeseries, datetime_to_epoch_us
+from .schema import MarineTimeseries, MarineVariable, QualityFlag
+from .units import round_array
+
+DIRECTIONAL_VARIABLES: frozenset[MarineVariable] = frozenset(
+    {MarineVariable.WIND_DIRECTION_10M, MarineVariable.SWELL_DIRECTION}
+)
+DEFAULT_STEP = dt.timedelta(hours=1)
+IMPUTED_QUALITY = QUALITY_FLAGS.index(QualityFlag.IMPUTED)
+
+TimeBound = dt.datetime | int | None
+
+
+def to_epoch_us(value: dt.datetime | int) -> int:
+    """datetime 또는 epoch µs → epoch µs. Normalise a datetime or epoch µs to epoch µs."""
+
+    if isinstance(value, dt.datetime):
+        return datetime_to_epoch_us(value)
+    return int(value)
+
+
+def step_to_us(step: dt.timedelta | int) -> int:
+    """양수 간격 → µs. Convert a positive step (timedelta or µs) to microseconds."""
+
+    step_us = step // dt.timedelta(microseconds=1) if isinstance(step, dt.timedelta) else step
+    if step_us <= 0:
+        raise ValueError("step must be positive")
+    return int(step_us)
+
+
+def as_columnar(series: MarineTimeseries | ColumnarTimeseries) -> ColumnarTimeseries:
+    """컬럼형으로 변환 (이미 컬럼형이면 그대로). Columnar view, converting only if needed."""
+
+    if isinstance(series, ColumnarTimeseries):
+        return series
+    return ColumnarTimeseries.from_timeseries(series)
+
+
+def time_grid(
+    start: dt.datetime | int, end: dt.datetime | int, step: dt.timedelta | int
+) -> np.ndarray:
+    """
+    epoch 정렬 시간 격자 (양끝 포함). Epoch-aligned time grid, inclusive.
+
+    격자점은 ``step`` 의 정수배이므로 공급자가 달라도 같은 시각에 맞춰진다.
+    Grid points are integer multiples of ``step`` so grids from different providers line up.
+    """
+
+    step_us = step_to_us(step)
+    first = -(-to_epoch_us(start) // step_us) * step_us
+    last = to_epoch_us(end) // step_us * step_us
+    if last < first:
+        return np.empty(0, dtype=np.int64)
+    return np.arange(first, last + step_us, step_us, dtype=np.int64)
+
+
+def resample(
+    series: MarineTimeseries | ColumnarTimeseries,
+    step: dt.timedelta | int = DEFAULT_STEP,
+    start: TimeBound = None,
+    end: TimeBound = None,
+    max_gap: dt.timedelta | int | None = None,
+) -> ColumnarTimeseries:
+    """
+    위치별 시계열을 시간 격자로 재표본화. Resample every position onto one time grid.
+
+    격자 시각과 일치하는 측정값은 품질 플래그와 함께 그대로 쓰고, 같은 위치의 앞뒤
+    측정값 사이는 선형(방향 변수는 최단 호를 따라 원형) 보간해 ``QualityFlag.IMPUTED`` 로
+    표시한다. 측정 구간 밖은 외삽하지 않으며 간격이 ``max_gap`` 보다 크면 결측으로 둔다.
+    모든 위치를 (위치, 시각) 합성 키에 대한 변수별 ``searchsorted`` 한 번으로 처리하며,
+    측정값이 하나도 없는 격자 행은 제외한다.
+    Measurements on a grid instant are kept with their quality flag. Between two
+    measurements of the same position values are interpolated linearly, or along the
+    shortest arc for direction variables, and flagged ``QualityFlag.IMPUTED``. Nothing is
+    extrapolated and gaps wider than ``max_gap`` stay missing. All positions are handled
+    with one ``searchsorted`` per variable over a (position, time) composite key; grid rows
+    without any measurement are dropped.
+    """
+
+    columnar = as_columnar(series)
+    step_us = step_to_us(step)
+    gap_us = None if max_gap is None else step_to_us(max_gap)
+    size = len(columnar)
+    if size == 0:
+        return columnar.take(np.empty(0, dtype=np.intp))
+
+    # 위치, 시각 순으로 정렬하고 위치 번호를 매긴다.
+    order = np.lexsort((columnar.timestamps, columnar.longitude, columnar.latitude))
+    latitude = columnar.latitude[order]
+    longitude = columnar.longitude[order]
+    times = columnar.timestamps[order]
+    new_site = np.concatenate(
+        [[True], (latitude[1:] != latitude[:-1]) | (longitude[1:] != longitude[:-1])]
+    )
+    site_of_row = np.cumsum(new_site) - 1
+    site_starts = np.flatnonzero(new_site)
+    sites = site_starts.size
+
+    grid = time_grid(
+        int(times.min()) if start is None else start,
+        int(times.max()) if end is None else end,
+        step_us,
+    )
+    if grid.size == 0:
+        return columnar.take(np.empty(0, dtype=np.intp))
+    origin = min(int(times.min()), int(grid[0]))
+    span = max(int(times.max()), int(grid[-1])) - origin + 1
+    if sites > np.iinfo(np.int64).max // span:
+        raise ValueError("time span too wide for the number of positions")
+    keys = site_of_row * span + (times - origin)
+    query_site = np.repeat(np.arange(sites), grid.size)
+    query_time = np.tile(grid, sites)
+    query = query_site * span + (query_time - origin)
+
+    # 메타데이터는 같은 위치의 직전(없으면 첫) 행에서 가져온다.
+    previous = np.searchsorted(keys, query, side="right") - 1
+    previous = np.maximum(previous, site_starts[query_site])
+    metadata_index = columnar.metadata_index[order][previous]
+
+    values: dict[MarineVariable, np.ndarray] = {}
+    quality: dict[MarineVariable, np.ndarray] = {}
+    present = np.zeros(query.size, dtype=bool)
+    for variable in columnar.variables:
+        codes = columnar.quality[variable][order]
+        valid = codes != MISSING_QUALITY
+        valid_keys = keys[valid]
+        valid_values = columnar.values[variable][order][valid]
+        valid_codes = codes[valid]
+        valid_sites = site_of_row[valid]
+        valid_times = times[valid]
+        out_values = np.zeros(query.size, dtype=np.float64)
+        out_codes = np.full(query.size, MISSING_QUALITY, dtype=np.int8)
+        if valid_keys.size:
+            right = np.searchsorted(valid_keys, query, side="left")
+            left = right - 1
+            right_in = np.minimum(right, valid_keys.size - 1)
+            left_in = np.maximum(left, 0)
+            exact = (right < valid_keys.size) & (valid_keys[right_in] == query)
+            between = (
+                ~exact
+                & (left >= 0)
+                & (right < valid_keys.size)
+                & (valid_sites[left_in] == query_site)
+                & (valid_sites[right_in] == query_site)
+            )
+            if gap_us is not None:
+                between &= valid_times[right_in] - valid_times[left_in] <= gap_us
+            left_values = valid_values[left_in]
+            right_values = valid_values[right_in]
+            weight = (query_time - valid_times[left_in]) / np.maximum(
+                valid_times[right_in] - valid_times[left_in], 1
+            )
+            if variable in DIRECTIONAL_VARIABLES:
+                # 최단 호 차이(-180, 180]로 보간한 뒤 [0, 360)으로 되돌린다.
+                delta = (right_values - left_values + 180.0) % 360.0 - 180.0
+                delta = np.where(delta == -180.0, 180.0, delta)
+                interpolated = round_array((left_values + weight * delta) % 360.0, 2)
+                interpolated = np.where(interpolated >= 360.0, 0.0, interpolated)
+            else:
+                interpolated = round_array(left_values + weight * (right_values - left_values), 2)
+            out_values = np.where(
+                exact, valid_values[right_in], np.where(between, interpolated, 0.0)
+            )
+            out_codes[between] = IMPUTED_QUALITY
+            out_codes[exact] = valid_codes[right_in][exact]
+        values[variable] = out_values
+        quality[variable] = out_codes
+        present |= out_codes != MISSING_QUALITY
+
+    rows = np.flatnonzero(present)
+    return ColumnarTimeseries(
+        timestamps=query_time[rows],
+        latitude=latitude[site_starts][query_site[rows]],
+        longitude=longitude[site_starts][query_site[rows]],
+        values={variable: array[rows] for variable, array in values.items()},
+        quality={variable: array[rows] for variable, array in quality.items()},
+        units=dict(columnar.units),
+        metadata=columnar.metadata,
+        metadata_index=metadata_index[rows],
+    )
+
+
+def align(
+    series: Sequence[MarineTimeseries | ColumnarTimeseries],
+    step: dt.timedelta | int = DEFAULT_STEP,
+    start: TimeBound = None,
+    end: TimeBound = None,
+    max_gap: dt.timedelta | int | None = None,
+) -> list[ColumnarTimeseries]:
+    """
+    여러 공급자 시계열을 같은 격자로 정렬. Align several provider series on one grid.
+
+    ``start``/``end`` 를 생략하면 모든 입력의 전체 시간 범위를 덮는 격자를 쓴다.
+    예: WorldTides 30분 간격 수위와 Stormglass·Open-Meteo 1시간 예보를 같은 시각으로 맞춘다.
+    Without ``start``/``end`` the grid covers the union of all inputs, e.g. to line up
+    30-minute WorldTides heights with hourly Stormglass and Open-Meteo forecasts.
+    """
+
+    columnars = [as_columnar(item) for item in series]
+    non_empty = [columnar.timestamps for columnar in columnars if len(columnar)]
+    if start is None:
+        start = min((int(times.min()) for times in non_empty), default=0)
+    if end is None:
+        end = max((int(times.max()) for times in non_empty), default=-1)
+    return [resample(columnar, step, start, end, max_gap) for columnar in columnars]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import datetime as dt
 from enum import Enum
-from typing import Iterable, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 
@@ -114,25 +114,49 @@ class MarineTimeseries(BaseModel):
 
     points: Sequence[MarineDataPoint]
 
+    def window(self, start: dt.datetime, end: dt.datetime) -> "MarineTimeseries":
+        """시간 구간 부분 시계열 (양끝 포함). Sub-series with start <= timestamp <= end."""
+
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=dt.timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=dt.timezone.utc)
+        return MarineTimeseries.model_construct(
+            points=[point for point in self.points if start <= point.timestamp <= end]
+        )
+
     def iter_rows(self) -> Iterable[tuple[str, ...]]:
         """RFC 4180 행 이터레이터. RFC 4180 row iterator."""
 
-        for point in self.points:
-            iso_time = point.timestamp.strftime(CSV_TIMESTAMP_FORMAT)
-            for measurement in point.measurements:
-                yield (
-                    iso_time,
-                    f"{point.position.latitude:.2f}",
-                    f"{point.position.longitude:.2f}",
-                    measurement.variable.value,
-                    f"{measurement.value:.2f}",
-                    measurement.unit.value,
-                    point.metadata.source,
-                    measurement.quality_flag.value,
-                    "true" if point.metadata.bias_corrected else "false",
-                    (
-                        f"{point.metadata.ensemble_weight:.2f}"
-                        if point.metadata.ensemble_weight is not None
-                        else ""
-                    ),
-                )
+        return iter_csv_rows(self.points)
+
+
+def iter_csv_rows(points: Iterable[Any]) -> Iterator[tuple[str, ...]]:
+    """
+    포인트의 RFC 4180 행. RFC 4180 rows of data points.
+
+    ``timestamp``/``position``/``measurements``/``metadata`` 속성만 읽으므로 pydantic
+    포인트와 ``__slots__`` 포인트를 모두 받는다.
+    Reads only the ``timestamp``/``position``/``measurements``/``metadata`` attributes, so
+    pydantic and ``__slots__`` points are both accepted.
+    """
+
+    for point in points:
+        iso_time = point.timestamp.strftime(CSV_TIMESTAMP_FORMAT)
+        for measurement in point.measurements:
+            yield (
+                iso_time,
+                f"{point.position.latitude:.2f}",
+                f"{point.position.longitude:.2f}",
+                measurement.variable.value,
+                f"{measurement.value:.2f}",
+                measurement.unit.value,
+                point.metadata.source,
+                measurement.quality_flag.value,
+                "true" if point.metadata.bias_corrected else "false",
+                (
+                    f"{point.metadata.ensemble_weight:.2f}"
+                    if point.metadata.ensemble_weight is not None
+                    else ""
+                ),
+            )
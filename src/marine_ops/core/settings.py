@@ -3,17 +3,25 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Mapping
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Mapping, TypeVar
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 DEFAULT_TIMEOUT = 10.0
+DEFAULT_HTTP_MAX_CONNECTIONS = 20
+DEFAULT_HTTP_MAX_KEEPALIVE = 10
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30.0
+
+NumberT = TypeVar("NumberT", int, float)
 
 if TYPE_CHECKING:  # pragma: no cover - import-time typing only
-    from marine_ops.connectors.open_meteo_fallback import OpenMeteoFallback
-    from marine_ops.connectors.stormglass import StormglassConnector
-    from marine_ops.connectors.worldtides import WorldTidesConnector
+    from marine_ops.connectors.http_pool import HttpClientRegistry
+    from marine_ops.connectors.open_meteo_fallback import AsyncOpenMeteoFallback, OpenMeteoFallback
+    from marine_ops.connectors.routing import AsyncProviderRouter, ProviderRouter
+    from marine_ops.connectors.stormglass import AsyncStormglassConnector, StormglassConnector
+    from marine_ops.connectors.worldtides import AsyncWorldTidesConnector, WorldTidesConnector
 
 
 class MarineOpsSettings(BaseModel):
@@ -24,6 +32,14 @@ class MarineOpsSettings(BaseModel):
     open_meteo_base: str | None = None
     open_meteo_timeout: float = DEFAULT_TIMEOUT
     app_log_level: str = "INFO"
+    trusted_sources: bool = False
+    http_max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS
+    http_max_keepalive: int = DEFAULT_HTTP_MAX_KEEPALIVE
+    http_keepalive_expiry: float = DEFAULT_HTTP_KEEPALIVE_EXPIRY
+    http2: bool = True
+    http_ca_bundle: str | None = None
+
+    _clients: HttpClientRegistry | None = PrivateAttr(default=None)
 
     @classmethod
     def from_env(cls, env: Mapping[str, str] | None = None) -> MarineOpsSettings:
@@ -43,32 +59,102 @@ class MarineOpsSettings(BaseModel):
             open_meteo_base=source.get("OPEN_METEO_BASE"),
             open_meteo_timeout=timeout,
             app_log_level=source.get("APP_LOG_LEVEL", "INFO"),
+            trusted_sources=source.get("TRUSTED_SOURCES", "").lower() in ("1", "true", "yes"),
+            http_max_connections=_env_number(
+                source, "HTTP_MAX_CONNECTIONS", DEFAULT_HTTP_MAX_CONNECTIONS, int
+            ),
+            http_max_keepalive=_env_number(
+                source, "HTTP_MAX_KEEPALIVE", DEFAULT_HTTP_MAX_KEEPALIVE, int
+            ),
+            http_keepalive_expiry=_env_number(
+                source, "HTTP_KEEPALIVE_EXPIRY", DEFAULT_HTTP_KEEPALIVE_EXPIRY, float
+            ),
+            http2=source.get("HTTP2", "true").lower() in ("1", "true", "yes"),
+            http_ca_bundle=source.get("HTTP_CA_BUNDLE") or None,
         )
 
+    @property
+    def clients(self) -> HttpClientRegistry:
+        """
+        공유 HTTP 클라이언트 레지스트리. Shared pooled HTTP client registry.
+
+        모든 ``build_*`` 메서드는 클라이언트를 넘기지 않으면 여기서 호스트별 클라이언트를 받는다.
+        Every ``build_*`` method draws its per-host client from here unless one is passed in.
+        """
+
+        from marine_ops.connectors.http_pool import HttpClientRegistry
+
+        if self._clients is None:
+            self._clients = HttpClientRegistry(
+                timeout=self.open_meteo_timeout,
+                max_connections=self.http_max_connections,
+                max_keepalive_connections=self.http_max_keepalive,
+                keepalive_expiry=self.http_keepalive_expiry,
+                http2=self.http2,
+                verify=self.http_ca_bundle or True,
+            )
+        return self._clients
+
+    def close(self) -> None:
+        """공유 동기 클라이언트 종료. Close the shared sync clients."""
+
+        if self._clients is not None:
+            self._clients.close()
+
+    async def aclose(self) -> None:
+        """공유 클라이언트 전체 종료. Close every shared client."""
+
+        if self._clients is not None:
+            await self._clients.aclose()
+
+    def __enter__(self) -> MarineOpsSettings:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> MarineOpsSettings:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
     def build_stormglass_connector(self, client: httpx.Client | None = None) -> StormglassConnector:
         """Stormglass 커넥터 생성. Build Stormglass connector."""
 
-        from marine_ops.connectors.stormglass import StormglassConnector
+        from marine_ops.connectors.stormglass import STORMGLASS_URL, StormglassConnector
 
         if not self.stormglass_api_key:
             raise ValueError("STORMGLASS_API_KEY is required for StormglassConnector")
         return StormglassConnector(
             api_key=self.stormglass_api_key,
-            client=client or httpx.Client(timeout=self.open_meteo_timeout),
+            client=client or self.clients.client(STORMGLASS_URL),
             timeout=self.open_meteo_timeout,
+            trusted=self.trusted_sources,
         )
 
     def build_worldtides_connector(self, client: httpx.Client | None = None) -> WorldTidesConnector:
         """WorldTides 커넥터 생성. Build WorldTides connector."""
 
-        from marine_ops.connectors.worldtides import WorldTidesConnector
+        from marine_ops.connectors.worldtides import WORLDTIDES_URL, WorldTidesConnector
 
         if not self.worldtides_api_key:
             raise ValueError("WORLDTIDES_API_KEY is required for WorldTidesConnector")
         return WorldTidesConnector(
             api_key=self.worldtides_api_key,
-            client=client or httpx.Client(timeout=self.open_meteo_timeout),
+            client=client or self.clients.client(WORLDTIDES_URL),
             timeout=self.open_meteo_timeout,
+            trusted=self.trusted_sources,
         )
 
     def build_open_meteo_fallback(self, client: httpx.Client | None = None) -> OpenMeteoFallback:
@@ -79,6 +165,88 @@ class MarineOpsSettings(BaseModel):
         base_url = self.open_meteo_base or OPEN_METEO_URL
         return OpenMeteoFallback(
             base_url=base_url,
-            client=client or httpx.Client(timeout=self.open_meteo_timeout),
+            client=client or self.clients.client(base_url),
+            timeout=self.open_meteo_timeout,
+            trusted=self.trusted_sources,
+        )
+
+    def build_async_stormglass_connector(
+        self, client: httpx.AsyncClient | None = None
+    ) -> AsyncStormglassConnector:
+        """비동기 Stormglass 커넥터 생성. Build async Stormglass connector."""
+
+        from marine_ops.connectors.stormglass import STORMGLASS_URL, AsyncStormglassConnector
+
+        if not self.stormglass_api_key:
+            raise ValueError("STORMGLASS_API_KEY is required for AsyncStormglassConnector")
+        return AsyncStormglassConnector(
+            api_key=self.stormglass_api_key,
+            client=client or self.clients.async_client(STORMGLASS_URL),
             timeout=self.open_meteo_timeout,
+            trusted=self.trusted_sources,
         )
+
+    def build_async_worldtides_connector(
+        self, client: httpx.AsyncClient | None = None
+    ) -> AsyncWorldTidesConnector:
+        """비동기 WorldTides 커넥터 생성. Build async WorldTides connector."""
+
+        from marine_ops.connectors.worldtides import WORLDTIDES_URL, AsyncWorldTidesConnector
+
+        if not self.worldtides_api_key:
+            raise ValueError("WORLDTIDES_API_KEY is required for AsyncWorldTidesConnector")
+        return AsyncWorldTidesConnector(
+            api_key=self.worldtides_api_key,
+            client=client or self.clients.async_client(WORLDTIDES_URL),
+            timeout=self.open_meteo_timeout,
+            trusted=self.trusted_sources,
+        )
+
+    def build_async_open_meteo_fallback(
+        self, client: httpx.AsyncClient | None = None
+    ) -> AsyncOpenMeteoFallback:
+        """비동기 Open-Meteo 폴백 생성. Build async Open-Meteo fallback connector."""
+
+        from marine_ops.connectors.open_meteo_fallback import (
+            OPEN_METEO_URL,
+            AsyncOpenMeteoFallback,
+        )
+
+        base_url = self.open_meteo_base or OPEN_METEO_URL
+        return AsyncOpenMeteoFallback(
+            base_url=base_url,
+            client=client or self.clients.async_client(base_url),
+            timeout=self.open_meteo_timeout,
+            trusted=self.trusted_sources,
+        )
+
+    def build_provider_router(self, **options: Any) -> ProviderRouter:
+        """Stormglass→Open-Meteo 라우터 생성. Build a Stormglass-first provider router."""
+
+        from marine_ops.connectors.routing import ProviderRouter
+
+        return ProviderRouter(
+            [self.build_stormglass_connector(), self.build_open_meteo_fallback()], **options
+        )
+
+    def build_async_provider_router(self, **options: Any) -> AsyncProviderRouter:
+        """비동기 Stormglass→Open-Meteo 라우터 생성. Build an async provider router."""
+
+        from marine_ops.connectors.routing import AsyncProviderRouter
+
+        return AsyncProviderRouter(
+            [self.build_async_stormglass_connector(), self.build_async_open_meteo_fallback()],
+            **options,
+        )
+
+
+def _env_number(
+    source: Mapping[str, str], name: str, default: NumberT, cast: Callable[[str], NumberT]
+) -> NumberT:
+    raw = source.get(name)
+    if not raw:
+        return default
+    try:
+        return cast(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be numeric") from exc
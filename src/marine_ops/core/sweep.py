@@ -0,0 +1,298 @@
+"""계수·임계값 민감도 스윕. Coefficient and threshold sensitivity sweep."""
+
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .marine_decision import (
+    ALPHA,
+    BETA,
+    CONDITIONAL_THRESHOLD_HS,
+    CONDITIONAL_THRESHOLD_WIND,
+    DECISION_LABELS,
+    GO_THRESHOLD_HS,
+    GO_THRESHOLD_WIND,
+    K_WAVE,
+    K_WIND,
+    decide_and_eta_batch,
+)
+
+SWEEP_DEFAULTS: dict[str, float] = {
+    "alpha": ALPHA,
+    "beta": BETA,
+    "k_wind": K_WIND,
+    "k_wave": K_WAVE,
+    "go_threshold_hs": GO_THRESHOLD_HS,
+    "go_threshold_wind": GO_THRESHOLD_WIND,
+    "conditional_threshold_hs": CONDITIONAL_THRESHOLD_HS,
+    "conditional_threshold_wind": CONDITIONAL_THRESHOLD_WIND,
+}
+HISTORY_COLUMNS = (
+    "combined_ft",
+    "wind_adnoc",
+    "hs_onshore_ft",
+    "hs_offshore_ft",
+    "wind_albahar",
+    "offshore_weight",
+    "distance_nm",
+    "planned_speed",
+)
+DEFAULT_CHUNK_CELLS = 1_000_000
+PARALLEL_THRESHOLD_CELLS = 50_000_000
+
+# 작업 프로세스가 한 번만 받는 과거 입력 표.
+_WORKER_HISTORY: dict[str, Any] = {}
+
+
+def coefficient_grid(**axes: Sequence[float]) -> dict[str, np.ndarray]:
+    """
+    계수 축의 데카르트 곱. Cartesian product of coefficient axes.
+
+    지정하지 않은 계수는 기본값으로 고정된다.
+    Coefficients without an axis stay at their defaults.
+    """
+
+    unknown = set(axes) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"unknown sweep parameters: {sorted(unknown)}")
+    names = list(axes)
+    combos = list(itertools.product(*(axes[name] for name in names)))
+    columns = {name: np.full(len(combos), value) for name, value in SWEEP_DEFAULTS.items()}
+    for position, name in enumerate(names):
+        columns[name] = np.array([combo[position] for combo in combos], dtype=np.float64)
+    return columns
+
+
+def sample_coefficients(
+    samples: int, bounds: Mapping[str, tuple[float, float]], seed: int | None = None
+) -> dict[str, np.ndarray]:
+    """
+    균등 무작위 계수 표본. Uniform random sample of coefficient sets.
+
+    ``bounds`` 에 없는 계수는 기본값으로 고정된다.
+    Coefficients missing from ``bounds`` stay at their defaults.
+    """
+
+    unknown = set(bounds) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"unknown sweep parameters: {sorted(unknown)}")
+    rng = np.random.default_rng(seed)
+    columns = {name: np.full(samples, value) for name, value in SWEEP_DEFAULTS.items()}
+    for name, (low, high) in bounds.items():
+        columns[name] = rng.uniform(low, high, samples)
+    return columns
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    스윕 결과 (조합별 요약). Per-set sweep summary.
+
+    ``decision_share`` 는 (조합, ``DECISION_LABELS``) 비율이고, ETA 오차는 관측 ETA 가 있는
+    행에 대한 (예측 - 관측) 통계다. ``baseline_*`` 는 기본 계수의 같은 지표다.
+    ``decision_share`` is the (set, ``DECISION_LABELS``) share; ETA errors are
+    (predicted - observed) statistics over rows with an observed ETA. ``baseline_*`` holds
+    the same metrics for the default coefficients.
+    """
+
+    coefficients: Mapping[str, np.ndarray]
+    decision_share: np.ndarray
+    mean_eta_hours: np.ndarray
+    eta_bias_hours: np.ndarray
+    eta_mae_hours: np.ndarray
+    eta_rmse_hours: np.ndarray
+    baseline_share: np.ndarray
+    baseline_eta_mae_hours: float
+
+    def __len__(self) -> int:
+        return int(self.decision_share.shape[0])
+
+    @property
+    def share_change(self) -> np.ndarray:
+        """기본값 대비 결정 비율 변화. Decision share change against the defaults."""
+
+        return self.decision_share - self.baseline_share
+
+    def best(self, metric: str = "eta_mae_hours") -> dict[str, float]:
+        """지표 최소 조합. Coefficient set minimizing a metric."""
+
+        values = getattr(self, metric)
+        if np.all(np.isnan(values)):
+            raise ValueError(f"{metric} is undefined without observed ETAs")
+        return {
+            name: float(column[int(np.nanargmin(values))])
+            for name, column in self.coefficients.items()
+        }
+
+    def to_rows(self) -> list[dict[str, float]]:
+        """조합별 행 목록. One summary row per coefficient set."""
+
+        rows = []
+        for index in range(len(self)):
+            row = {name: float(column[index]) for name, column in self.coefficients.items()}
+            for label, share, change in zip(
+                DECISION_LABELS, self.decision_share[index], self.share_change[index]
+            ):
+                row[f"share[{label}]"] = float(share)
+                row[f"change[{label}]"] = float(change)
+            row["mean_eta_hours"] = float(self.mean_eta_hours[index])
+            row["eta_bias_hours"] = float(self.eta_bias_hours[index])
+            row["eta_mae_hours"] = float(self.eta_mae_hours[index])
+            row["eta_rmse_hours"] = float(self.eta_rmse_hours[index])
+            rows.append(row)
+        return rows
+
+
+def prepare_history(
+    history: Mapping[str, ArrayLike], observed_eta_hours: ArrayLike | None
+) -> dict[str, Any]:
+    """이력 열 검증·작업용 표 구성. Validate history columns and build the worker table."""
+
+    missing = [name for name in HISTORY_COLUMNS if name not in history]
+    if missing:
+        raise ValueError(f"history is missing columns: {missing}")
+    table: dict[str, Any] = {
+        name: np.asarray(history[name], dtype=np.float64) for name in HISTORY_COLUMNS
+    }
+    size = np.broadcast(*table.values()).shape
+    alert = history.get("alert")
+    if alert is not None and not isinstance(alert, str):
+        # 경보 문자열은 한 번만 코드로 인코딩해 작업 프로세스로 보낸다.
+        lookup: dict[str | None, int] = {}
+        raw = np.asarray(alert, dtype=object)
+        table["alert_codes"] = np.fromiter(
+            (lookup.setdefault(value, len(lookup)) for value in raw.ravel().tolist()),
+            dtype=np.intp,
+            count=raw.size,
+        ).reshape(raw.shape)
+        table["alert_labels"] = list(lookup)
+    else:
+        table["alert"] = alert
+    observed = (
+        np.full(size, np.nan)
+        if observed_eta_hours is None
+        else np.broadcast_to(np.asarray(observed_eta_hours, dtype=np.float64), size)
+    )
+    table["observed"] = observed
+    return table
+
+
+def _evaluate(table: Mapping[str, Any], coefficients: Mapping[str, np.ndarray]) -> np.ndarray:
+    """
+    조합 묶음 평가 → (조합, 지표) 배열. Evaluate a block of sets into a (set, metric) array.
+
+    열은 결정별 비율 4개, 평균 ETA, 편향, MAE, RMSE 순이다.
+    Columns are the four decision shares, then mean ETA, bias, MAE and RMSE.
+    """
+
+    inputs = [table[name].reshape(1, -1) for name in HISTORY_COLUMNS]
+    alert_kwargs: dict[str, Any]
+    if "alert_codes" in table:
+        alert_kwargs = {
+            "alert_codes": table["alert_codes"].reshape(1, -1),
+            "alert_labels": table["alert_labels"],
+        }
+    else:
+        alert_kwargs = {"alert": table["alert"]}
+    outputs = decide_and_eta_batch(
+        *inputs,
+        **alert_kwargs,
+        **{name: np.asarray(column).reshape(-1, 1) for name, column in coefficients.items()},
+    )
+    sets, rows = outputs.decision_code.shape
+    counts = np.stack(
+        [(outputs.decision_code == code).sum(axis=1) for code in range(len(DECISION_LABELS))],
+        axis=1,
+    )
+    observed = table["observed"].reshape(1, -1)
+    has_eta = ~np.isnan(observed)
+    known = int(has_eta.sum())
+    error = np.where(has_eta, outputs.eta_hours - observed, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        bias = error.sum(axis=1) / known
+        mae = np.abs(error).sum(axis=1) / known
+        rmse = np.sqrt((error**2).sum(axis=1) / known)
+    return np.column_stack(
+        [counts / max(rows, 1), outputs.eta_hours.mean(axis=1), bias, mae, rmse]
+    ).reshape(sets, -1)
+
+
+def _init_worker(table: dict[str, Any]) -> None:
+    _WORKER_HISTORY.clear()
+    _WORKER_HISTORY.update(table)
+
+
+def _evaluate_in_worker(coefficients: Mapping[str, np.ndarray]) -> np.ndarray:
+    return _evaluate(_WORKER_HISTORY, coefficients)
+
+
+def sweep(
+    history: Mapping[str, ArrayLike],
+    coefficients: Mapping[str, ArrayLike],
+    observed_eta_hours: ArrayLike | None = None,
+    chunk_cells: int = DEFAULT_CHUNK_CELLS,
+    workers: int | None = None,
+    parallel_threshold: int = PARALLEL_THRESHOLD_CELLS,
+) -> SweepResult:
+    """
+    과거 입력 표에 대한 계수·임계값 조합 평가.
+    Evaluate coefficient and threshold sets against a historical input table.
+
+    ``history`` 는 ``decide_and_eta_batch`` 입력 열(``HISTORY_COLUMNS`` 와 선택적 ``alert``)
+    이고 ``coefficients`` 는 ``SWEEP_DEFAULTS`` 이름별 같은 길이의 배열이다(없는 이름은
+    기본값). 조합 × 행을 (조합, 1) × (1, 행) 브로드캐스트로 평가하며, 메모리를 제한하기 위해
+    ``chunk_cells`` 셀 단위 조합 묶음으로 나눈다. 전체 셀이 ``parallel_threshold`` 를 넘고
+    ``workers`` 가 1이 아니면 묶음을 프로세스 풀에 분산한다.
+    ``history`` holds the ``decide_and_eta_batch`` input columns (``HISTORY_COLUMNS`` plus
+    an optional ``alert``) and ``coefficients`` equal-length arrays keyed by
+    ``SWEEP_DEFAULTS`` names (missing names use the defaults). Sets × rows are evaluated by
+    (set, 1) × (1, row) broadcasting in blocks of about ``chunk_cells`` cells; above
+    ``parallel_threshold`` cells and unless ``workers`` is 1 the blocks go to a process pool.
+    """
+
+    unknown = set(coefficients) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"unknown sweep parameters: {sorted(unknown)}")
+    table = prepare_history(history, observed_eta_hours)
+    rows = int(table["observed"].size)
+    lengths = {np.asarray(column).size for column in coefficients.values()}
+    if len(lengths) > 1:
+        raise ValueError("coefficient columns must have the same length")
+    sets = lengths.pop() if lengths else 1
+    columns = {
+        name: np.broadcast_to(
+            np.asarray(coefficients.get(name, default), dtype=np.float64).ravel(), (sets,)
+        )
+        for name, default in SWEEP_DEFAULTS.items()
+    }
+    block = max(1, chunk_cells // max(rows, 1))
+    blocks = [
+        {name: column[start : start + block] for name, column in columns.items()}
+        for start in range(0, sets, block)
+    ]
+    if workers != 1 and sets * rows > parallel_threshold and len(blocks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(), initializer=_init_worker, initargs=(table,)
+        ) as pool:
+            metrics = np.concatenate(list(pool.map(_evaluate_in_worker, blocks)))
+    else:
+        metrics = np.concatenate([_evaluate(table, part) for part in blocks])
+    baseline = _evaluate(table, {name: np.array([value]) for name, value in SWEEP_DEFAULTS.items()})
+    labels = len(DECISION_LABELS)
+    return SweepResult(
+        coefficients=columns,
+        decision_share=metrics[:, :labels],
+        mean_eta_hours=metrics[:, labels],
+        eta_bias_hours=metrics[:, labels + 1],
+        eta_mae_hours=metrics[:, labels + 2],
+        eta_rmse_hours=metrics[:, labels + 3],
+        baseline_share=baseline[0, :labels],
+        baseline_eta_mae_hours=float(baseline[0, labels + 2]),
+    )
@@ -0,0 +1,623 @@
+"""예보 구간 결정 타임라인. Decision timeline over a forecast horizon."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .columnar import ColumnarTimeseries, epoch_us_to_datetime
+from .index import TimeseriesIndex
+from .marine_decision import (
+    ALPHA,
+    BETA,
+    DECISION_COASTAL_WINDOW,
+    DECISION_CONDITIONAL,
+    DECISION_GO,
+    DECISION_LABELS,
+    DECISION_NO_GO,
+    FT_TO_M,
+    K_WAVE,
+    K_WIND,
+    MarineBatchOutput,
+    decide_and_eta_batch,
+)
+from .resample import DEFAULT_STEP, as_columnar, resample, step_to_us, to_epoch_us
+from .schema import MarineTimeseries, MarineVariable, UnitEnum
+from .units import METER_PER_SECOND_TO_KNOT
+
+DEFAULT_HORIZON_HOURS = 240
+DEPARTURE_DECISIONS: tuple[int, ...] = (
+    DECISION_GO,
+    DECISION_CONDITIONAL,
+    DECISION_COASTAL_WINDOW,
+)
+# 창 결정은 창 안에서 가장 제한적인 결정이다 (덜 제한적인 것부터 나열).
+WINDOW_SEVERITY: tuple[int, ...] = (
+    DECISION_GO,
+    DECISION_CONDITIONAL,
+    DECISION_COASTAL_WINDOW,
+    DECISION_NO_GO,
+)
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+
+
+@dataclass(frozen=True)
+class TimelineRoute:
+    """
+    타임라인 항로 정의. Route evaluated over a forecast timeline.
+
+    ``latitude``/``longitude`` 는 외해 예보 지점이고, 연안 지점을 생략하면 외해 값을
+    연안 값으로도 쓴다.
+    ``latitude``/``longitude`` is the offshore forecast point; without an onshore point the
+    offshore values stand in for the onshore ones.
+    """
+
+    name: str
+    latitude: float
+    longitude: float
+    distance_nm: float
+    planned_speed: float
+    offshore_weight: float
+    onshore_latitude: float | None = None
+    onshore_longitude: float | None = None
+
+
+@dataclass(frozen=True)
+class DepartureWindow:
+    """출항 가능 창. Contiguous departure window of one route."""
+
+    route: str
+    start: dt.datetime
+    end: dt.datetime
+    hours: float
+    decision: str
+    eta_hours: float
+    buffer_minutes: int
+
+
+@dataclass(frozen=True)
+class DecisionTimeline:
+    """
+    항로 × 시각 결정 타임라인. Route × time decision timeline.
+
+    ``outputs`` 배열은 (항로, 시각) 형태이고, 출항 창은 런 길이 부호화된 배열
+    (``window_route``, ``window_start``, ``window_stop`` 시각 인덱스, 끝 제외)로 저장된다.
+    ``outputs`` arrays have shape (route, time); departure windows are stored run-length
+    encoded as ``window_route``/``window_start``/``window_stop`` time indices (stop
+    exclusive) with the window decision code in ``window_code``.
+    """
+
+    routes: tuple[str, ...]
+    timestamps: np.ndarray
+    step_us: int
+    outputs: MarineBatchOutput
+    window_route: np.ndarray
+    window_start: np.ndarray
+    window_stop: np.ndarray
+    window_code: np.ndarray
+
+    def _route_index(self, route: str | int) -> int:
+        return route if isinstance(route, int) else self.routes.index(route)
+
+    def _window(self, number: int) -> DepartureWindow:
+        route = int(self.window_route[number])
+        start = int(self.window_start[number])
+        stop = int(self.window_stop[number])
+        return DepartureWindow(
+            route=self.routes[route],
+            start=epoch_us_to_datetime(self.timestamps[start]),
+            end=epoch_us_to_datetime(self.timestamps[stop - 1] + self.step_us),
+            hours=(stop - start) * self.step_us / 3_600_000_000,
+            decision=DECISION_LABELS[int(self.window_code[number])],
+            eta_hours=float(self.outputs.eta_hours[route, start]),
+            buffer_minutes=int(self.outputs.buffer_minutes[route, start]),
+        )
+
+    def windows(self, route: str | int) -> list[DepartureWindow]:
+        """항로의 출항 창 (시간 순). Departure windows of a route in time order."""
+
+        numbers = np.flatnonzero(self.window_route == self._route_index(route))
+        return [self._window(int(number)) for number in numbers]
+
+    def first_window(self, route: str | int) -> DepartureWindow | None:
+        """가장 이른 출항 창. Earliest departure window, if any."""
+
+        numbers = np.flatnonzero(self.window_route == self._route_index(route))
+        return self._window(int(numbers[0])) if numbers.size else None
+
+    def longest_window(self, route: str | int) -> DepartureWindow | None:
+        """가장 긴 출항 창 (동률이면 이른 것). Longest departure window, earliest on ties."""
+
+        numbers = np.flatnonzero(self.window_route == self._route_index(route))
+        if not numbers.size:
+            return None
+        lengths = self.window_stop[numbers] - self.window_start[numbers]
+        return self._window(int(numbers[int(np.argmax(lengths))]))
+
+
+def run_length_windows(
+    decision_code: np.ndarray, departures: Sequence[int] = DEPARTURE_DECISIONS
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (항로, 시각) 결정 코드의 출항 창 런 길이 부호화.
+    Run-length encode departure windows of a (route, time) decision code array.
+
+    Returns:
+        (항로, 시작, 끝(제외), 창 결정 코드) 배열
+    """
+
+    codes = np.atleast_2d(decision_code)
+    routes, hours = codes.shape
+    departable = np.isin(codes, np.asarray(departures, dtype=codes.dtype))
+    padded = np.zeros((routes, hours + 2), dtype=np.int8)
+    padded[:, 1:-1] = departable
+    edges = np.diff(padded, axis=1)
+    # np.nonzero 는 행 우선 순서라 시작과 끝이 같은 순서로 짝지어진다.
+    window_route, window_start = np.nonzero(edges == 1)
+    _, window_stop = np.nonzero(edges == -1)
+    window_code = np.full(window_route.size, DECISION_GO, dtype=np.int8)
+    for code in WINDOW_SEVERITY[1:]:
+        cumulative = np.zeros((routes, hours + 1), dtype=np.int32)
+        np.cumsum(codes == code, axis=1, out=cumulative[:, 1:])
+        inside = cumulative[window_route, window_stop] > cumulative[window_route, window_start]
+        window_code[inside] = code
+    return window_route, window_start, window_stop, window_code
+
+
+def position_keys(latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    """위치 키 (복소수: 위도 + i·경도, 사전식 정렬). Complex position keys, lexically ordered."""
+
+    return latitude + 1j * longitude
+
+
+def _gather(
+    hourly: ColumnarTimeseries,
+    keys: Sequence[np.ndarray],
+    grid: np.ndarray,
+    step_us: int,
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """
+    위치 키별 격자 시각 Hs·풍속 행렬 (결측 NaN). Hs and wind grid matrices per position key.
+
+    ``keys`` 의 각 배열에 대해 (키, 시각) 행렬을 Hs 와 풍속으로 하나씩 반환한다.
+    Returns one (key, time) matrix per ``keys`` array, for Hs and for wind.
+    """
+
+    row_keys = position_keys(hourly.latitude, hourly.longitude)
+    sites = np.unique(row_keys)
+    row_site = np.searchsorted(sites, row_keys)
+    hour = (hourly.timestamps - grid[0]) // step_us
+    hs = np.full((sites.size + 1, grid.size), np.nan)
+    wind = np.full((sites.size + 1, grid.size), np.nan)
+    hs[row_site, hour] = hourly.column(HS)
+    wind[row_site, hour] = hourly.column(WIND)
+    hs_out: list[np.ndarray] = []
+    wind_out: list[np.ndarray] = []
+    for wanted in keys:
+        # 격자 안에 행이 없는 위치는 마지막 NaN 행을 가리킨다.
+        site = np.minimum(np.searchsorted(sites, wanted), sites.size)
+        found = site < sites.size
+        found[found] = sites[site[found]] == wanted[found]
+        site = np.where(found, site, sites.size)
+        hs_out.append(hs[site])
+        wind_out.append(wind[site])
+    return hs_out, wind_out
+
+
+def check_units(columnar: ColumnarTimeseries) -> None:
+    """Hs(m)·풍속(m/s) 단위 검사. Check Hs is in metres and wind in m/s."""
+
+    for variable, expected in ((HS, UnitEnum.METERS), (WIND, UnitEnum.METERS_PER_SECOND)):
+        unit = columnar.units.get(variable)
+        if unit is not None and unit is not expected:
+            raise ValueError(f"{variable.value} must be in {expected.value}")
+
+
+def _route_inputs(
+    columnar: ColumnarTimeseries,
+    routes: Sequence[TimelineRoute],
+    grid: np.ndarray,
+    step_us: int,
+    max_gap: dt.timedelta | int | None,
+) -> tuple[tuple[np.ndarray, np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]:
+    """
+    항로 × 시각 결정 입력과 항로 위치 키.
+    Route × time decision inputs (offshore Hs ft, onshore Hs ft, wind kt) and route keys.
+    """
+
+    check_units(columnar)
+    hourly = resample(columnar, step_us, int(grid[0]), int(grid[-1]), max_gap)
+    index = TimeseriesIndex(hourly)
+    offshore = np.array(
+        [index.nearest(route.latitude, route.longitude)[0] for route in routes], dtype=np.intp
+    )
+    onshore = np.array(
+        [
+            (
+                index.nearest(route.onshore_latitude, route.onshore_longitude)[0]
+                if route.onshore_latitude is not None and route.onshore_longitude is not None
+                else site
+            )
+            for route, site in zip(routes, offshore)
+        ],
+        dtype=np.intp,
+    )
+    site_keys = position_keys(index.site_latitude, index.site_longitude)
+    keys = (site_keys[offshore], site_keys[onshore])
+    return route_values(hourly, keys, grid, step_us), keys
+
+
+def route_values(
+    hourly: ColumnarTimeseries,
+    keys: tuple[np.ndarray, np.ndarray],
+    grid: np.ndarray,
+    step_us: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """위치 키에서 결정 입력 변환. Decision inputs read at the route position keys."""
+
+    (hs_offshore, hs_onshore), (wind, _) = _gather(hourly, keys, grid, step_us)
+    return hs_offshore / FT_TO_M, hs_onshore / FT_TO_M, wind * METER_PER_SECOND_TO_KNOT
+
+
+def _decide(
+    hs_offshore_ft: np.ndarray,
+    hs_onshore_ft: np.ndarray,
+    wind_kt: np.ndarray,
+    route_columns: tuple[np.ndarray, np.ndarray, np.ndarray],
+    alert: str | None,
+    coefficients: dict[str, float],
+) -> MarineBatchOutput:
+    """결정 배치 평가 (예보 결측은 No-Go). Batch decisions, No-Go where the forecast is missing."""
+
+    offshore_weight, distance_nm, planned_speed = route_columns
+    outputs = decide_and_eta_batch(
+        hs_offshore_ft,
+        wind_kt,
+        hs_onshore_ft,
+        hs_offshore_ft,
+        wind_kt,
+        offshore_weight,
+        distance_nm,
+        planned_speed,
+        alert,
+        **coefficients,
+    )
+    # 예보 결측 시각은 결정할 수 없으므로 No-Go 로 둔다.
+    outputs.decision_code[
+        np.isnan(hs_offshore_ft) | np.isnan(hs_onshore_ft) | np.isnan(wind_kt)
+    ] = DECISION_NO_GO
+    return outputs
+
+
+def _route_columns(routes: Sequence[TimelineRoute]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return (
+        np.array([route.offshore_weight for route in routes], dtype=np.float64),
+        np.array([route.distance_nm for route in routes], dtype=np.float64),
+        np.array([route.planned_speed for route in routes], dtype=np.float64),
+    )
+
+
+def _horizon(start: dt.datetime | int, hours: int, step_us: int) -> np.ndarray:
+    if hours <= 0:
+        raise ValueError("hours must be positive")
+    first = -(-to_epoch_us(start) // step_us) * step_us
+    return first + np.arange(hours, dtype=np.int64) * step_us
+
+
+def evaluate_timeline(
+    forecast: MarineTimeseries | ColumnarTimeseries,
+    routes: Sequence[TimelineRoute],
+    start: dt.datetime | int | None = None,
+    hours: int = DEFAULT_HORIZON_HOURS,
+    step: dt.timedelta | int = DEFAULT_STEP,
+    alert: str | None = None,
+    max_gap: dt.timedelta | int | None = None,
+    departures: Sequence[int] = DEPARTURE_DECISIONS,
+    *,
+    alpha: float = ALPHA,
+    beta: float = BETA,
+    k_wind: float = K_WIND,
+    k_wave: float = K_WAVE,
+) -> DecisionTimeline:
+    """
+    예보 구간 전체의 항로별 결정과 출항 창 계산.
+    Evaluate decisions and departure windows for every route over a forecast horizon.
+
+    예보를 ``step`` 격자로 재표본화하고 각 항로 지점의 최근접 예보 위치에서 Hs(m→ft)와
+    U10(m/s→kt)을 읽어 ADNOC·Al Bahar 입력 양쪽에 쓴다. (항로, 시각) 전체를
+    ``decide_and_eta_batch`` 한 번으로 평가하며, 예보가 없는 시각은 No-Go로 둔다. 출항 가능한
+    시각(기본: Go, Conditional Go, coastal window)의 연속 구간을 출항 창으로 부호화한다.
+    The forecast is resampled onto a ``step`` grid and Hs (m→ft) and U10 (m/s→kt) are read
+    at the forecast position nearest to each route point and fed to both the ADNOC and
+    Al Bahar inputs. All (route, time) cells go through one ``decide_and_eta_batch`` call;
+    hours without a forecast are No-Go. Runs of departable hours (Go, Conditional Go and
+    coastal window by default) are encoded as departure windows.
+    """
+
+    columnar = as_columnar(forecast)
+    step_us = step_to_us(step)
+    if start is None:
+        if not len(columnar):
+            raise ValueError("forecast is empty; pass start explicitly")
+        start = int(columnar.timestamps.min())
+    grid = _horizon(start, hours, step_us)
+    (hs_offshore_ft, hs_onshore_ft, wind_kt), _ = _route_inputs(
+        columnar, routes, grid, step_us, max_gap
+    )
+    outputs = _decide(
+        hs_offshore_ft,
+        hs_onshore_ft,
+        wind_kt,
+        tuple(column[:, None] for column in _route_columns(routes)),
+        alert,
+        {"alpha": alpha, "beta": beta, "k_wind": k_wind, "k_wave": k_wave},
+    )
+    window_route, window_start, window_stop, window_code = run_length_windows(
+        outputs.decision_code, departures
+    )
+    return DecisionTimeline(
+        routes=tuple(route.name for route in routes),
+        timestamps=grid,
+        step_us=step_us,
+        outputs=outputs,
+        window_route=window_route,
+        window_start=window_start,
+        window_stop=window_stop,
+        window_code=window_code,
+    )
+
+
+@dataclass(frozen=True)
+class DecisionChange:
+    """셀 단위 결정 변경. Decision change of one (route, time) cell."""
+
+    route: str
+    timestamp: dt.datetime
+    previous: str | None
+    decision: str
+    previous_eta_hours: float | None
+    eta_hours: float
+
+
+@dataclass(frozen=True)
+class TimelineUpdate:
+    """
+    증분 평가 결과. Result of an incremental timeline update.
+
+    ``route``/``hour`` 는 결정 코드나 ETA 가 바뀐 셀이고 ``previous_code`` 는 이전 결정
+    (최초 평가면 -1)이다. ``affected_routes`` 는 입력이 바뀌어 재평가된 항로다.
+    ``route``/``hour`` index the cells whose decision code or ETA changed and
+    ``previous_code`` holds the earlier decision (-1 on the first evaluation).
+    ``affected_routes`` lists the routes whose inputs changed and were re-evaluated.
+    """
+
+    timeline: DecisionTimeline
+    route: np.ndarray
+    hour: np.ndarray
+    previous_code: np.ndarray
+    previous_eta_hours: np.ndarray
+    affected_routes: np.ndarray
+    cells_evaluated: int
+
+    def __len__(self) -> int:
+        return int(self.route.size)
+
+    def changes(self) -> list[DecisionChange]:
+        """변경 목록. Decision changes as records."""
+
+        outputs = self.timeline.outputs
+        return [
+            DecisionChange(
+                route=self.timeline.routes[route],
+                timestamp=epoch_us_to_datetime(self.timeline.timestamps[hour]),
+                previous=DECISION_LABELS[previous] if previous >= 0 else None,
+                decision=DECISION_LABELS[int(outputs.decision_code[route, hour])],
+                previous_eta_hours=previous_eta if previous >= 0 else None,
+                eta_hours=float(outputs.eta_hours[route, hour]),
+            )
+            for route, hour, previous, previous_eta in zip(
+                self.route.tolist(),
+                self.hour.tolist(),
+                self.previous_code.tolist(),
+                self.previous_eta_hours.tolist(),
+            )
+        ]
+
+
+def _changed(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    return ~((previous == current) | (np.isnan(previous) & np.isnan(current)))
+
+
+class IncrementalTimeline:
+    """
+    예보 갱신 증분 평가기. Incremental evaluator for successive forecast issues.
+
+    고정된 시간 격자 위에서 직전 예보가 각 항로에 준 입력(위치·변수별 Hs, 풍속)을 보관하고,
+    새 예보와 비교해 값이 바뀐 (항로, 시각) 셀만 다시 결정한다. 출항 창은 입력이 바뀐 항로만
+    다시 부호화하며, 결과로는 결정 코드나 ETA 가 바뀐 셀만 내보낸다. 격자는 생성 시 정해지므로
+    예보 구간이 크게 이동하면 새 평가기를 만든다.
+    Keeps the inputs the previous forecast gave each route (Hs and wind at its positions)
+    on a fixed time grid; a new forecast is diffed against them and only the (route, time)
+    cells whose inputs changed are decided again. Departure windows are re-encoded for
+    affected routes only and only cells whose decision or ETA changed are emitted. The
+    grid is fixed at construction; build a new evaluator when the horizon moves on.
+    """
+
+    def __init__(
+        self,
+        routes: Sequence[TimelineRoute],
+        start: dt.datetime | int,
+        hours: int = DEFAULT_HORIZON_HOURS,
+        step: dt.timedelta | int = DEFAULT_STEP,
+        alert: str | None = None,
+        max_gap: dt.timedelta | int | None = None,
+        departures: Sequence[int] = DEPARTURE_DECISIONS,
+        *,
+        alpha: float = ALPHA,
+        beta: float = BETA,
+        k_wind: float = K_WIND,
+        k_wave: float = K_WAVE,
+    ) -> None:
+        self.routes = tuple(routes)
+        self.step_us = step_to_us(step)
+        self.grid = _horizon(start, hours, self.step_us)
+        self.alert = alert
+        self.max_gap = max_gap
+        self.departures = tuple(departures)
+        self.coefficients = {"alpha": alpha, "beta": beta, "k_wind": k_wind, "k_wave": k_wave}
+        self.timeline: DecisionTimeline | None = None
+        self._route_columns = _route_columns(self.routes)
+        self._inputs: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._route_keys: tuple[np.ndarray, np.ndarray] | None = None
+        self._snapshot: ColumnarTimeseries | None = None
+
+    def update(self, forecast: MarineTimeseries | ColumnarTimeseries) -> TimelineUpdate:
+        """새 예보 반영. Apply a new forecast issue and return the decision changes."""
+
+        columnar = as_columnar(forecast)
+        inputs = self._refresh_inputs(columnar)
+        self._snapshot = columnar
+        previous = self.timeline
+        if previous is None or self._inputs is None:
+            outputs = _decide(
+                *inputs,
+                tuple(column[:, None] for column in self._route_columns),
+                self.alert,
+                self.coefficients,
+            )
+            windows = run_length_windows(outputs.decision_code, self.departures)
+            changed_cells = np.ones(outputs.decision_code.shape, dtype=bool)
+            previous_code = np.full(outputs.decision_code.shape, -1, dtype=np.int8)
+            previous_eta = np.full(outputs.decision_code.shape, np.nan)
+            affected = np.arange(len(self.routes))
+            evaluated = int(outputs.decision_code.size)
+        else:
+            dirty = np.zeros(previous.outputs.decision_code.shape, dtype=bool)
+            for old, new in zip(self._inputs, inputs):
+                dirty |= _changed(old, new)
+            routes, hours = np.nonzero(dirty)
+            evaluated = int(routes.size)
+            patch = _decide(
+                inputs[0][routes, hours],
+                inputs[1][routes, hours],
+                inputs[2][routes, hours],
+                tuple(column[routes] for column in self._route_columns),
+                self.alert,
+                self.coefficients,
+            )
+            # 이전 결과를 복사해 바뀐 셀만 덮어쓴다.
+            fields = {
+                field.name: getattr(previous.outputs, field.name).copy()
+                for field in dataclasses.fields(previous.outputs)
+            }
+            for name, array in fields.items():
+                array[routes, hours] = getattr(patch, name)
+            outputs = MarineBatchOutput(**fields)
+            affected = np.unique(routes)
+            windows = self._merge_windows(previous, outputs, affected)
+            previous_code = previous.outputs.decision_code
+            previous_eta = previous.outputs.eta_hours
+            changed_cells = (outputs.decision_code != previous_code) | _changed(
+                previous_eta, outputs.eta_hours
+            )
+        self._inputs = inputs
+        self.timeline = DecisionTimeline(
+            tuple(route.name for route in self.routes),
+            self.grid,
+            self.step_us,
+            outputs,
+            *windows,
+        )
+        route, hour = np.nonzero(changed_cells)
+        return TimelineUpdate(
+            timeline=self.timeline,
+            route=route,
+            hour=hour,
+            previous_code=previous_code[route, hour],
+            previous_eta_hours=previous_eta[route, hour],
+            affected_routes=affected,
+            cells_evaluated=evaluated,
+        )
+
+    def _refresh_inputs(
+        self, columnar: ColumnarTimeseries
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        직전 예보와 위치·변수별 비교 후 바뀐 위치만 재표본화.
+        Diff against the previous snapshot per position and variable; resample only changes.
+
+        행 배치(시각·위치·변수)가 같으면 값이나 품질이 바뀐 행의 위치를 찾아 그 위치를 쓰는
+        항로 입력만 다시 만든다. 배치가 다르면 전체를 다시 계산한다.
+        With the same row layout (times, positions, variables) only the positions with a
+        changed value or quality flag are resampled and only the routes reading them are
+        refreshed; otherwise everything is recomputed.
+        """
+
+        old = self._snapshot
+        if (
+            old is None
+            or self._inputs is None
+            or self._route_keys is None
+            or len(old) != len(columnar)
+            or set(old.variables) != set(columnar.variables)
+            or not np.array_equal(old.timestamps, columnar.timestamps)
+            or not np.array_equal(old.latitude, columnar.latitude)
+            or not np.array_equal(old.longitude, columnar.longitude)
+        ):
+            inputs, self._route_keys = _route_inputs(
+                columnar, self.routes, self.grid, self.step_us, self.max_gap
+            )
+            return inputs
+        changed = np.zeros(len(columnar), dtype=bool)
+        for variable in (HS, WIND):
+            if variable in columnar.values:
+                changed |= old.values[variable] != columnar.values[variable]
+                changed |= old.quality[variable] != columnar.quality[variable]
+        if not changed.any():
+            return self._inputs
+        row_keys = position_keys(columnar.latitude, columnar.longitude)
+        changed_keys = np.unique(row_keys[changed])
+        offshore, onshore = self._route_keys
+        routes = np.flatnonzero(np.isin(offshore, changed_keys) | np.isin(onshore, changed_keys))
+        if not routes.size:
+            return self._inputs
+        keys = (offshore[routes], onshore[routes])
+        subset = columnar.take(np.flatnonzero(np.isin(row_keys, np.union1d(*keys))))
+        hourly = resample(subset, self.step_us, int(self.grid[0]), int(self.grid[-1]), self.max_gap)
+        inputs = tuple(array.copy() for array in self._inputs)
+        for array, values in zip(inputs, route_values(hourly, keys, self.grid, self.step_us)):
+            array[routes] = values
+        return inputs
+
+    def _merge_windows(
+        self, previous: DecisionTimeline, outputs: MarineBatchOutput, affected: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """영향 항로만 창 재부호화. Re-encode windows of affected routes only."""
+
+        if not affected.size:
+            return (
+                previous.window_route,
+                previous.window_start,
+                previous.window_stop,
+                previous.window_code,
+            )
+        fresh_route, fresh_start, fresh_stop, fresh_code = run_length_windows(
+            outputs.decision_code[affected], self.departures
+        )
+        keep = ~np.isin(previous.window_route, affected)
+        route = np.concatenate([previous.window_route[keep], affected[fresh_route]])
+        start = np.concatenate([previous.window_start[keep], fresh_start])
+        # 항로 순, 항로 안에서는 시각 순을 유지한다.
+        order = np.lexsort((start, route))
+        return (
+            route[order],
+            start[order],
+            np.concatenate([previous.window_stop[keep], fresh_stop])[order],
+            np.concatenate([previous.window_code[keep], fresh_code])[order],
+        )
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 KNOT_TO_METER_PER_SECOND = 0.514444
 METER_PER_SECOND_TO_KNOT = 1.943844
 FOOT_TO_METER = 0.3048
 METER_TO_FOOT = 3.28084
+EARTH_RADIUS_NM = 3440.065
 
 
 def knots_to_meters_per_second(knots: float) -> float:
@@ -30,3 +34,41 @@ def meters_to_feet(meters: float) -> float:
     """미터→피트 변환. Convert meters to feet."""
 
     return round(meters * METER_TO_FOOT, 2)
+
+
+def round_array(values: ArrayLike, ndigits: int) -> np.ndarray:
+    """내장 round()와 동일한 배열 반올림. Round an array exactly like built-in ``round()``.
+
+    ``np.round`` 는 ``x * 10**n`` 을 반올림하므로 x.xx5 경계에서 ``round()`` 와 결과가
+    달라질 수 있다. 경계 근처 원소만 내장 ``round()`` 로 재계산한다.
+    ``np.round`` rounds ``x * 10**n`` and can disagree with ``round()`` near x.xx5 ties,
+    so only the near-tie elements are recomputed with the built-in.
+    """
+
+    array = np.asarray(values, dtype=np.float64)
+    scale = 10.0**ndigits
+    scaled = array * scale
+    result = np.rint(scaled) / scale
+    with np.errstate(invalid="ignore"):
+        distance = np.abs(scaled - np.floor(scaled) - 0.5)
+        suspect = distance <= 1e-9 * (np.abs(scaled) + 1.0)
+    if suspect.any():
+        result = np.array(result, copy=True)
+        flat_result = result.reshape(-1)
+        flat_source = array.reshape(-1)
+        for index in np.flatnonzero(suspect.reshape(-1)):
+            flat_result[index] = round(float(flat_source[index]), ndigits)
+    return result
+
+
+def haversine_nm(lat1: ArrayLike, lon1: ArrayLike, lat2: ArrayLike, lon2: ArrayLike) -> np.ndarray:
+    """대권 거리 (해리). Great-circle distance in nautical miles, broadcasting."""
+
+    phi1, lam1, phi2, lam2 = (
+        np.radians(np.asarray(value, dtype=np.float64)) for value in (lat1, lon1, lat2, lon2)
+    )
+    half = (
+        np.sin((phi2 - phi1) / 2.0) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin((lam2 - lam1) / 2.0) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.clip(half, 0.0, 1.0)))
@@ -0,0 +1,324 @@
+"""웨이포인트 항로 구간 분할과 ETA 적분. Waypoint route segmentation and ETA integration."""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+
+from .columnar import ColumnarTimeseries, epoch_us_to_datetime
+from .index import TimeseriesIndex
+from .marine_decision import (
+    ALPHA,
+    BETA,
+    DECISION_LABELS,
+    DECISION_NO_GO,
+    K_WAVE,
+    K_WIND,
+    decide_and_eta_batch,
+)
+from .resample import DEFAULT_STEP, as_columnar, resample, step_to_us, time_grid, to_epoch_us
+from .schema import MarineTimeseries
+from .timeline import WINDOW_SEVERITY, check_units, position_keys, route_values
+from .units import haversine_nm, round_array
+
+DEFAULT_SEGMENT_NM = 5.0
+_HOUR_US = 3_600_000_000
+# 결정 코드 → 제한 순위 (항로 결정은 구간 중 가장 제한적인 것).
+_SEVERITY_RANK = np.argsort(np.asarray(WINDOW_SEVERITY))
+_SEVERITY_CODES = np.asarray(WINDOW_SEVERITY, dtype=np.int8)
+
+
+@dataclass(frozen=True)
+class WaypointRoute:
+    """
+    웨이포인트 폴리라인 항로. Route defined by a waypoint polyline.
+
+    ``waypoints`` 는 (위도, 경도) 목록이고 ``offshore_weight`` 는 항로 전체에 하나 또는
+    구간(leg)별 값이다.
+    ``waypoints`` is a list of (latitude, longitude) pairs; ``offshore_weight`` is either
+    one value for the whole route or one value per leg.
+    """
+
+    name: str
+    waypoints: tuple[tuple[float, float], ...]
+    planned_speed: float
+    offshore_weight: float | tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class RouteSegments:
+    """
+    평탄화된 항로 세그먼트. Flattened route segments.
+
+    항로 ``r`` 의 세그먼트는 ``offsets[r]:offsets[r + 1]`` 이며 위치는 세그먼트 중점이다.
+    Segments of route ``r`` are ``offsets[r]:offsets[r + 1]``; positions are segment
+    midpoints.
+    """
+
+    routes: tuple[str, ...]
+    offsets: np.ndarray
+    leg: np.ndarray
+    latitude: np.ndarray
+    longitude: np.ndarray
+    distance_nm: np.ndarray
+    offshore_weight: np.ndarray
+    planned_speed: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.distance_nm.size)
+
+    @property
+    def route_distance_nm(self) -> np.ndarray:
+        """항로별 총 거리. Total distance per route."""
+
+        return np.add.reduceat(self.distance_nm, self.offsets[:-1])
+
+
+def segment_routes(
+    routes: Sequence[WaypointRoute], max_segment_nm: float = DEFAULT_SEGMENT_NM
+) -> RouteSegments:
+    """
+    항로를 최대 ``max_segment_nm`` 세그먼트로 분할. Split routes into short segments.
+
+    각 leg 을 대권 거리 기준으로 같은 길이의 세그먼트로 나누고 중점은 위경도 선형 보간으로
+    구한다(걸프 해역 규모의 짧은 leg 가정). 길이가 0인 leg 은 건너뛴다.
+    Every leg is cut into equal segments of its great-circle length; midpoints are linearly
+    interpolated in latitude/longitude, which assumes short legs as in the Gulf.
+    Zero-length legs are skipped.
+    """
+
+    if max_segment_nm <= 0:
+        raise ValueError("max_segment_nm must be positive")
+    if not routes:
+        raise ValueError("at least one route is required")
+    leg_points: list[np.ndarray] = []
+    leg_weights: list[np.ndarray] = []
+    for route in routes:
+        points = np.asarray(route.waypoints, dtype=np.float64).reshape(-1, 2)
+        if points.shape[0] < 2:
+            raise ValueError(f"route {route.name} needs at least two waypoints")
+        if route.planned_speed <= 0:
+            raise ValueError("planned_speed must be positive")
+        weights = np.asarray(route.offshore_weight, dtype=np.float64)
+        if weights.ndim == 0:
+            weights = np.full(points.shape[0] - 1, float(weights))
+        if weights.shape != (points.shape[0] - 1,):
+            raise ValueError(f"route {route.name} needs one offshore_weight per leg")
+        leg_points.append(np.concatenate([points[:-1], points[1:]], axis=1))
+        leg_weights.append(weights)
+    legs = np.concatenate(leg_points)
+    leg_counts = np.array([weights.size for weights in leg_weights])
+    leg_route = np.repeat(np.arange(len(routes)), leg_counts)
+    leg_number = np.arange(leg_route.size) - np.repeat(
+        np.cumsum(leg_counts) - leg_counts, leg_counts
+    )
+    leg_length = haversine_nm(legs[:, 0], legs[:, 1], legs[:, 2], legs[:, 3])
+    pieces = np.where(leg_length > 0, np.ceil(leg_length / max_segment_nm), 0).astype(np.intp)
+    if np.any(np.bincount(leg_route, weights=pieces, minlength=len(routes)) == 0):
+        raise ValueError("every route needs a positive length")
+
+    # 세그먼트 → leg, leg 안의 순번으로 중점 비율을 구한다.
+    segment_leg = np.repeat(np.arange(leg_route.size), pieces)
+    first = np.cumsum(pieces) - pieces
+    fraction = (np.arange(segment_leg.size) - first[segment_leg] + 0.5) / pieces[segment_leg]
+    start, end = legs[segment_leg, :2], legs[segment_leg, 2:]
+    segment_route = leg_route[segment_leg]
+    return RouteSegments(
+        routes=tuple(route.name for route in routes),
+        offsets=np.searchsorted(segment_route, np.arange(len(routes) + 1)),
+        leg=leg_number[segment_leg],
+        latitude=start[:, 0] + fraction * (end[:, 0] - start[:, 0]),
+        longitude=start[:, 1] + fraction * (end[:, 1] - start[:, 1]),
+        distance_nm=(leg_length / np.maximum(pieces, 1))[segment_leg],
+        offshore_weight=np.concatenate(leg_weights)[segment_leg],
+        planned_speed=np.array([route.planned_speed for route in routes])[segment_route],
+    )
+
+
+@dataclass(frozen=True)
+class VoyagePlan:
+    """
+    출항 시각 × 항로 ETA 적분 결과. Integrated voyages per departure and route.
+
+    세그먼트 배열은 (출항, 세그먼트), 항로 배열은 (출항, 항로) 형태다. 항로 결정은 통과하는
+    세그먼트 중 가장 제한적인 결정이다.
+    Segment arrays have shape (departure, segment) and route arrays (departure, route).
+    The route decision is the most restrictive decision of its segments.
+    """
+
+    segments: RouteSegments
+    departures: np.ndarray
+    entry_us: np.ndarray
+    segment_hours: np.ndarray
+    hs_fused_m: np.ndarray
+    wind_fused_kt: np.ndarray
+    effective_speed: np.ndarray
+    segment_code: np.ndarray
+    eta_hours: np.ndarray
+    arrival_us: np.ndarray
+    decision_code: np.ndarray
+    buffer_minutes: np.ndarray
+
+    @property
+    def decisions(self) -> np.ndarray:
+        """(출항, 항로) 결정 라벨. Decision labels per departure and route."""
+
+        return np.asarray(DECISION_LABELS, dtype=object)[self.decision_code]
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """출항·항로별 요약 행. One summary row per departure and route."""
+
+        distance = self.segments.route_distance_nm
+        rows = []
+        for departure in range(self.departures.size):
+            for route, name in enumerate(self.segments.routes):
+                rows.append(
+                    {
+                        "route": name,
+                        "departure": epoch_us_to_datetime(int(self.departures[departure])),
+                        "arrival": epoch_us_to_datetime(int(self.arrival_us[departure, route])),
+                        "distance_nm": round(float(distance[route]), 1),
+                        "eta_hours": float(self.eta_hours[departure, route]),
+                        "decision": DECISION_LABELS[int(self.decision_code[departure, route])],
+                        "buffer_minutes": int(self.buffer_minutes[departure, route]),
+                    }
+                )
+        return rows
+
+
+def _interpolate(matrix: np.ndarray, rows: np.ndarray, position: np.ndarray) -> np.ndarray:
+    """(행, 격자 위치) 선형 보간, 격자 밖은 NaN. Linear lookup at fractional grid positions."""
+
+    last = matrix.shape[1] - 1
+    inside = (position >= 0) & (position <= last)
+    lo = np.clip(np.floor(position), 0, last).astype(np.intp)
+    hi = np.minimum(lo + 1, last)
+    weight = position - lo
+    left = matrix[rows, lo]
+    value = np.where(weight > 0, left + weight * (matrix[rows, hi] - left), left)
+    return np.where(inside, value, np.nan)
+
+
+def plan_voyages(
+    forecast: MarineTimeseries | ColumnarTimeseries,
+    routes: Sequence[WaypointRoute] | RouteSegments,
+    departures: dt.datetime | int | Sequence[dt.datetime | int],
+    max_segment_nm: float = DEFAULT_SEGMENT_NM,
+    step: dt.timedelta | int = DEFAULT_STEP,
+    alert: str | None = None,
+    max_gap: dt.timedelta | int | None = None,
+    *,
+    alpha: float = ALPHA,
+    beta: float = BETA,
+    k_wind: float = K_WIND,
+    k_wave: float = K_WAVE,
+) -> VoyagePlan:
+    """
+    세그먼트별 도착 시각 예보로 ETA 를 앞으로 적분.
+    Integrate ETA forward through route segments using the forecast at arrival time.
+
+    예보를 ``step`` 격자로 재표본화하고 세그먼트 중점의 최근접 예보 위치에서 Hs(m→ft)와
+    U10(m/s→kt)을 읽는다. 모든 (출항, 항로)를 동시에 k 번째 세그먼트로 진행시키며, 세그먼트
+    진입 시각의 값을 시간 선형 보간해 ``decide_and_eta_batch`` 로 유효 속력과 결정을 구하고
+    통과 시간을 더해 다음 진입 시각을 얻는다. 반복 횟수는 가장 긴 항로의 세그먼트 수이고 각
+    반복은 (출항, 항로) 배열 연산 한 번이다. 예보가 없는 세그먼트는 No-Go 로 두고 계획 속력으로
+    통과시킨다.
+    The forecast is resampled onto a ``step`` grid and Hs (m→ft) and U10 (m/s→kt) are read
+    at the forecast position nearest to each segment midpoint. Every (departure, route)
+    advances through its k-th segment together: values are interpolated linearly in time at
+    the segment entry time, ``decide_and_eta_batch`` gives the effective speed and decision,
+    and the transit time yields the next entry time. The loop runs once per segment of the
+    longest route, each iteration being one array operation over (departure, route).
+    Segments without a forecast are No-Go and are crossed at the planned speed.
+    """
+
+    segments = (
+        routes if isinstance(routes, RouteSegments) else segment_routes(routes, max_segment_nm)
+    )
+    columnar = as_columnar(forecast)
+    if not len(columnar):
+        raise ValueError("forecast is empty")
+    check_units(columnar)
+    step_us = step_to_us(step)
+    if isinstance(departures, (dt.datetime, int, np.integer)):
+        departures = [departures]
+    departure_us = np.array([to_epoch_us(value) for value in departures], dtype=np.int64)
+    if not departure_us.size:
+        raise ValueError("at least one departure is required")
+    origin = int(departure_us.min()) // step_us * step_us
+    grid = time_grid(origin, max(int(columnar.timestamps.max()), origin + step_us), step_us)
+    hourly = resample(columnar, step_us, int(grid[0]), int(grid[-1]), max_gap)
+    if len(hourly):
+        index = TimeseriesIndex(hourly)
+        sites, _ = index.nearest_many(segments.latitude, segments.longitude)
+        keys = position_keys(index.site_latitude, index.site_longitude)[sites]
+    else:
+        keys = position_keys(segments.latitude, segments.longitude)
+    hs_ft, _, wind_kt = route_values(hourly, (keys, keys), grid, step_us)
+
+    shape = (departure_us.size, len(segments))
+    entry = np.zeros(shape, dtype=np.int64)
+    hours = np.zeros(shape)
+    hs_fused = np.full(shape, np.nan)
+    wind_fused = np.full(shape, np.nan)
+    speed = np.zeros(shape)
+    code = np.zeros(shape, dtype=np.int8)
+    buffer = np.zeros(shape, dtype=np.int64)
+    coefficients = {"alpha": alpha, "beta": beta, "k_wind": k_wind, "k_wave": k_wave}
+
+    counts = np.diff(segments.offsets)
+    clock = np.repeat(departure_us[:, None].astype(np.float64), counts.size, axis=1)
+    for k in range(int(counts.max())):
+        # 아직 k 번째 세그먼트가 있는 항로만 진행한다.
+        active = np.flatnonzero(counts > k)
+        segment = segments.offsets[active] + k
+        now = clock[:, active]
+        position = (now - grid[0]) / step_us
+        hs = _interpolate(hs_ft, segment, position)
+        wind = _interpolate(wind_kt, segment, position)
+        outputs = decide_and_eta_batch(
+            hs,
+            wind,
+            hs,
+            hs,
+            wind,
+            segments.offshore_weight[segment],
+            segments.distance_nm[segment],
+            segments.planned_speed[segment],
+            alert,
+            rounded=False,
+            **coefficients,
+        )
+        missing = np.isnan(hs) | np.isnan(wind)
+        outputs.decision_code[missing] = DECISION_NO_GO
+        effective = np.where(missing, segments.planned_speed[segment], outputs.effective_speed)
+        transit = segments.distance_nm[segment] / effective
+        entry[:, segment] = np.round(now).astype(np.int64)
+        hours[:, segment] = transit
+        hs_fused[:, segment] = np.where(missing, np.nan, outputs.hs_fused_m)
+        wind_fused[:, segment] = np.where(missing, np.nan, outputs.wind_fused_kt)
+        speed[:, segment] = effective
+        code[:, segment] = outputs.decision_code
+        buffer[:, segment] = outputs.buffer_minutes
+        clock[:, active] = now + transit * _HOUR_US
+
+    starts = segments.offsets[:-1]
+    total = np.add.reduceat(hours, starts, axis=1)
+    rank = np.maximum.reduceat(_SEVERITY_RANK[code], starts, axis=1)
+    return VoyagePlan(
+        segments=segments,
+        departures=departure_us,
+        entry_us=entry,
+        segment_hours=hours,
+        hs_fused_m=round_array(hs_fused, 2),
+        wind_fused_kt=round_array(wind_fused, 1),
+        effective_speed=round_array(speed, 1),
+        segment_code=code,
+        eta_hours=round_array(total, 1),
+        arrival_us=departure_us[:, None] + np.round(total * _HOUR_US).astype(np.int64),
+        decision_code=_SEVERITY_CODES[rank],
+        buffer_minutes=np.maximum.reduceat(buffer, starts, axis=1),
+    )
@@ -0,0 +1,29 @@
+"""입출력 패키지. Input/output package."""
+
+from .archive import ArchivePart, ForecastArchive, RowGroup
+from .csv_export import StreamingCsvWriter, csv_field, export_csv
+from .csv_import import (
+    iter_csv_columnar,
+    iter_csv_points,
+    parse_csv_timestamp,
+    read_csv_columnar,
+    read_csv_timeseries,
+)
+from .json_codec import dumps, loads, orjson_available
+
+__all__ = [
+    "ArchivePart",
+    "ForecastArchive",
+    "RowGroup",
+    "StreamingCsvWriter",
+    "csv_field",
+    "dumps",
+    "export_csv",
+    "iter_csv_columnar",
+    "iter_csv_points",
+    "loads",
+    "orjson_available",
+    "parse_csv_timestamp",
+    "read_csv_columnar",
+    "read_csv_timeseries",
+]
@@ -0,0 +1,350 @@
+"""메모리 매핑 NPY 예보 아카이브. Memory-mapped NPY forecast archive."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+import numpy as np
+
+from ..core.columnar import ColumnarTimeseries, datetime_to_epoch_us
+from ..core.fast_schema import FastTimeseries
+from ..core.schema import MarineTimeseries, MarineVariable, TimeseriesMetadata, UnitEnum
+
+ARCHIVE_VERSION = 1
+DEFAULT_ROW_GROUP_SIZE = 65_536
+MANIFEST_NAME = "part.json"
+# 쓰기 중인 조각의 준비 디렉터리 접두사. 목록·조회에서 제외한다.
+STAGING_PREFIX = ".tmp-"
+
+BoundingBox = tuple[float, float, float, float]  # (lat_min, lat_max, lon_min, lon_max)
+
+
+@dataclass(frozen=True)
+class RowGroup:
+    """행 그룹 통계. Row group bounds and min/max statistics."""
+
+    start: int
+    stop: int
+    time_min: int
+    time_max: int
+    lat_min: float
+    lat_max: float
+    lon_min: float
+    lon_max: float
+
+    def overlaps(self, start_us: int | None, end_us: int | None, bbox: BoundingBox | None) -> bool:
+        """조회 조건과 겹치는지 여부. Whether the group may hold matching rows."""
+
+        if start_us is not None and self.time_max < start_us:
+            return False
+        if end_us is not None and self.time_min > end_us:
+            return False
+        if bbox is not None:
+            lat_min, lat_max, lon_min, lon_max = bbox
+            if self.lat_max < lat_min or self.lat_min > lat_max:
+                return False
+            if self.lon_max < lon_min or self.lon_min > lon_max:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class ArchivePart:
+    """아카이브 파티션 조각. One immutable part inside a source/issue-date partition."""
+
+    path: Path
+    source: str
+    issued_at: dt.datetime
+    rows: int
+    row_groups: tuple[RowGroup, ...]
+    variables: tuple[MarineVariable, ...]
+    units: dict[MarineVariable, UnitEnum]
+    metadata: tuple[TimeseriesMetadata, ...]
+
+    @classmethod
+    def load(cls, path: Path) -> ArchivePart:
+        """매니페스트 읽기. Load a part from its manifest."""
+
+        manifest = json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest["version"] != ARCHIVE_VERSION:
+            raise ValueError(f"unsupported archive version {manifest['version']} in {path}")
+        return cls(
+            path=path,
+            source=manifest["source"],
+            issued_at=dt.datetime.fromisoformat(manifest["issued_at"]),
+            rows=manifest["rows"],
+            row_groups=tuple(RowGroup(**group) for group in manifest["row_groups"]),
+            variables=tuple(MarineVariable(name) for name in manifest["variables"]),
+            units={
+                MarineVariable(name): UnitEnum(unit) for name, unit in manifest["units"].items()
+            },
+            metadata=tuple(
+                TimeseriesMetadata.model_validate(meta) for meta in manifest["metadata"]
+            ),
+        )
+
+    def read(
+        self,
+        start_us: int | None = None,
+        end_us: int | None = None,
+        bbox: BoundingBox | None = None,
+    ) -> ColumnarTimeseries | None:
+        """
+        조건에 맞는 행 읽기. Read matching rows through memory maps.
+
+        겹치는 행 그룹만 읽으며, 그룹 전체가 조건을 만족하는 연속 구간은 복사 없이 memmap
+        뷰로 반환한다.
+        Only overlapping row groups are touched; a contiguous run of groups with every row
+        matching is returned as zero-copy memmap views.
+        """
+
+        groups = [group for group in self.row_groups if group.overlaps(start_us, end_us, bbox)]
+        if not groups:
+            return None
+        columns = {name: self._column(name) for name in ("timestamps", "latitude", "longitude")}
+        pieces: list[slice | np.ndarray] = []
+        for group in groups:
+            rows = slice(group.start, group.stop)
+            mask = np.ones(group.stop - group.start, dtype=bool)
+            times = columns["timestamps"][rows]
+            if start_us is not None and group.time_min < start_us:
+                mask &= times >= start_us
+            if end_us is not None and group.time_max > end_us:
+                mask &= times <= end_us
+            if bbox is not None:
+                lat = columns["latitude"][rows]
+                lon = columns["longitude"][rows]
+                mask &= (lat >= bbox[0]) & (lat <= bbox[1]) & (lon >= bbox[2]) & (lon <= bbox[3])
+            if mask.all():
+                pieces.append(rows)
+            elif mask.any():
+                pieces.append(group.start + np.flatnonzero(mask))
+        if not pieces:
+            return None
+        index = _merge_pieces(pieces)
+        return ColumnarTimeseries(
+            timestamps=columns["timestamps"][index],
+            latitude=columns["latitude"][index],
+            longitude=columns["longitude"][index],
+            values={
+                variable: self._column(f"values.{variable.value}")[index]
+                for variable in self.variables
+            },
+            quality={
+                variable: self._column(f"quality.{variable.value}")[index]
+                for variable in self.variables
+            },
+            units=dict(self.units),
+            metadata=self.metadata,
+            metadata_index=self._column("metadata_index")[index],
+        )
+
+    def _column(self, name: str) -> np.ndarray:
+        return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+
+def _merge_pieces(pieces: list[slice | np.ndarray]) -> slice | np.ndarray:
+    # 인접한 슬라이스만 있으면 하나의 슬라이스(뷰)로 합친다.
+    if all(isinstance(piece, slice) for piece in pieces):
+        slices = [piece for piece in pieces if isinstance(piece, slice)]
+        if all(left.stop == right.start for left, right in zip(slices, slices[1:])):
+            return slice(slices[0].start, slices[-1].stop)
+    return np.concatenate(
+        [
+            np.arange(piece.start, piece.stop) if isinstance(piece, slice) else piece
+            for piece in pieces
+        ]
+    )
+
+
+class ForecastArchive:
+    """
+    공급자·발표일 분할 예보 아카이브. Forecast archive partitioned by source and issue date.
+
+    ``<root>/source=<source>/issue_date=<YYYY-MM-DD>/<part>/`` 아래에 변수별 ``.npy`` 열과
+    행 그룹 통계를 담은 ``part.json`` 을 저장한다. 조각은 임시 디렉터리에 쓴 뒤 이름 변경으로
+    게시되어 불변이며, 조회는 파티션 이름과 행 그룹 통계로 필요한 부분만 memmap 으로 읽는다.
+    Stores per-variable ``.npy`` columns and a ``part.json`` with row group statistics under
+    ``<root>/source=<source>/issue_date=<YYYY-MM-DD>/<part>/``. Parts are written to a
+    temporary directory and published by rename, so they are immutable; queries prune by
+    partition name and row group statistics and read the rest through memory maps.
+    """
+
+    def __init__(
+        self, root: str | os.PathLike[str], row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ) -> None:
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+        self.root = Path(root)
+        self.row_group_size = row_group_size
+
+    def write(
+        self,
+        timeseries: MarineTimeseries | FastTimeseries | ColumnarTimeseries,
+        issued_at: dt.datetime,
+    ) -> list[ArchivePart]:
+        """
+        스냅샷 저장. Store one forecast snapshot; returns one part per source.
+
+        ``issued_at`` 은 예보 발표 시각이며 파티션 날짜(UTC)를 정한다.
+        ``issued_at`` is the forecast issue time and selects the (UTC) partition date.
+        """
+
+        if issued_at.tzinfo is None:
+            issued_at = issued_at.replace(tzinfo=dt.timezone.utc)
+        issued_at = issued_at.astimezone(dt.timezone.utc)
+        columnar = (
+            timeseries
+            if isinstance(timeseries, ColumnarTimeseries)
+            else ColumnarTimeseries.from_timeseries(timeseries)
+        )
+        sources = [meta.source for meta in columnar.metadata]
+        parts = []
+        for source in dict.fromkeys(sources):
+            codes = [code for code, name in enumerate(sources) if name == source]
+            rows = np.flatnonzero(np.isin(columnar.metadata_index, codes))
+            if rows.size:
+                parts.append(self._write_part(columnar.take(rows), source, codes, issued_at))
+        return parts
+
+    def parts(
+        self,
+        sources: Sequence[str] | None = None,
+        issued_from: dt.date | None = None,
+        issued_to: dt.date | None = None,
+    ) -> list[ArchivePart]:
+        """파티션 이름으로 거른 조각 목록. Parts pruned by partition names only."""
+
+        found = []
+        wanted = None if sources is None else {_partition_name(source) for source in sources}
+        for source_dir in sorted(self.root.glob("source=*")):
+            if wanted is not None and source_dir.name.removeprefix("source=") not in wanted:
+                continue
+            for date_dir in sorted(source_dir.glob("issue_date=*")):
+                day = dt.date.fromisoformat(date_dir.name.removeprefix("issue_date="))
+                if issued_from is not None and day < issued_from:
+                    continue
+                if issued_to is not None and day > issued_to:
+                    continue
+                for part_dir in sorted(date_dir.iterdir()):
+                    if part_dir.name.startswith(STAGING_PREFIX):
+                        continue
+                    if (part_dir / MANIFEST_NAME).is_file():
+                        found.append(ArchivePart.load(part_dir))
+        return found
+
+    def query(
+        self,
+        start: dt.datetime | None = None,
+        end: dt.datetime | None = None,
+        bbox: BoundingBox | None = None,
+        sources: Sequence[str] | None = None,
+        issued_from: dt.date | None = None,
+        issued_to: dt.date | None = None,
+    ) -> Iterator[tuple[ArchivePart, ColumnarTimeseries]]:
+        """
+        시간·영역 조건 조회. Query by valid-time range and bounding box.
+
+        조각별 (조각, 컬럼형 결과)를 발표 시각 순으로 내보낸다. 시간 조건은 양끝 포함이다.
+        Yields (part, columnar rows) per part in issue-time order; time bounds are
+        inclusive.
+        """
+
+        start_us = None if start is None else datetime_to_epoch_us(start)
+        end_us = None if end is None else datetime_to_epoch_us(end)
+        parts = sorted(self.parts(sources, issued_from, issued_to), key=lambda part: part.issued_at)
+        for part in parts:
+            if sources is not None and part.source not in sources:
+                continue
+            columnar = part.read(start_us, end_us, bbox)
+            if columnar is not None:
+                yield part, columnar
+
+    def read_timeseries(self, **query: Any) -> MarineTimeseries:
+        """조회 결과를 하나의 시계열로. Query and concatenate into one timeseries."""
+
+        points = [
+            point
+            for _, columnar in self.query(**query)
+            for point in columnar.to_timeseries().points
+        ]
+        return MarineTimeseries.model_construct(points=points)
+
+    def _write_part(
+        self,
+        columnar: ColumnarTimeseries,
+        source: str,
+        codes: list[int],
+        issued_at: dt.datetime,
+    ) -> ArchivePart:
+        directory = (
+            self.root
+            / f"source={_partition_name(source)}"
+            / f"issue_date={issued_at.date().isoformat()}"
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        remap = np.zeros(max(codes) + 1, dtype=np.int32)
+        remap[codes] = np.arange(len(codes), dtype=np.int32)
+        arrays = {
+            "timestamps": columnar.timestamps.astype(np.int64),
+            "latitude": columnar.latitude.astype(np.float64),
+            "longitude": columnar.longitude.astype(np.float64),
+            "metadata_index": remap[columnar.metadata_index],
+        }
+        for variable in columnar.values:
+            arrays[f"values.{variable.value}"] = columnar.values[variable].astype(np.float64)
+            arrays[f"quality.{variable.value}"] = columnar.quality[variable].astype(np.int8)
+        row_groups = [
+            _row_group_stats(arrays, start, min(start + self.row_group_size, len(columnar)))
+            for start in range(0, len(columnar), self.row_group_size)
+        ]
+        manifest = {
+            "version": ARCHIVE_VERSION,
+            "source": source,
+            "issued_at": issued_at.isoformat(),
+            "rows": len(columnar),
+            "row_groups": [group.__dict__ for group in row_groups],
+            "variables": [variable.value for variable in columnar.values],
+            "units": {variable.value: unit.value for variable, unit in columnar.units.items()},
+            "metadata": [columnar.metadata[code].model_dump(mode="json") for code in codes],
+        }
+        name = f"part-{datetime_to_epoch_us(issued_at)}-{uuid.uuid4().hex[:8]}"
+        staging = Path(tempfile.mkdtemp(dir=directory, prefix=STAGING_PREFIX))
+        try:
+            for key, array in arrays.items():
+                np.save(staging / f"{key}.npy", np.ascontiguousarray(array))
+            (staging / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+            os.replace(staging, directory / name)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return ArchivePart.load(directory / name)
+
+
+def _partition_name(source: str) -> str:
+    # 경로 구분자 등 파일명에 안전하지 않은 문자를 치환한다.
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in source)
+
+
+def _row_group_stats(arrays: dict[str, np.ndarray], start: int, stop: int) -> RowGroup:
+    times = arrays["timestamps"][start:stop]
+    lat = arrays["latitude"][start:stop]
+    lon = arrays["longitude"][start:stop]
+    return RowGroup(
+        start=start,
+        stop=stop,
+        time_min=int(times.min()),
+        time_max=int(times.max()),
+        lat_min=float(lat.min()),
+        lat_max=float(lat.max()),
+        lon_min=float(lon.min()),
+        lon_max=float(lon.max()),
+    )
@@ -0,0 +1,249 @@
+"""스트리밍 CSV 내보내기. Streaming CSV export."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Iterable
+
+from ..core.columnar import (
+    MISSING_QUALITY,
+    QUALITY_FLAGS,
+    ColumnarTimeseries,
+    epoch_us_to_datetime,
+)
+from ..core.fast_schema import FastDataPoint, FastTimeseries
+from ..core.schema import (
+    CSV_HEADER,
+    CSV_TIMESTAMP_FORMAT,
+    MarineDataPoint,
+    MarineTimeseries,
+    TimeseriesMetadata,
+)
+
+DEFAULT_BLOCK_BYTES = 1 << 20
+TIMESTAMP_CACHE_SIZE = 4096
+LINE_END = "\r\n"
+_FLAG_VALUES = tuple(flag.value for flag in QUALITY_FLAGS)
+_NEEDS_QUOTES = frozenset(',"\r\n')
+
+
+def csv_field(text: str) -> str:
+    """RFC 4180 필드 인용 (``csv.writer`` 와 동일). Quote a field like ``csv.writer``."""
+
+    if _NEEDS_QUOTES.isdisjoint(text):
+        return text
+    return '"' + text.replace('"', '""') + '"'
+
+
+class StreamingCsvWriter:
+    """
+    블록 단위 CSV 스트리밍 작성기. Block-buffered streaming CSV writer.
+
+    ``MarineDataPoint``·``FastDataPoint`` 이터러블이나 ``ColumnarTimeseries`` 청크를 받아
+    ``CSV_HEADER`` 형식(``csv.writer`` 와 바이트 단위 동일)으로 기록한다. 출력은 ``block_bytes`` 단위로
+    내보내고 타임스탬프 문자열 캐시도 크기가 제한되므로 출력 길이와 무관하게 메모리가 일정하다.
+    경로가 ``.gz`` 로 끝나거나 ``compress=True`` 이면 gzip 으로 압축한다.
+    Accepts ``MarineDataPoint``/``FastDataPoint`` iterables or ``ColumnarTimeseries`` chunks
+    and writes ``CSV_HEADER`` rows, byte-identical to ``csv.writer``. Output is flushed in
+    ``block_bytes`` blocks and the timestamp string cache is bounded, so memory stays
+    constant however long the output is. Paths ending in ``.gz`` or ``compress=True``
+    produce gzip output.
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike[str] | BinaryIO,
+        compress: bool | None = None,
+        block_bytes: int = DEFAULT_BLOCK_BYTES,
+        compresslevel: int = 6,
+        header: bool = True,
+    ) -> None:
+        if block_bytes < 1:
+            raise ValueError("block_bytes must be positive")
+        if isinstance(target, (str, os.PathLike)):
+            path = Path(target)
+            if compress is None:
+                compress = path.suffix == ".gz"
+            self._raw: BinaryIO = path.open("wb")
+            self._owns_raw = True
+        else:
+            self._raw = target
+            self._owns_raw = False
+        self._stream: BinaryIO = (
+            gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=compresslevel, mtime=0)
+            if compress
+            else self._raw
+        )
+        self.block_bytes = block_bytes
+        self.rows_written = 0
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._times: dict[object, str] = {}
+        self._fields: dict[tuple[str, bool, float | None], tuple[str, str]] = {}
+        self._closed = False
+        if header:
+            self._append(",".join(CSV_HEADER) + LINE_END)
+
+    def write_points(self, points: Iterable[MarineDataPoint | FastDataPoint]) -> int:
+        """데이터 포인트 기록. Write data points; returns rows written."""
+
+        written = 0
+        for point in points:
+            timestamp = point.timestamp
+            # 같은 시각이라도 오프셋이 다르면 문자열이 다르다.
+            key = (timestamp, timestamp.utcoffset())
+            iso_time = self._times.get(key)
+            if iso_time is None:
+                iso_time = timestamp.strftime(CSV_TIMESTAMP_FORMAT)
+                self._remember_time(key, iso_time)
+            head = f"{iso_time},{point.position.latitude:.2f},{point.position.longitude:.2f},"
+            source, tail = self._metadata_fields(point.metadata)
+            lines = [
+                f"{head}{measurement.variable.value},{measurement.value:.2f},"
+                f"{measurement.unit.value},{source},{measurement.quality_flag.value},{tail}"
+                for measurement in point.measurements
+            ]
+            written += len(lines)
+            self._append("".join(lines))
+        self.rows_written += written
+        return written
+
+    def write_timeseries(self, timeseries: MarineTimeseries | FastTimeseries) -> int:
+        """시계열 기록. Write a whole ``MarineTimeseries`` or ``FastTimeseries``."""
+
+        return self.write_points(timeseries.points)
+
+    def write_columnar(self, chunk: ColumnarTimeseries) -> int:
+        """컬럼형 청크 기록. Write one columnar chunk; returns rows written."""
+
+        fields = [self._metadata_fields(meta) for meta in chunk.metadata]
+        columns = [
+            (
+                f"{variable.value},",
+                f",{chunk.units[variable].value},",
+                chunk.values[variable].tolist(),
+                chunk.quality[variable].tolist(),
+            )
+            for variable in chunk.values
+        ]
+        written = 0
+        lines: list[str] = []
+        for row, (epoch, lat, lon, meta) in enumerate(
+            zip(
+                chunk.timestamps.tolist(),
+                chunk.latitude.tolist(),
+                chunk.longitude.tolist(),
+                chunk.metadata_index.tolist(),
+            )
+        ):
+            iso_time = self._times.get(epoch)
+            if iso_time is None:
+                iso_time = epoch_us_to_datetime(epoch).strftime(CSV_TIMESTAMP_FORMAT)
+                self._remember_time(epoch, iso_time)
+            head = f"{iso_time},{lat:.2f},{lon:.2f},"
+            source, tail = fields[meta]
+            for name, unit, value_list, quality_list in columns:
+                code = quality_list[row]
+                if code == MISSING_QUALITY:
+                    continue
+                lines.append(
+                    f"{head}{name}{value_list[row]:.2f}{unit}{source},{_FLAG_VALUES[code]},{tail}"
+                )
+            if len(lines) >= 4096:
+                written += len(lines)
+                self._append("".join(lines))
+                lines = []
+        written += len(lines)
+        self._append("".join(lines))
+        self.rows_written += written
+        return written
+
+    def write(self, source: Iterable[MarineDataPoint | FastDataPoint | ColumnarTimeseries]) -> int:
+        """포인트·청크 혼합 스트림 기록. Write a stream of points and/or columnar chunks."""
+
+        written = 0
+        pending: list[MarineDataPoint | FastDataPoint] = []
+        for item in source:
+            if isinstance(item, ColumnarTimeseries):
+                written += self.write_points(pending)
+                pending = []
+                written += self.write_columnar(item)
+            else:
+                pending.append(item)
+                if len(pending) >= 1024:
+                    written += self.write_points(pending)
+                    pending = []
+        return written + self.write_points(pending)
+
+    def flush(self) -> None:
+        """버퍼 비우기. Flush buffered text to the stream."""
+
+        if self._buffer:
+            self._stream.write("".join(self._buffer).encode("utf-8"))
+            self._buffer = []
+            self._buffered = 0
+
+    def close(self) -> None:
+        """기록 종료. Flush and close the output."""
+
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        if self._stream is not self._raw:
+            self._stream.close()
+        if self._owns_raw:
+            self._raw.close()
+        else:
+            self._raw.flush()
+
+    def __enter__(self) -> StreamingCsvWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _append(self, text: str) -> None:
+        if not text:
+            return
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.block_bytes:
+            self.flush()
+
+    def _remember_time(self, key: object, text: str) -> None:
+        # 시각은 대개 정렬되어 들어오므로 가득 차면 비워도 적중률이 유지된다.
+        if len(self._times) >= TIMESTAMP_CACHE_SIZE:
+            self._times.clear()
+        self._times[key] = text
+
+    def _metadata_fields(self, metadata: TimeseriesMetadata) -> tuple[str, str]:
+        key = (metadata.source, metadata.bias_corrected, metadata.ensemble_weight)
+        fields = self._fields.get(key)
+        if fields is None:
+            weight = (
+                f"{metadata.ensemble_weight:.2f}" if metadata.ensemble_weight is not None else ""
+            )
+            bias = "true" if metadata.bias_corrected else "false"
+            fields = self._fields[key] = (csv_field(metadata.source), f"{bias},{weight}{LINE_END}")
+        return fields
+
+
+def export_csv(
+    target: str | os.PathLike[str] | BinaryIO,
+    source: Iterable[MarineDataPoint | FastDataPoint | ColumnarTimeseries],
+    compress: bool | None = None,
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+) -> int:
+    """스트림을 CSV 로 내보내기. Export a point/chunk stream to CSV; returns rows written."""
+
+    with StreamingCsvWriter(target, compress=compress, block_bytes=block_bytes) as writer:
+        return writer.write(source)
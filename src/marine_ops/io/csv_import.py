@@ -0,0 +1,315 @@
+"""표준 CSV 시계열 읽기. Reader for the standard long-format timeseries CSV."""
+
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import gzip
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+import numpy as np
+
+from ..core.columnar import (
+    EPOCH,
+    MISSING_QUALITY,
+    QUALITY_FLAGS,
+    ColumnarTimeseries,
+    merge_variable_order,
+)
+from ..core.schema import (
+    CSV_HEADER,
+    MarineDataPoint,
+    MarineTimeseries,
+    MarineVariable,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+
+DEFAULT_CHUNK_ROWS = 250_000
+TIMESTAMP_CACHE_SIZE = 4096
+_VARIABLE_LIST: tuple[MarineVariable, ...] = tuple(MarineVariable)
+_VARIABLE_CODES = {variable: code for code, variable in enumerate(_VARIABLE_LIST)}
+_VARIABLE_TEXT_CODES = {variable.value: code for code, variable in enumerate(_VARIABLE_LIST)}
+_UNIT_LIST: tuple[UnitEnum, ...] = tuple(UnitEnum)
+_UNIT_CODES = {unit.value: code for code, unit in enumerate(_UNIT_LIST)}
+_QUALITY = {flag.value: code for code, flag in enumerate(QUALITY_FLAGS)}
+_BOOLEANS = {"true": True, "false": False}
+
+CsvSource = str | os.PathLike[str] | TextIO
+
+
+def parse_csv_timestamp(text: str, days: dict[str, int] | None = None) -> int:
+    """
+    ``CSV_TIMESTAMP_FORMAT`` 고정 폭 해석. Parse ``%Y-%m-%dT%H:%M:%SZ`` to epoch µs.
+
+    ``strptime`` 대신 고정 위치 슬라이스로 해석하며, ``days`` 캐시를 주면 날짜 부분의
+    해석 결과를 재사용한다.
+    Uses fixed-position slicing instead of ``strptime``; an optional ``days`` cache reuses
+    the parsed date part across timestamps.
+    """
+
+    if (
+        len(text) != 20
+        or text[4] != "-"
+        or text[7] != "-"
+        or text[10] != "T"
+        or text[13] != ":"
+        or text[16] != ":"
+        or text[19] != "Z"
+    ):
+        raise ValueError(f"timestamp {text!r} does not match CSV_TIMESTAMP_FORMAT")
+    hour, minute, second = int(text[11:13]), int(text[14:16]), int(text[17:19])
+    if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+        raise ValueError(f"timestamp {text!r} has an invalid time of day")
+    day_text = text[:10]
+    day = None if days is None else days.get(day_text)
+    if day is None:
+        date = dt.date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+        day = (date - EPOCH.date()).days * 86_400_000_000
+        if days is not None:
+            if len(days) >= TIMESTAMP_CACHE_SIZE:
+                days.clear()
+            days[day_text] = day
+    return day + (hour * 3600 + minute * 60 + second) * 1_000_000
+
+
+@contextmanager
+def open_text(source: CsvSource) -> Iterator[TextIO]:
+    """경로(.gz 포함) 또는 열린 파일을 텍스트로 연다. Open a path (gzip aware) or pass a handle."""
+
+    if not isinstance(source, (str, os.PathLike)):
+        yield source
+        return
+    path = Path(source)
+    if path.suffix == ".gz":
+        with gzip.open(path, "rt", newline="", encoding="utf-8") as handle:
+            yield handle
+    else:
+        with path.open("r", newline="", encoding="utf-8") as handle:
+            yield handle
+
+
+class _ChunkBuilder:
+    """
+    행을 포인트 단위 컬럼으로 묶는 버퍼. Groups CSV rows into point-shaped columns.
+
+    행별로는 원문 문자열만 모으고 수치 변환·코드 매핑은 청크 단위로 한 번에 수행한다.
+    Per row only raw strings are collected; numeric conversion and code mapping run once
+    per chunk.
+    """
+
+    def __init__(self, first_row: int) -> None:
+        self.first_row = first_row
+        self.timestamps: list[int] = []
+        self.latitude: list[float] = []
+        self.longitude: list[float] = []
+        self.metadata_index: list[int] = []
+        self.metadata_keys: dict[tuple[str, bool, float | None], int] = {}
+        self.sequences: set[tuple[int, ...]] = set()
+        self.cells: list[tuple[int, int, str, str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def start_point(
+        self, epoch: int, lat: float, lon: float, meta_key: tuple[str, bool, float | None]
+    ) -> None:
+        meta = self.metadata_keys.get(meta_key)
+        if meta is None:
+            meta = self.metadata_keys[meta_key] = len(self.metadata_keys)
+        self.timestamps.append(epoch)
+        self.latitude.append(lat)
+        self.longitude.append(lon)
+        self.metadata_index.append(meta)
+
+    def build(self) -> ColumnarTimeseries:
+        size = len(self.timestamps)
+        latitude = np.array(self.latitude, dtype=np.float64)
+        longitude = np.array(self.longitude, dtype=np.float64)
+        if not np.all((latitude >= -90.0) & (latitude <= 90.0)):
+            raise ValueError("latitude must be within [-90, 90]")
+        if not np.all((longitude >= -180.0) & (longitude <= 180.0)):
+            raise ValueError("longitude must be within [-180, 180]")
+        row_point, row_variable, row_value, row_unit, row_quality = (
+            list(column) for column in zip(*self.cells)
+        )
+        points = np.array(row_point, dtype=np.int64)
+        variables = np.array(row_variable, dtype=np.int8)
+        row_values = self._floats(row_value)
+        row_units = np.array(self._codes(row_unit, _UNIT_CODES, "unit"), dtype=np.int8)
+        row_quality = np.array(self._codes(row_quality, _QUALITY, "quality_flag"), np.int8)
+        metadata_index = np.array(self.metadata_index, dtype=np.int32)
+
+        values: dict[MarineVariable, np.ndarray] = {}
+        quality: dict[MarineVariable, np.ndarray] = {}
+        units: dict[MarineVariable, UnitEnum] = {}
+        order = merge_variable_order(
+            tuple(_VARIABLE_LIST[code] for code in sequence) for sequence in self.sequences
+        )
+        for variable in order:
+            mask = variables == _VARIABLE_CODES[variable]
+            unit_codes = np.unique(row_units[mask])
+            if unit_codes.size != 1:
+                raise ValueError(f"mixed units for variable {variable.value} in one chunk")
+            units[variable] = _UNIT_LIST[unit_codes[0]]
+            values[variable] = np.zeros(size, dtype=np.float64)
+            quality[variable] = np.full(size, MISSING_QUALITY, dtype=np.int8)
+            values[variable][points[mask]] = row_values[mask]
+            quality[variable][points[mask]] = row_quality[mask]
+
+        pairs = np.unique(metadata_index[points].astype(np.int64) * 256 + variables)
+        metadata_variables: list[set[MarineVariable]] = [set() for _ in self.metadata_keys]
+        for pair in pairs.tolist():
+            metadata_variables[pair // 256].add(_VARIABLE_LIST[pair % 256])
+        metadata = tuple(
+            TimeseriesMetadata(
+                source=source,
+                units={variable: unit for variable, unit in units.items() if variable in seen},
+                bias_corrected=bias,
+                ensemble_weight=weight,
+            )
+            for (source, bias, weight), seen in zip(self.metadata_keys, metadata_variables)
+        )
+        return ColumnarTimeseries(
+            timestamps=np.array(self.timestamps, dtype=np.int64),
+            latitude=latitude,
+            longitude=longitude,
+            values=values,
+            quality=quality,
+            units=units,
+            metadata=metadata,
+            metadata_index=metadata_index,
+        )
+
+    def _floats(self, texts: list[str]) -> np.ndarray:
+        try:
+            return np.array(texts, dtype=np.float64)
+        except ValueError:
+            for offset, text in enumerate(texts):
+                try:
+                    float(text)
+                except ValueError:
+                    raise ValueError(
+                        f"invalid value {text!r} in CSV row {self.first_row + offset}"
+                    ) from None
+            raise
+
+    def _codes(self, texts: list[str], table: dict[str, int], label: str) -> list[int]:
+        try:
+            return [table[text] for text in texts]
+        except KeyError as exc:
+            offset = texts.index(exc.args[0])
+            raise ValueError(
+                f"invalid {label} {exc.args[0]!r} in CSV row {self.first_row + offset}"
+            ) from None
+
+
+def iter_csv_columnar(
+    source: CsvSource, chunk_rows: int | None = DEFAULT_CHUNK_ROWS
+) -> Iterator[ColumnarTimeseries]:
+    """
+    CSV 를 컬럼형 청크로 스트리밍. Stream a ``CSV_HEADER`` file as columnar chunks.
+
+    연속된 행 중 (timestamp, 위치, source, bias_corrected, ensemble_weight)가 같은 행이 한
+    포인트가 된다. 청크는 약 ``chunk_rows`` CSV 행마다 포인트 경계에서 나뉘며, ``None`` 이면
+    파일 전체가 한 청크다. ``.gz`` 경로는 gzip 으로 읽는다.
+    Consecutive rows sharing (timestamp, position, source, bias_corrected,
+    ensemble_weight) form one point. Chunks are cut at a point boundary roughly every
+    ``chunk_rows`` CSV rows; ``None`` reads the whole file as one chunk. ``.gz`` paths are
+    read through gzip.
+    """
+
+    if chunk_rows is not None and chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    with open_text(source) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None or tuple(header) != CSV_HEADER:
+            raise ValueError("CSV header does not match CSV_HEADER")
+        times: dict[str, int] = {}
+        days: dict[str, int] = {}
+        coordinates: dict[str, float] = {}
+        weights: dict[str, float | None] = {"": None}
+        builder = _ChunkBuilder(first_row=2)
+        previous: tuple[str, str, str, str, str, str] | None = None
+        current: list[int] = []
+        rows = 0
+        for number, row in enumerate(reader, start=2):
+            try:
+                (
+                    stamp,
+                    lat_text,
+                    lon_text,
+                    variable_text,
+                    value_text,
+                    unit_text,
+                    source_text,
+                    quality_text,
+                    bias_text,
+                    weight_text,
+                ) = row
+                variable = _VARIABLE_TEXT_CODES[variable_text]
+                key = (stamp, lat_text, lon_text, source_text, bias_text, weight_text)
+                if key != previous or variable in current:
+                    if current:
+                        builder.sequences.add(tuple(current))
+                        current = []
+                    if chunk_rows is not None and rows >= chunk_rows:
+                        yield builder.build()
+                        builder = _ChunkBuilder(first_row=number)
+                        rows = 0
+                    epoch = times.get(stamp)
+                    if epoch is None:
+                        if len(times) >= TIMESTAMP_CACHE_SIZE:
+                            times.clear()
+                        epoch = times[stamp] = parse_csv_timestamp(stamp, days)
+                    latitude = coordinates.get(lat_text)
+                    if latitude is None:
+                        latitude = coordinates[lat_text] = float(lat_text)
+                    longitude = coordinates.get(lon_text)
+                    if longitude is None:
+                        longitude = coordinates[lon_text] = float(lon_text)
+                    weight = weights.get(weight_text)
+                    if weight is None and weight_text:
+                        weight = weights[weight_text] = float(weight_text)
+                    # 공급자 문자열은 intern 하여 포인트 간에 공유한다.
+                    meta_key = (sys.intern(source_text), _BOOLEANS[bias_text], weight)
+                    builder.start_point(epoch, latitude, longitude, meta_key)
+                    point = len(builder) - 1
+                    previous = key
+            except (KeyError, ValueError) as exc:
+                raise ValueError(f"invalid CSV row {number}: {row!r}") from exc
+            current.append(variable)
+            builder.cells.append((point, variable, value_text, unit_text, quality_text))
+            rows += 1
+        if current:
+            builder.sequences.add(tuple(current))
+        if len(builder):
+            yield builder.build()
+
+
+def iter_csv_points(
+    source: CsvSource, chunk_rows: int | None = DEFAULT_CHUNK_ROWS
+) -> Iterator[MarineDataPoint]:
+    """CSV 를 데이터 포인트로 스트리밍. Stream a ``CSV_HEADER`` file as data points."""
+
+    for chunk in iter_csv_columnar(source, chunk_rows):
+        yield from chunk.to_timeseries().points
+
+
+def read_csv_columnar(source: CsvSource) -> ColumnarTimeseries:
+    """CSV 전체를 컬럼형으로 읽기. Read a whole ``CSV_HEADER`` file as one columnar block."""
+
+    for chunk in iter_csv_columnar(source, chunk_rows=None):
+        return chunk
+    return ColumnarTimeseries.from_timeseries(MarineTimeseries.model_construct(points=[]))
+
+
+def read_csv_timeseries(source: CsvSource) -> MarineTimeseries:
+    """CSV 전체를 시계열로 읽기. Read a whole ``CSV_HEADER`` file as a timeseries."""
+
+    return read_csv_columnar(source).to_timeseries()
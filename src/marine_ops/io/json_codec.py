@@ -0,0 +1,69 @@
+"""JSON 인코딩·디코딩. JSON encoding and decoding with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import datetime as dt
+import importlib
+import importlib.util
+import json
+from typing import Any
+
+import numpy as np
+
+
+def orjson_available() -> bool:
+    """orjson 사용 가능 여부. Whether the optional ``orjson`` package is installed."""
+
+    return importlib.util.find_spec("orjson") is not None
+
+
+_orjson: Any = importlib.import_module("orjson") if orjson_available() else None
+
+
+def _default(value: Any) -> Any:
+    # 표준 json 폴백용 변환 (orjson 은 numpy·datetime 을 직접 직렬화한다).
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dt.datetime):
+        return value.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def loads(payload: bytes | str) -> Any:
+    """JSON 디코딩. Decode JSON, through orjson when available."""
+
+    if _orjson is not None:
+        return _orjson.loads(payload)
+    return json.loads(payload)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    JSON 인코딩 → UTF-8 바이트. Encode JSON to UTF-8 bytes.
+
+    numpy 배열·스칼라와 datetime 을 지원하며, NaN 은 ``null`` 로 기록된다.
+    Supports numpy arrays/scalars and datetimes; NaN is written as ``null``.
+    """
+
+    if _orjson is not None:
+        return _orjson.dumps(
+            value, default=_default, option=_orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_UTC_Z
+        )
+    return json.dumps(
+        _replace_nan(value), default=_default, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+def _replace_nan(value: Any) -> Any:
+    # 표준 json 은 NaN 을 거부하므로 orjson 과 같게 null 로 바꾼다.
+    if isinstance(value, float) and value != value:
+        return None
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        return [None if item != item else item for item in value.tolist()]
+    if isinstance(value, dict):
+        return {key: _replace_nan(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_nan(item) for item in value]
+    return value
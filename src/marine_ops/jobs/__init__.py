@@ -0,0 +1,45 @@
+"""일괄 작업 패키지. Batch jobs package."""
+
+from .runner import (
+    JOB_HEADER,
+    RESULT_HEADER,
+    JobRunner,
+    JobRunSummary,
+    JobSettings,
+    JobSpec,
+    available_cores,
+    evaluate_jobs,
+    group_jobs,
+    load_checkpoint,
+    read_jobs,
+)
+from .scheduler import (
+    DEFAULT_CHECK_TIMES,
+    DEFAULT_PREFETCH_LEAD,
+    DEFAULT_TIMEZONE,
+    CheckReport,
+    CheckScheduler,
+    PreparedCheck,
+    next_check,
+)
+
+__all__ = [
+    "DEFAULT_CHECK_TIMES",
+    "DEFAULT_PREFETCH_LEAD",
+    "DEFAULT_TIMEZONE",
+    "JOB_HEADER",
+    "RESULT_HEADER",
+    "CheckReport",
+    "CheckScheduler",
+    "JobRunner",
+    "JobRunSummary",
+    "JobSettings",
+    "JobSpec",
+    "PreparedCheck",
+    "available_cores",
+    "evaluate_jobs",
+    "group_jobs",
+    "load_checkpoint",
+    "next_check",
+    "read_jobs",
+]
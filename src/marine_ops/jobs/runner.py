@@ -0,0 +1,401 @@
+"""작업 CSV 일괄 실행기. Batch runner for the jobs CSV."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import datetime as dt
+import io
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence, TextIO
+
+import numpy as np
+
+from ..connectors.fanout import DEFAULT_CONCURRENCY, gather_positions
+from ..core.columnar import ColumnarTimeseries, datetime_to_epoch_us, epoch_us_to_datetime
+from ..core.marine_decision import (
+    DECISION_COASTAL_WINDOW,
+    DECISION_CONDITIONAL,
+    DECISION_GO,
+    DECISION_LABELS,
+    DECISION_NO_GO,
+)
+from ..core.resample import DEFAULT_STEP
+from ..core.schema import CSV_TIMESTAMP_FORMAT
+from ..core.timeline import TimelineRoute, evaluate_timeline, run_length_windows
+from ..io.csv_import import CsvSource, open_text, parse_csv_timestamp
+
+JOB_HEADER = ("job_id", "latitude", "longitude", "start", "end")
+RESULT_HEADER = (
+    "job_id",
+    "latitude",
+    "longitude",
+    "start",
+    "end",
+    "status",
+    "hours",
+    "go_hours",
+    "conditional_hours",
+    "no_go_hours",
+    "window_start",
+    "window_end",
+    "window_decision",
+    "eta_hours",
+    "error",
+)
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+_STATUS_COLUMN = RESULT_HEADER.index("status")
+
+FetchKey = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """작업 CSV 한 행. One row of the jobs CSV."""
+
+    job_id: str
+    latitude: float
+    longitude: float
+    start: dt.datetime
+    end: dt.datetime
+
+
+@dataclass(frozen=True)
+class JobSettings:
+    """
+    작업 평가 설정. Settings used to evaluate every job.
+
+    작업 CSV 에는 항로 정보가 없으므로 모든 작업이 같은 항로 값(기본: MW4↔AGI 샘플 항로)을 쓴다.
+    The jobs CSV carries no route data, so every job uses the same route values (the
+    MW4↔AGI sample route by default).
+    """
+
+    distance_nm: float = 120.0
+    planned_speed: float = 12.0
+    offshore_weight: float = 0.35
+    alert: str | None = None
+    step: dt.timedelta = DEFAULT_STEP
+    max_gap: dt.timedelta | None = None
+
+
+@dataclass(frozen=True)
+class JobRunSummary:
+    """실행 요약. Summary of one runner pass."""
+
+    total: int
+    skipped: int
+    fetches: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+
+
+def read_jobs(source: CsvSource) -> list[JobSpec]:
+    """
+    작업 CSV 읽기. Read the jobs CSV written by ``scripts/generate_sample_csv.py``.
+
+    작업 ID 는 재개 체크포인트의 키이므로 중복되면 ``ValueError`` 를 낸다.
+    Job ids key the resume checkpoint, so duplicates raise ``ValueError``.
+    """
+
+    jobs: list[JobSpec] = []
+    seen: set[str] = set()
+    days: dict[str, int] = {}
+    with open_text(source) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None or tuple(header) != JOB_HEADER:
+            raise ValueError(f"jobs CSV header must be {','.join(JOB_HEADER)}")
+        for line, row in enumerate(reader, start=2):
+            if not row:
+                continue
+            if len(row) != len(JOB_HEADER):
+                raise ValueError(f"jobs CSV line {line} has {len(row)} fields")
+            job_id, latitude, longitude, start, end = row
+            if job_id in seen:
+                raise ValueError(f"duplicate job_id {job_id!r} on line {line}")
+            start_us = parse_csv_timestamp(start, days)
+            end_us = parse_csv_timestamp(end, days)
+            if end_us <= start_us:
+                raise ValueError(f"job {job_id!r} ends before it starts")
+            seen.add(job_id)
+            jobs.append(
+                JobSpec(
+                    job_id=job_id,
+                    latitude=float(latitude),
+                    longitude=float(longitude),
+                    start=epoch_us_to_datetime(start_us),
+                    end=epoch_us_to_datetime(end_us),
+                )
+            )
+    return jobs
+
+
+def group_jobs(
+    jobs: Sequence[JobSpec], grid_resolution: float | None = None
+) -> dict[FetchKey, list[JobSpec]]:
+    """
+    같은 조회 좌표의 작업 묶기. Group jobs that share one fetch position.
+
+    ``grid_resolution`` 을 주면 좌표를 격자에 맞춰 가까운 작업끼리 한 번의 조회를 공유한다.
+    With ``grid_resolution`` positions are snapped so nearby jobs share one fetch.
+    """
+
+    groups: dict[FetchKey, list[JobSpec]] = {}
+    for job in jobs:
+        latitude, longitude = job.latitude, job.longitude
+        if grid_resolution is not None:
+            latitude = round(round(latitude / grid_resolution) * grid_resolution, 6)
+            longitude = round(round(longitude / grid_resolution) * grid_resolution, 6)
+        groups.setdefault((latitude, longitude), []).append(job)
+    return groups
+
+
+def _timestamp(value: int) -> str:
+    return epoch_us_to_datetime(value).strftime(CSV_TIMESTAMP_FORMAT)
+
+
+def _job_fields(job: JobSpec) -> list[str]:
+    return [
+        job.job_id,
+        repr(job.latitude),
+        repr(job.longitude),
+        job.start.strftime(CSV_TIMESTAMP_FORMAT),
+        job.end.strftime(CSV_TIMESTAMP_FORMAT),
+    ]
+
+
+def _error_rows(jobs: Sequence[JobSpec], error: BaseException) -> list[list[str]]:
+    message = f"{type(error).__name__}: {error}"
+    return [
+        _job_fields(job) + [STATUS_ERROR] + [""] * (len(RESULT_HEADER) - 7) + [message]
+        for job in jobs
+    ]
+
+
+def evaluate_jobs(
+    forecast: ColumnarTimeseries, jobs: Sequence[JobSpec], settings: JobSettings
+) -> list[list[str]]:
+    """
+    조회 묶음의 작업 평가 → 결과 행. Evaluate the jobs of one fetch group into result rows.
+
+    묶음 전체 구간을 ``evaluate_timeline`` 한 번으로 평가한 뒤 작업별 [start, end) 시각의
+    결정 시간과 첫 출항 창을 요약한다. 프로세스 풀 작업자에서 실행된다.
+    Runs one ``evaluate_timeline`` over the span of the group, then summarizes decision
+    hours and the first departure window within each job's [start, end) hours. Runs in
+    the process pool workers.
+    """
+
+    step_us = settings.step // dt.timedelta(microseconds=1)
+    first = min(datetime_to_epoch_us(job.start) for job in jobs)
+    last = max(datetime_to_epoch_us(job.end) for job in jobs)
+    origin = -(-first // step_us) * step_us
+    timeline = evaluate_timeline(
+        forecast,
+        [
+            TimelineRoute(
+                name=job.job_id,
+                latitude=job.latitude,
+                longitude=job.longitude,
+                distance_nm=settings.distance_nm,
+                planned_speed=settings.planned_speed,
+                offshore_weight=settings.offshore_weight,
+            )
+            for job in jobs
+        ],
+        start=first,
+        hours=max(1, math.ceil((last - origin) / step_us)),
+        step=step_us,
+        alert=settings.alert,
+        max_gap=settings.max_gap,
+    )
+    step_hours = step_us / 3_600_000_000
+    conditional = np.array([DECISION_CONDITIONAL, DECISION_COASTAL_WINDOW], dtype=np.int8)
+    rows = []
+    for number, job in enumerate(jobs):
+        lo = int(np.searchsorted(timeline.timestamps, datetime_to_epoch_us(job.start)))
+        hi = int(np.searchsorted(timeline.timestamps, datetime_to_epoch_us(job.end)))
+        codes = timeline.outputs.decision_code[number, lo:hi]
+        window = ["", "", "", ""]
+        _, starts, stops, window_codes = run_length_windows(codes[None, :])
+        if starts.size:
+            begin, stop = lo + int(starts[0]), lo + int(stops[0])
+            window = [
+                _timestamp(int(timeline.timestamps[begin])),
+                _timestamp(int(timeline.timestamps[stop - 1]) + step_us),
+                DECISION_LABELS[int(window_codes[0])],
+                repr(float(timeline.outputs.eta_hours[number, begin])),
+            ]
+        rows.append(
+            _job_fields(job)
+            + [
+                STATUS_OK,
+                repr(codes.size * step_hours),
+                repr(int(np.count_nonzero(codes == DECISION_GO)) * step_hours),
+                repr(int(np.count_nonzero(np.isin(codes, conditional))) * step_hours),
+                repr(int(np.count_nonzero(codes == DECISION_NO_GO)) * step_hours),
+            ]
+            + window
+            + [""]
+        )
+    return rows
+
+
+def load_checkpoint(path: Path, retry_failed: bool = True) -> set[str]:
+    """
+    결과 파일에서 완료 작업 복구. Recover completed job ids from a results file.
+
+    결과 파일이 체크포인트다. 충돌로 잘린 마지막 줄과(``retry_failed`` 이면) 실패 행을 지우고
+    파일을 원자적으로 다시 써서, 재개 후에도 작업마다 결과 행이 하나만 남게 한다.
+    The results file is the checkpoint. A last line cut short by a crash and, with
+    ``retry_failed``, failed rows are removed by an atomic rewrite so every job still ends
+    up with exactly one result row after resuming.
+    """
+
+    if not path.exists() or path.stat().st_size == 0:
+        return set()
+    text = path.read_text(encoding="utf-8")
+    complete = text[: text.rfind("\n") + 1]
+    rows = list(csv.reader(io.StringIO(complete)))
+    if not rows or tuple(rows[0]) != RESULT_HEADER:
+        raise ValueError(f"{path} is not a job results file")
+    kept = [
+        row
+        for row in rows[1:]
+        if len(row) == len(RESULT_HEADER) and (not retry_failed or row[_STATUS_COLUMN] == STATUS_OK)
+    ]
+    if complete != text or len(kept) != len(rows) - 1:
+        temporary = path.with_name(path.name + ".tmp")
+        with temporary.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(RESULT_HEADER)
+            writer.writerows(kept)
+        os.replace(temporary, path)
+    return {row[0] for row in kept}
+
+
+def available_cores() -> int:
+    """현재 프로세스가 쓸 수 있는 코어 수. Cores available to this process."""
+
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+class JobRunner:
+    """
+    작업 CSV 일괄 실행기. Fleet-scale batch runner for the jobs CSV.
+
+    작업을 조회 좌표로 묶어 좌표마다 묶음 구간을 한 번만 조회하고(``concurrency`` 동시 조회),
+    조회된 예보는 코어 수만큼의 프로세스 풀에서 평가한다. 조회 슬롯은 평가가 끝날 때까지
+    유지되므로 평가가 밀리면 새 조회도 멈춘다(메모리 상한). 결과 행은 묶음마다 출력 파일에
+    추가·flush 되며 이 파일이 재개 체크포인트다.
+    Jobs are grouped by fetch position and each position is fetched once over the span of
+    its group (``concurrency`` fetches at a time); forecasts are evaluated in a process
+    pool sized to the available cores. A fetch slot is held until its evaluation finishes,
+    so a backlog of evaluations pauses new fetches and bounds memory. Result rows are
+    appended and flushed per group, and that file is the resume checkpoint.
+    """
+
+    def __init__(
+        self,
+        connector: Any,
+        settings: JobSettings | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        workers: int | None = None,
+        grid_resolution: float | None = None,
+    ) -> None:
+        self.connector = connector
+        self.settings = settings or JobSettings()
+        self.concurrency = concurrency
+        self.workers = workers or available_cores()
+        self.grid_resolution = grid_resolution
+
+    def run(
+        self, jobs: Sequence[JobSpec], output: str | os.PathLike[str], resume: bool = True
+    ) -> JobRunSummary:
+        """동기 실행. Run synchronously."""
+
+        return asyncio.run(self.run_async(jobs, output, resume))
+
+    async def run_async(
+        self, jobs: Sequence[JobSpec], output: str | os.PathLike[str], resume: bool = True
+    ) -> JobRunSummary:
+        """
+        작업 실행과 결과 스트리밍. Run the jobs and stream results to ``output``.
+
+        ``resume`` 이면 ``output`` 에 이미 성공으로 기록된 작업은 건너뛴다.
+        With ``resume`` jobs already recorded as successful in ``output`` are skipped.
+        """
+
+        started = time.perf_counter()
+        path = Path(output)
+        done = load_checkpoint(path) if resume else set()
+        pending = [job for job in jobs if job.job_id not in done]
+        groups = group_jobs(pending, self.grid_resolution)
+        counts = {STATUS_OK: 0, STATUS_ERROR: 0}
+        fresh = not done or not path.exists()
+        with path.open("w" if fresh else "a", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            if fresh:
+                writer.writerow(RESULT_HEADER)
+                handle.flush()
+            if self.workers > 1 and len(groups) > 1:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    await self._run_groups(groups, pool, writer, handle, counts)
+            else:
+                await self._run_groups(groups, None, writer, handle, counts)
+        return JobRunSummary(
+            total=len(jobs),
+            skipped=len(jobs) - len(pending),
+            fetches=len(groups),
+            succeeded=counts[STATUS_OK],
+            failed=counts[STATUS_ERROR],
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    async def _run_groups(
+        self,
+        groups: dict[FetchKey, list[JobSpec]],
+        pool: Executor | None,
+        writer: Any,
+        handle: TextIO,
+        counts: dict[str, int],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+
+        async def process(latitude: float, longitude: float) -> None:
+            members = groups[(latitude, longitude)]
+            try:
+                series = await self.connector.fetch_forecast(
+                    latitude,
+                    longitude,
+                    min(job.start for job in members),
+                    max(job.end for job in members),
+                )
+                forecast = (
+                    series
+                    if isinstance(series, ColumnarTimeseries)
+                    else ColumnarTimeseries.from_timeseries(series)
+                )
+                if pool is None:
+                    rows = evaluate_jobs(forecast, members, self.settings)
+                else:
+                    rows = await loop.run_in_executor(
+                        pool, evaluate_jobs, forecast, members, self.settings
+                    )
+            except Exception as exc:  # noqa: BLE001 - 작업별 실패는 결과 행으로 남긴다
+                rows = _error_rows(members, exc)
+            # 이벤트 루프 한 곳에서만 쓰므로 행이 섞이지 않는다.
+            writer.writerows(rows)
+            handle.flush()
+            for row in rows:
+                counts[row[_STATUS_COLUMN]] += 1
+
+        await gather_positions(groups, process, self.concurrency)
@@ -0,0 +1,306 @@
+"""정기 점검 스케줄러. Daemon scheduler for the daily marine checks."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ..connectors.fanout import DEFAULT_CONCURRENCY, gather_positions
+from ..core.columnar import ColumnarTimeseries
+from ..core.resample import DEFAULT_STEP
+from ..core.timeline import (
+    DEFAULT_HORIZON_HOURS,
+    IncrementalTimeline,
+    TimelineRoute,
+    TimelineUpdate,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEZONE = "Asia/Dubai"
+DEFAULT_CHECK_TIMES: tuple[dt.time, ...] = (dt.time(6, 0), dt.time(17, 0))
+DEFAULT_PREFETCH_LEAD = dt.timedelta(minutes=15)
+
+FetchKey = tuple[float, float]
+
+
+def next_check(
+    now: dt.datetime,
+    times: Sequence[dt.time] = DEFAULT_CHECK_TIMES,
+    timezone: str = DEFAULT_TIMEZONE,
+) -> dt.datetime:
+    """
+    ``now`` 이후 첫 점검 시각(UTC). First check strictly after ``now``, in UTC.
+
+    ``times`` 는 ``timezone`` 의 현지 시각이다.
+    ``times`` are wall-clock times in ``timezone``.
+    """
+
+    if not times:
+        raise ValueError("at least one check time is required")
+    zone = ZoneInfo(timezone)
+    local = now.astimezone(zone)
+    for days in range(2):
+        day = local.date() + dt.timedelta(days=days)
+        for moment in sorted(times):
+            candidate = dt.datetime.combine(day, moment, tzinfo=zone)
+            if candidate > local:
+                return candidate.astimezone(dt.timezone.utc)
+    raise AssertionError("unreachable: a check falls within two days")
+
+
+@dataclass(frozen=True)
+class PreparedCheck:
+    """
+    사전 조회된 점검 입력. Forecast prefetched ahead of one check.
+
+    ``stale_positions`` 는 조회에 실패해 직전 스냅샷 값으로 채운 위치다.
+    ``stale_positions`` failed to fetch and were filled from the previous snapshot.
+    """
+
+    scheduled_for: dt.datetime
+    forecast: ColumnarTimeseries
+    positions: int
+    stale_positions: tuple[FetchKey, ...]
+    stages: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CheckReport:
+    """
+    점검 1회 결과와 단계별 소요 시간. One check's outcome and per-stage timings.
+
+    ``stages`` 는 단계 이름 → 초이며 ``fetch``, ``convert``, ``wait``(사전 조회 완료 후 점검
+    시각까지 대기), ``decide`` 순이다.
+    ``stages`` maps stage name to seconds: ``fetch``, ``convert``, ``wait`` (idle between
+    the finished prefetch and the check time) and ``decide``.
+    """
+
+    scheduled_for: dt.datetime
+    positions: int
+    stale_positions: tuple[FetchKey, ...]
+    rows: int
+    update: TimelineUpdate
+    stages: dict[str, float]
+
+    def summary(self) -> str:
+        """한 줄 요약. One-line summary for logs."""
+
+        timings = " ".join(f"{name}={seconds:.3f}s" for name, seconds in self.stages.items())
+        return (
+            f"check {self.scheduled_for.isoformat()}: {self.positions} positions "
+            f"({len(self.stale_positions)} stale), {self.rows} rows, "
+            f"{self.update.cells_evaluated} cells evaluated, {len(self.update)} changed; "
+            f"{timings}"
+        )
+
+
+def _route_positions(routes: Sequence[TimelineRoute]) -> list[FetchKey]:
+    positions: dict[FetchKey, None] = {}
+    for route in routes:
+        positions[(route.latitude, route.longitude)] = None
+        if route.onshore_latitude is not None and route.onshore_longitude is not None:
+            positions[(route.onshore_latitude, route.onshore_longitude)] = None
+    return list(positions)
+
+
+class CheckScheduler:
+    """
+    06:00/17:00 정기 점검 데몬. Long-running scheduler for the daily checks.
+
+    커넥터(와 그 공유 HTTP 풀)와 직전 예보 스냅샷, 하루 단위 ``IncrementalTimeline`` 을 실행
+    사이에 유지한다. 점검 ``lead`` 전에 항로 위치를 동시 조회해 컬럼형으로 변환해 두므로 점검
+    시각에는 결정 단계만 남는다. 시간 격자는 현지 자정부터 ``24 + hours`` 시간이라 같은 날의
+    점검은 같은 구간을 조회하고, 두 번째 점검은 바뀐 셀만 다시 결정한다. 조회에 실패한 위치는
+    직전 스냅샷 값으로 채운다.
+    Keeps the connector (and its pooled HTTP clients), the last forecast snapshot and a
+    per-day ``IncrementalTimeline`` alive between runs. Route positions are fetched
+    concurrently and converted to columnar form ``lead`` ahead of each check, so only the
+    decision step runs at check time. The grid spans ``24 + hours`` hours from local
+    midnight, so checks on the same day fetch the same span and the later one re-decides
+    only changed cells. Positions that fail to fetch are filled from the last snapshot.
+    """
+
+    def __init__(
+        self,
+        connector: Any,
+        routes: Sequence[TimelineRoute],
+        times: Sequence[dt.time] = DEFAULT_CHECK_TIMES,
+        timezone: str = DEFAULT_TIMEZONE,
+        lead: dt.timedelta = DEFAULT_PREFETCH_LEAD,
+        hours: int = DEFAULT_HORIZON_HOURS,
+        step: dt.timedelta = DEFAULT_STEP,
+        alert: str | None = None,
+        max_gap: dt.timedelta | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        on_report: Callable[[CheckReport], None] | None = None,
+        clock: Callable[[], dt.datetime] | None = None,
+    ) -> None:
+        if not routes:
+            raise ValueError("at least one route is required")
+        self.connector = connector
+        self.routes = tuple(routes)
+        self.times = tuple(times)
+        self.timezone = timezone
+        self.lead = lead
+        self.hours = hours
+        self.step = step
+        self.alert = alert
+        self.max_gap = max_gap
+        self.concurrency = concurrency
+        self.on_report = on_report
+        self.clock = clock or (lambda: dt.datetime.now(dt.timezone.utc))
+        self.positions = _route_positions(self.routes)
+        self.snapshot: ColumnarTimeseries | None = None
+        self.evaluator: IncrementalTimeline | None = None
+        self._day: dt.date | None = None
+        self._stopping: asyncio.Event | None = None
+
+    def horizon(self, check: dt.datetime) -> tuple[dt.datetime, dt.datetime]:
+        """점검일 조회 구간(UTC). Fetch span for the day of ``check`` in UTC."""
+
+        zone = ZoneInfo(self.timezone)
+        day = check.astimezone(zone).date()
+        start = dt.datetime.combine(day, dt.time(0), tzinfo=zone).astimezone(dt.timezone.utc)
+        return start, start + dt.timedelta(hours=24 + self.hours)
+
+    async def prefetch(self, check: dt.datetime) -> PreparedCheck:
+        """점검 입력 사전 조회·변환. Fetch and convert the inputs for ``check``."""
+
+        start, end = self.horizon(check)
+        started = time.perf_counter()
+
+        async def fetch(latitude: float, longitude: float) -> Any:
+            return await self.connector.fetch_forecast(latitude, longitude, start, end)
+
+        results = await gather_positions(
+            self.positions, fetch, self.concurrency, return_exceptions=True
+        )
+        fetched = time.perf_counter()
+        parts: list[ColumnarTimeseries] = []
+        stale: list[FetchKey] = []
+        for (latitude, longitude), result in zip(self.positions, results):
+            if isinstance(result, BaseException):
+                logger.warning("fetch failed for %s,%s: %s", latitude, longitude, result)
+                stale.append((latitude, longitude))
+                previous = self._previous_rows(latitude, longitude)
+                if previous is not None:
+                    parts.append(previous)
+                continue
+            parts.append(
+                result
+                if isinstance(result, ColumnarTimeseries)
+                else ColumnarTimeseries.from_timeseries(result)
+            )
+        if not parts:
+            raise RuntimeError("no forecast available: every fetch failed and no snapshot")
+        forecast = ColumnarTimeseries.concat(parts)
+        return PreparedCheck(
+            scheduled_for=check,
+            forecast=forecast,
+            positions=len(self.positions),
+            stale_positions=tuple(stale),
+            stages={"fetch": fetched - started, "convert": time.perf_counter() - fetched},
+        )
+
+    def decide(self, prepared: PreparedCheck, waited: float = 0.0) -> CheckReport:
+        """사전 조회 입력으로 결정. Run the decision step on prefetched inputs."""
+
+        started = time.perf_counter()
+        start, _ = self.horizon(prepared.scheduled_for)
+        day = prepared.scheduled_for.astimezone(ZoneInfo(self.timezone)).date()
+        if self.evaluator is None or self._day != day:
+            # 날짜가 바뀌면 격자가 이동하므로 새 평가기를 만든다.
+            self.evaluator = IncrementalTimeline(
+                self.routes,
+                start,
+                hours=24 + self.hours,
+                step=self.step,
+                alert=self.alert,
+                max_gap=self.max_gap,
+            )
+            self._day = day
+        update = self.evaluator.update(prepared.forecast)
+        self.snapshot = prepared.forecast
+        report = CheckReport(
+            scheduled_for=prepared.scheduled_for,
+            positions=prepared.positions,
+            stale_positions=prepared.stale_positions,
+            rows=len(prepared.forecast),
+            update=update,
+            stages={
+                **prepared.stages,
+                "wait": waited,
+                "decide": time.perf_counter() - started,
+            },
+        )
+        logger.info(report.summary())
+        if self.on_report is not None:
+            self.on_report(report)
+        return report
+
+    async def run_check(self, check: dt.datetime | None = None) -> CheckReport:
+        """즉시 점검 1회. Run one check right away (prefetch, then decide)."""
+
+        return self.decide(await self.prefetch(check or self.clock()))
+
+    async def serve(self, checks: int | None = None) -> list[CheckReport]:
+        """
+        점검 반복 실행. Run checks on schedule until stopped (or ``checks`` reached).
+
+        점검이 실패해도 로그만 남기고 다음 점검으로 넘어간다.
+        A failed check is logged and the loop moves on to the next one.
+        """
+
+        self._stopping = asyncio.Event()
+        reports: list[CheckReport] = []
+        previous: dt.datetime | None = None
+        while checks is None or len(reports) < checks:
+            # 시계가 점검 시각보다 조금 늦어도 같은 점검을 반복하지 않는다.
+            now = self.clock() if previous is None else max(self.clock(), previous)
+            check = next_check(now, self.times, self.timezone)
+            previous = check
+            if not await self._sleep_until(check - self.lead):
+                break
+            try:
+                prepared = await self.prefetch(check)
+            except Exception:  # noqa: BLE001 - 데몬은 다음 점검까지 살아 있어야 한다
+                logger.exception("prefetch for %s failed", check.isoformat())
+                await self._sleep_until(check)
+                continue
+            ready = time.perf_counter()
+            if not await self._sleep_until(check):
+                break
+            reports.append(self.decide(prepared, time.perf_counter() - ready))
+        return reports
+
+    def stop(self) -> None:
+        """``serve`` 중지 요청. Ask ``serve`` to return at its next wait."""
+
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def _sleep_until(self, moment: dt.datetime) -> bool:
+        assert self._stopping is not None
+        delay = (moment - self.clock()).total_seconds()
+        if delay > 0:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+        return not self._stopping.is_set()
+
+    def _previous_rows(self, latitude: float, longitude: float) -> ColumnarTimeseries | None:
+        if self.snapshot is None:
+            return None
+        rows = np.flatnonzero(
+            (self.snapshot.latitude == latitude) & (self.snapshot.longitude == longitude)
+        )
+        return self.snapshot.take(rows) if rows.size else None
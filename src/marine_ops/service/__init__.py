@@ -0,0 +1,25 @@
+"""의사결정 HTTP 서비스 패키지. Decision HTTP service package."""
+
+from .app import (
+    BATCH_FIELDS,
+    OUTPUT_FIELDS,
+    DecisionService,
+    HTTPError,
+    app,
+    create_app,
+    parse_batch,
+    parse_forecast,
+    parse_routes,
+)
+
+__all__ = [
+    "BATCH_FIELDS",
+    "OUTPUT_FIELDS",
+    "DecisionService",
+    "HTTPError",
+    "app",
+    "create_app",
+    "parse_batch",
+    "parse_forecast",
+    "parse_routes",
+]
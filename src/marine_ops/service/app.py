@@ -0,0 +1,533 @@
+"""의사결정 HTTP 서비스. ASGI decision service."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import hashlib
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from urllib.parse import parse_qs
+
+import numpy as np
+from pydantic import ValidationError
+
+from ..connectors.fast_path import numeric_column, parse_epoch_us, parse_utc_timestamp
+from ..core.columnar import ColumnarTimeseries, datetime_to_epoch_us, epoch_us_to_datetime
+from ..core.decision_cache import DecisionCache
+from ..core.marine_decision import (
+    DECISION_LABELS,
+    MarineInputs,
+    create_sample_inputs,
+    decide_and_eta_batch,
+)
+from ..core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from ..core.timeline import DEFAULT_HORIZON_HOURS, TimelineRoute, evaluate_timeline
+from ..io.json_codec import dumps, loads, orjson_available
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_TIMELINE_CELLS = 5_000_000
+DEFAULT_STREAM_ROWS = 10_000
+# 이보다 작은 배치는 스레드 전환 비용이 계산보다 커서 이벤트 루프에서 바로 계산한다.
+INLINE_ROWS = 20_000
+DEFAULT_TIMELINE_CACHE = 64
+JSON_TYPE = b"application/json"
+NDJSON_TYPE = b"application/x-ndjson"
+BATCH_FIELDS = (
+    "combined_ft",
+    "wind_adnoc",
+    "hs_onshore_ft",
+    "hs_offshore_ft",
+    "wind_albahar",
+    "offshore_weight",
+    "distance_nm",
+    "planned_speed",
+)
+OUTPUT_FIELDS = (
+    "hs_fused_m",
+    "wind_fused_kt",
+    "decision_code",
+    "eta_hours",
+    "buffer_minutes",
+    "effective_speed",
+)
+
+# 응답에서 datetime 으로 바꿀 수 있는 epoch µs 범위 (1–9999년).
+MIN_EPOCH_US = datetime_to_epoch_us(dt.datetime.min.replace(tzinfo=dt.timezone.utc))
+MAX_EPOCH_US = datetime_to_epoch_us(dt.datetime.max.replace(tzinfo=dt.timezone.utc))
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+FORECAST_UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+
+
+class HTTPError(Exception):
+    """상태 코드가 있는 요청 오류. Request error carrying an HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _field(payload: Mapping[str, Any], name: str) -> Any:
+    if name not in payload or payload[name] is None:
+        raise HTTPError(400, f"{name} is required")
+    return payload[name]
+
+
+def _numbers(payload: Mapping[str, Any], name: str) -> np.ndarray:
+    try:
+        column = np.asarray(_field(payload, name), dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise HTTPError(400, f"{name} must be a number or an array of numbers") from exc
+    if column.ndim > 1:
+        raise HTTPError(400, f"{name} must be a flat array")
+    if not np.all(np.isfinite(column)):
+        raise HTTPError(400, f"{name} must be finite")
+    return column
+
+
+def parse_batch(payload: Mapping[str, Any]) -> tuple[dict[str, np.ndarray], Any, int]:
+    """
+    컬럼형 배치 요청 파싱. Parse a columnar batch request.
+
+    ``MarineInputs`` 필드마다 숫자 또는 배열 하나를 받으며 스칼라는 모든 행에 적용된다.
+    ``alert`` 는 생략, 문자열 하나, 또는 행별 문자열 배열이다. 필드 제약은 ``MarineInputs`` 와
+    같다.
+    Takes one number or array per ``MarineInputs`` field; scalars apply to every row.
+    ``alert`` is omitted, one string or a per-row array. Field constraints match
+    ``MarineInputs``.
+    """
+
+    if not isinstance(payload, Mapping):
+        raise HTTPError(400, "batch payload must be a JSON object of columns")
+    columns = {name: _numbers(payload, name) for name in BATCH_FIELDS}
+    try:
+        shape = np.broadcast_shapes(*(column.shape for column in columns.values()))
+    except ValueError as exc:
+        raise HTTPError(400, "batch columns must have equal lengths") from exc
+    rows = int(np.prod(shape, dtype=np.int64))
+    weight = columns["offshore_weight"]
+    if np.any((weight < 0.0) | (weight > 1.0)):
+        raise HTTPError(400, "offshore_weight must be within [0, 1]")
+    for name in ("distance_nm", "planned_speed"):
+        if np.any(columns[name] <= 0.0):
+            raise HTTPError(400, f"{name} must be positive")
+    alert = payload.get("alert")
+    if isinstance(alert, list):
+        if len(alert) != rows or not all(item is None or isinstance(item, str) for item in alert):
+            raise HTTPError(400, "alert must be a string or one string/null per row")
+        alert = np.asarray(alert, dtype=object)
+    elif alert is not None and not isinstance(alert, str):
+        raise HTTPError(400, "alert must be a string or one string/null per row")
+    return {name: np.broadcast_to(column, shape) for name, column in columns.items()}, alert, rows
+
+
+def _epoch(value: Any, name: str) -> int:
+    try:
+        if isinstance(value, str):
+            epoch = datetime_to_epoch_us(parse_utc_timestamp(value))
+        else:
+            epoch = int(value)
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise HTTPError(400, f"{name} must be an ISO-8601 string or epoch microseconds") from exc
+    if not MIN_EPOCH_US <= epoch <= MAX_EPOCH_US:
+        raise HTTPError(400, f"{name} is outside the supported date range")
+    return epoch
+
+
+def parse_forecast(payload: Mapping[str, Any]) -> ColumnarTimeseries:
+    """
+    컬럼형 예보 파싱. Parse a columnar forecast payload.
+
+    ``timestamps``(ISO-8601 문자열 또는 epoch µs), ``latitude``/``longitude``(스칼라 또는 배열),
+    ``hs_m``, ``wind_ms`` 배열을 받는다. ``null`` 은 결측이다.
+    Takes ``timestamps`` (ISO-8601 strings or epoch µs), ``latitude``/``longitude``
+    (scalars or arrays) and ``hs_m``/``wind_ms`` arrays; ``null`` marks a missing value.
+    """
+
+    if not isinstance(payload, Mapping):
+        raise HTTPError(400, "forecast must be a JSON object of columns")
+    raw_times = _field(payload, "timestamps")
+    if not isinstance(raw_times, list):
+        raise HTTPError(400, "timestamps must be an array")
+    try:
+        if all(isinstance(value, str) for value in raw_times):
+            times = parse_epoch_us(raw_times)
+        else:
+            times = np.asarray(raw_times, dtype=np.int64)
+        size = times.size
+        if size and (times.min() < MIN_EPOCH_US or times.max() > MAX_EPOCH_US):
+            raise HTTPError(400, "timestamps are outside the supported date range")
+        return ColumnarTimeseries.from_arrays(
+            times,
+            np.asarray(_field(payload, "latitude"), dtype=np.float64),
+            np.asarray(_field(payload, "longitude"), dtype=np.float64),
+            {
+                HS: numeric_column(_field(payload, "hs_m"), size, "hs_m"),
+                WIND: numeric_column(_field(payload, "wind_ms"), size, "wind_ms"),
+            },
+            FORECAST_UNITS,
+            TimeseriesMetadata(source=str(payload.get("source", "api")), units=FORECAST_UNITS),
+        )
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise HTTPError(400, f"invalid forecast: {exc}") from exc
+
+
+def parse_routes(payload: Any) -> list[TimelineRoute]:
+    """항로 목록 파싱. Parse the ``routes`` array into ``TimelineRoute`` objects."""
+
+    if not isinstance(payload, list) or not payload:
+        raise HTTPError(400, "routes must be a non-empty array")
+    try:
+        return [TimelineRoute(**route) for route in payload]
+    except TypeError as exc:
+        raise HTTPError(400, f"invalid route: {exc}") from exc
+
+
+def _columns(outputs: Any) -> dict[str, np.ndarray]:
+    return {name: getattr(outputs, name).ravel() for name in OUTPUT_FIELDS}
+
+
+def _ndjson(records: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+    for record in records:
+        yield dumps(record) + b"\n"
+
+
+class DecisionService:
+    """
+    의사결정 ASGI 애플리케이션. ASGI application serving marine decisions.
+
+    경로:
+    - ``GET /health``: 상태와 캐시 통계
+    - ``POST /v1/decide``: ``MarineInputs`` JSON 하나 → ``MarineOutput``
+    - ``POST /v1/decide/batch``: 컬럼형 입력 → 컬럼형 결과 (``decide_and_eta_batch``)
+    - ``POST /v1/timeline``: 컬럼형 예보와 항로 → 결정 타임라인과 출항 창
+
+    배치와 타임라인은 ``?stream=1`` 또는 ``Accept: application/x-ndjson`` 이면 NDJSON 으로
+    청크(배치)·항로(타임라인)별로 스트리밍한다. 단일 결정은 ``DecisionCache`` 를, 타임라인은
+    요청 본문 해시 기반 LRU 응답 캐시를 거치며, lifespan 시작 시 각 경로를 한 번 실행해
+    캐시와 numpy 경로를 데워 둔다. 타임라인과 ``inline_rows`` 행을 넘는 배치(스트리밍이면
+    청크마다)는 이벤트 루프를 막지 않도록 스레드 풀에서 계산한다. JSON 은 orjson 이 있으면 orjson 으로 처리한다.
+    Routes:
+    - ``GET /health``: status and cache statistics
+    - ``POST /v1/decide``: one ``MarineInputs`` JSON object → ``MarineOutput``
+    - ``POST /v1/decide/batch``: columnar inputs → columnar outputs
+    - ``POST /v1/timeline``: columnar forecast plus routes → decision timeline and windows
+
+    Batch and timeline responses stream as NDJSON, per chunk or per route, with
+    ``?stream=1`` or ``Accept: application/x-ndjson``. Single decisions go through a
+    ``DecisionCache`` and timelines through an LRU response cache keyed by a hash of the
+    request body; lifespan startup runs every path once to warm the caches and numpy code
+    paths. Timelines and batches above ``inline_rows`` rows (chunk by chunk when streaming)
+    run in the thread pool so the event loop stays responsive. JSON goes through orjson when
+    it is installed.
+    """
+
+    def __init__(
+        self,
+        cache: DecisionCache | None = None,
+        timeline_cache_size: int = DEFAULT_TIMELINE_CACHE,
+        stream_rows: int = DEFAULT_STREAM_ROWS,
+        max_body_bytes: int = MAX_BODY_BYTES,
+        inline_rows: int = INLINE_ROWS,
+    ) -> None:
+        self.cache = cache or DecisionCache()
+        self.timeline_cache_size = timeline_cache_size
+        self.stream_rows = stream_rows
+        self.inline_rows = inline_rows
+        self.max_body_bytes = max_body_bytes
+        self.timeline_hits = 0
+        self.timeline_misses = 0
+        self._timelines: OrderedDict[bytes, list[bytes]] = OrderedDict()
+        self._routes: dict[str, dict[str, Callable[..., Awaitable[Any]]]] = {
+            "/health": {"GET": self._health},
+            "/v1/decide": {"POST": self._decide},
+            "/v1/decide/batch": {"POST": self._batch},
+            "/v1/timeline": {"POST": self._timeline},
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":  # pragma: no cover - websocket 등은 지원하지 않음
+            return
+        try:
+            methods = self._routes.get(scope["path"])
+            if methods is None:
+                raise HTTPError(404, f"no route for {scope['path']}")
+            handler = methods.get(scope["method"])
+            if handler is None:
+                raise HTTPError(405, f"{scope['method']} not allowed on {scope['path']}")
+            body = await self._read_body(scope, receive)
+            result = await handler(body, self._wants_stream(scope))
+        except HTTPError as exc:
+            await self._send_body(send, exc.status, dumps({"success": False, "error": str(exc)}))
+            return
+        except ValidationError as exc:
+            await self._send_body(send, 400, dumps({"success": False, "error": str(exc)}))
+            return
+        if isinstance(result, bytes):
+            await self._send_body(send, 200, result)
+        else:
+            await self._send_stream(send, result)
+
+    def warm_up(self) -> None:
+        """캐시·numpy 경로 예열. Run every decision path once to warm caches."""
+
+        sample = create_sample_inputs()
+        self.cache(sample)
+        decide_and_eta_batch(*(np.full(4, getattr(sample, name)) for name in BATCH_FIELDS))
+        start = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+        times = datetime_to_epoch_us(start) + np.arange(24, dtype=np.int64) * 3_600_000_000
+        evaluate_timeline(
+            ColumnarTimeseries.from_arrays(
+                times,
+                24.8,
+                54.6,
+                {HS: np.full(24, 1.0), WIND: np.full(24, 8.0)},
+                FORECAST_UNITS,
+                TimeseriesMetadata(source="warm-up", units=FORECAST_UNITS),
+            ),
+            [TimelineRoute("warm-up", 24.8, 54.6, 120.0, 12.0, 0.35)],
+            start=start,
+            hours=24,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계. Cache statistics."""
+
+        return {
+            "decision_cache": self.cache.stats(),
+            "timeline_cache": {
+                "hits": self.timeline_hits,
+                "misses": self.timeline_misses,
+                "size": len(self._timelines),
+                "maxsize": self.timeline_cache_size,
+            },
+        }
+
+    async def _health(self, body: bytes, stream: bool) -> bytes:
+        return dumps({"status": "ok", "orjson": orjson_available(), **self.stats()})
+
+    async def _decide(self, body: bytes, stream: bool) -> bytes:
+        payload = self._json(body)
+        if not isinstance(payload, Mapping):
+            raise HTTPError(400, "decision payload must be a JSON object")
+        output = self.cache(MarineInputs.model_validate(payload))
+        return dumps({"success": True, "data": output.model_dump()})
+
+    async def _batch(self, body: bytes, stream: bool) -> bytes | AsyncIterator[bytes]:
+        columns, alert, rows = parse_batch(self._json(body))
+        if stream:
+            return self._batch_chunks(columns, alert, rows)
+        if rows <= self.inline_rows:
+            outputs = decide_and_eta_batch(*columns.values(), alert=alert)
+        else:
+            loop = asyncio.get_running_loop()
+            outputs = await loop.run_in_executor(
+                None, lambda: decide_and_eta_batch(*columns.values(), alert=alert)
+            )
+        return dumps(
+            {
+                "success": True,
+                "rows": rows,
+                "decision_labels": DECISION_LABELS,
+                "data": _columns(outputs),
+            }
+        )
+
+    async def _batch_chunks(
+        self, columns: dict[str, np.ndarray], alert: Any, rows: int
+    ) -> AsyncIterator[bytes]:
+        yield dumps({"rows": rows, "decision_labels": DECISION_LABELS}) + b"\n"
+        flat = [column.ravel() for column in columns.values()]
+        flat_alert = alert.ravel() if isinstance(alert, np.ndarray) else alert
+
+        def chunk(offset: int) -> bytes:
+            part = slice(offset, offset + self.stream_rows)
+            outputs = decide_and_eta_batch(
+                *(column[part] for column in flat),
+                alert=flat_alert[part] if isinstance(flat_alert, np.ndarray) else flat_alert,
+            )
+            return dumps({"offset": offset, **_columns(outputs)}) + b"\n"
+
+        # 큰 배치는 청크마다 스레드 풀에서 계산해 스트리밍 중에도 이벤트 루프를 막지 않는다.
+        loop = asyncio.get_running_loop()
+        for offset in range(0, rows, self.stream_rows):
+            if rows <= self.inline_rows:
+                yield chunk(offset)
+            else:
+                yield await loop.run_in_executor(None, chunk, offset)
+
+    async def _timeline(self, body: bytes, stream: bool) -> bytes | list[bytes]:
+        key = hashlib.blake2b(body, digest_size=16).digest() + (b"s" if stream else b"j")
+        cached = self._timelines.get(key)
+        if cached is not None:
+            self._timelines.move_to_end(key)
+            self.timeline_hits += 1
+        else:
+            self.timeline_misses += 1
+            payload = self._json(body)
+            loop = asyncio.get_running_loop()
+            cached = await loop.run_in_executor(None, self._render_timeline, payload, stream)
+            self._timelines[key] = cached
+            while len(self._timelines) > self.timeline_cache_size:
+                self._timelines.popitem(last=False)
+        return cached if stream else cached[0]
+
+    def _render_timeline(self, payload: Any, stream: bool) -> list[bytes]:
+        if not isinstance(payload, Mapping):
+            raise HTTPError(400, "timeline payload must be a JSON object")
+        forecast = parse_forecast(_field(payload, "forecast"))
+        routes = parse_routes(payload.get("routes"))
+        hours = payload.get("hours", DEFAULT_HORIZON_HOURS)
+        step_minutes = payload.get("step_minutes", 60)
+        if not isinstance(hours, int) or hours < 1:
+            raise HTTPError(400, "hours must be a positive integer")
+        if not isinstance(step_minutes, int) or step_minutes < 1:
+            raise HTTPError(400, "step_minutes must be a positive integer")
+        if hours * 60 // step_minutes * len(routes) > MAX_TIMELINE_CELLS:
+            raise HTTPError(413, f"timeline exceeds {MAX_TIMELINE_CELLS} route × time cells")
+        start = payload.get("start")
+        start_us = None if start is None else _epoch(start, "start")
+        alert = payload.get("alert")
+        if alert is not None and not isinstance(alert, str):
+            raise HTTPError(400, "alert must be a string or null")
+        try:
+            timeline = evaluate_timeline(
+                forecast,
+                routes,
+                start=start_us,
+                hours=hours * 60 // step_minutes,
+                step=dt.timedelta(minutes=step_minutes),
+                alert=alert,
+            )
+            timestamps = [epoch_us_to_datetime(value) for value in timeline.timestamps.tolist()]
+        except OverflowError as exc:
+            raise HTTPError(400, "timeline extends outside the supported date range") from exc
+        except ValueError as exc:
+            raise HTTPError(400, str(exc)) from exc
+        header = {"timestamps": timestamps, "decision_labels": DECISION_LABELS}
+        outputs = timeline.outputs
+        records = [
+            {
+                "route": name,
+                "decision_code": outputs.decision_code[number],
+                "eta_hours": outputs.eta_hours[number],
+                "buffer_minutes": outputs.buffer_minutes[number],
+                "windows": [window.__dict__ for window in timeline.windows(number)],
+            }
+            for number, name in enumerate(timeline.routes)
+        ]
+        if stream:
+            return list(_ndjson([header, *records]))
+        return [dumps({"success": True, "data": {**header, "routes": records}})]
+
+    @staticmethod
+    def _json(body: bytes) -> Any:
+        if not body:
+            raise HTTPError(400, "request body is empty")
+        try:
+            return loads(body)
+        except ValueError as exc:
+            raise HTTPError(400, f"invalid JSON: {exc}") from exc
+
+    @staticmethod
+    def _wants_stream(scope: Scope) -> bool:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if query.get("stream", ["0"])[-1].lower() in {"1", "true", "yes"}:
+            return True
+        accept = dict(scope.get("headers", ())).get(b"accept", b"")
+        return NDJSON_TYPE in accept
+
+    async def _read_body(self, scope: Scope, receive: Receive) -> bytes:
+        length = dict(scope.get("headers", ())).get(b"content-length")
+        if length is not None:
+            try:
+                declared = int(length)
+            except ValueError:
+                raise HTTPError(400, "invalid content-length") from None
+            if declared < 0:
+                raise HTTPError(400, "invalid content-length")
+            if declared > self.max_body_bytes:
+                raise HTTPError(413, f"request body exceeds {self.max_body_bytes} bytes")
+        chunks: list[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                raise HTTPError(413, f"request body exceeds {self.max_body_bytes} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _send_body(send: Send, status: int, body: bytes) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", JSON_TYPE),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _send_stream(send: Send, chunks: Iterable[bytes] | AsyncIterator[bytes]) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", NDJSON_TYPE)],
+            }
+        )
+        if isinstance(chunks, AsyncIterator):
+            async for chunk in chunks:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            for chunk in chunks:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await asyncio.get_running_loop().run_in_executor(None, self.warm_up)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_app(**options: Any) -> DecisionService:
+    """서비스 생성. Build a ``DecisionService`` (``uvicorn --factory`` entry point)."""
+
+    return DecisionService(**options)
+
+
+app = DecisionService()
@@ -0,0 +1,128 @@
+"""예보 아카이브 테스트. Forecast archive tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.schema import (
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from marine_ops.io import ForecastArchive
+
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+UNITS = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+}
+
+
+def _snapshot(hours: int = 48) -> MarineTimeseries:
+    stormglass = TimeseriesMetadata(source="stormglass", units=UNITS)
+    blended = TimeseriesMetadata(
+        source="open-meteo", units=UNITS, bias_corrected=True, ensemble_weight=0.35
+    )
+    points = []
+    for hour in range(hours):
+        for latitude, metadata in ((25.0, stormglass), (24.0, blended)):
+            measurements = [
+                MarineMeasurement(
+                    variable=MarineVariable.SIGNIFICANT_WAVE_HEIGHT,
+                    value=1.0 + hour * 0.01,
+                    unit=UnitEnum.METERS,
+                    quality_flag=QualityFlag.IMPUTED if hour % 7 == 0 else QualityFlag.RAW,
+                )
+            ]
+            if hour % 3:
+                measurements.append(
+                    MarineMeasurement(
+                        variable=MarineVariable.WIND_SPEED_10M,
+                        value=6.0,
+                        unit=UnitEnum.METERS_PER_SECOND,
+                        quality_flag=QualityFlag.CLIPPED,
+                    )
+                )
+            points.append(
+                MarineDataPoint(
+                    timestamp=START + dt.timedelta(hours=hour),
+                    position=Position(latitude=latitude, longitude=54.0 + hour * 0.01),
+                    measurements=measurements,
+                    metadata=metadata,
+                )
+            )
+    return MarineTimeseries(points=points)
+
+
+def _by_source(timeseries: MarineTimeseries, source: str) -> MarineTimeseries:
+    return MarineTimeseries(
+        points=[point for point in timeseries.points if point.metadata.source == source]
+    )
+
+
+def test_archive_round_trips_per_source_partition(tmp_path: Path) -> None:
+    """소스별 파티션 왕복 테스트. Test round trip through source partitions."""
+
+    snapshot = _snapshot()
+    archive = ForecastArchive(tmp_path)
+    parts = archive.write(snapshot, issued_at=START)
+
+    assert sorted(part.path.parent.parent.name for part in parts) == [
+        "source=open-meteo",
+        "source=stormglass",
+    ]
+    assert all(part.path.parent.name == "issue_date=2025-01-01" for part in parts)
+    for source in ("stormglass", "open-meteo"):
+        loaded = archive.read_timeseries(sources=[source])
+        assert loaded == _by_source(snapshot, source)
+    assert not list(tmp_path.rglob(".tmp-*"))
+
+    # 중단된 쓰기의 준비 디렉터리는 매니페스트가 있어도 보이지 않는다.
+    shutil.copytree(parts[0].path, parts[0].path.parent / ".tmp-crashed")
+    assert sorted(part.path for part in archive.parts()) == sorted(part.path for part in parts)
+    assert archive.read_timeseries(sources=["stormglass"]) == _by_source(snapshot, "stormglass")
+
+
+def test_query_prunes_partitions_and_row_groups(tmp_path: Path) -> None:
+    """파티션·행 그룹 가지치기 테스트. Test pruning by issue date, time and bbox."""
+
+    archive = ForecastArchive(tmp_path, row_group_size=8)
+    archive.write(_snapshot(), issued_at=START)
+    archive.write(_snapshot(), issued_at=START + dt.timedelta(days=1, hours=6))
+
+    part = archive.parts(sources=["stormglass"], issued_from=dt.date(2025, 1, 2))[0]
+    assert part.issued_at == START + dt.timedelta(days=1, hours=6)
+    assert len(part.row_groups) == 6
+
+    start, end = START + dt.timedelta(hours=8), START + dt.timedelta(hours=23)
+    aligned = part.read(start_us=int(start.timestamp() * 1e6), end_us=int(end.timestamp() * 1e6))
+    assert aligned is not None and len(aligned) == 16
+    assert isinstance(aligned.timestamps.base, np.memmap)
+
+    results = list(
+        archive.query(
+            start=START + dt.timedelta(hours=10),
+            end=START + dt.timedelta(hours=30),
+            bbox=(24.5, 25.5, 54.0, 54.2),
+            issued_from=dt.date(2025, 1, 2),
+        )
+    )
+    assert [found.source for found, _ in results] == ["stormglass"]
+    expected = [
+        point
+        for point in _by_source(_snapshot(), "stormglass").points
+        if START + dt.timedelta(hours=10) <= point.timestamp <= START + dt.timedelta(hours=20)
+    ]
+    assert results[0][1].to_timeseries() == MarineTimeseries(points=expected)
+    assert list(archive.query(start=START + dt.timedelta(days=30))) == []
+    assert isinstance(results[0][1], ColumnarTimeseries)
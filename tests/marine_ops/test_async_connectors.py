@@ -0,0 +1,138 @@
+"""비동기 커넥터 테스트. Async connector tests."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from marine_ops.connectors import (
+    AsyncOpenMeteoFallback,
+    AsyncStormglassConnector,
+    AsyncWorldTidesConnector,
+    WorldTidesConnector,
+    fetch_forecasts_with_fallback,
+    gather_positions,
+)
+from marine_ops.core.settings import MarineOpsSettings
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+END = START + dt.timedelta(days=10)
+LATENCY = 0.05
+POSITIONS = [(24.0 + index * 0.1, 54.0 + index * 0.1) for index in range(8)]
+
+
+def load_payload(name: str) -> dict[str, Any]:
+    """기록된 응답 로드. Load a recorded provider payload."""
+
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def _async_client(payload: dict[str, Any], status: int = 200) -> httpx.AsyncClient:
+    async def handler(_: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(LATENCY)
+        return httpx.Response(status, json=payload)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_fan_out_runs_requests_concurrently() -> None:
+    """동시 수집 테스트. Test every position's request is in flight at once."""
+
+    payload = load_payload("worldtides_heights.json")
+    sync_connector = WorldTidesConnector(
+        "key",
+        client=httpx.Client(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, json=payload))
+        ),
+    )
+    expected = [sync_connector.fetch_heights(lat, lon, START) for lat, lon in POSITIONS]
+    in_flight = 0
+    peak = 0
+
+    async def run() -> list[Any]:
+        everyone = asyncio.Event()
+
+        async def handler(_: httpx.Request) -> httpx.Response:
+            # 벽시계 시간 대신 동시에 진행 중인 요청 수를 잰다.
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if in_flight == len(POSITIONS):
+                everyone.set()
+            await asyncio.wait_for(everyone.wait(), timeout=5)
+            in_flight -= 1
+            return httpx.Response(200, json=payload)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        connector = AsyncWorldTidesConnector("key", client=client)
+        return await gather_positions(
+            POSITIONS,
+            lambda lat, lon: connector.fetch_heights(lat, lon, START),
+            concurrency=len(POSITIONS),
+        )
+
+    assert asyncio.run(run()) == expected
+    assert peak == len(POSITIONS)
+
+
+def test_gather_positions_respects_concurrency_limit() -> None:
+    """동시성 제한 테스트. Test the concurrency limit is respected."""
+
+    in_flight = 0
+    peak = 0
+
+    async def fetch(latitude: float, longitude: float) -> tuple[float, float]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return latitude, longitude
+
+    results = asyncio.run(gather_positions(POSITIONS, fetch, concurrency=3))
+
+    assert results == POSITIONS
+    assert peak == 3
+
+
+def test_async_fallback_and_worldtides() -> None:
+    """비동기 폴백 및 WorldTides 테스트. Test async fallback and WorldTides fetch."""
+
+    async def run() -> tuple[list[Any], Any]:
+        primary = AsyncStormglassConnector("key", client=_async_client({}, status=503))
+        fallback = AsyncOpenMeteoFallback(
+            client=_async_client(load_payload("open_meteo_forecast.json"))
+        )
+        forecasts = await fetch_forecasts_with_fallback(
+            POSITIONS[:3], START, END, primary, fallback, concurrency=2
+        )
+        tides = await AsyncWorldTidesConnector(
+            "key", client=_async_client(load_payload("worldtides_heights.json"))
+        ).fetch_heights(25.0, 55.0, START)
+        return forecasts, tides
+
+    forecasts, tides = asyncio.run(run())
+
+    assert [series.points[0].metadata.source for series in forecasts] == ["open-meteo"] * 3
+    assert forecasts[1].points[0].position.latitude == POSITIONS[1][0]
+    assert len(tides.points) == 144
+
+
+def test_settings_close_shared_async_clients() -> None:
+    """공유 비동기 클라이언트 종료 테스트. Test settings close shared async clients."""
+
+    async def scenario() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        async with MarineOpsSettings(stormglass_api_key="key") as settings:
+            stormglass = settings.build_async_stormglass_connector()
+            fallback = settings.build_async_open_meteo_fallback()
+            assert settings.build_async_stormglass_connector().client is stormglass.client
+        return stormglass.client, fallback.client
+
+    clients = asyncio.run(scenario())
+    assert all(client.is_closed for client in clients)
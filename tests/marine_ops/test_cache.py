@@ -0,0 +1,159 @@
+"""예보 캐시 테스트. Forecast cache tests."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from marine_ops.connectors import (
+    AsyncCachedConnector,
+    AsyncStormglassConnector,
+    CachedConnector,
+    ForecastCache,
+    StormglassConnector,
+    WorldTidesConnector,
+)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+class CountingTransport(httpx.MockTransport):
+    """호출 횟수 기록 전송. Mock transport counting requests."""
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.calls = 0
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            self.calls += 1
+            return httpx.Response(200, json=payload)
+
+        super().__init__(handler)
+
+
+def _stormglass(transport: CountingTransport) -> StormglassConnector:
+    return StormglassConnector("key", client=httpx.Client(transport=transport), trusted=True)
+
+
+def _payload(name: str) -> dict[str, Any]:
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def test_cache_serves_repeat_and_sub_window_without_http(tmp_path: Path) -> None:
+    """반복·부분 구간 캐시 적중 테스트. Test repeat and sub-window requests hit the cache."""
+
+    transport = CountingTransport(_payload("stormglass_forecast.json"))
+    cached = CachedConnector(_stormglass(transport), ForecastCache(tmp_path))
+    end = START + dt.timedelta(days=10)
+
+    first = cached.fetch_forecast(25.0, 55.0, START, end)
+    again = cached.fetch_forecast(25.01, 55.01, START, end)
+    sub_start = START + dt.timedelta(hours=12)
+    sub_end = START + dt.timedelta(hours=35)
+    sub = cached.fetch_forecast(25.0, 55.0, sub_start, sub_end)
+
+    assert transport.calls == 1
+    assert again == first
+    assert [point.timestamp for point in sub.points] == [
+        sub_start + dt.timedelta(hours=hour) for hour in range(24)
+    ]
+    assert sub.points[0] == first.window(sub_start, sub_end).points[0]
+    assert cached.cache.hits == 2
+
+    cached.fetch_forecast(25.0, 55.0, START, end, ("noaa",))
+    assert transport.calls == 2
+
+
+def test_cache_exact_window_hit_is_sliced(tmp_path: Path) -> None:
+    """같은 창 적중도 요청 구간으로 자르는지 테스트. Test exact-window hits are sliced too."""
+
+    cache = ForecastCache(tmp_path)
+    series = _stormglass(CountingTransport({})).parse_forecast(
+        _payload("stormglass_forecast.json"), 25.0, 55.0
+    )
+    end = START + dt.timedelta(days=1)
+    # 공급자가 요청보다 넓은 구간(10일)을 돌려준 경우.
+    cache.put("stormglass", 25.0, 55.0, START, end, series)
+
+    exact = cache.get("stormglass", 25.0, 55.0, START, end)
+    assert exact is not None and len(exact.points) == 25
+    assert exact == series.window(START, end)
+
+
+def test_cache_miss_and_hit_return_same_window(tmp_path: Path) -> None:
+    """미스·적중 결과 일치 테스트. Test a miss and the following hit return the same rows."""
+
+    payload = _payload("stormglass_forecast.json")
+    end = START + dt.timedelta(days=1)
+    cached = CachedConnector(_stormglass(CountingTransport(payload)), ForecastCache(tmp_path))
+    miss = cached.fetch_forecast(25.0, 55.0, START, end)
+    hit = cached.fetch_forecast(25.0, 55.0, START, end)
+
+    assert cached.cache.hits == 1
+    assert len(miss.points) == 25
+    assert hit == miss
+
+    async def fetch_twice() -> list[Any]:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200, json=payload))
+        async with httpx.AsyncClient(transport=transport) as client:
+            connector = AsyncCachedConnector(
+                AsyncStormglassConnector("key", client=client, trusted=True),
+                ForecastCache(tmp_path / "async"),
+            )
+            return [await connector.fetch_forecast(25.0, 55.0, START, end) for _ in range(2)]
+
+    assert asyncio.run(fetch_twice()) == [miss, miss]
+
+
+def test_cache_expires_per_provider_ttl(tmp_path: Path) -> None:
+    """공급자별 TTL 만료 테스트. Test per-provider TTL expiry."""
+
+    now = [1_000_000.0]
+    cache = ForecastCache(
+        tmp_path, ttl_seconds={"stormglass": 60.0, "worldtides": 600.0}, clock=lambda: now[0]
+    )
+    sg_transport = CountingTransport(_payload("stormglass_forecast.json"))
+    wt_transport = CountingTransport(_payload("worldtides_heights.json"))
+    stormglass = CachedConnector(_stormglass(sg_transport), cache)
+    tides = CachedConnector(
+        WorldTidesConnector("key", client=httpx.Client(transport=wt_transport)), cache
+    )
+    end = START + dt.timedelta(days=1)
+
+    stormglass.fetch_forecast(25.0, 55.0, START, end)
+    tides.fetch_heights(25.0, 55.0, START)
+    now[0] += 120.0
+    stormglass.fetch_forecast(25.0, 55.0, START, end)
+    tides.fetch_heights(25.0, 55.0, START, hours=24)
+
+    assert sg_transport.calls == 2
+    assert wt_transport.calls == 1
+
+
+def test_cache_lru_eviction_and_corrupt_entries(tmp_path: Path) -> None:
+    """LRU 축출 및 손상 항목 처리 테스트. Test LRU eviction and corrupt entries."""
+
+    transport = CountingTransport(_payload("worldtides_heights.json"))
+    series = WorldTidesConnector("key", client=httpx.Client(transport=transport)).fetch_heights(
+        25.0, 55.0, START
+    )
+    end = START + dt.timedelta(hours=72)
+    cache = ForecastCache(tmp_path)
+    first = cache.put("worldtides", 25.0, 55.0, START, end, series)
+    cache.max_bytes = first.stat().st_size * 2
+    cache.put("worldtides", 26.0, 55.0, START, end, series)
+    assert cache.get("worldtides", 25.0, 55.0, START, end) is not None
+    cache.put("worldtides", 27.0, 55.0, START, end, series)
+
+    assert cache.get("worldtides", 26.0, 55.0, START, end) is None
+    assert cache.get("worldtides", 25.0, 55.0, START, end) == series
+
+    first.write_text("{not json", encoding="utf-8")
+    assert cache.get("worldtides", 25.0, 55.0, START, end) is None
+    assert not first.exists()
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,170 @@
+"""요청 병합 테스트. Request coalescing tests."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from marine_ops.connectors import (
+    AsyncCoalescingConnector,
+    AsyncWorldTidesConnector,
+    CoalescingConnector,
+    RequestCoalescer,
+    WorldTidesConnector,
+)
+from marine_ops.core import MarineTimeseries
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+PAYLOAD: dict[str, Any] = json.loads(
+    (FIXTURES / "worldtides_heights.json").read_text(encoding="utf-8")
+)
+
+
+def test_threads_share_one_call_and_get_own_windows() -> None:
+    """스레드 병합 및 부분 구간 테스트. Test threads share one call and get sliced copies."""
+
+    release = threading.Event()
+    calls = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return httpx.Response(200, json=PAYLOAD)
+
+    connector = WorldTidesConnector(
+        "key", client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    coalescing = CoalescingConnector(connector, RequestCoalescer())
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(coalescing.fetch_heights, 25.0, 55.0, START)
+        while coalescing.coalescer.stats()["in_flight"] == 0:
+            time.sleep(0.001)
+        followers = [pool.submit(coalescing.fetch_heights, 25.0, 55.0, START) for _ in range(3)]
+        short = pool.submit(coalescing.fetch_heights, 25.0, 55.0, START, 24)
+        while coalescing.coalescer.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        full = leader.result()
+        copies = [future.result() for future in followers]
+        window = short.result()
+
+    assert calls == 1
+    assert coalescing.coalescer.stats() == {"issued": 1, "coalesced": 4, "in_flight": 0}
+    assert all(copy == full and copy is not full for copy in copies)
+    copies[0].points.clear()
+    assert full.points
+    assert window == full.window(START, START + dt.timedelta(hours=24))
+    assert len(window.points) < len(full.points)
+
+
+def test_async_tasks_share_one_call_and_propagate_errors() -> None:
+    """asyncio 병합 및 오류 전파 테스트. Test asyncio tasks share one call and errors."""
+
+    calls = 0
+    status = 200
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(status, json=PAYLOAD)
+
+    async def scenario() -> None:
+        nonlocal status
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        coalescing = AsyncCoalescingConnector(
+            AsyncWorldTidesConnector("key", client=client), RequestCoalescer(grid_resolution=0.05)
+        )
+        results = await asyncio.gather(
+            *(coalescing.fetch_heights(25.0 + offset, 55.0, START) for offset in (0, 0.01, 0.02))
+        )
+        assert calls == 1
+        assert results[1] == results[0] and results[2] == results[0]
+
+        status = 500
+        outcomes = await asyncio.gather(
+            coalescing.fetch_heights(25.0, 55.0, START),
+            coalescing.fetch_heights(25.0, 55.0, START, 24),
+            return_exceptions=True,
+        )
+        assert calls == 2
+        assert all(isinstance(outcome, httpx.HTTPStatusError) for outcome in outcomes)
+        assert coalescing.coalescer.stats() == {"issued": 2, "coalesced": 3, "in_flight": 0}
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_follower_does_not_break_the_flight() -> None:
+    """후속 호출자 취소 격리 테스트. Test cancelling one follower leaves the flight intact."""
+
+    async def scenario() -> None:
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+        empty = MarineTimeseries(points=[])
+        end = START + dt.timedelta(hours=1)
+
+        async def slow() -> MarineTimeseries:
+            await release.wait()
+            return empty
+
+        async def never() -> MarineTimeseries:
+            raise AssertionError("follower must not fetch")
+
+        leader = asyncio.create_task(
+            coalescer.run_async("worldtides", 25.0, 55.0, START, end, slow)
+        )
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(coalescer.run_async("worldtides", 25.0, 55.0, START, end, never))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        followers[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await leader is empty
+        assert [await task for task in followers[1:]] == [empty, empty]
+        assert followers[0].cancelled()
+        assert coalescer.stats() == {"issued": 1, "coalesced": 3, "in_flight": 0}
+
+    asyncio.run(scenario())
+
+
+def test_wider_window_is_not_coalesced() -> None:
+    """구간 미포함 요청 별도 호출 테스트. Test a wider window issues its own call."""
+
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    empty = MarineTimeseries(points=[])
+
+    def slow() -> MarineTimeseries:
+        release.wait(5)
+        return empty
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        narrow = pool.submit(
+            coalescer.run, "worldtides", 25.0, 55.0, START, START + dt.timedelta(hours=1), slow
+        )
+        while coalescer.stats()["in_flight"] == 0:
+            time.sleep(0.001)
+        wide = coalescer.run(
+            "worldtides", 25.0, 55.0, START, START + dt.timedelta(hours=2), lambda: empty
+        )
+        release.set()
+        narrow.result()
+
+    assert wide is empty
+    assert coalescer.stats() == {"issued": 2, "coalesced": 0, "in_flight": 0}
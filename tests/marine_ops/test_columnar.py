@@ -0,0 +1,163 @@
+"""컬럼형 시계열 테스트. Columnar timeseries tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from marine_ops.core.columnar import MISSING_QUALITY, ColumnarTimeseries
+from marine_ops.core.schema import (
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+
+UNITS = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+    MarineVariable.VISIBILITY: UnitEnum.KILOMETERS,
+}
+
+
+def _stormglass_metadata() -> TimeseriesMetadata:
+    return TimeseriesMetadata(source="stormglass", units=UNITS)
+
+
+def _sample_timeseries() -> MarineTimeseries:
+    base = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+    sg = _stormglass_metadata()
+    om = TimeseriesMetadata(
+        source="open-meteo", units=UNITS, bias_corrected=True, ensemble_weight=0.4
+    )
+    points = []
+    for hour in range(5):
+        measurements = [
+            MarineMeasurement(
+                variable=MarineVariable.SIGNIFICANT_WAVE_HEIGHT,
+                value=1.234 + hour,
+                unit=UnitEnum.METERS,
+                quality_flag=QualityFlag.CLIPPED if hour == 2 else QualityFlag.RAW,
+            ),
+            MarineMeasurement(
+                variable=MarineVariable.WIND_SPEED_10M, value=7.0, unit=UnitEnum.METERS_PER_SECOND
+            ),
+        ]
+        if hour % 2:
+            measurements.append(
+                MarineMeasurement(
+                    variable=MarineVariable.VISIBILITY, value=12.5, unit=UnitEnum.KILOMETERS
+                )
+            )
+        points.append(
+            MarineDataPoint(
+                timestamp=base + dt.timedelta(minutes=30 * hour, microseconds=hour),
+                position=Position(latitude=25.0 + hour * 0.001, longitude=55.1),
+                measurements=measurements,
+                # 동일 내용의 별도 인스턴스도 하나의 메타데이터로 공유되어야 함
+                metadata=sg if hour == 0 else (_stormglass_metadata() if hour < 3 else om),
+            )
+        )
+    return MarineTimeseries(points=points)
+
+
+def test_columnar_round_trip_is_lossless() -> None:
+    """무손실 왕복 변환 테스트. Test lossless round trip."""
+
+    timeseries = _sample_timeseries()
+    columnar = ColumnarTimeseries.from_timeseries(timeseries)
+
+    assert len(columnar) == 5
+    assert len(columnar.metadata) == 2
+    assert columnar.to_timeseries() == timeseries
+    assert list(columnar.iter_rows()) == list(timeseries.iter_rows())
+    assert int(columnar.quality[MarineVariable.VISIBILITY][0]) == MISSING_QUALITY
+    assert np.isnan(columnar.column(MarineVariable.VISIBILITY)[0])
+
+
+def test_columnar_from_arrays_rounds_like_measurements() -> None:
+    """배열 생성 반올림 테스트. Test from_arrays rounds like MarineMeasurement."""
+
+    times = np.array(["2025-01-01T00:00", "2025-01-01T01:00"], dtype="datetime64[us]")
+    columnar = ColumnarTimeseries.from_arrays(
+        times,
+        25.0,
+        55.0,
+        {MarineVariable.SIGNIFICANT_WAVE_HEIGHT: [1.115, np.nan]},
+        UNITS,
+        TimeseriesMetadata(source="sample", units=UNITS),
+    )
+    rebuilt = columnar.to_timeseries()
+
+    assert len(rebuilt.points[0].measurements) == 1
+    assert rebuilt.points[0].measurements[0].value == round(1.115, 2)
+    assert rebuilt.points[1].measurements == []
+    assert rebuilt.points[0].timestamp == dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def test_columnar_rejects_inconsistent_measurement_order() -> None:
+    """측정 순서 불일치 거부 테스트. Test inconsistent measurement order is rejected."""
+
+    metadata = TimeseriesMetadata(source="sample", units=UNITS)
+    hs = MarineMeasurement(
+        variable=MarineVariable.SIGNIFICANT_WAVE_HEIGHT, value=1.0, unit=UnitEnum.METERS
+    )
+    wind = MarineMeasurement(
+        variable=MarineVariable.WIND_SPEED_10M, value=5.0, unit=UnitEnum.METERS_PER_SECOND
+    )
+    timestamp = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+    position = Position(latitude=25.0, longitude=55.0)
+    timeseries = MarineTimeseries(
+        points=[
+            MarineDataPoint(
+                timestamp=timestamp, position=position, measurements=[hs, wind], metadata=metadata
+            ),
+            MarineDataPoint(
+                timestamp=timestamp, position=position, measurements=[wind, hs], metadata=metadata
+            ),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="inconsistent"):
+        ColumnarTimeseries.from_timeseries(timeseries)
+
+
+def test_columnar_concat_fills_missing_variables() -> None:
+    """행 이어 붙이기 테스트. Test concat keeps metadata and fills absent variables."""
+
+    series = ColumnarTimeseries.from_timeseries(_sample_timeseries())
+    wind_only = ColumnarTimeseries.from_arrays(
+        np.array(["2025-01-02T00:00"], dtype="datetime64[us]"),
+        24.0,
+        54.0,
+        {MarineVariable.WIND_SPEED_10M: [9.0]},
+        UNITS,
+        TimeseriesMetadata(source="open-meteo", units=UNITS),
+    )
+    combined = ColumnarTimeseries.concat([series, wind_only])
+
+    assert len(combined) == len(series) + 1
+    assert combined.variables == series.variables
+    assert combined.quality[MarineVariable.SIGNIFICANT_WAVE_HEIGHT][-1] == MISSING_QUALITY
+    assert combined.to_timeseries().points[:-1] == series.to_timeseries().points
+    assert combined.to_timeseries().points[-1].metadata.source == "open-meteo"
+    with pytest.raises(ValueError, match="mixed units"):
+        ColumnarTimeseries.concat(
+            [
+                series,
+                ColumnarTimeseries.from_arrays(
+                    [0],
+                    24.0,
+                    54.0,
+                    {MarineVariable.VISIBILITY: [1.0]},
+                    {MarineVariable.VISIBILITY: UnitEnum.METERS},
+                    TimeseriesMetadata(source="x", units={}),
+                ),
+            ]
+        )
@@ -0,0 +1,152 @@
+"""커넥터 파싱 테스트. Connector parsing tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from marine_ops.connectors import (
+    HttpClientRegistry,
+    OpenMeteoFallback,
+    StormglassConnector,
+    WorldTidesConnector,
+)
+from marine_ops.connectors.fast_path import decode_payload, parse_epoch_us, parse_utc_timestamp
+from marine_ops.core.columnar import datetime_to_epoch_us
+from marine_ops.core.settings import MarineOpsSettings
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def load_payload(name: str) -> dict[str, Any]:
+    """기록된 응답 로드. Load a recorded provider payload."""
+
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def _client(payload: dict[str, Any]) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200, json=payload)))
+
+
+def test_stormglass_trusted_path_matches_validated_path() -> None:
+    """Stormglass 고속 경로 일치 테스트. Test Stormglass fast path matches."""
+
+    payload = load_payload("stormglass_forecast.json")
+    end = START + dt.timedelta(days=10)
+    validated = StormglassConnector("key", client=_client(payload)).fetch_forecast(
+        25.0, 55.0, START, end
+    )
+    trusted = StormglassConnector("key", client=_client(payload), trusted=True).fetch_forecast(
+        25.0, 55.0, START, end
+    )
+
+    assert len(trusted.points) == 240
+    assert trusted == validated
+    assert trusted.points[0].metadata is trusted.points[-1].metadata
+
+
+def test_open_meteo_trusted_path_matches_validated_path() -> None:
+    """Open-Meteo 고속 경로 일치 테스트. Test Open-Meteo fast path matches."""
+
+    payload = load_payload("open_meteo_forecast.json")
+    payload["hourly"]["visibility"] = payload["hourly"]["visibility"][:100]
+    end = START + dt.timedelta(days=10)
+    validated = OpenMeteoFallback(client=_client(payload)).fetch_forecast(25.0, 55.0, START, end)
+    trusted = OpenMeteoFallback(client=_client(payload), trusted=True).fetch_forecast(
+        25.0, 55.0, START, end
+    )
+
+    assert trusted == validated
+    assert list(trusted.iter_rows()) == list(validated.iter_rows())
+
+
+def test_worldtides_trusted_path_matches_and_validates() -> None:
+    """WorldTides 고속 경로 일치 및 검증 테스트. Test WorldTides fast path and validation."""
+
+    payload = load_payload("worldtides_heights.json")
+    validated = WorldTidesConnector("key", client=_client(payload)).fetch_heights(25.0, 55.0, START)
+    connector = WorldTidesConnector("key", client=_client(payload), trusted=True)
+
+    assert connector.fetch_heights(25.0, 55.0, START) == validated
+
+    payload["heights"][3]["height"] = "n/a"
+    with pytest.raises(ValueError, match="heights"):
+        connector.parse_heights(payload, 25.0, 55.0)
+
+
+def test_fast_decoding_handles_extra_sources_and_time_spellings() -> None:
+    """고속 디코딩·공급원·시각 표기 테스트. Test fast decoding, sources and time spellings."""
+
+    payload = load_payload("stormglass_forecast.json")
+    for hour, entry in enumerate(payload["hours"]):
+        entry["waveHeight"] = {"icon": 1.5, "sg": None, "noaa": 0.9 if hour % 3 else None}
+        entry["visibility"] = {"dwd": None}
+    end = START + dt.timedelta(days=10)
+    validated = StormglassConnector("key", client=_client(payload)).fetch_forecast(
+        25.0, 55.0, START, end
+    )
+    trusted = StormglassConnector("key", client=_client(payload), trusted=True).fetch_forecast(
+        25.0, 55.0, START, end
+    )
+    assert trusted == validated
+    assert {point.measurements[0].value for point in trusted.points} == {0.9, 1.5}
+
+    spellings = [
+        ["2025-01-01T00:00:00Z", "2025-01-01T01:30:00.250Z"],
+        ["2025-01-01T00:00+0000", "2025-01-01T01:30+0000"],
+        ["2025-01-01T00:00", "2025-01-01T01:30"],
+        ["2025-01-01T04:00:00+04:00", "2025-01-01T01:30:00Z"],
+    ]
+    for texts in spellings:
+        expected = [datetime_to_epoch_us(parse_utc_timestamp(text)) for text in texts]
+        assert parse_epoch_us(texts).tolist() == expected
+    with pytest.raises(ValueError, match="JSON object"):
+        decode_payload(b"[1, 2]")
+
+
+def test_settings_enable_trusted_sources() -> None:
+    """설정 기반 고속 경로 활성화 테스트. Test settings enable the fast path."""
+
+    settings = MarineOpsSettings.from_env({"STORMGLASS_API_KEY": "key", "TRUSTED_SOURCES": "true"})
+
+    assert settings.build_stormglass_connector(client=httpx.Client()).trusted is True
+    assert settings.build_open_meteo_fallback(client=httpx.Client()).trusted is True
+
+
+def test_settings_share_pooled_clients_per_host() -> None:
+    """호스트별 공유 클라이언트 테스트. Test builders share one pooled client per host."""
+
+    env = {
+        "STORMGLASS_API_KEY": "key",
+        "WORLDTIDES_API_KEY": "key",
+        "OPEN_METEO_BASE": "https://api.stormglass.io/marine",
+        "HTTP_MAX_CONNECTIONS": "4",
+        "HTTP_KEEPALIVE_EXPIRY": "12.5",
+    }
+    with MarineOpsSettings.from_env(env) as settings:
+        stormglass = settings.build_stormglass_connector()
+        tides = settings.build_worldtides_connector()
+        fallback = settings.build_open_meteo_fallback()
+        assert settings.build_stormglass_connector().client is stormglass.client
+        assert fallback.client is stormglass.client
+        assert tides.client is not stormglass.client
+        assert len(settings.clients) == 2
+        assert settings.clients.limits.max_connections == 4
+        assert settings.clients.limits.keepalive_expiry == 12.5
+
+    assert stormglass.client.is_closed and tides.client.is_closed
+    assert not settings.build_stormglass_connector().client.is_closed
+    settings.close()
+    with pytest.raises(ValueError, match="HTTP_MAX_CONNECTIONS"):
+        MarineOpsSettings.from_env({"HTTP_MAX_CONNECTIONS": "many"})
+    with pytest.raises(ValueError, match="max_connections must be positive"):
+        HttpClientRegistry(max_connections=0)
+    with pytest.raises(ValueError, match="max_keepalive_connections must be non-negative"):
+        HttpClientRegistry(max_keepalive_connections=-1)
+    assert HttpClientRegistry(max_keepalive_connections=0).limits.max_keepalive_connections == 0
@@ -0,0 +1,114 @@
+"""스트리밍 CSV 내보내기 테스트. Streaming CSV export tests."""
+
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import gzip
+import io
+import os
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.schema import (
+    CSV_HEADER,
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from marine_ops.io import StreamingCsvWriter, export_csv
+
+UNITS = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _points(hours: int, source: str = "stormglass") -> Iterator[MarineDataPoint]:
+    metadata = TimeseriesMetadata(source=source, units=UNITS, ensemble_weight=0.25)
+    for hour in range(hours):
+        measurements = [
+            MarineMeasurement(
+                variable=MarineVariable.SIGNIFICANT_WAVE_HEIGHT,
+                value=1.0 + (hour % 17) * 0.137,
+                unit=UnitEnum.METERS,
+                quality_flag=QualityFlag.IMPUTED if hour % 5 == 0 else QualityFlag.RAW,
+            )
+        ]
+        if hour % 3:
+            measurements.append(
+                MarineMeasurement(
+                    variable=MarineVariable.WIND_SPEED_10M,
+                    value=-0.001 * hour,
+                    unit=UnitEnum.METERS_PER_SECOND,
+                )
+            )
+        yield MarineDataPoint(
+            timestamp=START + dt.timedelta(hours=hour // 2),
+            position=Position(latitude=25.0 + 0.01 * (hour % 2), longitude=55.0),
+            measurements=measurements,
+            metadata=metadata,
+        )
+
+
+def _reference(timeseries: MarineTimeseries) -> bytes:
+    handle = io.StringIO(newline="")
+    writer = csv.writer(handle)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(timeseries.iter_rows())
+    return handle.getvalue().encode("utf-8")
+
+
+def test_points_and_columnar_chunks_match_csv_writer() -> None:
+    """csv.writer 바이트 동일성 테스트. Test output is byte-identical to csv.writer."""
+
+    timeseries = MarineTimeseries(points=list(_points(48, source='sg "blend", v2')))
+    expected = _reference(timeseries)
+    columnar = ColumnarTimeseries.from_timeseries(timeseries)
+
+    for source in (
+        timeseries.points,
+        [columnar],
+        [columnar.take(range(0, 20)), *timeseries.points[20:30], columnar.take(range(30, 48))],
+    ):
+        stream = io.BytesIO()
+        rows = export_csv(stream, source, block_bytes=256)
+        assert stream.getvalue() == expected
+        assert rows == len(list(timeseries.iter_rows()))
+
+
+def test_gzip_output_by_suffix(tmp_path: Path) -> None:
+    """gzip 출력 테스트. Test ``.gz`` paths are compressed."""
+
+    timeseries = MarineTimeseries(points=list(_points(24)))
+    path = tmp_path / "export.csv.gz"
+    with StreamingCsvWriter(path) as writer:
+        writer.write_timeseries(timeseries)
+
+    assert gzip.decompress(path.read_bytes()) == _reference(timeseries)
+
+
+def test_memory_stays_flat_for_long_streams() -> None:
+    """긴 출력의 메모리 일정성 테스트. Test peak memory does not grow with output length."""
+
+    def peak(hours: int) -> int:
+        tracemalloc.start()
+        with (
+            open(os.devnull, "wb") as sink,
+            StreamingCsvWriter(sink, block_bytes=64 * 1024) as writer,
+        ):
+            writer.write(_points(hours))
+        _, high = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return high
+
+    short, long = peak(2_000), peak(20_000)
+    assert long < short * 1.5
@@ -0,0 +1,141 @@
+"""CSV 읽기 테스트. CSV reader tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+from pathlib import Path
+
+import pytest
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.schema import (
+    CSV_HEADER,
+    CSV_TIMESTAMP_FORMAT,
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from marine_ops.io import (
+    export_csv,
+    iter_csv_columnar,
+    iter_csv_points,
+    parse_csv_timestamp,
+    read_csv_columnar,
+    read_csv_timeseries,
+)
+
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+UNITS = {
+    MarineVariable.SIGNIFICANT_WAVE_HEIGHT: UnitEnum.METERS,
+    MarineVariable.WIND_SPEED_10M: UnitEnum.METERS_PER_SECOND,
+    MarineVariable.VISIBILITY: UnitEnum.KILOMETERS,
+}
+
+
+def _timeseries() -> MarineTimeseries:
+    stormglass = TimeseriesMetadata(source="stormglass", units=UNITS)
+    blended = TimeseriesMetadata(
+        source="blend, v2", units=UNITS, bias_corrected=True, ensemble_weight=0.35
+    )
+    points = []
+    for hour in range(30):
+        for latitude, metadata in ((25.0, stormglass), (24.5, blended)):
+            measurements = [
+                MarineMeasurement(
+                    variable=MarineVariable.SIGNIFICANT_WAVE_HEIGHT,
+                    value=0.8 + hour * 0.05,
+                    unit=UnitEnum.METERS,
+                    quality_flag=QualityFlag.CLIPPED if hour == 7 else QualityFlag.RAW,
+                ),
+                MarineMeasurement(
+                    variable=MarineVariable.WIND_SPEED_10M,
+                    value=5.5 + latitude - 24.0,
+                    unit=UnitEnum.METERS_PER_SECOND,
+                ),
+            ]
+            if hour % 4 == 0:
+                measurements.append(
+                    MarineMeasurement(
+                        variable=MarineVariable.VISIBILITY, value=9.5, unit=UnitEnum.KILOMETERS
+                    )
+                )
+            points.append(
+                MarineDataPoint(
+                    timestamp=START + dt.timedelta(hours=hour),
+                    position=Position(latitude=latitude, longitude=54.8),
+                    measurements=measurements,
+                    metadata=metadata,
+                )
+            )
+    return MarineTimeseries(points=points)
+
+
+def _csv_bytes(timeseries: MarineTimeseries) -> bytes:
+    stream = io.BytesIO()
+    export_csv(stream, timeseries.points)
+    return stream.getvalue()
+
+
+def test_round_trip_preserves_rows_and_grouping(tmp_path: Path) -> None:
+    """쓰기-읽기 왕복 테스트. Test write/read round trip in every output mode."""
+
+    original = _timeseries()
+    expected_rows = list(original.iter_rows())
+    path = tmp_path / "series.csv.gz"
+    export_csv(path, original.points)
+
+    loaded = read_csv_timeseries(path)
+    columnar = read_csv_columnar(io.StringIO(_csv_bytes(original).decode("utf-8")))
+
+    assert list(loaded.iter_rows()) == expected_rows
+    assert len(loaded.points) == len(original.points)
+    assert loaded.points[1].metadata.source == "blend, v2"
+    assert loaded.points[1].metadata.ensemble_weight == 0.35
+    assert isinstance(columnar, ColumnarTimeseries)
+    assert list(columnar.iter_rows()) == expected_rows
+    assert len(columnar.metadata) == 2
+
+
+def test_chunked_mode_cuts_at_point_boundaries() -> None:
+    """청크 경계 테스트. Test chunks never split a point."""
+
+    original = _timeseries()
+    text = _csv_bytes(original).decode("utf-8")
+
+    chunks = list(iter_csv_columnar(io.StringIO(text), chunk_rows=25))
+    points = list(iter_csv_points(io.StringIO(text), chunk_rows=7))
+
+    assert len(chunks) > 3
+    assert sum(len(chunk) for chunk in chunks) == len(original.points)
+    assert [row for chunk in chunks for row in chunk.iter_rows()] == list(original.iter_rows())
+    assert list(MarineTimeseries.model_construct(points=points).iter_rows()) == list(
+        original.iter_rows()
+    )
+
+
+def test_timestamp_parser_and_invalid_rows() -> None:
+    """타임스탬프 해석 및 잘못된 행 테스트. Test timestamp parsing and row errors."""
+
+    stamp = dt.datetime(2024, 2, 29, 23, 59, 58, tzinfo=dt.timezone.utc)
+    epoch = parse_csv_timestamp(stamp.strftime(CSV_TIMESTAMP_FORMAT))
+    assert epoch == int(stamp.timestamp()) * 1_000_000
+    days: dict[str, int] = {}
+    assert parse_csv_timestamp("2024-02-29T23:59:58Z", days) == epoch
+    assert parse_csv_timestamp("2024-02-29T00:00:00Z", days) == epoch - 86_398_000_000
+    with pytest.raises(ValueError, match="time of day"):
+        parse_csv_timestamp("2024-02-29T24:00:00Z", days)
+    with pytest.raises(ValueError, match="CSV_TIMESTAMP_FORMAT"):
+        parse_csv_timestamp("2024-02-29 23:59:58")
+
+    header = ",".join(CSV_HEADER)
+    with pytest.raises(ValueError, match="header"):
+        read_csv_timeseries(io.StringIO("a,b\r\n"))
+    bad = f"{header}\r\n2025-01-01T00:00:00Z,25.00,55.00,Hs,abc,m,sg,raw,false,\r\n"
+    with pytest.raises(ValueError, match="row 2"):
+        read_csv_timeseries(io.StringIO(bad))
@@ -0,0 +1,57 @@
+"""의사결정 메모이제이션 테스트. Decision memoization tests."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from marine_ops.core.decision_cache import DecisionCache
+from marine_ops.core.marine_decision import MarineInputs, create_sample_inputs, decide_and_eta
+
+
+def test_cache_matches_uncached_path() -> None:
+    """캐시 결과 일치 테스트. Test cached results against the uncached path."""
+
+    rng = np.random.default_rng(5)
+    cache = DecisionCache(maxsize=64)
+    alerts = [None, "rough at times westward", "High seas", "Fog"]
+    for _ in range(500):
+        inputs = MarineInputs(
+            combined_ft=round(float(rng.choice([2.0, 3.5, 5.0])), 2),
+            wind_adnoc=float(rng.choice([12.0, 18.0, 25.0])),
+            hs_onshore_ft=float(rng.choice([1.5, 2.0])),
+            hs_offshore_ft=float(rng.choice([2.5, 4.0])),
+            wind_albahar=float(rng.choice([15.0, 23.0])),
+            alert=alerts[int(rng.integers(0, 4))],
+            offshore_weight=float(rng.choice([0.3, 0.7])),
+            distance_nm=120.0,
+            planned_speed=12.0,
+        )
+        k_wave = float(rng.choice([0.6, 0.5]))
+        assert cache(inputs, k_wave=k_wave) == decide_and_eta(inputs, k_wave=k_wave)
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 500
+    assert stats["hits"] > 0
+    assert stats["size"] <= 64
+
+
+def test_cache_evicts_least_recently_used_and_isolates_results() -> None:
+    """LRU 축출과 결과 격리 테스트. Test LRU eviction and result isolation."""
+
+    cache = DecisionCache(maxsize=2)
+    first = create_sample_inputs()
+    second = first.model_copy(update={"distance_nm": 60.0})
+    third = first.model_copy(update={"distance_nm": 30.0})
+
+    result = cache(first)
+    result.decision = "No-Go"
+    assert cache(first).decision == decide_and_eta(first).decision
+    cache(second)
+    cache(first)
+    cache(third)
+    assert cache.stats() == {"hits": 2, "misses": 3, "size": 2, "maxsize": 2}
+    cache(second)
+    assert cache.stats()["misses"] == 4
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
@@ -0,0 +1,74 @@
+"""앙상블 융합 테스트. Ensemble fusion tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from marine_ops.core.columnar import QUALITY_FLAGS, ColumnarTimeseries
+from marine_ops.core.ensemble import fuse
+from marine_ops.core.schema import MarineVariable, QualityFlag, TimeseriesMetadata, UnitEnum
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND_DIR = MarineVariable.WIND_DIRECTION_10M
+HOUR_US = 3_600_000_000
+START_US = 1_735_689_600_000_000
+
+
+def _provider(
+    source: str, values: dict[MarineVariable, list[float]], hours: list[int], lat: float = 25.0
+) -> ColumnarTimeseries:
+    units = {
+        variable: UnitEnum.DEGREES if variable is WIND_DIR else UnitEnum.METERS
+        for variable in values
+    }
+    return ColumnarTimeseries.from_arrays(
+        START_US + np.array(hours) * HOUR_US,
+        lat,
+        55.0,
+        values,
+        units,
+        TimeseriesMetadata(source=source, units=units),
+    )
+
+
+def test_fuse_weights_providers_per_cell() -> None:
+    """칸별 가중 평균과 가중치 기록 테스트. Test per-cell weighted mean and weight output."""
+
+    stormglass = _provider(
+        "stormglass", {HS: [1.0, 2.0, np.nan], WIND_DIR: [350.0, 10.0, 20.0]}, [0, 1, 2]
+    )
+    open_meteo = _provider("open-meteo", {HS: [2.0, 3.0, 4.0]}, [0, 1, 2])
+    other_site = _provider("open-meteo", {HS: [0.5]}, [0], lat=24.0)
+
+    result = fuse(
+        [stormglass, open_meteo, other_site],
+        weights={"stormglass": 3.0, "open-meteo": 1.0},
+        step=None,
+    )
+
+    assert result.weights == {"stormglass": 0.75, "open-meteo": 0.25}
+    assert [member.metadata[0].ensemble_weight for member in result.members] == [0.75, 0.25, 0.25]
+    consensus = result.consensus
+    assert consensus.metadata[0].source == "ensemble"
+    assert consensus.latitude.tolist() == [24.0, 25.0, 25.0, 25.0]
+    # 세 번째 시각은 Stormglass Hs가 없어 Open-Meteo 값만 쓴다.
+    assert consensus.column(HS).tolist() == [0.5, 1.25, 2.25, 4.0]
+    assert np.isnan(consensus.column(WIND_DIR)[0])
+    assert consensus.column(WIND_DIR)[1:].tolist() == [350.0, 10.0, 20.0]
+
+
+def test_fuse_aligns_and_reports_worst_quality() -> None:
+    """정렬 후 융합과 품질 플래그 테스트. Test aligned fusion and its quality flag."""
+
+    hourly = _provider("stormglass", {HS: [1.0, 3.0]}, [0, 2])
+    offset = _provider("open-meteo", {HS: [2.0, 2.0, 2.0]}, [0, 1, 2])
+
+    consensus = fuse([hourly, offset]).consensus
+
+    assert consensus.column(HS).tolist() == [1.5, 2.0, 2.5]
+    flags = [QUALITY_FLAGS[code] for code in consensus.quality[HS]]
+    assert flags == [QualityFlag.RAW, QualityFlag.IMPUTED, QualityFlag.RAW]
+
+    with pytest.raises(ValueError, match="positive"):
+        fuse([hourly, offset], weights={"stormglass": 0.0, "open-meteo": 0.0})
@@ -0,0 +1,120 @@
+"""경량 스키마 테스트. Lightweight ``__slots__`` schema tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+from pathlib import Path
+
+import pytest
+
+from marine_ops.connectors import ForecastCache
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.fast_schema import FastDataPoint, FastMeasurement, FastPosition, FastTimeseries
+from marine_ops.core.schema import (
+    MarineDataPoint,
+    MarineMeasurement,
+    MarineTimeseries,
+    MarineVariable,
+    Position,
+    QualityFlag,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from marine_ops.io import export_csv
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _sample_timeseries() -> MarineTimeseries:
+    metadata = TimeseriesMetadata(source="stormglass", units=UNITS, ensemble_weight=0.4)
+    return MarineTimeseries(
+        points=[
+            MarineDataPoint(
+                timestamp=START + dt.timedelta(hours=hour),
+                position=Position(latitude=24.8, longitude=54.6),
+                measurements=[
+                    MarineMeasurement(variable=HS, value=1.234 + hour, unit=UnitEnum.METERS),
+                    MarineMeasurement(
+                        variable=WIND,
+                        value=7.005,
+                        unit=UnitEnum.METERS_PER_SECOND,
+                        quality_flag=QualityFlag.CLIPPED if hour == 1 else QualityFlag.RAW,
+                    ),
+                ],
+                metadata=metadata,
+            )
+            for hour in range(4)
+        ]
+    )
+
+
+def test_fast_schema_matches_pydantic_rounding_and_utc() -> None:
+    """반올림·UTC·범위 규칙 테스트. Test rounding, UTC and range rules match the models."""
+
+    gst = dt.timezone(dt.timedelta(hours=4))
+    local = dt.datetime(2025, 1, 1, 10, 0, tzinfo=gst)
+    metadata = TimeseriesMetadata(source="api", units=UNITS)
+    fast = FastDataPoint(
+        local,
+        FastPosition(24.8, 54.6),
+        [
+            FastMeasurement("Hs", 1.23456, "m"),
+            FastMeasurement(WIND, 7.005, UnitEnum.METERS_PER_SECOND),
+        ],
+        metadata,
+    )
+    model = MarineDataPoint(
+        timestamp=local,
+        position=Position(latitude=24.8, longitude=54.6),
+        measurements=[
+            MarineMeasurement(variable=HS, value=1.23456, unit=UnitEnum.METERS),
+            MarineMeasurement(variable=WIND, value=7.005, unit=UnitEnum.METERS_PER_SECOND),
+        ],
+        metadata=metadata,
+    )
+
+    assert fast.timestamp == dt.datetime(2025, 1, 1, 6, 0, tzinfo=dt.timezone.utc)
+    assert fast.timestamp.tzinfo is dt.timezone.utc
+    assert FastDataPoint(dt.datetime(2025, 1, 1), fast.position, [], metadata).timestamp == START
+    assert fast.to_model() == model
+    assert FastDataPoint.from_model(model) == fast
+    assert not hasattr(fast.measurements[0], "__dict__")
+    with pytest.raises(ValueError):
+        FastPosition(91.0, 54.6)
+    with pytest.raises(ValueError):
+        FastMeasurement("Hs", 1.0, "ft")
+
+
+def test_fast_timeseries_round_trips_through_models_and_columnar() -> None:
+    """모델·컬럼형 왕복 테스트. Test round trips via the pydantic and columnar forms."""
+
+    timeseries = _sample_timeseries()
+    fast = FastTimeseries.from_model(timeseries)
+    columnar = ColumnarTimeseries.from_timeseries(timeseries)
+
+    assert fast.to_model() == timeseries
+    assert columnar.to_fast_timeseries() == fast
+    assert ColumnarTimeseries.from_timeseries(fast).to_timeseries() == timeseries
+    assert list(fast.iter_rows()) == list(timeseries.iter_rows())
+    bounds = (START + dt.timedelta(hours=1), START + dt.timedelta(hours=2))
+    assert fast.window(*bounds).to_model() == timeseries.window(*bounds)
+
+
+def test_exporters_and_cache_accept_fast_timeseries(tmp_path: Path) -> None:
+    """내보내기·캐시 수용 테스트. Test CSV export and the forecast cache accept fast series."""
+
+    timeseries = _sample_timeseries()
+    fast = FastTimeseries.from_model(timeseries)
+    expected, actual = io.BytesIO(), io.BytesIO()
+    export_csv(expected, timeseries.points)
+    export_csv(actual, fast.points)
+    assert actual.getvalue() == expected.getvalue()
+
+    cache = ForecastCache(tmp_path)
+    end = START + dt.timedelta(hours=3)
+    cache.put("stormglass", 24.8, 54.6, START, end, fast)
+    assert cache.get("stormglass", 24.8, 54.6, START, end) == timeseries
@@ -0,0 +1,128 @@
+"""시계열 색인 테스트. Timeseries index tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.index import TimeseriesIndex
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.units import haversine_nm
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START_US = int(dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc).timestamp()) * 1_000_000
+HOUR_US = 3_600_000_000
+
+
+def _columnar(
+    sites: int,
+    hours: int,
+    seed: int = 7,
+    latitude: tuple[float, float] = (22.0, 27.0),
+    longitude: tuple[float, float] = (51.0, 57.0),
+) -> ColumnarTimeseries:
+    rng = np.random.default_rng(seed)
+    site_lat = rng.uniform(*latitude, sites)
+    site_lon = rng.uniform(*longitude, sites)
+    # 시각을 섞어 저장 순서가 정렬되어 있지 않게 한다.
+    site_ids = np.repeat(np.arange(sites), hours)
+    times = START_US + np.tile(rng.permutation(hours), sites) * HOUR_US
+    wind = rng.uniform(0.0, 15.0, sites * hours)
+    wind[::5] = np.nan
+    return ColumnarTimeseries.from_arrays(
+        times,
+        site_lat[site_ids],
+        site_lon[site_ids],
+        {HS: rng.uniform(0.2, 3.0, sites * hours), WIND: wind},
+        UNITS,
+        TimeseriesMetadata(source="stormglass", units=UNITS),
+    )
+
+
+def test_window_queries_match_linear_scan() -> None:
+    """시간 구간 조회 테스트. Test window queries against a linear scan."""
+
+    columnar = _columnar(sites=12, hours=48)
+    index = TimeseriesIndex(columnar)
+    start, end = START_US + 5 * HOUR_US, START_US + 17 * HOUR_US
+    site, distance = index.nearest(24.0, 54.0)
+    lat, lon = index.site_position(site)
+
+    expected = np.flatnonzero(
+        (columnar.latitude == lat)
+        & (columnar.longitude == lon)
+        & (columnar.timestamps >= start)
+        & (columnar.timestamps <= end)
+    )
+    rows = index.rows_at(site, start, end)
+    assert sorted(rows.tolist()) == expected.tolist()
+    assert np.all(np.diff(columnar.timestamps[rows]) > 0)
+
+    times, values = index.values(WIND, 24.0, 54.0, start, end)
+    assert np.array_equal(times, columnar.timestamps[rows])
+    assert np.array_equal(values, columnar.column(WIND)[rows], equal_nan=True)
+    assert index.values(HS, 24.0, 54.0, start, end, max_distance_nm=distance / 2)[0].size == 0
+
+    between = index.rows_between(
+        dt.datetime(2025, 1, 1, 5, tzinfo=dt.timezone.utc), START_US + 5 * HOUR_US
+    )
+    assert between.size == 12
+    assert np.all(columnar.timestamps[between] == START_US + 5 * HOUR_US)
+
+
+def test_grid_nearest_matches_brute_force() -> None:
+    """격자 최근접 탐색 테스트. Test grid nearest-neighbour against brute force."""
+
+    columnar = _columnar(sites=3000, hours=2)
+    index = TimeseriesIndex(columnar, cell_degrees=0.1)
+    assert index._grid
+
+    rng = np.random.default_rng(3)
+    for lat, lon in zip(rng.uniform(21.0, 28.0, 200), rng.uniform(50.0, 58.0, 200)):
+        site, distance = index.nearest(lat, lon)
+        brute = haversine_nm(lat, lon, index.site_latitude, index.site_longitude)
+        assert distance == brute.min()
+        assert brute[site] == brute.min()
+
+
+def test_grid_nearest_wraps_antimeridian_and_handles_high_latitudes() -> None:
+    """날짜변경선·고위도 최근접 탐색 테스트. Test antimeridian and high-latitude lookups."""
+
+    columnar = _columnar(sites=3000, hours=1, latitude=(-85.0, 85.0), longitude=(-180.0, 180.0))
+    index = TimeseriesIndex(columnar, cell_degrees=0.1)
+    assert index._grid
+
+    rng = np.random.default_rng(5)
+    queries = [(0.0, 179.9), (10.0, -179.95), (-45.0, 180.0), (89.9, 12.0), (-89.0, -170.0)]
+    queries += zip(rng.uniform(-90.0, 90.0, 100), rng.uniform(-180.0, 180.0, 100))
+    for lat, lon in queries:
+        site, distance = index.nearest(lat, lon)
+        brute = haversine_nm(lat, lon, index.site_latitude, index.site_longitude)
+        assert distance == brute.min()
+        assert brute[site] == brute.min()
+
+    east = TimeseriesIndex(
+        _columnar(sites=1500, hours=1, latitude=(-5.0, 5.0), longitude=(150.0, 170.0)),
+        cell_degrees=0.25,
+    )
+    assert east._grid
+    site, distance = east.nearest(0.0, -179.9)
+    brute = haversine_nm(0.0, -179.9, east.site_latitude, east.site_longitude)
+    assert (site, distance) == (int(np.argmin(brute)), brute.min())
+
+
+def test_nearest_many_matches_scalar_lookup() -> None:
+    """일괄 최근접 탐색 테스트. Test batched nearest lookups against ``nearest``."""
+
+    rng = np.random.default_rng(4)
+    latitude, longitude = rng.uniform(21.0, 28.0, 500), rng.uniform(50.0, 58.0, 500)
+    for sites in (200, 3000):
+        index = TimeseriesIndex(_columnar(sites=sites, hours=2), cell_degrees=0.1)
+        nearest, distances = index.nearest_many(latitude, longitude)
+        expected = [index.nearest(lat, lon) for lat, lon in zip(latitude, longitude)]
+        np.testing.assert_array_equal(nearest, [site for site, _ in expected])
+        np.testing.assert_allclose(distances, [distance for _, distance in expected])
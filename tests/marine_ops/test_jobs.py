@@ -0,0 +1,157 @@
+"""작업 CSV 실행기 테스트. Jobs CSV runner tests."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import datetime as dt
+from pathlib import Path
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries, datetime_to_epoch_us
+from marine_ops.core.schema import (
+    CSV_TIMESTAMP_FORMAT,
+    MarineTimeseries,
+    MarineVariable,
+    TimeseriesMetadata,
+    UnitEnum,
+)
+from marine_ops.core.timeline import TimelineRoute, evaluate_timeline
+from marine_ops.jobs import RESULT_HEADER, JobRunner, JobSettings, read_jobs
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+HOUR_US = 3_600_000_000
+
+
+class FakeForecasts:
+    """좌표별 합성 예보 비동기 커넥터. Async connector serving synthetic forecasts."""
+
+    def __init__(self, failing: set[tuple[float, float]] | None = None) -> None:
+        self.failing = failing or set()
+        self.calls: list[tuple[float, float, dt.datetime, dt.datetime]] = []
+
+    async def fetch_forecast(
+        self, latitude: float, longitude: float, start: dt.datetime, end: dt.datetime
+    ) -> MarineTimeseries:
+        self.calls.append((latitude, longitude, start, end))
+        if (latitude, longitude) in self.failing:
+            raise RuntimeError("provider unavailable")
+        first = datetime_to_epoch_us(start) // HOUR_US * HOUR_US
+        times = np.arange(first, datetime_to_epoch_us(end) + HOUR_US, HOUR_US)
+        clock = (times - times[0]) / HOUR_US
+        # 위도가 높을수록 파고가 커지고 시간에 따라 오르내린다.
+        hs = np.round((latitude - 23.5) + 0.6 * np.sin(clock / 6.0), 2).clip(0.1)
+        return ColumnarTimeseries.from_arrays(
+            times,
+            np.full(times.size, latitude),
+            np.full(times.size, longitude),
+            {HS: hs, WIND: np.full(times.size, 7.0)},
+            UNITS,
+            TimeseriesMetadata(source="fake", units=UNITS),
+        ).to_timeseries()
+
+
+def _write_jobs(path: Path) -> Path:
+    rows = [
+        ("job-1", "24.00", "54.00", 0, 24),
+        ("job-2", "24.00", "54.00", 12, 36),
+        ("job-3", "24.80", "54.50", 0, 48),
+        ("job-4", "25.20", "55.00", 6, 30),
+        ("job-5", "24.40", "54.20", 0, 12),
+    ]
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(("job_id", "latitude", "longitude", "start", "end"))
+        for job_id, latitude, longitude, start, end in rows:
+            writer.writerow(
+                (
+                    job_id,
+                    latitude,
+                    longitude,
+                    (START + dt.timedelta(hours=start)).strftime(CSV_TIMESTAMP_FORMAT),
+                    (START + dt.timedelta(hours=end)).strftime(CSV_TIMESTAMP_FORMAT),
+                )
+            )
+    return path
+
+
+def _results(path: Path) -> dict[str, dict[str, str]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == len({row["job_id"] for row in rows})
+    return {row["job_id"]: row for row in rows}
+
+
+def test_runner_dedupes_fetches_and_matches_timeline(tmp_path: Path) -> None:
+    """조회 병합·평가 일치 테스트. Test shared fetches and per-job timeline summaries."""
+
+    jobs = read_jobs(_write_jobs(tmp_path / "jobs.csv"))
+    connector = FakeForecasts()
+    output = tmp_path / "results.csv"
+    summary = JobRunner(connector, workers=2).run(jobs, output)
+
+    assert (summary.total, summary.fetches, summary.succeeded, summary.failed) == (5, 4, 5, 0)
+    # job-1 과 job-2 는 합친 구간으로 한 번만 조회한다.
+    shared = [call for call in connector.calls if call[:2] == (24.0, 54.0)]
+    assert shared == [(24.0, 54.0, START, START + dt.timedelta(hours=36))]
+
+    results = _results(output)
+    assert set(results) == {job.job_id for job in jobs}
+    job = jobs[2]
+    settings = JobSettings()
+    timeline = evaluate_timeline(
+        asyncio.run(
+            FakeForecasts().fetch_forecast(job.latitude, job.longitude, job.start, job.end)
+        ),
+        [
+            TimelineRoute(
+                job.job_id,
+                job.latitude,
+                job.longitude,
+                settings.distance_nm,
+                settings.planned_speed,
+                settings.offshore_weight,
+            )
+        ],
+        start=job.start,
+        hours=48,
+    )
+    codes = timeline.outputs.decision_code[0]
+    row = results["job-3"]
+    assert float(row["hours"]) == 48.0
+    assert float(row["go_hours"]) == float(np.count_nonzero(codes == 0))
+    assert float(row["no_go_hours"]) == float(np.count_nonzero(codes == 2))
+    window = timeline.first_window("job-3")
+    assert window is not None
+    assert row["window_start"] == window.start.strftime(CSV_TIMESTAMP_FORMAT)
+    assert row["window_decision"] == window.decision
+
+
+def test_runner_resumes_after_crash_and_retries_failures(tmp_path: Path) -> None:
+    """체크포인트 재개 테스트. Test resuming from a truncated results file."""
+
+    jobs = read_jobs(_write_jobs(tmp_path / "jobs.csv"))
+    output = tmp_path / "results.csv"
+    first = JobRunner(FakeForecasts(failing={(25.2, 55.0)}), workers=1).run(jobs, output)
+    assert (first.succeeded, first.failed) == (4, 1)
+    assert _results(output)["job-4"]["error"] == "RuntimeError: provider unavailable"
+
+    # 충돌로 job-5 행이 반쯤만 기록된 상태를 만든다.
+    lines = output.read_text(encoding="utf-8").splitlines(keepends=True)
+    kept = [line for line in lines if not line.startswith("job-5,")]
+    partial = next(line for line in lines if line.startswith("job-5,"))
+    output.write_text("".join(kept) + partial[:15], encoding="utf-8")
+
+    connector = FakeForecasts()
+    second = JobRunner(connector, workers=1).run(jobs, output)
+    assert (second.skipped, second.succeeded, second.failed) == (3, 2, 0)
+    assert sorted(call[:2] for call in connector.calls) == [(24.4, 54.2), (25.2, 55.0)]
+    results = _results(output)
+    assert set(results) == {job.job_id for job in jobs}
+    assert all(row["status"] == "ok" for row in results.values())
+    with output.open(newline="", encoding="utf-8") as handle:
+        assert tuple(next(csv.reader(handle))) == RESULT_HEADER
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from marine_ops.core.marine_decision import MarineInputs, decide_and_eta
+from marine_ops.core.marine_decision import (
+    DECISION_LABELS,
+    MarineInputs,
+    decide_and_eta,
+    decide_and_eta_batch,
+)
 
 
 def test_marine_decision_go_condition() -> None:
@@ -177,3 +183,66 @@ def test_alert_weighting() -> None:
     
     # 경보가 있으면 파고가 더 높게 계산되어야 함
     assert result_with_alert.hs_fused_m > result_no_alert.hs_fused_m
+
+
+def _random_columns(size: int, seed: int = 7) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    alerts = np.array(
+        [None, "", "rough at times westward", "High seas", "High Seas", "Fog", " fog ", "unknown"],
+        dtype=object,
+    )
+    return {
+        "combined_ft": np.round(rng.uniform(0.0, 8.0, size), 2),
+        "wind_adnoc": np.round(rng.uniform(0.0, 35.0, size), 1),
+        "hs_onshore_ft": np.round(rng.uniform(0.0, 6.0, size), 2),
+        "hs_offshore_ft": np.round(rng.uniform(0.0, 8.0, size), 2),
+        "wind_albahar": np.round(rng.uniform(0.0, 35.0, size), 1),
+        "offshore_weight": np.round(rng.uniform(0.0, 1.0, size), 2),
+        "distance_nm": np.round(rng.uniform(5.0, 200.0, size), 1),
+        "planned_speed": np.round(rng.uniform(0.5, 14.0, size), 1),
+        "alert": alerts[rng.integers(0, alerts.size, size)],
+    }
+
+
+def test_batch_matches_scalar() -> None:
+    """배치 결과와 스칼라 결과 일치 테스트. Test batch results match scalar results."""
+
+    columns = _random_columns(3000)
+    batch = decide_and_eta_batch(**columns)
+
+    for index, output in enumerate(batch.to_outputs()):
+        inputs = MarineInputs(**{key: values[index] for key, values in columns.items()})
+        assert output == decide_and_eta(inputs)
+    assert set(batch.decisions.tolist()) == set(DECISION_LABELS)
+
+
+def test_batch_alert_codes_and_coefficients() -> None:
+    """사전 인코딩 경보와 계수 전달 테스트. Test pre-encoded alerts and coefficients."""
+
+    columns = _random_columns(500, seed=11)
+    labels = [None, "rough at times westward", "High seas"]
+    codes = np.arange(500) % 3
+    batch = decide_and_eta_batch(
+        **{key: value for key, value in columns.items() if key != "alert"},
+        alert_codes=codes,
+        alert_labels=labels,
+        alpha=0.9,
+        k_wind=0.08,
+    )
+
+    for index in range(0, 500, 17):
+        inputs = MarineInputs(
+            **{key: values[index] for key, values in columns.items() if key != "alert"},
+            alert=labels[codes[index]],
+        )
+        expected = decide_and_eta(inputs, alpha=0.9, k_wind=0.08)
+        assert batch.to_outputs()[index] == expected
+
+
+def test_batch_rejects_invalid_route_columns() -> None:
+    """잘못된 항로 입력 거부 테스트. Test invalid route columns are rejected."""
+
+    with pytest.raises(ValueError, match="offshore_weight"):
+        decide_and_eta_batch(2.0, 15.0, 1.5, 2.0, 18.0, [0.3, 1.2], 120.0, 12.0)
+    with pytest.raises(ValueError, match="planned_speed"):
+        decide_and_eta_batch(2.0, 15.0, 1.5, 2.0, 18.0, 0.3, 120.0, [12.0, 0.0])
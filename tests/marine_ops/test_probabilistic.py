@@ -0,0 +1,75 @@
+"""확률적 의사결정 테스트. Probabilistic decision tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from marine_ops.core.marine_decision import create_sample_inputs, decide_and_eta
+from marine_ops.core.probabilistic import ForecastError, decide_probabilistic
+
+ALERTS = np.array([None, "rough at times westward", "High seas"], dtype=object)
+
+
+def _routes(count: int = 50) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(5)
+    return {
+        "combined_ft": np.round(rng.uniform(0.5, 7.0, count), 2),
+        "wind_adnoc": np.round(rng.uniform(5.0, 30.0, count), 1),
+        "hs_onshore_ft": np.round(rng.uniform(0.5, 5.0, count), 2),
+        "hs_offshore_ft": np.round(rng.uniform(0.5, 7.0, count), 2),
+        "wind_albahar": np.round(rng.uniform(5.0, 30.0, count), 1),
+        "offshore_weight": np.round(rng.uniform(0.0, 1.0, count), 2),
+        "distance_nm": np.round(rng.uniform(20.0, 150.0, count), 1),
+        "planned_speed": np.round(rng.uniform(8.0, 14.0, count), 1),
+        "alert": ALERTS[rng.integers(0, ALERTS.size, count)],
+    }
+
+
+def test_probabilities_are_reproducible_and_chunk_independent() -> None:
+    """재현성·묶음 무관성 테스트. Test seeded results do not depend on the block size."""
+
+    routes = _routes()
+    result = decide_probabilistic(routes, samples=2000, seed=7)
+    chunked = decide_probabilistic(routes, samples=2000, seed=7, chunk_cells=333)
+    reseeded = decide_probabilistic(routes, samples=2000, seed=8)
+
+    assert len(result) == 50
+    np.testing.assert_array_equal(result.probabilities, chunked.probabilities)
+    np.testing.assert_array_equal(result.eta_percentiles, chunked.eta_percentiles)
+    assert not np.array_equal(result.eta_percentiles, reseeded.eta_percentiles)
+    np.testing.assert_allclose(result.probabilities.sum(axis=1), 1.0)
+    np.testing.assert_allclose(result.p_go + result.p_conditional + result.p_no_go, 1.0)
+    assert np.all(np.diff(result.eta_percentiles, axis=1) >= 0.0)
+    # 경보 No-Go 항로는 어떤 교란에서도 No-Go 다.
+    assert np.all(result.p_no_go[routes["alert"] == "High seas"] == 1.0)
+
+
+def test_zero_error_matches_deterministic_decision() -> None:
+    """오차 0 일치 테스트. Test zero-width errors reproduce ``decide_and_eta``."""
+
+    inputs = create_sample_inputs()
+    expected = decide_and_eta(inputs)
+    result = decide_probabilistic(
+        [inputs],
+        samples=100,
+        wave_error=ForecastError("normal", 0.0, relative=True),
+        wind_error=ForecastError("uniform", 0.0),
+        seed=1,
+    )
+
+    row = result.to_rows()[0]
+    assert row["decision"] == expected.decision
+    assert result.probabilities[0, result.deterministic_code[0]] == 1.0
+    assert row["eta_p10"] == row["eta_p90"] == expected.eta_hours
+
+
+def test_forecast_error_validation() -> None:
+    """오차 분포 검증 테스트. Test forecast error validation."""
+
+    with pytest.raises(ValueError, match="unknown error distribution"):
+        ForecastError("gamma", 0.1)
+    with pytest.raises(ValueError, match="lognormal errors must be relative"):
+        ForecastError("lognormal", 0.1)
+    with pytest.raises(ValueError, match="samples must be positive"):
+        decide_probabilistic([create_sample_inputs()], samples=0)
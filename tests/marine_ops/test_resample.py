@@ -0,0 +1,89 @@
+"""시간 격자 재표본화 테스트. Time-grid resampling tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+
+from marine_ops.core.columnar import QUALITY_FLAGS, ColumnarTimeseries
+from marine_ops.core.resample import align, resample, time_grid
+from marine_ops.core.schema import MarineVariable, QualityFlag, TimeseriesMetadata, UnitEnum
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND_DIR = MarineVariable.WIND_DIRECTION_10M
+TIDE = MarineVariable.TIDE_HEIGHT
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+HOUR_US = 3_600_000_000
+START_US = int(START.timestamp()) * 1_000_000
+
+
+def _flags(columnar: ColumnarTimeseries, variable: MarineVariable) -> list[QualityFlag | None]:
+    return [QUALITY_FLAGS[code] if code >= 0 else None for code in columnar.quality[variable]]
+
+
+def test_resample_interpolates_per_site_with_circular_directions() -> None:
+    """위치별 선형·원형 보간 테스트. Test per-site linear and circular interpolation."""
+
+    units = {HS: UnitEnum.METERS, WIND_DIR: UnitEnum.DEGREES}
+    # 두 위치, 2시간 간격 원시값을 섞인 순서로 저장한다.
+    times = START_US + np.array([2, 0, 4, 0, 2, 4]) * HOUR_US
+    columnar = ColumnarTimeseries.from_arrays(
+        times,
+        [25.0, 25.0, 25.0, 24.0, 24.0, 24.0],
+        [55.0, 55.0, 55.0, 54.0, 54.0, 54.0],
+        {HS: [2.0, 1.0, np.nan, 0.5, 0.7, 0.9], WIND_DIR: [10.0, 350.0, 30.0, 90.0, 110.0, 130.0]},
+        units,
+        TimeseriesMetadata(source="stormglass", units=units),
+    )
+
+    result = resample(columnar, dt.timedelta(hours=1))
+
+    assert result.timestamps.tolist() == (START_US + np.tile(np.arange(5), 2) * HOUR_US).tolist()
+    assert result.latitude.tolist() == [24.0] * 5 + [25.0] * 5
+    assert np.allclose(
+        result.column(HS), [0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.5, 2.0, np.nan, np.nan], equal_nan=True
+    )
+    # 350° → 10° 사이는 0°를 지나 보간된다.
+    assert result.column(WIND_DIR).tolist() == [90, 100, 110, 120, 130, 350, 0, 10, 20, 30]
+    raw, imputed = QualityFlag.RAW, QualityFlag.IMPUTED
+    assert _flags(result, HS)[5:] == [raw, imputed, raw, None, None]
+    assert _flags(result, WIND_DIR)[:5] == [raw, imputed, raw, imputed, raw]
+
+    limited = resample(columnar, dt.timedelta(hours=1), max_gap=dt.timedelta(hours=1))
+    assert all(flag is not QualityFlag.IMPUTED for flag in _flags(limited, WIND_DIR))
+
+
+def test_align_puts_providers_on_one_grid() -> None:
+    """공급자 간 격자 정렬 테스트. Test alignment of 30-minute and hourly providers."""
+
+    tide_units = {TIDE: UnitEnum.METERS}
+    tide = ColumnarTimeseries.from_arrays(
+        START_US + np.arange(0, 12) * HOUR_US // 2,
+        25.0,
+        55.0,
+        {TIDE: np.linspace(0.0, 1.1, 12)},
+        tide_units,
+        TimeseriesMetadata(source="worldtides", units=tide_units),
+    )
+    wave_units = {HS: UnitEnum.METERS}
+    # 30분 어긋난 시간별 예보.
+    waves = ColumnarTimeseries.from_arrays(
+        START_US + HOUR_US // 2 + np.arange(6) * HOUR_US,
+        25.0,
+        55.0,
+        {HS: np.arange(6, dtype=float)},
+        wave_units,
+        TimeseriesMetadata(source="open-meteo", units=wave_units),
+    )
+
+    aligned_tide, aligned_waves = align([tide, waves.to_timeseries()])
+
+    grid = time_grid(START, START_US + 6 * HOUR_US, dt.timedelta(hours=1))
+    assert aligned_tide.timestamps.tolist() == grid[:6].tolist()
+    assert aligned_tide.column(TIDE).tolist() == [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+    assert set(_flags(aligned_tide, TIDE)) == {QualityFlag.RAW}
+    assert aligned_waves.timestamps.tolist() == grid[1:6].tolist()
+    assert aligned_waves.column(HS).tolist() == [0.5, 1.5, 2.5, 3.5, 4.5]
+    assert set(_flags(aligned_waves, HS)) == {QualityFlag.IMPUTED}
+    assert aligned_waves.metadata[0].source == "open-meteo"
@@ -0,0 +1,232 @@
+"""공급자 라우팅 테스트. Provider routing tests."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from marine_ops.connectors import (
+    AsyncOpenMeteoFallback,
+    AsyncProviderRouter,
+    AsyncStormglassConnector,
+    CircuitState,
+    NoHealthyProviderError,
+    OpenMeteoFallback,
+    ProviderRouter,
+    StormglassConnector,
+)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+END = START + dt.timedelta(days=1)
+
+
+def _payload(name: str) -> dict[str, Any]:
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+class Scripted:
+    """응답 상태·지연 조절 전송 핸들러. Handler with adjustable status and delay."""
+
+    def __init__(self, payload: dict[str, Any], status: int = 200, delay: float = 0.0) -> None:
+        self.payload = payload
+        self.status = status
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self, _: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        time.sleep(self.delay)
+        return httpx.Response(self.status, json=self.payload)
+
+    async def handle_async(self, _: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return httpx.Response(self.status, json=self.payload)
+
+
+def _sync_router(primary: Scripted, fallback: Scripted, **options: Any) -> ProviderRouter:
+    return ProviderRouter(
+        [
+            StormglassConnector(
+                "key", client=httpx.Client(transport=httpx.MockTransport(primary)), trusted=True
+            ),
+            OpenMeteoFallback(
+                client=httpx.Client(transport=httpx.MockTransport(fallback)), trusted=True
+            ),
+        ],
+        **options,
+    )
+
+
+def test_circuit_opens_skips_and_recovers_through_half_open() -> None:
+    """서킷 개방·건너뜀·복구 테스트. Test open, skip, half-open probe and recovery."""
+
+    now = [0.0]
+    primary = Scripted(_payload("stormglass_forecast.json"), status=503)
+    fallback = Scripted(_payload("open_meteo_forecast.json"))
+    router = _sync_router(
+        primary, fallback, failure_threshold=2, recovery_seconds=30.0, clock=lambda: now[0]
+    )
+
+    for _ in range(4):
+        router.fetch_forecast(25.0, 55.0, START, END)
+    assert primary.calls == 2
+    health = {item.provider: item for item in router.snapshot()}
+    assert health["stormglass"].state is CircuitState.OPEN
+    assert health["stormglass"].skipped == 2
+    assert health["open-meteo"].successes == 4
+    assert health["open-meteo"].p95_ms is not None
+
+    now[0] += 31.0
+    router.fetch_forecast(25.0, 55.0, START, END)
+    assert primary.calls == 3
+    assert router.breakers["stormglass"].state is CircuitState.OPEN
+
+    now[0] += 31.0
+    primary.status = 200
+    series = router.fetch_forecast(25.0, 55.0, START, END)
+    assert series.points[0].metadata.source == "stormglass"
+    assert [(item.previous, item.current) for item in router.transitions] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_client_errors_raise_without_opening_circuit() -> None:
+    """클라이언트 오류 전파 테스트. Test non-retryable errors propagate, circuit stays closed."""
+
+    primary = Scripted(_payload("stormglass_forecast.json"), status=401)
+    fallback = Scripted(_payload("open_meteo_forecast.json"))
+    router = _sync_router(primary, fallback, failure_threshold=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        router.fetch_forecast(25.0, 55.0, START, END)
+    assert fallback.calls == 0
+    assert router.breakers["stormglass"].state is CircuitState.CLOSED
+
+
+def test_client_error_probe_does_not_close_half_open_circuit() -> None:
+    """반개방 시험 클라이언트 오류 테스트. Test a 4xx probe leaves the circuit half-open."""
+
+    now = [0.0]
+    primary = Scripted(_payload("stormglass_forecast.json"), status=503)
+    fallback = Scripted(_payload("open_meteo_forecast.json"))
+    router = _sync_router(
+        primary, fallback, failure_threshold=1, recovery_seconds=30.0, clock=lambda: now[0]
+    )
+    router.fetch_forecast(25.0, 55.0, START, END)
+    assert router.breakers["stormglass"].state is CircuitState.OPEN
+
+    now[0] += 31.0
+    primary.status = 401
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            router.fetch_forecast(25.0, 55.0, START, END)
+        assert router.breakers["stormglass"].state is CircuitState.HALF_OPEN
+    assert primary.calls == 3
+    assert router.breakers["stormglass"].consecutive_failures == 1
+
+
+def test_sync_hedge_fires_fallback_after_latency_budget() -> None:
+    """동기 헤징 테스트. Test the fallback is fired once the primary exceeds its budget."""
+
+    primary = Scripted(_payload("stormglass_forecast.json"), delay=0.5)
+    fallback = Scripted(_payload("open_meteo_forecast.json"))
+    router = _sync_router(primary, fallback, hedge_after=0.05)
+
+    started = time.perf_counter()
+    series = router.fetch_forecast(25.0, 55.0, START, END)
+    elapsed = time.perf_counter() - started
+    router.close()
+
+    assert series.points[0].metadata.source == "open-meteo"
+    assert elapsed < 0.4
+    assert {item.provider: item.hedged for item in router.snapshot()}["open-meteo"] == 1
+
+
+def test_async_router_hedges_and_reports_no_healthy_provider() -> None:
+    """비동기 헤징 및 전체 차단 테스트. Test async hedging and all-open circuits."""
+
+    primary = Scripted(_payload("stormglass_forecast.json"), delay=0.5)
+    fallback = Scripted(_payload("open_meteo_forecast.json"), delay=0.01)
+
+    async def scenario() -> None:
+        primary_client = httpx.AsyncClient(transport=httpx.MockTransport(primary.handle_async))
+        fallback_client = httpx.AsyncClient(transport=httpx.MockTransport(fallback.handle_async))
+        router = AsyncProviderRouter(
+            [
+                AsyncStormglassConnector("key", client=primary_client, trusted=True),
+                AsyncOpenMeteoFallback(client=fallback_client, trusted=True),
+            ],
+            hedge_after=0.05,
+            failure_threshold=1,
+            recovery_seconds=60.0,
+        )
+        started = time.perf_counter()
+        series = await router.fetch_forecast(25.0, 55.0, START, END)
+        assert time.perf_counter() - started < 0.4
+        assert series.points[0].metadata.source == "open-meteo"
+
+        primary.delay = fallback.delay = 0.0
+        primary.status = fallback.status = 503
+        with pytest.raises(httpx.HTTPStatusError):
+            await router.fetch_forecast(25.0, 55.0, START, END)
+        with pytest.raises(NoHealthyProviderError):
+            await router.fetch_forecast(25.0, 55.0, START, END)
+        assert all(item.state is CircuitState.OPEN for item in router.snapshot())
+        await primary_client.aclose()
+        await fallback_client.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_async_hedge_cancelling_half_open_probe_releases_it() -> None:
+    """헤징 취소된 시험 호출 반납 테스트. Test a cancelled half-open probe is released."""
+
+    now = [0.0]
+    primary = Scripted(_payload("stormglass_forecast.json"), status=503)
+    fallback = Scripted(_payload("open_meteo_forecast.json"), delay=0.01)
+
+    async def scenario() -> None:
+        primary_client = httpx.AsyncClient(transport=httpx.MockTransport(primary.handle_async))
+        fallback_client = httpx.AsyncClient(transport=httpx.MockTransport(fallback.handle_async))
+        router = AsyncProviderRouter(
+            [
+                AsyncStormglassConnector("key", client=primary_client, trusted=True),
+                AsyncOpenMeteoFallback(client=fallback_client, trusted=True),
+            ],
+            hedge_after=0.05,
+            failure_threshold=1,
+            recovery_seconds=30.0,
+            clock=lambda: now[0],
+        )
+        await router.fetch_forecast(25.0, 55.0, START, END)
+        breaker = router.breakers["stormglass"]
+        assert breaker.state is CircuitState.OPEN
+
+        # 반개방 시험 호출이 느려 헤징에서 지고 취소된다.
+        now[0] += 31.0
+        primary.status, primary.delay = 200, 0.5
+        series = await router.fetch_forecast(25.0, 55.0, START, END)
+        assert series.points[0].metadata.source == "open-meteo"
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        primary.delay = 0.0
+        series = await router.fetch_forecast(25.0, 55.0, START, END)
+        assert series.points[0].metadata.source == "stormglass"
+        assert breaker.state is CircuitState.CLOSED
+        await primary_client.aclose()
+        await fallback_client.aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,127 @@
+"""정기 점검 스케줄러 테스트. Daily check scheduler tests."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries, datetime_to_epoch_us
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.timeline import TimelineRoute
+from marine_ops.jobs import CheckReport, CheckScheduler, next_check
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+UTC = dt.timezone.utc
+HOUR_US = 3_600_000_000
+ROUTES = [
+    TimelineRoute("MW4-AGI", 24.8, 54.6, 120.0, 12.0, 0.35),
+    TimelineRoute("MW4-DAS", 25.1, 52.9, 90.0, 10.0, 0.6, 24.5, 54.4),
+]
+
+
+class IssuedForecasts:
+    """발표 회차별 합성 예보 커넥터. Async connector serving one synthetic issue at a time."""
+
+    def __init__(self) -> None:
+        self.issue = 0
+        self.failing: set[tuple[float, float]] = set()
+        self.calls: list[tuple[float, float, dt.datetime, dt.datetime]] = []
+
+    async def fetch_forecast(
+        self, latitude: float, longitude: float, start: dt.datetime, end: dt.datetime
+    ) -> ColumnarTimeseries:
+        self.calls.append((latitude, longitude, start, end))
+        if (latitude, longitude) in self.failing:
+            raise RuntimeError("provider unavailable")
+        times = np.arange(datetime_to_epoch_us(start), datetime_to_epoch_us(end) + 1, HOUR_US)
+        hs = np.full(times.size, 0.8)
+        # 두 번째 발표에서는 앞 6시간만 파고가 높아진다.
+        hs[:6] += 1.5 * self.issue
+        return ColumnarTimeseries.from_arrays(
+            times,
+            latitude,
+            longitude,
+            {HS: hs, WIND: np.full(times.size, 6.0)},
+            UNITS,
+            TimeseriesMetadata(source="fake", units=UNITS),
+        )
+
+
+def test_next_check_uses_dubai_wall_clock() -> None:
+    """두바이 현지 시각 점검 테스트. Test check times follow Asia/Dubai (UTC+4)."""
+
+    assert next_check(dt.datetime(2025, 1, 1, 1, 0, tzinfo=UTC)) == dt.datetime(
+        2025, 1, 1, 2, 0, tzinfo=UTC
+    )
+    assert next_check(dt.datetime(2025, 1, 1, 2, 0, tzinfo=UTC)) == dt.datetime(
+        2025, 1, 1, 13, 0, tzinfo=UTC
+    )
+    assert next_check(dt.datetime(2025, 1, 1, 13, 30, tzinfo=UTC)) == dt.datetime(
+        2025, 1, 2, 2, 0, tzinfo=UTC
+    )
+
+
+def test_same_day_checks_reuse_snapshot_and_evaluator() -> None:
+    """같은 날 점검 재사용 테스트. Test the second daily check is incremental and warm."""
+
+    connector = IssuedForecasts()
+    reports: list[CheckReport] = []
+    scheduler = CheckScheduler(connector, ROUTES, hours=48, on_report=reports.append)
+    morning = dt.datetime(2025, 1, 1, 2, 0, tzinfo=UTC)
+    first = asyncio.run(scheduler.run_check(morning))
+
+    assert first.positions == 3 and first.stale_positions == ()
+    assert first.update.cells_evaluated == 2 * 72
+    assert list(first.stages) == ["fetch", "convert", "wait", "decide"]
+    # 조회 구간은 두바이 자정(전날 20:00 UTC)부터 24 + 48시간이다.
+    midnight = dt.datetime(2024, 12, 31, 20, 0, tzinfo=UTC)
+    assert {call[2:] for call in connector.calls} == {(midnight, midnight + dt.timedelta(hours=72))}
+
+    evaluator = scheduler.evaluator
+    connector.issue = 1
+    connector.failing = {(24.5, 54.4)}
+    second = asyncio.run(scheduler.run_check(morning + dt.timedelta(hours=11)))
+
+    assert scheduler.evaluator is evaluator
+    assert second.stale_positions == ((24.5, 54.4),)
+    assert second.rows == first.rows
+    # 앞 6시간만 바뀌었으므로 두 항로 × 6시간만 다시 결정한다.
+    assert second.update.cells_evaluated == 2 * 6
+    assert len(second.update) > 0
+    assert reports == [first, second]
+
+
+def test_serve_prefetches_before_check_and_stops() -> None:
+    """사전 조회 후 점검·중지 테스트. Test serve prefetches ahead, decides and stops."""
+
+    check = dt.datetime(2025, 1, 1, 13, 0, tzinfo=UTC)
+    now = [check - dt.timedelta(seconds=0.2)]
+    connector = IssuedForecasts()
+    scheduler = CheckScheduler(
+        connector,
+        ROUTES,
+        lead=dt.timedelta(seconds=0.1),
+        hours=24,
+        clock=lambda: now[0],
+    )
+
+    async def scenario() -> list[CheckReport]:
+        task = asyncio.ensure_future(scheduler.serve())
+        await asyncio.sleep(0.05)
+        assert not connector.calls
+        # 사전 조회 시각이 지나면 조회하고, 점검 시각에 결정한다.
+        now[0] = check - dt.timedelta(seconds=0.05)
+        await asyncio.sleep(0.2)
+        assert len(connector.calls) == 3
+        now[0] = check + dt.timedelta(hours=1)
+        await asyncio.sleep(0.1)
+        scheduler.stop()
+        return await task
+
+    reports = asyncio.run(scenario())
+    assert [report.scheduled_for for report in reports] == [check]
+    assert reports[0].stages["wait"] >= 0.0
@@ -0,0 +1,202 @@
+"""의사결정 HTTP 서비스 테스트. Decision HTTP service tests."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import importlib
+import json
+import threading
+from typing import Any
+
+import httpx
+import numpy as np
+import pytest
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.marine_decision import (
+    DECISION_LABELS,
+    create_sample_inputs,
+    decide_and_eta,
+    decide_and_eta_batch,
+)
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.timeline import TimelineRoute, evaluate_timeline
+from marine_ops.service import BATCH_FIELDS, DecisionService
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _call(service: DecisionService, *requests: tuple[str, str, Any]) -> list[httpx.Response]:
+    async def run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=service)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [
+                await client.request(method, url, json=payload) for method, url, payload in requests
+            ]
+
+    return asyncio.run(run())
+
+
+def test_decide_matches_scalar_and_reports_errors() -> None:
+    """단일 결정·오류 테스트. Test single decisions, caching and error statuses."""
+
+    service = DecisionService()
+    sample = create_sample_inputs()
+    ok, again, invalid, missing, wrong = _call(
+        service,
+        ("POST", "/v1/decide", sample.model_dump()),
+        ("POST", "/v1/decide", sample.model_dump()),
+        ("POST", "/v1/decide", {**sample.model_dump(), "offshore_weight": 2.0}),
+        ("GET", "/v1/unknown", None),
+        ("GET", "/v1/decide", None),
+    )
+
+    assert ok.status_code == 200
+    assert ok.json() == {"success": True, "data": decide_and_eta(sample).model_dump()}
+    assert again.json() == ok.json()
+    assert service.cache.stats()["hits"] == 1
+    assert invalid.status_code == 400 and invalid.json()["success"] is False
+    assert (missing.status_code, wrong.status_code) == (404, 405)
+
+    # 잘못된 content-length 헤더는 httpx 로 보낼 수 없어 ASGI 로 직접 호출한다.
+    sent: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"{}", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/v1/decide",
+        "headers": [(b"content-length", b"abc")],
+    }
+    asyncio.run(service(scope, receive, send))
+    assert sent[0]["status"] == 400
+    assert json.loads(sent[1]["body"])["error"] == "invalid content-length"
+
+
+def test_batch_columnar_and_streaming_match() -> None:
+    """컬럼형 배치·스트리밍 테스트. Test columnar batch and NDJSON streaming agree."""
+
+    rng = np.random.default_rng(7)
+    rows = 25
+    payload: dict[str, Any] = {
+        "combined_ft": rng.uniform(1.0, 8.0, rows).round(2).tolist(),
+        "wind_adnoc": rng.uniform(5.0, 30.0, rows).round(2).tolist(),
+        "hs_onshore_ft": rng.uniform(0.5, 5.0, rows).round(2).tolist(),
+        "hs_offshore_ft": rng.uniform(1.0, 8.0, rows).round(2).tolist(),
+        "wind_albahar": rng.uniform(5.0, 30.0, rows).round(2).tolist(),
+        "offshore_weight": 0.35,
+        "distance_nm": 120.0,
+        "planned_speed": 12.0,
+        "alert": [None, "High seas"] * 12 + ["rough at times westward"],
+    }
+    plain, streamed, bad = _call(
+        DecisionService(stream_rows=10),
+        ("POST", "/v1/decide/batch", payload),
+        ("POST", "/v1/decide/batch?stream=1", payload),
+        ("POST", "/v1/decide/batch", {**payload, "distance_nm": [1.0, 2.0]}),
+    )
+
+    expected = decide_and_eta_batch(
+        *(payload[name] for name in BATCH_FIELDS), alert=np.asarray(payload["alert"], object)
+    )
+    body = plain.json()
+    assert body["rows"] == rows and body["decision_labels"] == list(DECISION_LABELS)
+    assert body["data"]["decision_code"] == expected.decision_code.tolist()
+    assert body["data"]["eta_hours"] == expected.eta_hours.tolist()
+
+    assert streamed.headers["content-type"] == "application/x-ndjson"
+    header, *chunks = [json.loads(line) for line in streamed.text.splitlines()]
+    assert header["rows"] == rows and [chunk["offset"] for chunk in chunks] == [0, 10, 20]
+    for name, column in body["data"].items():
+        assert sum((chunk[name] for chunk in chunks), []) == column
+    assert bad.status_code == 400
+
+
+def test_timeline_matches_evaluate_timeline_and_caches() -> None:
+    """타임라인·응답 캐시 테스트. Test timeline output and the response cache."""
+
+    hours = np.arange(48)
+    hs = np.round(0.8 + 0.7 * np.sin(hours / 5.0), 2)
+    forecast = {
+        "timestamps": [(START + dt.timedelta(hours=int(hour))).isoformat() for hour in hours],
+        "latitude": 24.8,
+        "longitude": 54.6,
+        "hs_m": hs.tolist(),
+        "wind_ms": [7.0] * 47 + [None],
+    }
+    route = TimelineRoute("MW4-AGI", 24.8, 54.6, 120.0, 12.0, 0.35)
+    routes = [route.__dict__]
+    payload = {"forecast": forecast, "routes": routes, "hours": 48}
+    service = DecisionService()
+    first, second, streamed = _call(
+        service,
+        ("POST", "/v1/timeline", payload),
+        ("POST", "/v1/timeline", payload),
+        ("POST", "/v1/timeline?stream=true", payload),
+    )
+
+    expected = evaluate_timeline(
+        ColumnarTimeseries.from_arrays(
+            int(START.timestamp()) * 1_000_000 + hours * 3_600_000_000,
+            24.8,
+            54.6,
+            {HS: hs, WIND: np.r_[np.full(47, 7.0), np.nan]},
+            UNITS,
+            TimeseriesMetadata(source="api", units=UNITS),
+        ),
+        [route],
+        hours=48,
+    )
+    data = first.json()["data"]
+    assert data["timestamps"][0] == "2025-01-01T00:00:00Z"
+    record = data["routes"][0]
+    assert record["decision_code"] == expected.outputs.decision_code[0].tolist()
+    assert len(record["windows"]) == len(expected.windows(0))
+    assert record["windows"][0]["decision"] == expected.windows(0)[0].decision
+    assert second.content == first.content
+    assert service.stats()["timeline_cache"]["hits"] == 1
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert lines[0]["timestamps"] == data["timestamps"] and lines[1] == record
+
+    invalid = [
+        {**payload, "alert": 5},
+        {**payload, "start": 1e30},
+        {**payload, "start": "9999-12-31T23:00:00Z"},
+        {**payload, "forecast": {**forecast, "timestamps": [10**20] * 48}},
+        {**payload, "forecast": {**forecast, "timestamps": [2**62] * 48}},
+    ]
+    responses = _call(service, *(("POST", "/v1/timeline", body) for body in invalid))
+    assert [response.status_code for response in responses] == [400] * len(invalid)
+    assert "alert" in responses[0].json()["error"]
+
+
+def test_large_streaming_batch_runs_chunks_in_thread_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """대용량 스트리밍 배치 스레드 풀 테스트. Test large streamed batches leave the loop."""
+
+    threads: list[int] = []
+
+    def recording_batch(*args: Any, **kwargs: Any) -> Any:
+        threads.append(threading.get_ident())
+        return decide_and_eta_batch(*args, **kwargs)
+
+    # ``marine_ops.service.app`` 속성은 ASGI 앱이므로 모듈은 importlib 로 가져온다.
+    module = importlib.import_module("marine_ops.service.app")
+    monkeypatch.setattr(module, "decide_and_eta_batch", recording_batch)
+    payload = {name: [0.2, 0.4, 0.6] for name in BATCH_FIELDS}
+    loop_thread = threading.get_ident()
+    request = ("POST", "/v1/decide/batch?stream=1", payload)
+    (inline,) = _call(DecisionService(stream_rows=2), request)
+    (offloaded,) = _call(DecisionService(stream_rows=2, inline_rows=2), request)
+
+    assert threads[:2] == [loop_thread, loop_thread]
+    assert len(threads) == 4 and loop_thread not in threads[2:]
+    assert offloaded.status_code == 200 and inline.text == offloaded.text
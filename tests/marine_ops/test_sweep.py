@@ -0,0 +1,66 @@
+"""계수 스윕 테스트. Coefficient sweep tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from marine_ops.core.marine_decision import DECISION_LABELS, decide_and_eta_batch
+from marine_ops.core.sweep import coefficient_grid, sample_coefficients, sweep
+
+ALERTS = np.array([None, "rough at times westward", "High seas"], dtype=object)
+
+
+def _history(rows: int = 400) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(11)
+    return {
+        "combined_ft": np.round(rng.uniform(0.5, 7.0, rows), 2),
+        "wind_adnoc": np.round(rng.uniform(5.0, 30.0, rows), 1),
+        "hs_onshore_ft": np.round(rng.uniform(0.5, 5.0, rows), 2),
+        "hs_offshore_ft": np.round(rng.uniform(0.5, 7.0, rows), 2),
+        "wind_albahar": np.round(rng.uniform(5.0, 30.0, rows), 1),
+        "offshore_weight": np.round(rng.uniform(0.0, 1.0, rows), 2),
+        "distance_nm": np.round(rng.uniform(20.0, 150.0, rows), 1),
+        "planned_speed": np.round(rng.uniform(8.0, 14.0, rows), 1),
+        "alert": ALERTS[rng.integers(0, ALERTS.size, rows)],
+    }
+
+
+def test_sweep_matches_per_set_batch_calls() -> None:
+    """조합별 배치 호출 일치 테스트. Test sweep metrics against per-set batch calls."""
+
+    history = _history()
+    observed = np.round(history["distance_nm"] / 10.5, 1)
+    grid = coefficient_grid(alpha=[0.8, 0.85, 0.9], go_threshold_hs=[0.9, 1.0, 1.2])
+    result = sweep(history, grid, observed, chunk_cells=1000)
+
+    assert len(result) == 9
+    for index in range(9):
+        kwargs = {name: float(column[index]) for name, column in grid.items()}
+        batch = decide_and_eta_batch(**history, **kwargs)
+        shares = [np.mean(batch.decision_code == code) for code in range(len(DECISION_LABELS))]
+        assert np.allclose(result.decision_share[index], shares)
+        error = batch.eta_hours - observed
+        assert result.eta_mae_hours[index] == pytest.approx(np.abs(error).mean())
+        assert result.eta_bias_hours[index] == pytest.approx(error.mean())
+
+    default = int(np.flatnonzero((grid["alpha"] == 0.85) & (grid["go_threshold_hs"] == 1.0))[0])
+    assert np.allclose(result.share_change[default], 0.0)
+    assert result.eta_mae_hours[default] == pytest.approx(result.baseline_eta_mae_hours)
+    assert set(result.best()) == set(grid)
+    assert len(result.to_rows()) == 9
+
+
+def test_parallel_sweep_matches_serial() -> None:
+    """프로세스 풀 스윕 일치 테스트. Test the process-pool path against the serial one."""
+
+    history = _history(200)
+    samples = sample_coefficients(40, {"k_wind": (0.03, 0.09), "beta": (0.7, 0.9)}, seed=3)
+    serial = sweep(history, samples, chunk_cells=2000, workers=1)
+    parallel = sweep(history, samples, chunk_cells=2000, workers=2, parallel_threshold=0)
+
+    assert np.array_equal(serial.decision_share, parallel.decision_share)
+    assert np.array_equal(serial.mean_eta_hours, parallel.mean_eta_hours)
+    assert np.isnan(serial.eta_mae_hours).all()
+    with pytest.raises(ValueError, match="unknown"):
+        coefficient_grid(gamma=[0.1])
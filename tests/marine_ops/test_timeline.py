@@ -0,0 +1,138 @@
+"""결정 타임라인 테스트. Decision timeline tests."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+
+import numpy as np
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.marine_decision import MarineInputs, decide_and_eta
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.timeline import (
+    IncrementalTimeline,
+    TimelineRoute,
+    evaluate_timeline,
+    run_length_windows,
+)
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+HOUR_US = 3_600_000_000
+START_US = int(START.timestamp()) * 1_000_000
+
+
+def _forecast() -> ColumnarTimeseries:
+    hours = np.arange(48)
+    # 외해: 잔잔 → 거침(12–23시) → 잔잔, 연안: 항상 잔잔. 30–31시는 외해 예보 결측.
+    rough = (hours >= 12) & (hours < 24)
+    offshore_hs = np.where(rough, 2.5, 0.6)
+    offshore_hs[30:32] = np.nan
+    return ColumnarTimeseries.from_arrays(
+        np.concatenate([hours, hours]) * HOUR_US + START_US,
+        np.repeat([25.0, 24.5], 48),
+        np.repeat([54.0, 54.5], 48),
+        {
+            HS: np.concatenate([offshore_hs, np.full(48, 0.3)]),
+            WIND: np.concatenate([np.where(rough, 15.0, 6.0), np.full(48, 4.0)]),
+        },
+        UNITS,
+        TimeseriesMetadata(source="stormglass", units=UNITS),
+    )
+
+
+def test_timeline_matches_scalar_decisions_and_windows() -> None:
+    """스칼라 결정 일치와 출항 창 테스트. Test scalar parity and departure windows."""
+
+    routes = [
+        TimelineRoute("offshore", 25.0, 54.0, 120.0, 12.0, 0.8),
+        TimelineRoute("coastal", 25.0, 54.0, 40.0, 10.0, 0.3, 24.5, 54.5),
+    ]
+    timeline = evaluate_timeline(_forecast(), routes, hours=48, max_gap=dt.timedelta(hours=1))
+
+    assert timeline.outputs.decision_code.shape == (2, 48)
+    for route, spec in enumerate(routes):
+        for hour in (0, 12, 40):
+            hs_off, wind = (2.5, 15.0) if 12 <= hour < 24 else (0.6, 6.0)
+            hs_on = 0.3 if spec.onshore_latitude is not None else hs_off
+            expected = decide_and_eta(
+                MarineInputs(
+                    combined_ft=hs_off / 0.3048,
+                    wind_adnoc=wind * 1.943844,
+                    hs_onshore_ft=hs_on / 0.3048,
+                    hs_offshore_ft=hs_off / 0.3048,
+                    wind_albahar=wind * 1.943844,
+                    offshore_weight=spec.offshore_weight,
+                    distance_nm=spec.distance_nm,
+                    planned_speed=spec.planned_speed,
+                )
+            )
+            assert timeline.outputs.decisions[route, hour] == expected.decision
+            assert timeline.outputs.eta_hours[route, hour] == expected.eta_hours
+
+    offshore = timeline.windows("offshore")
+    assert [(w.start.hour, w.hours, w.decision) for w in offshore] == [
+        (0, 12.0, "Go"),
+        (0, 6.0, "Go"),
+        (8, 16.0, "Go"),
+    ]
+    assert offshore[1].start == START + dt.timedelta(hours=24)
+    assert timeline.first_window("offshore") == offshore[0]
+    assert timeline.longest_window("offshore") == offshore[2]
+    assert offshore[0].eta_hours == timeline.outputs.eta_hours[0, 0]
+    assert offshore[0].buffer_minutes == 60
+
+    coastal = timeline.longest_window("coastal")
+    assert coastal is not None and coastal.hours == 30.0
+    assert coastal.decision == "Conditional Go (coastal window)"
+    assert coastal.buffer_minutes == 45
+
+
+def test_run_length_windows_reports_worst_decision() -> None:
+    """창 결정 코드 테스트. Test the window decision code."""
+
+    codes = np.array([[0, 1, 2, 0, 3, 3], [2, 2, 0, 0, 0, 2]], dtype=np.int8)
+    route, start, stop, code = run_length_windows(codes)
+    assert route.tolist() == [0, 0, 1]
+    assert start.tolist() == [0, 3, 2]
+    assert stop.tolist() == [2, 6, 5]
+    assert code.tolist() == [1, 3, 0]
+
+
+def test_incremental_update_matches_full_evaluation() -> None:
+    """증분 평가와 전체 재평가 일치 테스트. Test incremental updates against a full rerun."""
+
+    routes = [
+        TimelineRoute("offshore", 25.0, 54.0, 120.0, 12.0, 0.8),
+        TimelineRoute("coastal", 25.0, 54.0, 40.0, 10.0, 0.3, 24.5, 54.5),
+        TimelineRoute("inshore", 24.5, 54.5, 30.0, 10.0, 0.2),
+    ]
+    evaluator = IncrementalTimeline(routes, START, hours=48, max_gap=dt.timedelta(hours=1))
+    first = evaluator.update(_forecast())
+    assert len(first) == 3 * 48 and first.previous_code.max() == -1
+
+    # 외해 지점의 20–27시만 잔잔해진 새 예보.
+    forecast = _forecast()
+    calmer = forecast.values[HS].copy()
+    calmer[20:28] = 0.6
+    wind = forecast.values[WIND].copy()
+    wind[20:28] = 6.0
+    updated = dataclasses.replace(
+        forecast, values={HS: calmer, WIND: wind}, quality=dict(forecast.quality)
+    )
+    update = evaluator.update(updated)
+
+    full = evaluate_timeline(updated, routes, START, hours=48, max_gap=dt.timedelta(hours=1))
+    assert np.array_equal(update.timeline.outputs.decision_code, full.outputs.decision_code)
+    assert np.array_equal(update.timeline.outputs.eta_hours, full.outputs.eta_hours, equal_nan=True)
+    for name in ("window_route", "window_start", "window_stop", "window_code"):
+        assert np.array_equal(getattr(update.timeline, name), getattr(full, name))
+    assert update.affected_routes.tolist() == [0, 1]
+    assert update.cells_evaluated == 8
+    assert set(update.hour.tolist()) == set(range(20, 24))
+    change = update.changes()[0]
+    assert change.route == "offshore" and change.previous == "No-Go" and change.decision == "Go"
+    assert len(evaluator.update(updated)) == 0
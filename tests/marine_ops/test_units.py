@@ -0,0 +1,24 @@
+"""단위 변환 테스트. Unit conversion tests."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from marine_ops.core.units import feet_to_meters, meters_to_feet, round_array
+
+
+def test_scalar_conversions_round_to_two_decimals() -> None:
+    """스칼라 변환 반올림 테스트. Test scalar conversions round to two decimals."""
+
+    assert feet_to_meters(3.28084) == 1.0
+    assert meters_to_feet(1.0) == 3.28
+
+
+def test_round_array_matches_builtin_round_on_ties() -> None:
+    """경계값 반올림 일치 테스트. Test round_array matches round() on ties."""
+
+    values = np.array([1.115, 2.675, 0.125, 0.285, -1.005, 1e-9, 7.45, np.nan])
+    for ndigits in (1, 2):
+        rounded = round_array(values, ndigits)
+        expected = [round(float(value), ndigits) for value in values]
+        np.testing.assert_array_equal(rounded, np.array(expected))
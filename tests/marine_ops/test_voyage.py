@@ -0,0 +1,114 @@
+"""웨이포인트 항로 ETA 적분 테스트. Waypoint route ETA integration tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from marine_ops.core.columnar import ColumnarTimeseries
+from marine_ops.core.marine_decision import FT_TO_M, MarineInputs, decide_and_eta
+from marine_ops.core.schema import MarineVariable, TimeseriesMetadata, UnitEnum
+from marine_ops.core.units import METER_PER_SECOND_TO_KNOT
+from marine_ops.core.voyage import WaypointRoute, plan_voyages, segment_routes
+
+HS = MarineVariable.SIGNIFICANT_WAVE_HEIGHT
+WIND = MarineVariable.WIND_SPEED_10M
+UNITS = {HS: UnitEnum.METERS, WIND: UnitEnum.METERS_PER_SECOND}
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+START_US = int(START.timestamp()) * 1_000_000
+HOUR_US = 3_600_000_000
+SITES = ((24.0, 54.0), (24.5, 54.0), (25.0, 54.0))
+
+
+def _forecast(hs: np.ndarray, wind: float = 6.0) -> ColumnarTimeseries:
+    """세 지점에 같은 시간별 Hs 를 둔 예보. Forecast with one hourly Hs series per site."""
+
+    hours = hs.size
+    site = np.repeat(np.arange(len(SITES)), hours)
+    latitude = np.array([lat for lat, _ in SITES])[site]
+    longitude = np.array([lon for _, lon in SITES])[site]
+    return ColumnarTimeseries.from_arrays(
+        START_US + np.tile(np.arange(hours), len(SITES)) * HOUR_US,
+        latitude,
+        longitude,
+        {HS: np.tile(hs, len(SITES)), WIND: np.full(site.size, wind)},
+        UNITS,
+        TimeseriesMetadata(source="stormglass", units=UNITS),
+    )
+
+
+def test_steady_weather_matches_single_leg_decision() -> None:
+    """정상 기상 일치 테스트. Test steady weather reproduces ``decide_and_eta``."""
+
+    forecast = _forecast(np.full(48, 0.9), wind=8.0)
+    route = WaypointRoute("MW4-AGI", ((24.0, 54.0), (24.5, 54.0), (25.0, 54.0)), 12.0, 0.7)
+    coarse = plan_voyages(forecast, [route], START, max_segment_nm=30.0)
+    fine = plan_voyages(forecast, [route], START, max_segment_nm=1.0)
+
+    distance = float(fine.segments.route_distance_nm[0])
+    expected = decide_and_eta(
+        MarineInputs(
+            combined_ft=0.9 / FT_TO_M,
+            wind_adnoc=8.0 * METER_PER_SECOND_TO_KNOT,
+            hs_onshore_ft=0.9 / FT_TO_M,
+            hs_offshore_ft=0.9 / FT_TO_M,
+            wind_albahar=8.0 * METER_PER_SECOND_TO_KNOT,
+            offshore_weight=0.7,
+            distance_nm=distance,
+            planned_speed=12.0,
+        )
+    )
+    assert len(fine.segments) == 62 and len(coarse.segments) == 4
+    for plan in (coarse, fine):
+        row = plan.to_rows()[0]
+        assert row["eta_hours"] == expected.eta_hours
+        assert row["decision"] == expected.decision
+        assert row["buffer_minutes"] == expected.buffer_minutes
+
+
+def test_eta_integrates_evolving_weather() -> None:
+    """기상 변화 적분 테스트. Test later segments see the forecast at their arrival time."""
+
+    hs = np.where(np.arange(48) < 3, 0.6, 2.0)
+    forecast = _forecast(hs)
+    routes = [
+        WaypointRoute("north", ((24.0, 54.0), (25.0, 54.0)), 12.0, 0.7),
+        WaypointRoute("coastal", ((24.0, 54.0), (24.2, 54.0), (24.0, 54.0)), 10.0, (0.3, 0.5)),
+    ]
+    plan = plan_voyages(forecast, routes, [START, START + dt.timedelta(hours=46)], 1.0)
+
+    north = slice(plan.segments.offsets[0], plan.segments.offsets[1])
+    entry = plan.entry_us[0, north]
+    assert np.all(np.diff(entry) > 0)
+    # 3시간 안에 지난 세그먼트는 잔잔한 해상, 이후 세그먼트는 높은 파고를 만난다.
+    calm = entry < START_US + 2 * HOUR_US
+    assert np.all(plan.hs_fused_m[0, north][calm] < 1.0)
+    assert np.all(plan.hs_fused_m[0, north][entry >= START_US + 3 * HOUR_US] > 1.9)
+    assert plan.effective_speed[0, north][0] > plan.effective_speed[0, north][-1]
+    steady = plan_voyages(_forecast(np.full(48, 0.6)), routes, START, 1.0)
+    assert plan.eta_hours[0, 0] > steady.eta_hours[0, 0]
+    assert plan.decisions[0, 0] == "Conditional Go"
+    assert plan.buffer_minutes[0, 1] == 60
+    assert plan.arrival_us[0, 0] == entry[-1] + round(plan.segment_hours[0, north][-1] * HOUR_US)
+    # 예보 구간을 벗어나는 출항은 No-Go 다.
+    assert plan.decisions[1, 0] == "No-Go"
+
+
+def test_segment_routes_validation() -> None:
+    """세그먼트 분할 검증 테스트. Test segmentation bookkeeping and validation."""
+
+    segments = segment_routes(
+        [WaypointRoute("loop", ((24.0, 54.0), (24.0, 54.0), (24.1, 54.0)), 10.0, (0.2, 0.4))],
+        max_segment_nm=2.0,
+    )
+    assert len(segments) == 4
+    assert np.all(segments.leg == 1)
+    assert np.all(segments.offshore_weight == 0.4)
+    np.testing.assert_allclose(segments.distance_nm.sum(), segments.route_distance_nm[0])
+
+    with pytest.raises(ValueError, match="two waypoints"):
+        segment_routes([WaypointRoute("dot", ((24.0, 54.0),), 10.0, 0.5)])
+    with pytest.raises(ValueError, match="one offshore_weight per leg"):
+        segment_routes([WaypointRoute("bad", ((24.0, 54.0), (24.1, 54.0)), 10.0, (0.2, 0.4))])